@@ -24,7 +24,12 @@ from cloud_optimizer.database import Base
 from cloud_optimizer.models import (  # noqa: F401
     AWSAccount,
     Finding,
+    FindingSummaryCounter,
+    ResourceFingerprint,
+    ScanCheckpoint,
     ScanJob,
+    SecurityScoreRollup,
+    SecurityScoreSnapshot,
     Session,
     Trial,
     TrialUsage,
@@ -0,0 +1,55 @@
+"""Add unique partial index on open findings for bulk upserts.
+
+Existing duplicate OPEN findings (same account, rule and resource) would block
+the index, so before creating it the upgrade marks every duplicate except the
+most recently seen one as RESOLVED, with ``resolved_at`` set to the migration
+time. Downgrading drops the index but does not reopen those findings.
+
+Revision ID: 20261016_0900
+Revises: 20251203_2220
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0900"
+down_revision: str | None = "20251203_2220"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create unique index on (account, rule, resource) for open findings."""
+    # Resolve duplicate open findings left by concurrent per-row inserts,
+    # keeping the most recently seen row for each key.
+    op.execute("""
+        UPDATE findings f
+        SET status = 'RESOLVED', resolved_at = now()
+        FROM (
+            SELECT finding_id,
+                   row_number() OVER (
+                       PARTITION BY aws_account_id, rule_id, resource_id
+                       ORDER BY last_seen_at DESC, first_seen_at DESC
+                   ) AS rn
+            FROM findings
+            WHERE status = 'OPEN'
+        ) dup
+        WHERE f.finding_id = dup.finding_id AND dup.rn > 1
+        """)
+    op.create_index(
+        "uq_finding_open_dedup",
+        "findings",
+        ["aws_account_id", "rule_id", "resource_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'OPEN'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop unique open-finding index."""
+    op.drop_index("uq_finding_open_dedup", table_name="findings")
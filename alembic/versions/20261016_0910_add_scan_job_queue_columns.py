@@ -0,0 +1,47 @@
+"""Add queue columns to scan jobs for background workers.
+
+Revision ID: 20261016_0910
+Revises: 20261016_0900
+Create Date: 2026-10-16 09:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0910"
+down_revision: str | None = "20261016_0900"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add region, worker, heartbeat and attempt tracking to scan_jobs."""
+    op.add_column("scan_jobs", sa.Column("region", sa.String(50), nullable=True))
+    op.add_column("scan_jobs", sa.Column("worker_id", sa.String(255), nullable=True))
+    op.add_column(
+        "scan_jobs",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "scan_jobs",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "idx_scan_jobs_pending",
+        "scan_jobs",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Remove queue columns from scan_jobs."""
+    op.drop_index("idx_scan_jobs_pending", table_name="scan_jobs")
+    op.drop_column("scan_jobs", "attempts")
+    op.drop_column("scan_jobs", "heartbeat_at")
+    op.drop_column("scan_jobs", "worker_id")
+    op.drop_column("scan_jobs", "region")
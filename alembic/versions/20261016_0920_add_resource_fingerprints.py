@@ -0,0 +1,48 @@
+"""Add resource fingerprints for incremental scanning.
+
+Revision ID: 20261016_0920
+Revises: 20261016_0910
+Create Date: 2026-10-16 09:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0920"
+down_revision: str | None = "20261016_0910"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create resource_fingerprints table."""
+    op.create_table(
+        "resource_fingerprints",
+        sa.Column("account_id", sa.String(20), nullable=False),
+        sa.Column("scanner", sa.String(100), nullable=False),
+        sa.Column("resource_id", sa.String(500), nullable=False),
+        sa.Column("fingerprint", sa.String(64), nullable=False),
+        sa.Column(
+            "results",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column(
+            "evaluated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("account_id", "scanner", "resource_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop resource_fingerprints table."""
+    op.drop_table("resource_fingerprints")
@@ -0,0 +1,55 @@
+"""Add scan checkpoints for resumable multi-account scans.
+
+Revision ID: 20261016_0930
+Revises: 20261016_0920
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0930"
+down_revision: str | None = "20261016_0920"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create scan_checkpoints table."""
+    op.create_table(
+        "scan_checkpoints",
+        sa.Column("scan_id", sa.String(64), nullable=False),
+        sa.Column("account_id", sa.String(20), nullable=False),
+        sa.Column("scanner", sa.String(100), nullable=False),
+        sa.Column("region", sa.String(30), nullable=False),
+        sa.Column(
+            "findings",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column("streamed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "streamed_by_severity",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("scan_id", "account_id", "scanner", "region"),
+    )
+
+
+def downgrade() -> None:
+    """Drop scan_checkpoints table."""
+    op.drop_table("scan_checkpoints")
@@ -0,0 +1,65 @@
+"""Add security score snapshots and rollups for dashboard trends.
+
+Revision ID: 20261016_0940
+Revises: 20261016_0930
+Create Date: 2026-10-16 09:40:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0940"
+down_revision: str | None = "20261016_0930"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create security_score_snapshots and security_score_rollups tables."""
+    op.create_table(
+        "security_score_snapshots",
+        sa.Column("scope", sa.String(20), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("findings_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("critical_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("high_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("medium_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("low_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("scope", "recorded_at"),
+    )
+    op.create_index(
+        "ix_security_score_snapshots_recorded_at",
+        "security_score_snapshots",
+        ["recorded_at"],
+    )
+
+    op.create_table(
+        "security_score_rollups",
+        sa.Column("scope", sa.String(20), nullable=False),
+        sa.Column("period", sa.String(10), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("score_min", sa.Float(), nullable=False),
+        sa.Column("score_max", sa.Float(), nullable=False),
+        sa.Column("last_recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_score", sa.Float(), nullable=False),
+        sa.Column("findings_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("critical_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("scope", "period", "bucket_start"),
+    )
+
+
+def downgrade() -> None:
+    """Drop security score history tables."""
+    op.drop_table("security_score_rollups")
+    op.drop_index(
+        "ix_security_score_snapshots_recorded_at",
+        table_name="security_score_snapshots",
+    )
+    op.drop_table("security_score_snapshots")
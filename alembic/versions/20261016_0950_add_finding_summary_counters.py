@@ -0,0 +1,65 @@
+"""Add materialized findings summary counters.
+
+Revision ID: 20261016_0950
+Revises: 20261016_0940
+Create Date: 2026-10-16 09:50:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0950"
+down_revision: str | None = "20261016_0940"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create finding_summary_counters and backfill it from findings."""
+    op.create_table(
+        "finding_summary_counters",
+        sa.Column("aws_account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "severity",
+            postgresql.ENUM(name="finding_severity", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="finding_status", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("service", sa.String(100), nullable=False),
+        sa.Column("framework", sa.String(50), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(
+            ["aws_account_id"], ["aws_accounts.account_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint(
+            "aws_account_id", "severity", "status", "service", "framework"
+        ),
+    )
+
+    # '*' rows count every finding; other rows count framework membership
+    op.execute("""
+        INSERT INTO finding_summary_counters
+            (aws_account_id, severity, status, service, framework, count)
+        SELECT aws_account_id, severity, status, service, '*', count(*)
+        FROM findings
+        GROUP BY aws_account_id, severity, status, service
+        UNION ALL
+        SELECT aws_account_id, severity, status, service, framework, count(*)
+        FROM findings,
+            jsonb_array_elements_text(compliance_frameworks) AS framework
+        GROUP BY aws_account_id, severity, status, service, framework
+        """)
+
+
+def downgrade() -> None:
+    """Drop finding_summary_counters table."""
+    op.drop_table("finding_summary_counters")
@@ -0,0 +1,41 @@
+"""Add indexes for keyset pagination of findings.
+
+Revision ID: 20261016_1000
+Revises: 20261016_0950
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_1000"
+down_revision: str | None = "20261016_0950"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create findings listing indexes."""
+    # Listing: WHERE aws_account_id = ? [AND status = ?]
+    #          AND (first_seen_at, finding_id) < (?, ?)
+    #          ORDER BY first_seen_at DESC, finding_id DESC
+    # Both indexes are scanned backwards for the descending order.
+    op.create_index(
+        "ix_findings_account_first_seen",
+        "findings",
+        ["aws_account_id", "first_seen_at", "finding_id"],
+    )
+    op.create_index(
+        "ix_findings_account_status_first_seen",
+        "findings",
+        ["aws_account_id", "status", "first_seen_at", "finding_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop findings listing indexes."""
+    op.drop_index("ix_findings_account_status_first_seen", table_name="findings")
+    op.drop_index("ix_findings_account_first_seen", table_name="findings")
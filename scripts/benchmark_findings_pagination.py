@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Compare offset and keyset pagination latency over synthetic findings.
+
+Inserts synthetic findings for one account into the configured PostgreSQL
+database (see ``DATABASE_*`` settings), times fetching pages at increasing
+depths with ``get_findings_by_account`` (LIMIT/OFFSET) and
+``get_findings_page`` (cursor), and rolls everything back afterwards.
+
+Usage:
+    python scripts/benchmark_findings_pagination.py --findings 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from functools import partial
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from cloud_optimizer.database import get_session_factory
+from cloud_optimizer.models.aws_account import (
+    AWSAccount,
+    ConnectionStatus,
+    ConnectionType,
+)
+from cloud_optimizer.models.scan_job import ScanJob, ScanStatus, ScanType
+from cloud_optimizer.models.user import User
+from cloud_optimizer.services.findings import FindingsService, encode_cursor
+
+PAGE_SIZE = 100
+
+INSERT_FINDINGS = text("""
+    INSERT INTO findings (
+        scan_job_id, aws_account_id, rule_id, finding_type, severity, status,
+        service, resource_type, resource_id, region, title, description,
+        recommendation, first_seen_at, last_seen_at
+    )
+    SELECT
+        :scan_job_id, :aws_account_id, 'S3_' || lpad((i % 40)::text, 3, '0'),
+        'SECURITY',
+        (ARRAY['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'])[i % 4 + 1]::finding_severity,
+        'OPEN', 'S3', 'AWS::S3::Bucket', 'bucket-' || i, 'us-east-1',
+        'Synthetic finding', 'Synthetic finding', 'None',
+        now() - i * interval '1 second', now()
+    FROM generate_series(1, :count) AS i
+    """)
+
+
+async def timed(fetch: Callable[[], Awaitable[object]], repeats: int) -> float:
+    """Get the median latency of a fetch in milliseconds."""
+    samples: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fetch()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def run(count: int, repeats: int) -> None:
+    """Run the benchmark inside a transaction that is rolled back."""
+    async with get_session_factory()() as session:
+        user = User(
+            email=f"benchmark-{uuid4()}@example.com",
+            password_hash="benchmark",
+            name="Benchmark",
+        )
+        session.add(user)
+        await session.flush()
+        account = AWSAccount(
+            user_id=user.user_id,
+            aws_account_id="000000000000",
+            friendly_name="benchmark",
+            connection_type=ConnectionType.IAM_ROLE,
+            role_arn="arn:aws:iam::000000000000:role/Benchmark",
+            external_id=str(uuid4()),
+            status=ConnectionStatus.ACTIVE,
+        )
+        session.add(account)
+        await session.flush()
+        job = ScanJob(
+            user_id=user.user_id,
+            aws_account_id=account.account_id,
+            scan_type=ScanType.SECURITY,
+            status=ScanStatus.COMPLETED,
+        )
+        session.add(job)
+        await session.flush()
+
+        start = time.perf_counter()
+        await session.execute(
+            INSERT_FINDINGS,
+            {
+                "scan_job_id": job.job_id,
+                "aws_account_id": account.account_id,
+                "count": count,
+            },
+        )
+        await session.execute(text("ANALYZE findings"))
+        print(f"inserted {count} findings in {time.perf_counter() - start:.1f}s")
+
+        service = FindingsService(session)
+        account_id = account.account_id
+        print(f"{'page':>8} {'offset ms':>10} {'keyset ms':>10}")
+        page = 1
+        while (page - 1) * PAGE_SIZE < count:
+            offset = (page - 1) * PAGE_SIZE
+            cursor = None
+            if offset:
+                # Position of the previous page's last row (not timed)
+                (previous,) = await service.get_findings_by_account(
+                    account_id, limit=1, offset=offset - 1
+                )
+                cursor = encode_cursor(previous)
+
+            offset_ms = await timed(
+                partial(
+                    service.get_findings_by_account,
+                    account_id,
+                    limit=PAGE_SIZE,
+                    offset=offset,
+                ),
+                repeats,
+            )
+            keyset_ms = await timed(
+                partial(
+                    service.get_findings_page,
+                    account_id,
+                    limit=PAGE_SIZE,
+                    cursor=cursor,
+                ),
+                repeats,
+            )
+            print(f"{page:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+            page *= 10
+
+        await session.rollback()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--findings", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.findings, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Measure MemgraphBackend read throughput at increasing concurrency.
+
+Loads a random directed graph (every node gets ``--degree`` outgoing edges),
+then issues ``--requests`` ``get_neighbors`` calls with 1, 4, 16 and 64
+calls in flight at once. Throughput should grow with the number of calls
+in flight, up to the connection pool size, instead of staying flat as it
+does when each call blocks the event loop. The graph is deleted afterwards.
+
+Usage:
+    python scripts/benchmark_memgraph_concurrency.py \\
+        --uri bolt://localhost:7688 --nodes 2000 --degree 4
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+from uuid import UUID
+
+from ib_platform.graph.backends.memgraph import MemgraphBackend
+from ib_platform.graph.protocol import TraversalDirection
+
+LABEL = "ConcurrencyBenchmark"
+IN_FLIGHT = (1, 4, 16, 64)
+
+
+async def throughput(
+    backend: MemgraphBackend, node_ids: List[UUID], in_flight: int
+) -> float:
+    """Get neighbors of every node with in_flight calls at once, in calls/s."""
+    semaphore = asyncio.Semaphore(in_flight)
+
+    async def call(node_id: UUID) -> None:
+        async with semaphore:
+            await backend.get_neighbors(node_id, TraversalDirection.OUTGOING)
+
+    begin = time.perf_counter()
+    await asyncio.gather(*(call(node_id) for node_id in node_ids))
+    return len(node_ids) / (time.perf_counter() - begin)
+
+
+async def run(uri: str, count: int, degree: int, requests: int) -> None:
+    """Build the graph and measure throughput at each concurrency level."""
+    backend = MemgraphBackend(uri, max_connection_pool_size=max(IN_FLIGHT))
+    await backend.connect()
+    rng = random.Random(42)
+    try:
+        nodes = await backend.batch_create_nodes(
+            [
+                {"labels": [LABEL], "properties": {"name": f"node-{i}"}}
+                for i in range(count)
+            ]
+        )
+        edges = []
+        for node in nodes:
+            targets = [t for t in rng.sample(nodes, degree + 1) if t.id != node.id]
+            edges.extend(
+                {"source_id": node.id, "target_id": target.id, "edge_type": "LINK"}
+                for target in targets[:degree]
+            )
+        await backend.batch_create_edges(edges)
+        print(f"graph: {len(nodes)} nodes, {len(edges)} edges")
+
+        node_ids = [rng.choice(nodes).id for _ in range(requests)]
+        # Warm up the connection pool
+        await throughput(backend, node_ids[: max(IN_FLIGHT)], max(IN_FLIGHT))
+
+        print(f"{'in flight':>9} {'calls/s':>10}")
+        for in_flight in IN_FLIGHT:
+            rate = await throughput(backend, node_ids, in_flight)
+            print(f"{in_flight:>9} {rate:>10.0f}")
+    finally:
+        await backend.execute_query(f"MATCH (n:{LABEL}) DETACH DELETE n")
+        await backend.disconnect()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uri", default="bolt://localhost:7688")
+    parser.add_argument("--nodes", type=int, default=2_000)
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.uri, args.nodes, args.degree, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Measure the memory cost of ScanResult objects.
+
+Compares the slotted ``ScanResult`` (shared ``AccountContext``, interned rule
+IDs and regions, lazy evidence) with the previous plain dataclass, which
+copied account context into each finding's evidence dict.
+
+Usage:
+    python scripts/benchmark_scan_results.py --findings 1000000
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from cloud_optimizer.scanners.base import AccountContext, ScanResult
+
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-2"]
+SEVERITIES = ["critical", "high", "medium", "low"]
+
+
+@dataclass
+class LegacyScanResult:
+    """ScanResult as it was before it was slotted."""
+
+    rule_id: str
+    passed: bool
+    resource_id: str
+    resource_arn: Optional[str] = None
+    region: str = "us-east-1"
+    evidence: Dict[str, Any] = field(default_factory=dict)
+    potential_savings: Optional[float] = None
+
+
+def build_legacy(count: int) -> List[Any]:
+    """Build findings the old way, copying account context per finding."""
+    results = []
+    for i in range(count):
+        passed = i % 3 == 0
+        result = LegacyScanResult(
+            rule_id=f"S3_{i % 40:03d}",
+            passed=passed,
+            resource_id=f"bucket-{i}",
+            region="".join(REGIONS[i % len(REGIONS)]),
+            evidence={} if passed else {"severity": SEVERITIES[i % 4]},
+        )
+        result.evidence["account_id"] = "123456789012"
+        result.evidence["account_name"] = "Production"
+        result.evidence["environment"] = "prod"
+        results.append(result)
+    return results
+
+
+def build_slotted(count: int) -> List[Any]:
+    """Build findings that share one AccountContext."""
+    context = AccountContext(
+        account_id="123456789012", account_name="Production", environment="prod"
+    )
+    results = []
+    for i in range(count):
+        passed = i % 3 == 0
+        result = ScanResult(
+            rule_id=f"S3_{i % 40:03d}",
+            passed=passed,
+            resource_id=f"bucket-{i}",
+            region="".join(REGIONS[i % len(REGIONS)]),
+            evidence=None if passed else {"severity": SEVERITIES[i % 4]},
+        )
+        result.context = context
+        results.append(result)
+    return results
+
+
+def measure(build: Callable[[int], List[Any]], count: int) -> float:
+    """Get the bytes allocated per finding by a builder."""
+    tracemalloc.start()
+    results = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--findings", type=int, default=200_000)
+    args = parser.parse_args()
+
+    legacy = measure(build_legacy, args.findings)
+    slotted = measure(build_slotted, args.findings)
+    print(f"findings:           {args.findings}")
+    print(f"dataclass + copies: {legacy:8.1f} bytes/finding")
+    print(f"slotted + context:  {slotted:8.1f} bytes/finding")
+    print(f"reduction:          {1 - slotted / legacy:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from cloud_optimizer.api.schemas.findings import (
+    ComplianceSummaryResponse,
     FindingListResponse,
     FindingResponse,
     FindingSeverity,
@@ -16,7 +17,8 @@ from cloud_optimizer.database import AsyncSessionDep
 from cloud_optimizer.middleware.auth import CurrentUser
 from cloud_optimizer.models.finding import FindingSeverity as ModelSeverity
 from cloud_optimizer.models.finding import FindingStatus as ModelStatus
-from cloud_optimizer.services.findings import FindingsService
+from cloud_optimizer.services.compliance import ComplianceService
+from cloud_optimizer.services.findings import DuplicateOpenFindingError, FindingsService
 
 router = APIRouter()
 
@@ -36,6 +38,21 @@ def get_findings_service(db: AsyncSessionDep) -> FindingsService:
 FindingsServiceDep = Annotated[FindingsService, Depends(get_findings_service)]
 
 
+def get_compliance_service(db: AsyncSessionDep) -> ComplianceService:
+    """Dependency to get compliance service with database session.
+
+    Args:
+        db: Database session
+
+    Returns:
+        ComplianceService instance
+    """
+    return ComplianceService(db)
+
+
+ComplianceServiceDep = Annotated[ComplianceService, Depends(get_compliance_service)]
+
+
 @router.get(
     "/accounts/{aws_account_id}",
     response_model=FindingListResponse,
@@ -53,9 +70,14 @@ async def list_findings(
     service: Optional[str] = None,
     limit: Annotated[int, Query(ge=1, le=500)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Optional[str] = None,
 ) -> FindingListResponse:
     """List findings for an AWS account with optional filters.
 
+    Pages are fetched by cursor: pass the ``next_cursor`` of a response to
+    get the following page. ``offset`` is still accepted but deep offsets
+    are slow.
+
     Args:
         aws_account_id: AWS account ID
         user_id: Current authenticated user ID
@@ -64,26 +86,49 @@ async def list_findings(
         status: Filter by status
         service: Filter by AWS service
         limit: Maximum number of results
-        offset: Number of results to skip
+        offset: Number of results to skip (ignored when ``cursor`` is set)
+        cursor: Cursor of the page to fetch, from a previous ``next_cursor``
 
     Returns:
         List of findings with pagination info
+
+    Raises:
+        HTTPException: If the cursor is invalid
     """
     # TODO: Verify user owns the AWS account
-    findings = await findings_service.get_findings_by_account(
-        aws_account_id=aws_account_id,
-        severity=ModelSeverity(severity.value) if severity else None,
-        status=ModelStatus(status.value) if status else None,
-        service=service,
-        limit=limit,
-        offset=offset,
-    )
+    model_severity = ModelSeverity(severity.value) if severity else None
+    model_status = ModelStatus(status.value) if status else None
+    next_cursor = None
+    if offset and cursor is None:
+        findings = await findings_service.get_findings_by_account(
+            aws_account_id=aws_account_id,
+            severity=model_severity,
+            status=model_status,
+            service=service,
+            limit=limit,
+            offset=offset,
+        )
+    else:
+        try:
+            page = await findings_service.get_findings_page(
+                aws_account_id=aws_account_id,
+                severity=model_severity,
+                status=model_status,
+                service=service,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            # ``status`` is the filter parameter here, not fastapi.status
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        findings, next_cursor = page.findings, page.next_cursor
 
     return FindingListResponse(
         findings=[FindingResponse.model_validate(f) for f in findings],
         total=len(findings),  # Would be from COUNT query in production
         limit=limit,
-        offset=offset,
+        offset=0 if cursor else offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -132,6 +177,7 @@ async def get_finding(
     responses={
         401: {"description": "Not authenticated"},
         404: {"description": "Finding not found"},
+        409: {"description": "Another finding is already open for the resource"},
     },
 )
 async def update_finding_status(
@@ -152,12 +198,16 @@ async def update_finding_status(
         Updated finding
 
     Raises:
-        HTTPException: If finding not found
+        HTTPException: If finding not found, or reopening it would duplicate
+            an open finding
     """
     # TODO: Verify user owns the AWS account associated with this finding
-    finding = await findings_service.update_status(
-        finding_id, ModelStatus(request.status.value)
-    )
+    try:
+        finding = await findings_service.update_status(
+            finding_id, ModelStatus(request.status.value)
+        )
+    except DuplicateOpenFindingError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
 
     if not finding:
         raise HTTPException(
@@ -193,3 +243,38 @@ async def get_findings_summary(
     # TODO: Verify user owns the AWS account
     summary = await findings_service.get_summary(aws_account_id)
     return FindingSummaryResponse(**summary)
+
+
+@router.get(
+    "/accounts/{aws_account_id}/compliance",
+    response_model=ComplianceSummaryResponse,
+    summary="Get compliance summary",
+    responses={
+        401: {"description": "Not authenticated"},
+        404: {"description": "AWS account not found"},
+    },
+)
+async def get_compliance_summary(
+    aws_account_id: UUID,
+    user_id: CurrentUser,
+    compliance_service: ComplianceServiceDep,
+) -> ComplianceSummaryResponse:
+    """Get per-framework finding counts for an AWS account.
+
+    Args:
+        aws_account_id: AWS account ID
+        user_id: Current authenticated user ID
+        compliance_service: Compliance service instance
+
+    Returns:
+        Total, passed and failed findings by compliance framework
+
+    Raises:
+        HTTPException: If the account does not belong to the user
+    """
+    if not await compliance_service.user_owns_account(aws_account_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="AWS account not found"
+        )
+    summary = await compliance_service.get_account_compliance_summary(aws_account_id)
+    return ComplianceSummaryResponse.model_validate({"frameworks": summary})
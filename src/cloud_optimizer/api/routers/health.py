@@ -54,7 +54,7 @@ async def check_database() -> ComponentStatus:
     start_time = time.time()
 
     try:
-        engine = get_engine()  # type: ignore[no-untyped-call]
+        engine = get_engine()
         async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
             response_time = (time.time() - start_time) * 1000
@@ -38,6 +38,7 @@ from cloud_optimizer.middleware.trial import (
     RequireScanLimit,
     record_trial_usage,
 )
+from cloud_optimizer.services.scan_queue import ScanQueue, get_scan_queue
 from cloud_optimizer.services.security_scanner import SecurityScanEngine
 
 router = APIRouter()
@@ -162,6 +163,7 @@ def get_security_scanner(db: AsyncSessionDep) -> SecurityScanEngine:
 
 
 SecurityScannerDep = Annotated[SecurityScanEngine, Depends(get_security_scanner)]
+ScanQueueDep = Annotated[ScanQueue, Depends(get_scan_queue)]
 
 
 # ============================================================================
@@ -218,7 +220,7 @@ async def analyze_text(
 @router.post(
     "/scans",
     response_model=SecurityScanJobResponse,
-    status_code=201,
+    status_code=202,
     summary="Start AWS security scan",
 )
 async def start_security_scan(
@@ -226,11 +228,16 @@ async def start_security_scan(
     user_id: CurrentUser,
     db: AsyncSessionDep,
     scanner: SecurityScannerDep,
+    scan_queue: ScanQueueDep,
     _scan_limit: RequireScanLimit,
 ) -> SecurityScanJobResponse:
-    """Start a security scan for an AWS account connection."""
+    """Queue a security scan for an AWS account connection.
+
+    The scan runs on a background worker; poll ``GET /scans/{job_id}`` for
+    progress.
+    """
     try:
-        job = await scanner.start_security_scan(
+        job = await scanner.enqueue_security_scan(
             user_id=user_id,
             account_id=request.aws_account_id,
             scan_types=request.scan_types or None,
@@ -239,6 +246,7 @@ async def start_security_scan(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    await scan_queue.submit(job.job_id)
     await record_trial_usage("scans", user_id, db, count=1)
     return SecurityScanJobResponse.model_validate(job)
 
@@ -980,9 +988,43 @@ async def get_security_analysis_service(request: Request) -> Any:
     return request.app.state.security_analysis_service
 
 
+async def _load_findings(
+    findings_service: Any,
+    finding_ids: List[str],
+    user_id: UUID,
+    not_found: str = "No findings found for the provided IDs",
+) -> List[Any]:
+    """Load the requested findings owned by the user in one query.
+
+    Args:
+        findings_service: Findings service
+        finding_ids: Finding IDs from the request
+        user_id: Current authenticated user ID
+        not_found: Detail of the 404 raised when nothing is found
+
+    Returns:
+        Findings in request order
+
+    Raises:
+        HTTPException: If an ID is malformed or no finding is found
+    """
+    try:
+        ids = [UUID(finding_id) for finding_id in finding_ids]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid finding ID: {exc}"
+        ) from exc
+
+    findings: List[Any] = await findings_service.get_findings_bulk(ids, user_id=user_id)
+    if not findings:
+        raise HTTPException(status_code=404, detail=not_found)
+    return findings
+
+
 @router.post("/analysis/comprehensive", response_model=AnalyzeFindingsResponse)
 async def analyze_findings_comprehensive(
     request_data: AnalyzeFindingsRequest,
+    user_id: CurrentUser,
     findings_service=Depends(get_findings_service),
     analysis_service=Depends(get_security_analysis_service),
 ) -> AnalyzeFindingsResponse:
@@ -997,20 +1039,7 @@ async def analyze_findings_comprehensive(
 
     This is the primary endpoint for end-to-end security analysis.
     """
-    # Fetch findings
-    findings = []
-    for finding_id in request_data.finding_ids:
-        from uuid import UUID
-
-        finding = await findings_service.get_finding(UUID(finding_id))
-        if finding:
-            findings.append(finding)
-
-    if not findings:
-        raise HTTPException(
-            status_code=404,
-            detail="No findings found for the provided IDs",
-        )
+    findings = await _load_findings(findings_service, request_data.finding_ids, user_id)
 
     # Perform comprehensive analysis
     analysis = await analysis_service.analyze_findings(
@@ -1028,6 +1057,7 @@ async def analyze_findings_comprehensive(
 @router.post("/analysis/score", response_model=ScoreFindingsResponse)
 async def score_findings(
     request_data: ScoreFindingsRequest,
+    user_id: CurrentUser,
     findings_service=Depends(get_findings_service),
     analysis_service=Depends(get_security_analysis_service),
 ) -> ScoreFindingsResponse:
@@ -1040,20 +1070,7 @@ async def score_findings(
     - Resource type (0-20 points)
     - Exposure level (0-10 points)
     """
-    # Fetch findings
-    findings = []
-    for finding_id in request_data.finding_ids:
-        from uuid import UUID
-
-        finding = await findings_service.get_finding(UUID(finding_id))
-        if finding:
-            findings.append(finding)
-
-    if not findings:
-        raise HTTPException(
-            status_code=404,
-            detail="No findings found for the provided IDs",
-        )
+    findings = await _load_findings(findings_service, request_data.finding_ids, user_id)
 
     # Score findings
     prioritized = await analysis_service.score_and_prioritize(findings)
@@ -1075,6 +1092,7 @@ async def score_findings(
 @router.post("/analysis/explain")
 async def explain_finding(
     request_data: ExplainFindingRequest,
+    user_id: CurrentUser,
     findings_service=Depends(get_findings_service),
     analysis_service=Depends(get_security_analysis_service),
 ) -> Dict[str, Any]:
@@ -1084,15 +1102,12 @@ async def explain_finding(
     Uses Claude AI to create contextual explanations tailored to
     the target audience (general, technical, or executive).
     """
-    from uuid import UUID
-
-    finding = await findings_service.get_finding(UUID(request_data.finding_id))
-
-    if not finding:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Finding {request_data.finding_id} not found",
-        )
+    (finding,) = await _load_findings(
+        findings_service,
+        [request_data.finding_id],
+        user_id,
+        not_found=f"Finding {request_data.finding_id} not found",
+    )
 
     explanation = await analysis_service.explain_finding(
         finding=finding,
@@ -1106,6 +1121,7 @@ async def explain_finding(
 @router.post("/analysis/remediation")
 async def generate_remediation_plan(
     request_data: RemediationPlanRequest,
+    user_id: CurrentUser,
     findings_service=Depends(get_findings_service),
     analysis_service=Depends(get_security_analysis_service),
 ) -> Dict[str, Any]:
@@ -1118,15 +1134,12 @@ async def generate_remediation_plan(
     - Prerequisites and rollback procedures
     - Documentation references
     """
-    from uuid import UUID
-
-    finding = await findings_service.get_finding(UUID(request_data.finding_id))
-
-    if not finding:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Finding {request_data.finding_id} not found",
-        )
+    (finding,) = await _load_findings(
+        findings_service,
+        [request_data.finding_id],
+        user_id,
+        not_found=f"Finding {request_data.finding_id} not found",
+    )
 
     plan = await analysis_service.generate_remediation_plan(
         finding=finding,
@@ -1139,6 +1152,7 @@ async def generate_remediation_plan(
 @router.post("/analysis/correlate", response_model=CorrelateFindingsResponse)
 async def correlate_findings(
     request_data: CorrelateFindingsRequest,
+    user_id: CurrentUser,
     findings_service=Depends(get_findings_service),
     analysis_service=Depends(get_security_analysis_service),
 ) -> CorrelateFindingsResponse:
@@ -1153,20 +1167,7 @@ async def correlate_findings(
 
     Useful for batch remediation planning.
     """
-    # Fetch findings
-    findings = []
-    for finding_id in request_data.finding_ids:
-        from uuid import UUID
-
-        finding = await findings_service.get_finding(UUID(finding_id))
-        if finding:
-            findings.append(finding)
-
-    if not findings:
-        raise HTTPException(
-            status_code=404,
-            detail="No findings found for the provided IDs",
-        )
+    findings = await _load_findings(findings_service, request_data.finding_ids, user_id)
 
     # Correlate findings
     from ib_platform.security.correlation import FindingCorrelator
@@ -69,6 +69,7 @@ class FindingListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class FindingSummaryResponse(BaseModel):
@@ -79,6 +80,20 @@ class FindingSummaryResponse(BaseModel):
     by_status: dict[str, int]
 
 
+class FrameworkComplianceCounts(BaseModel):
+    """Finding counts for one compliance framework."""
+
+    total: int
+    passed: int
+    failed: int
+
+
+class ComplianceSummaryResponse(BaseModel):
+    """Response schema for an account's compliance summary."""
+
+    frameworks: dict[str, FrameworkComplianceCounts]
+
+
 class UpdateFindingStatusRequest(BaseModel):
     """Request schema for updating finding status."""
 
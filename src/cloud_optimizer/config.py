@@ -5,7 +5,7 @@ Uses pydantic-settings for environment-based configuration with validation.
 """
 
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -91,6 +91,74 @@ class Settings(BaseSettings):
     aws_default_region: str = "us-east-1"
     aws_session_token: Optional[str] = None
 
+    # Scanner execution
+    scanner_max_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of scanners running concurrently off the event loop",
+    )
+    scanner_service_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Default cap on in-flight API calls per AWS service",
+    )
+    scanner_service_limits: Dict[str, int] = Field(
+        default_factory=dict,
+        description='Per-service overrides for in-flight API calls, e.g. {"iam": 2}',
+    )
+    scanner_unit_workers: int = Field(
+        default=16,
+        ge=1,
+        description="Threads shared by scanner fan-out work units (region x batch)",
+    )
+    scanner_max_in_flight_calls: int = Field(
+        default=32,
+        ge=1,
+        description="Global cap on in-flight AWS API calls across all scanners",
+    )
+    scanner_api_rate: float = Field(
+        default=10.0,
+        gt=0,
+        description="Initial AWS API requests/second per account, service and region",
+    )
+    scanner_service_rates: Dict[str, float] = Field(
+        default_factory=dict,
+        description='Per-service initial request rates, e.g. {"iam": 5.0}',
+    )
+
+    # Scan job queue
+    scan_queue_mode: Literal["database", "local"] = Field(
+        default="database",
+        description="'database' shares jobs across processes; 'local' is in-process",
+    )
+    scan_worker_concurrency: int = Field(
+        default=2,
+        ge=0,
+        description="Scan jobs run concurrently by this process (0 disables workers)",
+    )
+    scan_worker_poll_interval: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds an idle scan worker waits before polling for jobs",
+    )
+    scan_job_timeout_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="Running scan jobs without a heartbeat for this long are requeued",
+    )
+    scan_job_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Times a scan job may be claimed before it is failed",
+    )
+
+    # Findings summary counters
+    summary_reconcile_interval: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Seconds between summary counter reconciliations (0 disables)",
+    )
+
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8080
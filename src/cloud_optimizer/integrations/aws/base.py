@@ -2,12 +2,18 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import boto3
-from botocore.config import Config
 
 from cloud_optimizer.config import get_settings
+from cloud_optimizer.scanners.clients import get_client_cache
+from cloud_optimizer.scanners.rate_limit import (
+    RATE_LIMITED_CLIENT_CONFIG,
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,9 @@ class BaseAWSScanner(ABC):
         settings = get_settings()
         self.region = region or settings.aws_default_region
         self._session: Optional[boto3.Session] = session
+        # Set by the caller so API calls are rate limited per account
+        self.account_id: Optional[str] = None
+        self.rate_limiter: AdaptiveRateLimiter = get_rate_limiter()
 
     @property
     def session(self) -> boto3.Session:
@@ -59,8 +68,18 @@ class BaseAWSScanner(ABC):
         Returns:
             Configured boto3 client for the service
         """
-        config = Config(retries={"max_attempts": 3, "mode": "adaptive"})
-        return self.session.client(service_name, config=config)
+        return get_client_cache().get(
+            self.session,
+            service_name,
+            region=self.region,
+            config=RATE_LIMITED_CLIENT_CONFIG,
+            on_create=partial(
+                self.rate_limiter.instrument,
+                account_id=self.account_id,
+                service_name=service_name,
+                region=self.region,
+            ),
+        )
 
     @abstractmethod
     async def scan(self, account_id: str) -> List[Dict[str, Any]]:
@@ -75,6 +94,22 @@ class BaseAWSScanner(ABC):
         """
         pass
 
+    async def scan_iter(self, account_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield findings as they are produced.
+
+        The default implementation yields the output of ``scan()``; scanners
+        override it to stream findings while the scan is still running.
+
+        Args:
+            account_id: AWS account ID to scan
+
+        Yields:
+            Security findings as dictionaries
+        """
+        for finding in await self.scan(account_id):
+            yield finding
+
     @abstractmethod
     def get_scanner_name(self) -> str:
         """
@@ -11,6 +11,7 @@ from typing import Any, Dict, List
 from botocore.exceptions import ClientError
 
 from cloud_optimizer.integrations.aws.base import BaseAWSScanner
+from cloud_optimizer.scanners.metrics import MetricQuery, fetch_metric_data
 
 logger = logging.getLogger(__name__)
 
@@ -116,109 +117,106 @@ class CloudWatchScanner(BaseAWSScanner):
             response = ec2_client.describe_instances(
                 Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
             )
+            instances = [
+                instance
+                for reservation in response.get("Reservations", [])
+                for instance in reservation.get("Instances", [])
+            ]
+
+            # Fetch CPU, disk queue and network metrics for all instances at once
+            queries: Dict[str, Dict[str, MetricQuery]] = {}
+            for instance in instances:
+                dimensions = {"InstanceId": instance["InstanceId"]}
+                queries[instance["InstanceId"]] = {
+                    "cpu": MetricQuery.of(
+                        "AWS/EC2", "CPUUtilization", dimensions, "Average", 3600
+                    ),
+                    "disk_queue": MetricQuery.of(
+                        "AWS/EC2", "DiskQueueDepth", dimensions, "Average", 3600
+                    ),
+                    "network": MetricQuery.of(
+                        "AWS/EC2", "NetworkPacketsDropped", dimensions, "Sum", 3600
+                    ),
+                }
+            metrics = self._fetch_metrics(cloudwatch_client, queries, duration_hours=24)
+
+            for instance in instances:
+                instance_id = instance["InstanceId"]
+                instance_type = instance.get("InstanceType", "unknown")
+
+                # Get instance name from tags
+                instance_name = instance_id
+                for tag in instance.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        instance_name = tag["Value"]
+                        break
 
-            for reservation in response.get("Reservations", []):
-                for instance in reservation.get("Instances", []):
-                    instance_id = instance["InstanceId"]
-                    instance_type = instance.get("InstanceType", "unknown")
-
-                    # Get instance name from tags
-                    instance_name = instance_id
-                    for tag in instance.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            instance_name = tag["Value"]
-                            break
-
-                    # Check CPU utilization
-                    cpu_metrics = self._get_metric_statistics(
-                        cloudwatch_client,
-                        namespace="AWS/EC2",
-                        metric_name="CPUUtilization",
-                        dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                        statistic="Average",
-                        period=3600,  # 1 hour
-                        duration_hours=24,  # Last 24 hours
-                    )
+                # Check CPU utilization
+                cpu_metrics = metrics[instance_id]["cpu"]
 
-                    if cpu_metrics:
-                        avg_cpu = sum(cpu_metrics) / len(cpu_metrics)
-                        max_cpu = max(cpu_metrics)
+                if cpu_metrics:
+                    avg_cpu = sum(cpu_metrics) / len(cpu_metrics)
+                    max_cpu = max(cpu_metrics)
 
-                        if max_cpu >= self.CPU_CRITICAL_THRESHOLD:
-                            findings.append(
-                                self._create_cpu_bottleneck_finding(
-                                    resource_id=instance_id,
-                                    resource_name=instance_name,
-                                    instance_type=instance_type,
-                                    avg_cpu=avg_cpu,
-                                    max_cpu=max_cpu,
-                                    severity="critical",
-                                    account_id=account_id,
-                                )
+                    if max_cpu >= self.CPU_CRITICAL_THRESHOLD:
+                        findings.append(
+                            self._create_cpu_bottleneck_finding(
+                                resource_id=instance_id,
+                                resource_name=instance_name,
+                                instance_type=instance_type,
+                                avg_cpu=avg_cpu,
+                                max_cpu=max_cpu,
+                                severity="critical",
+                                account_id=account_id,
                             )
-                        elif avg_cpu >= self.CPU_HIGH_THRESHOLD:
-                            findings.append(
-                                self._create_cpu_bottleneck_finding(
-                                    resource_id=instance_id,
-                                    resource_name=instance_name,
-                                    instance_type=instance_type,
-                                    avg_cpu=avg_cpu,
-                                    max_cpu=max_cpu,
-                                    severity="high",
-                                    account_id=account_id,
-                                )
+                        )
+                    elif avg_cpu >= self.CPU_HIGH_THRESHOLD:
+                        findings.append(
+                            self._create_cpu_bottleneck_finding(
+                                resource_id=instance_id,
+                                resource_name=instance_name,
+                                instance_type=instance_type,
+                                avg_cpu=avg_cpu,
+                                max_cpu=max_cpu,
+                                severity="high",
+                                account_id=account_id,
                             )
+                        )
 
-                    # Check disk queue depth
-                    disk_queue_metrics = self._get_metric_statistics(
-                        cloudwatch_client,
-                        namespace="AWS/EC2",
-                        metric_name="DiskQueueDepth",
-                        dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                        statistic="Average",
-                        period=3600,
-                        duration_hours=24,
-                    )
+                # Check disk queue depth
+                disk_queue_metrics = metrics[instance_id]["disk_queue"]
 
-                    if disk_queue_metrics:
-                        avg_queue = sum(disk_queue_metrics) / len(disk_queue_metrics)
-                        max_queue = max(disk_queue_metrics)
+                if disk_queue_metrics:
+                    avg_queue = sum(disk_queue_metrics) / len(disk_queue_metrics)
+                    max_queue = max(disk_queue_metrics)
 
-                        if avg_queue >= self.DISK_QUEUE_THRESHOLD:
-                            findings.append(
-                                self._create_disk_queue_finding(
-                                    resource_id=instance_id,
-                                    resource_name=instance_name,
-                                    instance_type=instance_type,
-                                    avg_queue=avg_queue,
-                                    max_queue=max_queue,
-                                    account_id=account_id,
-                                )
+                    if avg_queue >= self.DISK_QUEUE_THRESHOLD:
+                        findings.append(
+                            self._create_disk_queue_finding(
+                                resource_id=instance_id,
+                                resource_name=instance_name,
+                                instance_type=instance_type,
+                                avg_queue=avg_queue,
+                                max_queue=max_queue,
+                                account_id=account_id,
                             )
+                        )
 
-                    # Check network errors
-                    network_error_metrics = self._get_metric_statistics(
-                        cloudwatch_client,
-                        namespace="AWS/EC2",
-                        metric_name="NetworkPacketsDropped",
-                        dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                        statistic="Sum",
-                        period=3600,
-                        duration_hours=24,
-                    )
+                # Check network errors
+                network_error_metrics = metrics[instance_id]["network"]
 
-                    if network_error_metrics:
-                        total_errors = sum(network_error_metrics)
-                        if total_errors >= self.NETWORK_ERROR_THRESHOLD:
-                            findings.append(
-                                self._create_network_issue_finding(
-                                    resource_id=instance_id,
-                                    resource_name=instance_name,
-                                    instance_type=instance_type,
-                                    total_errors=total_errors,
-                                    account_id=account_id,
-                                )
+                if network_error_metrics:
+                    total_errors = sum(network_error_metrics)
+                    if total_errors >= self.NETWORK_ERROR_THRESHOLD:
+                        findings.append(
+                            self._create_network_issue_finding(
+                                resource_id=instance_id,
+                                resource_name=instance_name,
+                                instance_type=instance_type,
+                                total_errors=total_errors,
+                                account_id=account_id,
                             )
+                        )
 
         except ClientError as e:
             logger.warning(f"Failed to check EC2 performance: {e}")
@@ -243,78 +241,68 @@ class CloudWatchScanner(BaseAWSScanner):
 
         try:
             # List all Lambda functions
+            functions: List[Dict[str, Any]] = []
             paginator = lambda_client.get_paginator("list_functions")
             for page in paginator.paginate():
-                for function in page.get("Functions", []):
-                    function_name = function["FunctionName"]
-                    memory_size = function.get("MemorySize", 128)
-                    timeout = function.get("Timeout", 3)
-
-                    # Check error rate
-                    error_metrics = self._get_metric_statistics(
-                        cloudwatch_client,
-                        namespace="AWS/Lambda",
-                        metric_name="Errors",
-                        dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                        statistic="Sum",
-                        period=3600,
-                        duration_hours=24,
+                functions.extend(page.get("Functions", []))
+
+            # Fetch error, invocation and throttle metrics for all functions
+            queries: Dict[str, Dict[str, MetricQuery]] = {}
+            for function in functions:
+                dimensions = {"FunctionName": function["FunctionName"]}
+                queries[function["FunctionName"]] = {
+                    metric: MetricQuery.of(
+                        "AWS/Lambda", metric, dimensions, "Sum", 3600
                     )
+                    for metric in ("Errors", "Invocations", "Throttles")
+                }
+            metrics = self._fetch_metrics(cloudwatch_client, queries, duration_hours=24)
 
-                    invocation_metrics = self._get_metric_statistics(
-                        cloudwatch_client,
-                        namespace="AWS/Lambda",
-                        metric_name="Invocations",
-                        dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                        statistic="Sum",
-                        period=3600,
-                        duration_hours=24,
-                    )
+            for function in functions:
+                function_name = function["FunctionName"]
+                memory_size = function.get("MemorySize", 128)
+                timeout = function.get("Timeout", 3)
 
-                    if error_metrics and invocation_metrics:
-                        total_errors = sum(error_metrics)
-                        total_invocations = sum(invocation_metrics)
-
-                        if total_invocations > 0:
-                            error_rate = (total_errors / total_invocations) * 100
-
-                            if error_rate >= self.LAMBDA_ERROR_RATE_THRESHOLD:
-                                findings.append(
-                                    self._create_lambda_error_finding(
-                                        function_name=function_name,
-                                        error_rate=error_rate,
-                                        total_errors=total_errors,
-                                        total_invocations=total_invocations,
-                                        memory_size=memory_size,
-                                        timeout=timeout,
-                                        account_id=account_id,
-                                    )
-                                )
+                # Check error rate
+                error_metrics = metrics[function_name]["Errors"]
+                invocation_metrics = metrics[function_name]["Invocations"]
 
-                    # Check throttling
-                    throttle_metrics = self._get_metric_statistics(
-                        cloudwatch_client,
-                        namespace="AWS/Lambda",
-                        metric_name="Throttles",
-                        dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                        statistic="Sum",
-                        period=3600,
-                        duration_hours=24,
-                    )
+                if error_metrics and invocation_metrics:
+                    total_errors = sum(error_metrics)
+                    total_invocations = sum(invocation_metrics)
+
+                    if total_invocations > 0:
+                        error_rate = (total_errors / total_invocations) * 100
 
-                    if throttle_metrics:
-                        total_throttles = sum(throttle_metrics)
-                        if total_throttles >= self.LAMBDA_THROTTLE_THRESHOLD:
+                        if error_rate >= self.LAMBDA_ERROR_RATE_THRESHOLD:
                             findings.append(
-                                self._create_lambda_throttle_finding(
+                                self._create_lambda_error_finding(
                                     function_name=function_name,
-                                    total_throttles=total_throttles,
+                                    error_rate=error_rate,
+                                    total_errors=total_errors,
+                                    total_invocations=total_invocations,
                                     memory_size=memory_size,
                                     timeout=timeout,
                                     account_id=account_id,
                                 )
                             )
 
+                # Check throttling
+                throttle_metrics = metrics[function_name]["Throttles"]
+
+                if throttle_metrics:
+                    total_throttles = sum(throttle_metrics)
+                    if total_throttles >= self.LAMBDA_THROTTLE_THRESHOLD:
+                        findings.append(
+                            self._create_lambda_throttle_finding(
+                                function_name=function_name,
+                                total_throttles=total_throttles,
+                                memory_size=memory_size,
+                                timeout=timeout,
+                                account_id=account_id,
+                            )
+                        )
+
         except ClientError as e:
             logger.warning(f"Failed to check Lambda performance: {e}")
 
@@ -339,24 +327,29 @@ class CloudWatchScanner(BaseAWSScanner):
         try:
             # Get all RDS instances
             response = rds_client.describe_db_instances()
+            db_instances = response.get("DBInstances", [])
+
+            # Fetch CPU and connection metrics for all instances at once
+            queries: Dict[str, Dict[str, MetricQuery]] = {}
+            for db_instance in db_instances:
+                dimensions = {
+                    "DBInstanceIdentifier": db_instance["DBInstanceIdentifier"]
+                }
+                queries[db_instance["DBInstanceIdentifier"]] = {
+                    metric: MetricQuery.of(
+                        "AWS/RDS", metric, dimensions, "Average", 3600
+                    )
+                    for metric in ("CPUUtilization", "DatabaseConnections")
+                }
+            metrics = self._fetch_metrics(cloudwatch_client, queries, duration_hours=24)
 
-            for db_instance in response.get("DBInstances", []):
+            for db_instance in db_instances:
                 db_identifier = db_instance["DBInstanceIdentifier"]
                 db_class = db_instance.get("DBInstanceClass", "unknown")
                 engine = db_instance.get("Engine", "unknown")
 
                 # Check CPU utilization
-                cpu_metrics = self._get_metric_statistics(
-                    cloudwatch_client,
-                    namespace="AWS/RDS",
-                    metric_name="CPUUtilization",
-                    dimensions=[
-                        {"Name": "DBInstanceIdentifier", "Value": db_identifier}
-                    ],
-                    statistic="Average",
-                    period=3600,
-                    duration_hours=24,
-                )
+                cpu_metrics = metrics[db_identifier]["CPUUtilization"]
 
                 if cpu_metrics:
                     avg_cpu = sum(cpu_metrics) / len(cpu_metrics)
@@ -375,17 +368,7 @@ class CloudWatchScanner(BaseAWSScanner):
                         )
 
                 # Check database connections
-                connection_metrics = self._get_metric_statistics(
-                    cloudwatch_client,
-                    namespace="AWS/RDS",
-                    metric_name="DatabaseConnections",
-                    dimensions=[
-                        {"Name": "DBInstanceIdentifier", "Value": db_identifier}
-                    ],
-                    statistic="Average",
-                    period=3600,
-                    duration_hours=24,
-                )
+                connection_metrics = metrics[db_identifier]["DatabaseConnections"]
 
                 if connection_metrics:
                     # Estimate max connections based on instance class
@@ -412,51 +395,36 @@ class CloudWatchScanner(BaseAWSScanner):
 
         return findings
 
-    def _get_metric_statistics(
+    def _fetch_metrics(
         self,
         cloudwatch_client: Any,
-        namespace: str,
-        metric_name: str,
-        dimensions: List[Dict[str, str]],
-        statistic: str,
-        period: int,
+        queries: Dict[str, Dict[str, MetricQuery]],
         duration_hours: int,
-    ) -> List[float]:
+    ) -> Dict[str, Dict[str, List[float]]]:
         """
-        Get CloudWatch metric statistics.
+        Get CloudWatch metric values for many resources in batched requests.
 
         Args:
             cloudwatch_client: Boto3 CloudWatch client
-            namespace: CloudWatch namespace
-            metric_name: Metric name
-            dimensions: Metric dimensions
-            statistic: Statistic type (Average, Sum, Maximum, etc.)
-            period: Period in seconds
+            queries: Metric queries by resource ID and metric key
             duration_hours: Duration to look back in hours
 
         Returns:
-            List of metric values
+            Metric values by resource ID and metric key
         """
-        try:
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(hours=duration_hours)
-
-            response = cloudwatch_client.get_metric_statistics(
-                Namespace=namespace,
-                MetricName=metric_name,
-                Dimensions=dimensions,
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=period,
-                Statistics=[statistic],
-            )
-
-            datapoints = response.get("Datapoints", [])
-            return [dp[statistic] for dp in datapoints if statistic in dp]
-
-        except ClientError as e:
-            logger.debug(f"Failed to get metric {metric_name}: {e}")
-            return []
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(hours=duration_hours)
+
+        values = fetch_metric_data(
+            cloudwatch_client,
+            [query for by_key in queries.values() for query in by_key.values()],
+            start_time,
+            end_time,
+        )
+        return {
+            resource_id: {key: values.get(query, []) for key, query in by_key.items()}
+            for resource_id, by_key in queries.items()
+        }
 
     def _estimate_rds_max_connections(self, db_class: str) -> int:
         """
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from botocore.exceptions import ClientError
 
@@ -21,7 +21,10 @@ class S3SecurityScanner(BaseAWSScanner):
 
     async def scan(self, account_id: str) -> List[Dict[str, Any]]:
         """Scan S3 buckets for common misconfigurations."""
-        findings: List[Dict[str, Any]] = []
+        return [finding async for finding in self.scan_iter(account_id)]
+
+    async def scan_iter(self, account_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield S3 findings bucket by bucket."""
         s3 = self.get_client("s3")
 
         try:
@@ -32,9 +35,8 @@ class S3SecurityScanner(BaseAWSScanner):
 
         for bucket in response.get("Buckets", []):
             bucket_name = bucket["Name"]
-            findings.extend(self._check_bucket(bucket_name, account_id, s3))
-
-        return findings
+            for finding in self._check_bucket(bucket_name, account_id, s3):
+                yield finding
 
     def _check_bucket(
         self,
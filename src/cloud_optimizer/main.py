@@ -80,11 +80,50 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.error("metering_service_start_failed", error=str(e))
         app.state.metering_service = None
 
+    # Start background scan workers
+    scan_worker_pool = None
+    if settings.scan_worker_concurrency > 0:
+        from cloud_optimizer.services.scan_queue import get_scan_worker_pool
+
+        try:
+            worker_pool = get_scan_worker_pool()
+            await worker_pool.start()
+            scan_worker_pool = worker_pool
+            logger.info(
+                "scan_workers_started",
+                concurrency=worker_pool.concurrency,
+                queue_mode=settings.scan_queue_mode,
+            )
+        except Exception as e:
+            logger.error("scan_workers_start_failed", error=str(e))
+    app.state.scan_worker_pool = scan_worker_pool
+
+    # Periodically repair drift in the findings summary counters
+    summary_reconciler = None
+    if settings.summary_reconcile_interval > 0:
+        from cloud_optimizer.services.finding_summary import get_summary_reconciler
+
+        try:
+            reconciler = get_summary_reconciler()
+            await reconciler.start(settings.summary_reconcile_interval)
+            summary_reconciler = reconciler
+        except Exception as e:
+            logger.error("summary_reconciler_start_failed", error=str(e))
+    app.state.summary_reconciler = summary_reconciler
+
     yield
 
     # Shutdown
     logger.info("shutting_down_cloud_optimizer")
 
+    if summary_reconciler is not None:
+        await summary_reconciler.stop()
+
+    # Stop scan workers before the scanner executor goes away
+    if scan_worker_pool is not None:
+        await scan_worker_pool.stop()
+        logger.info("scan_workers_stopped")
+
     # Stop metering service and flush remaining records
     if hasattr(app.state, "metering_service") and app.state.metering_service:
         try:
@@ -97,6 +136,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await app.state.ib_service.disconnect()
         logger.info("ib_service_disconnected")
 
+    # Release scanner worker threads
+    from cloud_optimizer.scanners.executor import shutdown_scanner_executor
+
+    shutdown_scanner_executor(wait=False)
+    logger.info("scanner_executor_stopped")
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -8,7 +8,14 @@ from cloud_optimizer.models.compliance import (
 )
 from cloud_optimizer.models.cost_finding import CostCategory, CostFinding, CostSummary
 from cloud_optimizer.models.finding import Finding, FindingSeverity, FindingStatus, FindingType
+from cloud_optimizer.models.finding_summary import FindingSummaryCounter
+from cloud_optimizer.models.resource_fingerprint import ResourceFingerprint
+from cloud_optimizer.models.scan_checkpoint import ScanCheckpoint
 from cloud_optimizer.models.scan_job import ScanJob, ScanStatus, ScanType
+from cloud_optimizer.models.security_score import (
+    SecurityScoreRollup,
+    SecurityScoreSnapshot,
+)
 from cloud_optimizer.models.session import Session
 from cloud_optimizer.models.trial import Trial, TrialUsage
 from cloud_optimizer.models.user import User
@@ -28,6 +35,11 @@ __all__ = [
     "FindingSeverity",
     "FindingStatus",
     "FindingType",
+    "FindingSummaryCounter",
+    "ResourceFingerprint",
+    "ScanCheckpoint",
+    "SecurityScoreRollup",
+    "SecurityScoreSnapshot",
     "CostFinding",
     "CostSummary",
     "CostCategory",
@@ -9,7 +9,17 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum as SQLEnum, Float, ForeignKey, Index, String, Text, func
+from sqlalchemy import (
+    DateTime,
+    Enum as SQLEnum,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -162,6 +172,32 @@ class Finding(Base):
             "resource_id",
             "status",
         ),
+        # At most one open finding per (account, rule, resource); this is the
+        # conflict target for bulk ingest upserts.
+        Index(
+            "uq_finding_open_dedup",
+            "aws_account_id",
+            "rule_id",
+            "resource_id",
+            unique=True,
+            postgresql_where=text("status = 'OPEN'"),
+            sqlite_where=text("status = 'OPEN'"),
+        ),
+        # Keyset pagination of an account's findings, newest first
+        Index(
+            "ix_findings_account_first_seen",
+            "aws_account_id",
+            "first_seen_at",
+            "finding_id",
+        ),
+        # Same listing filtered by status (e.g. open findings only)
+        Index(
+            "ix_findings_account_status_first_seen",
+            "aws_account_id",
+            "status",
+            "first_seen_at",
+            "finding_id",
+        ),
     )
 
     # Relationships
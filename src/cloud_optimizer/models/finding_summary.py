@@ -0,0 +1,44 @@
+"""Materialized findings summary counters."""
+
+from uuid import UUID
+
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cloud_optimizer.database import Base
+from cloud_optimizer.models.finding import FindingSeverity, FindingStatus
+
+
+class FindingSummaryCounter(Base):
+    """Number of findings of an account with one combination of attributes.
+
+    Rows with ``framework`` set to ``ALL_FINDINGS`` count every finding once;
+    other rows count the findings tagged with that compliance framework.
+    Counters are updated in the same transaction as the findings they count.
+    """
+
+    __tablename__ = "finding_summary_counters"
+
+    aws_account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("aws_accounts.account_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    severity: Mapped[FindingSeverity] = mapped_column(
+        SQLEnum(FindingSeverity, name="finding_severity"), primary_key=True
+    )
+    status: Mapped[FindingStatus] = mapped_column(
+        SQLEnum(FindingStatus, name="finding_status"), primary_key=True
+    )
+    service: Mapped[str] = mapped_column(String(100), primary_key=True)
+    framework: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """String representation of counter."""
+        return (
+            f"<FindingSummaryCounter {self.aws_account_id}:{self.severity.value}:"
+            f"{self.status.value}:{self.service}:{self.framework} = {self.count}>"
+        )
@@ -0,0 +1,35 @@
+"""Resource fingerprint model for incremental scanning."""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cloud_optimizer.database import Base
+
+
+class ResourceFingerprint(Base):
+    """Configuration hash and last results for one scanned resource.
+
+    Keyed by AWS account, scanner and resource so the next scan of the account
+    can skip resources whose configuration has not changed.
+    """
+
+    __tablename__ = "resource_fingerprints"
+
+    account_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    scanner: Mapped[str] = mapped_column(String(100), primary_key=True)
+    resource_id: Mapped[str] = mapped_column(String(500), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    results: Mapped[List[Dict[str, Any]]] = mapped_column(
+        JSONB, nullable=False, default=list
+    )
+    evaluated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        """String representation of fingerprint."""
+        return f"<ResourceFingerprint {self.scanner}:{self.resource_id}>"
@@ -0,0 +1,42 @@
+"""Scan checkpoint model for resumable multi-account scans."""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cloud_optimizer.database import Base
+
+
+class ScanCheckpoint(Base):
+    """Results of one completed (account, scanner, region) scan unit.
+
+    Keyed by scan ID so an interrupted multi-account scan can skip the units
+    it already finished when it is resumed.
+    """
+
+    __tablename__ = "scan_checkpoints"
+
+    scan_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    account_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    scanner: Mapped[str] = mapped_column(String(100), primary_key=True)
+    region: Mapped[str] = mapped_column(String(30), primary_key=True)
+    findings: Mapped[List[Dict[str, Any]]] = mapped_column(
+        JSONB, nullable=False, default=list
+    )
+    streamed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    streamed_by_severity: Mapped[Dict[str, int]] = mapped_column(
+        JSONB, nullable=False, default=dict
+    )
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        """String representation of checkpoint."""
+        return (
+            f"<ScanCheckpoint {self.scan_id}:{self.account_id}:"
+            f"{self.scanner}:{self.region}>"
+        )
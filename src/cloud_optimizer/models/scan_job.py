@@ -9,7 +9,16 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    DateTime,
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -75,6 +84,20 @@ class ScanJob(Base):
         nullable=False,
         default=list,
     )
+    region: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+    )
+    worker_id: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
     progress: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -93,6 +116,10 @@ class ScanJob(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
@@ -103,6 +130,15 @@ class ScanJob(Base):
         server_default=func.now(),
     )
 
+    # Workers claim the oldest pending job first
+    __table_args__ = (
+        Index(
+            "idx_scan_jobs_pending",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
     # Relationships
     user: Mapped["User"] = relationship("User")
     aws_account: Mapped["AWSAccount"] = relationship(
@@ -0,0 +1,67 @@
+"""Security score history models for dashboard trends."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cloud_optimizer.database import Base
+
+
+class SecurityScoreSnapshot(Base):
+    """Security score of an account, or the organization, after one scan.
+
+    ``scope`` is an AWS account ID or ``ORG_SCOPE`` for organization-wide
+    snapshots.
+    """
+
+    __tablename__ = "security_score_snapshots"
+    __table_args__ = (Index("ix_security_score_snapshots_recorded_at", "recorded_at"),)
+
+    scope: Mapped[str] = mapped_column(String(20), primary_key=True)
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    findings_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    critical_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    high_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    medium_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    low_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """String representation of snapshot."""
+        return f"<SecurityScoreSnapshot {self.scope}@{self.recorded_at}: {self.score}>"
+
+
+class SecurityScoreRollup(Base):
+    """Score snapshots of one scope rolled up per day or week.
+
+    Updated incrementally whenever snapshots are recorded, so trend queries
+    read one row per bucket.
+    """
+
+    __tablename__ = "security_score_rollups"
+
+    scope: Mapped[str] = mapped_column(String(20), primary_key=True)
+    period: Mapped[str] = mapped_column(String(10), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    samples: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    score_min: Mapped[float] = mapped_column(Float, nullable=False)
+    score_max: Mapped[float] = mapped_column(Float, nullable=False)
+    last_recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    last_score: Mapped[float] = mapped_column(Float, nullable=False)
+    findings_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    critical_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """String representation of rollup."""
+        return (
+            f"<SecurityScoreRollup {self.scope}:{self.period}:"
+            f"{self.bucket_start.date()}>"
+        )
@@ -10,7 +10,13 @@ This module provides AWS security scanning capabilities including:
 
 # Issue #134: API Gateway scanner
 from cloud_optimizer.scanners.apigateway_scanner import APIGatewayScanner
-from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.base import (
+    AccountContext,
+    BaseScanner,
+    ScannerRule,
+    ScanResult,
+)
+from cloud_optimizer.scanners.clients import ClientCache, get_client_cache
 
 # Issue #140: CloudFront scanner
 from cloud_optimizer.scanners.cloudfront_scanner import CloudFrontScanner
@@ -22,9 +28,11 @@ from cloud_optimizer.scanners.cost import CostScanner
 # Issue #148: Cross-account role assumption
 from cloud_optimizer.scanners.cross_account import (
     AssumedRoleCredentials,
+    CredentialBroker,
     CredentialCache,
     CrossAccountRoleManager,
     get_cloudformation_template,
+    get_credential_broker,
     get_terraform_template,
 )
 
@@ -41,7 +49,15 @@ from cloud_optimizer.scanners.custom_rules import (
     get_example_rules,
 )
 from cloud_optimizer.scanners.ec2 import EC2Scanner
+from cloud_optimizer.scanners.executor import (
+    ScannerExecutor,
+    ServiceBoundedClient,
+    get_scanner_executor,
+    shutdown_scanner_executor,
+)
+from cloud_optimizer.scanners.fanout import UnitTiming, WorkUnit
 from cloud_optimizer.scanners.iam import IAMScanner
+from cloud_optimizer.scanners.iam_cache import IAMPolicyCache
 from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
 
 # Issue #147: Multi-account scanning support
@@ -53,6 +69,10 @@ from cloud_optimizer.scanners.multi_account import (
     AWSAccount,
     MultiAccountScanner,
 )
+from cloud_optimizer.scanners.rate_limit import (
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+)
 from cloud_optimizer.scanners.rds import RDSScanner
 from cloud_optimizer.scanners.registry import ScannerRegistry
 from cloud_optimizer.scanners.s3 import S3Scanner
@@ -62,6 +82,7 @@ from cloud_optimizer.scanners.secrets_scanner import SecretsScanner
 
 __all__ = [
     # Base classes
+    "AccountContext",
     "BaseScanner",
     "ScanResult",
     "ScannerRule",
@@ -78,6 +99,18 @@ __all__ = [
     "SecretsScanner",
     # Registry
     "ScannerRegistry",
+    # Execution
+    "ScannerExecutor",
+    "ServiceBoundedClient",
+    "get_scanner_executor",
+    "shutdown_scanner_executor",
+    "UnitTiming",
+    "WorkUnit",
+    "IAMPolicyCache",
+    "ClientCache",
+    "get_client_cache",
+    "AdaptiveRateLimiter",
+    "get_rate_limiter",
     # Multi-account
     "AccountRegistry",
     "AccountScanResult",
@@ -87,9 +120,11 @@ __all__ = [
     "MultiAccountScanner",
     # Cross-account
     "AssumedRoleCredentials",
+    "CredentialBroker",
     "CredentialCache",
     "CrossAccountRoleManager",
     "get_cloudformation_template",
+    "get_credential_broker",
     "get_terraform_template",
     # Custom rules
     "CustomRule",
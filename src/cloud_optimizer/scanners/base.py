@@ -1,12 +1,44 @@
 """Base scanner classes for AWS security scanning."""
 
+import asyncio
 import logging
+import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import aclosing
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 import boto3
-from botocore.config import Config
+
+from cloud_optimizer.scanners.clients import get_client_cache
+from cloud_optimizer.scanners.executor import ScannerExecutor, run_coroutine_in_thread
+from cloud_optimizer.scanners.fanout import UnitTiming, WorkUnit, summarize_timings
+from cloud_optimizer.scanners.iam_cache import IAMPolicyCache
+from cloud_optimizer.scanners.rate_limit import (
+    DEFAULT_ACCOUNT,
+    RATE_LIMITED_CLIENT_CONFIG,
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+)
+from cloud_optimizer.scanners.streaming import DEFAULT_STREAM_CHUNK_SIZE, achunked
+
+if TYPE_CHECKING:
+    from cloud_optimizer.scanners.fingerprint import FingerprintSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -27,34 +59,210 @@ class ScannerRule:
     documentation_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class AccountContext:
+    """Account a finding belongs to, shared by all of the account's findings.
+
+    Attributes:
+        account_id: AWS account ID
+        account_name: Account friendly name
+        environment: Account environment (prod, staging, ...)
+    """
+
+    account_id: str
+    account_name: str
+    environment: str
+
+    def as_evidence(self) -> Dict[str, str]:
+        """Get the context as evidence entries."""
+        return {
+            "account_id": self.account_id,
+            "account_name": self.account_name,
+            "environment": self.environment,
+        }
+
+
 class ScanResult:
-    """Result of scanning a single resource."""
+    """Result of scanning a single resource.
 
-    rule_id: str
-    passed: bool
-    resource_id: str
-    resource_arn: Optional[str] = None
-    region: str = "us-east-1"
-    evidence: Dict[str, Any] = field(default_factory=dict)
-    potential_savings: Optional[float] = None
+    Organization scans hold millions of these, so the class is slotted and
+    avoids per-finding copies: rule IDs and regions are interned, the
+    evidence dict is only allocated once there is evidence, and account
+    context is a reference to one ``AccountContext`` per account that
+    ``evidence`` exposes alongside the finding's own entries.
+    """
+
+    __slots__ = (
+        "rule_id",
+        "passed",
+        "resource_id",
+        "resource_arn",
+        "region",
+        "potential_savings",
+        "context",
+        "_evidence",
+    )
+
+    def __init__(
+        self,
+        rule_id: str,
+        passed: bool,
+        resource_id: str,
+        resource_arn: Optional[str] = None,
+        region: str = "us-east-1",
+        evidence: Optional[Dict[str, Any]] = None,
+        potential_savings: Optional[float] = None,
+        context: Optional[AccountContext] = None,
+    ) -> None:
+        """
+        Initialize scan result.
+
+        Args:
+            rule_id: ID of the evaluated rule
+            passed: Whether the resource passed the rule
+            resource_id: ARN or ID of the resource
+            resource_arn: ARN of the resource, if known
+            region: AWS region
+            evidence: Details supporting the result
+            potential_savings: Estimated monthly savings, if any
+            context: Account the finding belongs to
+        """
+        self.rule_id = sys.intern(rule_id)
+        self.passed = passed
+        self.resource_id = resource_id
+        self.resource_arn = resource_arn
+        self.region = sys.intern(region) if region else region
+        self.potential_savings = potential_savings
+        self.context = context
+        self._evidence = evidence or None
+
+    @property
+    def evidence(self) -> Mapping[str, Any]:
+        """Get a read-only view of the evidence, including account context entries.
+
+        Writes to the returned mapping raise ``TypeError``; use ``set_evidence``
+        to record evidence and ``get_evidence`` for single reads.
+        """
+        evidence = dict(self._evidence) if self._evidence else {}
+        if self.context is not None:
+            for key, value in self.context.as_evidence().items():
+                evidence.setdefault(key, value)
+        return MappingProxyType(evidence)
+
+    @evidence.setter
+    def evidence(self, value: Dict[str, Any]) -> None:
+        self._evidence = value or None
+
+    def get_evidence(self, key: str, default: Any = None) -> Any:
+        """Read one evidence entry without allocating anything.
+
+        Args:
+            key: Evidence key
+            default: Value returned when the key is missing
+
+        Returns:
+            The entry from the finding's evidence or its account context
+        """
+        if self._evidence is not None and key in self._evidence:
+            return self._evidence[key]
+        if self.context is not None and key in _CONTEXT_KEYS:
+            return getattr(self.context, key)
+        return default
+
+    def set_evidence(self, key: str, value: Any) -> None:
+        """Record one evidence entry, allocating the dict on first write.
+
+        Args:
+            key: Evidence key
+            value: Value to store
+        """
+        if self._evidence is None:
+            self._evidence = {}
+        self._evidence[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result with its full evidence (context included)."""
+        return {
+            "rule_id": self.rule_id,
+            "passed": self.passed,
+            "resource_id": self.resource_id,
+            "resource_arn": self.resource_arn,
+            "region": self.region,
+            "evidence": dict(self.evidence),
+            "potential_savings": self.potential_savings,
+        }
+
+    def to_storage_dict(self) -> Dict[str, Any]:
+        """Serialize the result without its account context.
+
+        Stored results keep only the finding's own evidence; whoever loads them
+        attaches the account's current context again.
+        """
+        return {
+            "rule_id": self.rule_id,
+            "passed": self.passed,
+            "resource_id": self.resource_id,
+            "resource_arn": self.resource_arn,
+            "region": self.region,
+            "evidence": dict(self._evidence) if self._evidence else {},
+            "potential_savings": self.potential_savings,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Compare results field by field, including evidence."""
+        if not isinstance(other, ScanResult):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Represent the result like a dataclass would."""
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"ScanResult({fields})"
+
+
+# Evidence keys served from a finding's AccountContext
+_CONTEXT_KEYS = frozenset({"account_id", "account_name", "environment"})
 
 
 class BaseScanner(ABC):
     """Abstract base class for service scanners."""
 
     SERVICE: str = "unknown"
+    # False for scanners of global services, which ignore ``regions``
+    REGIONAL: bool = True
+    # Maximum number of work units a single scan runs at once
+    MAX_CONCURRENT_UNITS: int = 8
+    # Resources per work unit when a scanner batches within a region
+    UNIT_BATCH_SIZE: int = 25
 
-    def __init__(self, session: boto3.Session, regions: Optional[List[str]] = None) -> None:
+    def __init__(
+        self,
+        session: boto3.Session,
+        regions: Optional[List[str]] = None,
+        executor: Optional[ScannerExecutor] = None,
+    ) -> None:
         """
         Initialize scanner.
 
         Args:
             session: Boto3 session with AWS credentials
             regions: List of AWS regions to scan (defaults to ["us-east-1"])
+            executor: Optional executor that runs the scan off the event loop
+                and caps concurrent API calls per service
         """
         self.session = session
         self.regions = regions or ["us-east-1"]
+        self.executor = executor
+        # Set by the caller so API calls are rate limited per account
+        self.account_id: Optional[str] = None
+        self.rate_limiter: AdaptiveRateLimiter = get_rate_limiter()
+        # Set by the caller to skip resources unchanged since the last scan
+        self.fingerprints: Optional["FingerprintSnapshot"] = None
+        # Replaced by the caller to share IAM lookups between scanners
+        self.iam_cache = IAMPolicyCache()
+        self.unit_timings: List[UnitTiming] = []
         self.rules: Dict[str, ScannerRule] = {}
         self._register_rules()
 
@@ -84,10 +292,22 @@ class BaseScanner(ABC):
         Returns:
             Configured boto3 client for the service
         """
-        config = Config(retries={"max_attempts": 3, "mode": "adaptive"})
-        if region:
-            return self.session.client(service_name, region_name=region, config=config)
-        return self.session.client(service_name, config=config)
+        client = get_client_cache().get(
+            self.session,
+            service_name,
+            region,
+            RATE_LIMITED_CLIENT_CONFIG,
+            on_create=partial(
+                self.rate_limiter.instrument,
+                account_id=self.account_id,
+                service_name=service_name,
+                region=region,
+            ),
+        )
+
+        if self.executor is not None:
+            return self.executor.wrap_client(client, service_name)
+        return client
 
     @abstractmethod
     async def scan(self) -> List[ScanResult]:
@@ -99,6 +319,216 @@ class BaseScanner(ABC):
         """
         pass
 
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        """
+        Yield findings as they are produced.
+
+        The default implementation yields the output of ``scan()``; scanners
+        that split work into units override it with ``fan_out_iter`` so
+        findings stream out while the rest of the scan is still running.
+
+        Yields:
+            Scan results (findings)
+        """
+        for result in await self.scan():
+            yield result
+
+    async def run(self) -> List[ScanResult]:
+        """
+        Run the scan without blocking the caller's event loop.
+
+        When an executor is attached, ``scan()`` is driven on one of its worker
+        threads; otherwise it is awaited directly.
+
+        Returns:
+            List of scan results (findings)
+        """
+        if self.executor is None:
+            return await self.scan()
+        return await self.executor.run(self)
+
+    async def stream(
+        self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> AsyncGenerator[List[ScanResult], None]:
+        """
+        Stream findings in bounded chunks without blocking the caller's loop.
+
+        When an executor is attached, ``scan_iter()`` is advanced one chunk at
+        a time on one of its worker threads; otherwise it is iterated directly.
+
+        Args:
+            chunk_size: Maximum findings per chunk
+
+        Yields:
+            Lists of at most ``chunk_size`` scan results
+        """
+        if self.executor is None:
+            chunks = achunked(self.scan_iter(), chunk_size)
+        else:
+            chunks = self.executor.stream(self.scan_iter, chunk_size=chunk_size)
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                yield chunk
+
+    async def fan_out(
+        self,
+        units: Sequence[WorkUnit],
+        worker: Callable[[WorkUnit], Awaitable[List[ScanResult]]],
+    ) -> List[ScanResult]:
+        """
+        Run work units concurrently and merge their results.
+
+        Each unit's coroutine is driven on its own thread because scanner code
+        calls boto3 synchronously. With an executor attached, units share its
+        unit pool and global API-call budget; otherwise they run on the default
+        thread pool. At most ``MAX_CONCURRENT_UNITS`` units of this scan are in
+        flight at once.
+
+        Results are merged in the order of ``units`` regardless of completion
+        order. A unit that raises is logged and contributes no results. Timing
+        for every unit is appended to ``unit_timings``.
+
+        Args:
+            units: Work units to run
+            worker: Coroutine function that scans a single unit
+
+        Returns:
+            Merged scan results
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UNITS)
+        per_unit = await asyncio.gather(
+            *(self._run_unit(unit, worker, semaphore) for unit in units)
+        )
+
+        results: List[ScanResult] = []
+        for unit_results in per_unit:
+            results.extend(unit_results)
+        return results
+
+    async def fan_out_iter(
+        self,
+        units: Sequence[WorkUnit],
+        worker: Callable[[WorkUnit], Awaitable[List[ScanResult]]],
+    ) -> AsyncIterator[ScanResult]:
+        """
+        Run work units concurrently and yield results as each unit finishes.
+
+        Streaming counterpart of ``fan_out``: units run under the same
+        concurrency bound and are timed the same way, but a unit's results are
+        yielded as soon as it completes instead of being merged at the end.
+        Units still running when the consumer stops iterating are cancelled.
+
+        Args:
+            units: Work units to run
+            worker: Coroutine function that scans a single unit
+
+        Yields:
+            Scan results in unit completion order
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UNITS)
+        tasks = [
+            asyncio.ensure_future(self._run_unit(unit, worker, semaphore))
+            for unit in units
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_unit(
+        self,
+        unit: WorkUnit,
+        worker: Callable[[WorkUnit], Awaitable[List[ScanResult]]],
+        semaphore: asyncio.Semaphore,
+    ) -> List[ScanResult]:
+        """Run one work unit under ``semaphore`` and record its timing."""
+        scanner_name = type(self).__name__
+        async with semaphore:
+            start = time.perf_counter()
+            error: Optional[str] = None
+            unit_results: List[ScanResult] = []
+            try:
+                if self.executor is not None:
+                    unit_results = await self.executor.run_unit(worker, unit)
+                else:
+                    unit_results = await asyncio.to_thread(
+                        run_coroutine_in_thread, worker, (unit,)
+                    )
+            except Exception as e:
+                error = str(e)
+                logger.error(f"{scanner_name} unit {unit.label} failed: {e}")
+
+            timing = UnitTiming(
+                scanner=scanner_name,
+                region=unit.region,
+                service=unit.service,
+                batch_index=unit.batch_index,
+                label=unit.label or unit.region,
+                item_count=len(unit.items),
+                duration_seconds=time.perf_counter() - start,
+                result_count=len(unit_results),
+                error=error,
+            )
+            self.unit_timings.append(timing)
+            logger.debug(
+                f"{scanner_name} unit {timing.label} finished in "
+                f"{timing.duration_seconds:.3f}s with {timing.result_count} results"
+            )
+            return unit_results
+
+    async def evaluate_incremental(
+        self,
+        resource_id: str,
+        config: Any,
+        evaluate: Callable[[], Awaitable[List[ScanResult]]],
+    ) -> List[ScanResult]:
+        """
+        Evaluate a resource unless its configuration is unchanged.
+
+        With a fingerprint snapshot attached, ``config`` is hashed and compared
+        with the previous scan; an unchanged resource carries its previous
+        results forward without calling ``evaluate``. Without a snapshot the
+        resource is always evaluated.
+
+        Args:
+            resource_id: Resource identifier (ARN or name)
+            config: Configuration the evaluation depends on
+            evaluate: Coroutine function that evaluates the resource
+
+        Returns:
+            Results for the resource
+        """
+        snapshot = self.fingerprints
+        if snapshot is None:
+            return await evaluate()
+
+        fingerprint = snapshot.fingerprint_of(config)
+        carried = snapshot.carry_forward(resource_id, fingerprint)
+        if carried is not None:
+            return carried
+
+        results = await evaluate()
+        snapshot.record(resource_id, fingerprint, results)
+        return results
+
+    def get_timing_report(self) -> Dict[str, Any]:
+        """
+        Summarize per-unit timings recorded by ``fan_out``.
+
+        Returns:
+            Per-region durations and the slowest unit for this scanner, plus
+            the rate limit stats of the scanned account
+        """
+        report = summarize_timings(self.unit_timings)
+        report["scanner"] = type(self).__name__
+        report["rate_limits"] = self.rate_limiter.get_stats(
+            self.account_id or DEFAULT_ACCOUNT
+        )
+        return report
+
     def get_rules(self) -> Dict[str, ScannerRule]:
         """Get all registered rules."""
         return self.rules
@@ -129,5 +559,5 @@ class BaseScanner(ABC):
             resource_id=resource_id,
             resource_arn=resource_id if resource_id.startswith("arn:") else None,
             region=region,
-            evidence=metadata or {},
+            evidence=metadata,
         )
@@ -0,0 +1,109 @@
+"""Checkpoints for resumable multi-account scans.
+
+``MultiAccountScanner`` splits an account scan into units of one scanner and
+one region (global scanners form a single ``GLOBAL_REGION`` unit). When a unit
+finishes, its findings (or, when findings are streamed to a sink, their
+counts) are written to a ``CheckpointStore`` under the scan's ID. Running the
+scan again with the same ID skips every checkpointed unit and merges its
+stored results, so a crash or deploy during a long organization scan only
+costs the units that were in flight.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from cloud_optimizer.scanners.base import ScanResult
+
+# Region recorded for scanners of global services
+GLOBAL_REGION = "global"
+
+# Checkpoint key within one account scan: (scanner, region)
+UnitKey = Tuple[str, str]
+
+
+@dataclass
+class UnitCheckpoint:
+    """Outcome of one completed (account, scanner, region) unit.
+
+    Attributes:
+        scan_id: Scan the unit belongs to
+        account_id: AWS account ID
+        scanner: Scanner class name
+        region: AWS region, or ``GLOBAL_REGION``
+        findings: Findings kept in memory by the scan
+        streamed_count: Findings handed to a result sink
+        streamed_by_severity: Failed streamed findings counted by severity
+        completed_at: When the unit finished
+    """
+
+    scan_id: str
+    account_id: str
+    scanner: str
+    region: str
+    findings: List[ScanResult] = field(default_factory=list)
+    streamed_count: int = 0
+    streamed_by_severity: Dict[str, int] = field(default_factory=dict)
+    completed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def key(self) -> UnitKey:
+        """Get the unit's key within its account scan."""
+        return (self.scanner, self.region)
+
+
+class CheckpointStore(ABC):
+    """Durable storage for scan unit checkpoints."""
+
+    @abstractmethod
+    async def load(self, scan_id: str, account_id: str) -> List[UnitCheckpoint]:
+        """Load the completed units of an account scan.
+
+        Args:
+            scan_id: Scan ID
+            account_id: AWS account ID
+
+        Returns:
+            Checkpoints of completed units
+        """
+
+    @abstractmethod
+    async def save(self, checkpoint: UnitCheckpoint) -> None:
+        """Persist a completed unit.
+
+        Args:
+            checkpoint: Checkpoint to store
+        """
+
+    @abstractmethod
+    async def delete(self, scan_id: str) -> None:
+        """Drop every checkpoint of a scan.
+
+        Args:
+            scan_id: Scan ID
+        """
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Process-local checkpoint store."""
+
+    def __init__(self) -> None:
+        """Initialize store."""
+        self._checkpoints: Dict[Tuple[str, str], Dict[UnitKey, UnitCheckpoint]] = {}
+
+    async def load(self, scan_id: str, account_id: str) -> List[UnitCheckpoint]:
+        """Load the completed units of an account scan."""
+        return list(self._checkpoints.get((scan_id, account_id), {}).values())
+
+    async def save(self, checkpoint: UnitCheckpoint) -> None:
+        """Store a completed unit, replacing any earlier one."""
+        units = self._checkpoints.setdefault(
+            (checkpoint.scan_id, checkpoint.account_id), {}
+        )
+        units[checkpoint.key] = checkpoint
+
+    async def delete(self, scan_id: str) -> None:
+        """Drop every checkpoint of a scan."""
+        for key in [key for key in self._checkpoints if key[0] == scan_id]:
+            del self._checkpoints[key]
@@ -0,0 +1,128 @@
+"""Reusable boto3 clients.
+
+Creating a boto3 client loads and parses the service model, builds an
+endpoint resolver and opens a new HTTP connection pool, which costs tens of
+milliseconds and a few MB per call. Scanners ask for clients inside region
+loops, so ``ClientCache`` keeps one client per (session, service, region,
+config) and hands it out again. Clients are thread-safe, so one cached client
+serves every worker thread scanning that region, and its connection pool is
+reused across calls.
+
+Sessions that go through the cache also share one botocore data loader, so
+service models and endpoint data are parsed once per process rather than
+once per session (multi-account scans create a session per account).
+"""
+
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import boto3
+from botocore.loaders import Loader, create_loader
+
+# Cache key within one session: (service, region, config)
+ClientKey = Tuple[str, Optional[str], Hashable]
+
+
+class _SessionClients:
+    """Clients created from one session."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.clients: Dict[ClientKey, Any] = {}
+
+
+class ClientCache:
+    """Process-wide cache of boto3 clients.
+
+    Entries are held per session and dropped when the session is garbage
+    collected, so caching never keeps an account's credentials alive.
+    """
+
+    def __init__(self) -> None:
+        """Initialize cache."""
+        self._sessions: weakref.WeakKeyDictionary[boto3.Session, _SessionClients]
+        self._sessions = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._loader: Optional[Loader] = None
+        self.created = 0
+        self.reused = 0
+
+    def _session_clients(self, session: boto3.Session) -> _SessionClients:
+        with self._lock:
+            entry = self._sessions.get(session)
+            if entry is None:
+                entry = _SessionClients()
+                self._sessions[session] = entry
+                self._share_loader(session)
+            return entry
+
+    def _share_loader(self, session: boto3.Session) -> None:
+        # Sessions from boto3 wrap a botocore session; mocks do not
+        botocore_session = getattr(session, "_session", None)
+        if botocore_session is None or not hasattr(
+            botocore_session, "register_component"
+        ):
+            return
+        if self._loader is None:
+            self._loader = create_loader()
+        botocore_session.register_component("data_loader", self._loader)
+
+    def get(
+        self,
+        session: boto3.Session,
+        service_name: str,
+        region: Optional[str] = None,
+        config: Optional[Any] = None,
+        on_create: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        """Get a client, creating it on first use.
+
+        Args:
+            session: Session that owns the credentials
+            service_name: AWS service name
+            region: Region (None uses the session's region)
+            config: botocore Config; configs compare by identity, so pass a
+                shared instance
+            on_create: Called once with each newly created client, e.g. to
+                register event hooks
+
+        Returns:
+            Cached boto3 client
+        """
+        entry = self._session_clients(session)
+        key: ClientKey = (service_name, region, config)
+
+        with entry.lock:
+            client = entry.clients.get(key)
+            if client is not None:
+                self.reused += 1
+                return client
+
+            # boto3-stubs only types literal service names; the cache is keyed
+            # by whatever name the scanner asks for.
+            client = session.client(  # type: ignore[call-overload]
+                service_name=service_name, region_name=region or None, config=config
+            )
+            if on_create is not None:
+                on_create(client)
+            entry.clients[key] = client
+            self.created += 1
+            return client
+
+    def clear(self) -> None:
+        """Drop every cached client."""
+        with self._lock:
+            self._sessions = weakref.WeakKeyDictionary()
+
+
+_default_cache = ClientCache()
+
+
+def get_client_cache() -> ClientCache:
+    """Get the process-wide client cache.
+
+    Returns:
+        Shared ClientCache instance
+    """
+    return _default_cache
@@ -31,6 +31,7 @@ class CloudFrontScanner(BaseScanner):
     """
 
     SERVICE = "CloudFront"
+    REGIONAL = False
 
     def _register_rules(self) -> None:
         """Register CloudFront security rules."""
@@ -0,0 +1,333 @@
+"""Columnar representation of findings for fast aggregation.
+
+Organization summaries used to walk every ``ScanResult`` and its evidence dict
+several times: once per account for severity counts, again to bucket by
+scanner, and again per heat-map row to score. ``FindingColumns`` stores the
+fields those summaries group by in compact ``array`` columns, one row per
+finding, with strings interned into per-column tables so each row costs a few
+bytes instead of a Python object graph. ``FindingColumns.aggregate`` counts
+every (account, rule, severity, passed) combination in a single pass with
+``collections.Counter`` and derives all group-bys from that much smaller
+table. Each row also stores the code of its combination in a ``groups``
+column, so that pass counts plain integers.
+"""
+
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from cloud_optimizer.scanners.base import ScanResult
+
+if TYPE_CHECKING:
+    from cloud_optimizer.scanners.multi_account import AccountScanResult
+
+# Severity codes; anything else is stored as SEVERITY_OTHER
+SEVERITIES = ("critical", "high", "medium", "low")
+SEVERITY_OTHER = len(SEVERITIES)
+_SEVERITY_CODES = {name: code for code, name in enumerate(SEVERITIES)}
+
+# Severity assumed when a finding's evidence has none
+DEFAULT_SEVERITY = "medium"
+
+# Grouping key of a row: (account, rule, severity, passed) codes
+GroupKey = Tuple[int, int, int, int]
+
+
+def rule_service(rule_id: str) -> str:
+    """Get the service prefix of a rule ID (``S3_001`` -> ``S3``)."""
+    return rule_id.split("_")[0]
+
+
+def severity_code(severity: str) -> int:
+    """Encode a severity name (case-insensitive)."""
+    return _SEVERITY_CODES.get(severity.lower(), SEVERITY_OTHER)
+
+
+class StringTable:
+    """Interns strings as dense integer codes."""
+
+    def __init__(self) -> None:
+        """Initialize table."""
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Get the code for a string, adding it if new."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        """Get the number of distinct strings."""
+        return len(self.values)
+
+
+def _empty_severities() -> Dict[str, int]:
+    return dict.fromkeys(SEVERITIES, 0)
+
+
+@dataclass
+class FindingsAggregate:
+    """Every group-by the summaries need, computed from one pass.
+
+    Severity counts only include failed findings; ``other`` holds failed
+    findings whose severity is not one of ``SEVERITIES``.
+
+    Attributes:
+        total: All findings, passed or failed
+        failed: Failed findings
+        by_account: All findings per account
+        by_scanner: All findings per rule prefix
+        by_severity: Failed findings per severity
+        by_service: Failed findings per rule prefix
+        by_rule: Failed findings per rule
+        account_severity: Failed findings per account and severity
+        account_service: Failed findings per account and rule prefix
+        account_rule: Failed findings per account and rule
+        rule_severity: Highest severity seen per failed rule
+        rule_accounts: Accounts with failed findings per rule
+        rule_remediation: Remediation of the first failed finding per rule
+        other: Failed findings with an unknown severity, per account
+    """
+
+    total: int = 0
+    failed: int = 0
+    by_account: Dict[str, int] = field(default_factory=dict)
+    by_scanner: Dict[str, int] = field(default_factory=dict)
+    by_severity: Dict[str, int] = field(default_factory=_empty_severities)
+    by_service: Dict[str, int] = field(default_factory=dict)
+    by_rule: Dict[str, int] = field(default_factory=dict)
+    account_severity: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    account_service: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    account_rule: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    rule_severity: Dict[str, str] = field(default_factory=dict)
+    rule_accounts: Dict[str, Set[str]] = field(default_factory=dict)
+    rule_remediation: Dict[str, str] = field(default_factory=dict)
+    other: Dict[str, int] = field(default_factory=dict)
+
+    def severity_counts(self, account_id: Optional[str] = None) -> Dict[str, int]:
+        """Get failed findings per severity for an account or the whole set.
+
+        Args:
+            account_id: Account to count; None counts every account
+
+        Returns:
+            Counts keyed by severity name
+        """
+        if account_id is None:
+            return dict(self.by_severity)
+        return dict(self.account_severity.get(account_id, _empty_severities()))
+
+
+class FindingColumns:
+    """Array-backed columns of findings.
+
+    Columns (one entry per finding): account, rule, service, region,
+    severity and group codes, and the passed flag. Strings live in
+    ``StringTable``s.
+
+    Example:
+        >>> columns = FindingColumns.from_account_results(results)
+        >>> columns.aggregate().by_severity
+        {'critical': 1, 'high': 4, 'medium': 0, 'low': 2}
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.account_table = StringTable()
+        self.rule_table = StringTable()
+        self.service_table = StringTable()
+        self.region_table = StringTable()
+        self.accounts = array("I")
+        self.rules = array("I")
+        self.services = array("I")
+        self.regions = array("I")
+        self.severities = array("B")
+        self.passed = array("B")
+        # Code of each row's (account, rule, severity, passed) combination
+        self.groups = array("I")
+        self._group_codes: Dict[GroupKey, int] = {}
+        self._group_keys: List[GroupKey] = []
+        # Service code of each rule code
+        self._rule_services: List[int] = []
+        # Remediation text of the first failed finding of each rule code
+        self.remediation: Dict[int, str] = {}
+        # Findings handed to a result sink, per account code; they have no rows
+        self.streamed: Dict[int, int] = {}
+        self.streamed_by_severity: Dict[int, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of findings."""
+        return len(self.rules)
+
+    def append(self, account_id: str, finding: ScanResult) -> None:
+        """Add one finding.
+
+        Args:
+            account_id: Account the finding belongs to
+            finding: Finding to add
+        """
+        rule = self.rule_table.code(finding.rule_id)
+        if rule == len(self._rule_services):
+            self._rule_services.append(
+                self.service_table.code(rule_service(finding.rule_id))
+            )
+        if not finding.passed and rule not in self.remediation:
+            self.remediation[rule] = finding.get_evidence("remediation", "")
+
+        account = self.account_table.code(account_id)
+        severity = severity_code(finding.get_evidence("severity", DEFAULT_SEVERITY))
+        passed = 1 if finding.passed else 0
+        key = (account, rule, severity, passed)
+        group = self._group_codes.get(key)
+        if group is None:
+            group = len(self._group_keys)
+            self._group_codes[key] = group
+            self._group_keys.append(key)
+
+        self.accounts.append(account)
+        self.rules.append(rule)
+        self.services.append(self._rule_services[rule])
+        self.regions.append(self.region_table.code(finding.region))
+        self.severities.append(severity)
+        self.passed.append(passed)
+        self.groups.append(group)
+
+    def extend(self, account_id: str, findings: Iterable[ScanResult]) -> None:
+        """Add an account's findings.
+
+        Args:
+            account_id: Account the findings belong to
+            findings: Findings to add
+        """
+        # Registering the account keeps accounts without findings visible
+        self.account_table.code(account_id)
+        for finding in findings:
+            self.append(account_id, finding)
+
+    def add_streamed(
+        self, account_id: str, count: int, by_severity: Dict[str, int]
+    ) -> None:
+        """Add the counts of findings that were streamed rather than retained.
+
+        Streamed findings count towards totals and severities, but not towards
+        the rule, service or region group-bys.
+
+        Args:
+            account_id: Account the findings belong to
+            count: Number of streamed findings
+            by_severity: Failed streamed findings counted by severity
+        """
+        account = self.account_table.code(account_id)
+        self.streamed[account] = self.streamed.get(account, 0) + count
+        per_severity = self.streamed_by_severity.setdefault(account, {})
+        for severity, failed in by_severity.items():
+            per_severity[severity] = per_severity.get(severity, 0) + failed
+
+    @classmethod
+    def from_account_results(
+        cls, results: Iterable["AccountScanResult"]
+    ) -> "FindingColumns":
+        """Build columns from account scan results.
+
+        Args:
+            results: Account scan results
+
+        Returns:
+            Columns holding every finding, plus the results' streamed counts
+        """
+        columns = cls()
+        for result in results:
+            account_id = result.account.account_id
+            columns.extend(account_id, result.findings)
+            if result.streamed_count or result.streamed_by_severity:
+                columns.add_streamed(
+                    account_id, result.streamed_count, result.streamed_by_severity
+                )
+        return columns
+
+    def counts_by(self, column: str, failed_only: bool = True) -> Dict[str, int]:
+        """Count findings per value of one column.
+
+        Args:
+            column: ``account``, ``rule``, ``service`` or ``region``
+            failed_only: Only count failed findings
+
+        Returns:
+            Counts keyed by the column's string values
+        """
+        codes: "array[int]" = getattr(self, f"{column}s")
+        table: StringTable = getattr(self, f"{column}_table")
+        if failed_only:
+            counts = Counter(
+                code for code, passed in zip(codes, self.passed) if not passed
+            )
+        else:
+            counts = Counter(codes)
+        return {table.values[code]: count for code, count in counts.items()}
+
+    def aggregate(self) -> FindingsAggregate:
+        """Compute every summary group-by in one pass over the columns.
+
+        Returns:
+            Aggregated counts
+        """
+        groups = Counter(self.groups)
+
+        accounts = self.account_table.values
+        rules = self.rule_table.values
+        services = self.service_table.values
+        agg = FindingsAggregate(total=len(self))
+        agg.by_account = dict.fromkeys(accounts, 0)
+        agg.account_severity = {account: _empty_severities() for account in accounts}
+
+        for group, count in groups.items():
+            account_code, rule_code, severity, passed = self._group_keys[group]
+            account = accounts[account_code]
+            rule = rules[rule_code]
+            service = services[self._rule_services[rule_code]]
+            agg.by_account[account] += count
+            agg.by_scanner[service] = agg.by_scanner.get(service, 0) + count
+            if passed:
+                continue
+
+            agg.failed += count
+            agg.by_service[service] = agg.by_service.get(service, 0) + count
+            agg.by_rule[rule] = agg.by_rule.get(rule, 0) + count
+            per_service = agg.account_service.setdefault(account, {})
+            per_service[service] = per_service.get(service, 0) + count
+            per_rule = agg.account_rule.setdefault(account, {})
+            per_rule[rule] = per_rule.get(rule, 0) + count
+            agg.rule_accounts.setdefault(rule, set()).add(account)
+            agg.rule_remediation[rule] = self.remediation.get(rule_code, "")
+
+            if severity == SEVERITY_OTHER:
+                agg.other[account] = agg.other.get(account, 0) + count
+                agg.rule_severity.setdefault(rule, DEFAULT_SEVERITY)
+                continue
+            name = SEVERITIES[severity]
+            agg.by_severity[name] += count
+            agg.account_severity[account][name] += count
+            known = agg.rule_severity.get(rule)
+            if known is None or severity < _SEVERITY_CODES[known]:
+                agg.rule_severity[rule] = name
+
+        for account_code, count in self.streamed.items():
+            agg.total += count
+            agg.by_account[accounts[account_code]] += count
+        for account_code, per_severity in self.streamed_by_severity.items():
+            account = accounts[account_code]
+            for name, count in per_severity.items():
+                agg.failed += count
+                severity = severity_code(name)
+                if severity == SEVERITY_OTHER:
+                    agg.other[account] = agg.other.get(account, 0) + count
+                    continue
+                agg.by_severity[SEVERITIES[severity]] += count
+                agg.account_severity[account][SEVERITIES[severity]] += count
+
+        return agg
@@ -7,11 +7,12 @@ checking for cluster configuration, container security, network policies, and IA
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
 from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.fanout import WorkUnit, region_units
 
 logger = logging.getLogger(__name__)
 
@@ -277,31 +278,45 @@ class ContainerScanner(BaseScanner):
         Returns:
             List of scan results
         """
-        results: List[ScanResult] = []
+        units = region_units(self.regions, services=("eks", "ecs"))
+        return await self.fan_out(units, self._scan_unit)
+
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        """Yield container findings as each service and region finishes."""
+        units = region_units(self.regions, services=("eks", "ecs"))
+        async for result in self.fan_out_iter(units, self._scan_unit):
+            yield result
 
-        for region in self.regions:
-            try:
+    async def _scan_unit(self, unit: WorkUnit) -> List[ScanResult]:
+        """Scan one container service in one region.
+
+        Args:
+            unit: Work unit covering an EKS or ECS region
+
+        Returns:
+            List of scan results for the unit
+        """
+        region = unit.region
+        try:
+            if unit.service == "eks":
                 # Scan EKS clusters
                 eks_client = self.get_client("eks", region=region)
                 logger.info(f"Scanning EKS clusters in {region}")
-                results.extend(await self._check_eks_clusters(eks_client, region))
-
-                # Scan ECS clusters and tasks
-                ecs_client = self.get_client("ecs", region=region)
-                autoscaling_client = self.get_client(
-                    "application-autoscaling", region=region
-                )
-                logger.info(f"Scanning ECS clusters in {region}")
-                results.extend(
-                    await self._check_ecs_resources(
-                        ecs_client, autoscaling_client, region
-                    )
-                )
+                return await self._check_eks_clusters(eks_client, region)
 
-            except ClientError as e:
-                logger.error(f"Error scanning containers in {region}: {e}")
+            # Scan ECS clusters and tasks
+            ecs_client = self.get_client("ecs", region=region)
+            autoscaling_client = self.get_client(
+                "application-autoscaling", region=region
+            )
+            logger.info(f"Scanning ECS clusters in {region}")
+            return await self._check_ecs_resources(
+                ecs_client, autoscaling_client, region
+            )
 
-        return results
+        except ClientError as e:
+            logger.error(f"Error scanning containers in {region}: {e}")
+            return []
 
     async def _check_eks_clusters(
         self,
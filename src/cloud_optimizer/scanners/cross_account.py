@@ -4,21 +4,74 @@ Issue #148: 9.2.2 Cross-account role assumption
 
 Implements secure cross-account role assumption to enable Cloud Optimizer to scan
 resources in other AWS accounts using IAM roles with proper trust relationships.
+
+``CredentialBroker`` is the process-wide entry point shared by
+``CrossAccountRoleManager`` and ``MultiAccountScanner``: it caches assumed
+role credentials, makes concurrent requests for the same role wait for a
+single AssumeRole call, and hands out sessions whose credentials renew
+themselves before they expire, so repeated scans of an organization do not
+pay STS latency or spend AssumeRole quota. Credentials are shared only
+between requests with the same AssumeRole identity (role, external ID,
+session name, duration and session policy); MFA-authenticated credentials
+are never cached.
 """
 
+import hashlib
 import logging
 import secrets
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 import boto3
+import botocore.session
 from botocore.config import Config
+from botocore.credentials import (
+    CredentialProvider,
+    CredentialResolver,
+    RefreshableCredentials,
+)
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Credentials with less time left than this are not handed out
+EXPIRY_MARGIN_SECONDS = 300
+# Sessions start renewing their credentials this long before expiry
+REFRESH_AHEAD_SECONDS = 900
+# Default bound on cached roles
+DEFAULT_CACHE_SIZE = 1024
+
+# AssumeRole identity: (role ARN, external ID, session name, duration,
+# SHA-256 of the session policy)
+CredentialKey = Tuple[str, Optional[str], Optional[str], Optional[int], Optional[str]]
+# Plain role ARNs are accepted for callers that manage a single identity per role
+CacheKey = Union[str, CredentialKey]
+
+
+def credential_key(params: Dict[str, Any]) -> CredentialKey:
+    """Build the cache key for AssumeRole request parameters.
+
+    Args:
+        params: AssumeRole request parameters
+
+    Returns:
+        Key identifying every parameter that affects the issued credentials
+    """
+    policy = params.get("Policy")
+    policy_hash = hashlib.sha256(policy.encode()).hexdigest() if policy else None
+    return (
+        params["RoleArn"],
+        params.get("ExternalId"),
+        params.get("RoleSessionName"),
+        params.get("DurationSeconds"),
+        policy_hash,
+    )
+
 
 @dataclass
 class AssumedRoleCredentials:
@@ -50,7 +103,7 @@ class AssumedRoleCredentials:
         """Check if credentials expire within 5 minutes."""
         now = datetime.now(timezone.utc)
         time_remaining = (self.expiration - now).total_seconds()
-        return time_remaining < 300  # 5 minutes
+        return time_remaining < EXPIRY_MARGIN_SECONDS
 
     @property
     def time_remaining(self) -> float:
@@ -61,46 +114,379 @@ class AssumedRoleCredentials:
 class CredentialCache:
     """Cache for assumed role credentials.
 
-    Provides in-memory caching with automatic expiration handling.
+    Provides thread-safe in-memory caching with automatic expiration handling.
+    The least recently used roles are evicted once ``max_size`` is reached.
     """
 
-    def __init__(self) -> None:
-        """Initialize credential cache."""
-        self._cache: Dict[str, AssumedRoleCredentials] = {}
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize credential cache.
 
-    def get(self, role_arn: str) -> Optional[AssumedRoleCredentials]:
+        Args:
+            max_size: Maximum number of roles kept
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._cache: "OrderedDict[CacheKey, AssumedRoleCredentials]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: CacheKey, min_remaining: float = EXPIRY_MARGIN_SECONDS
+    ) -> Optional[AssumedRoleCredentials]:
         """Get cached credentials for a role.
 
         Args:
-            role_arn: ARN of the role
+            key: ARN of the role or ``credential_key`` of the request
+            min_remaining: Seconds the credentials must still be valid for
 
         Returns:
             Cached credentials if valid, None otherwise
         """
-        creds = self._cache.get(role_arn)
-        if creds and not creds.expires_soon:
-            return creds
-        return None
+        with self._lock:
+            creds = self._cache.get(key)
+            if creds and creds.time_remaining >= min_remaining:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return creds
+            self.misses += 1
+            return None
 
-    def put(self, credentials: AssumedRoleCredentials) -> None:
+    def put(
+        self, credentials: AssumedRoleCredentials, key: Optional[CacheKey] = None
+    ) -> None:
         """Cache credentials.
 
         Args:
             credentials: Credentials to cache
+            key: Cache key (defaults to the role ARN)
         """
-        self._cache[credentials.role_arn] = credentials
+        if key is None:
+            key = credentials.role_arn
+        with self._lock:
+            self._cache[key] = credentials
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
 
     def invalidate(self, role_arn: str) -> None:
-        """Invalidate cached credentials for a role.
+        """Invalidate all cached credentials for a role.
 
         Args:
             role_arn: ARN of the role to invalidate
         """
-        self._cache.pop(role_arn, None)
+        with self._lock:
+            for key in [key for key in self._cache if _key_role(key) == role_arn]:
+                del self._cache[key]
 
     def clear(self) -> None:
         """Clear all cached credentials."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached roles."""
+        with self._lock:
+            return len(self._cache)
+
+
+def _key_role(key: CacheKey) -> str:
+    """Get the role ARN of a cache key."""
+    return key if isinstance(key, str) else key[0]
+
+
+# Session cache key: (AssumeRole identity, region)
+SessionKey = Tuple[CredentialKey, Optional[str]]
+
+
+class _BrokerCredentialProvider(CredentialProvider):
+    """Credential provider handing a botocore session broker credentials."""
+
+    METHOD = "sts-assume-role"
+
+    def __init__(self, credentials: RefreshableCredentials) -> None:
+        super().__init__()
+        self._credentials = credentials
+
+    def load(self) -> RefreshableCredentials:
+        return self._credentials
+
+
+class CredentialBroker:
+    """Shared, thread-safe source of assumed role credentials and sessions.
+
+    Concurrent requests for the same AssumeRole identity wait for a single
+    call; requests that differ in external ID, session name, duration or
+    session policy never share credentials, and MFA requests always call STS.
+    Sessions from ``get_session`` are cached per identity and region and carry
+    botocore ``RefreshableCredentials``, so they renew themselves
+    ``REFRESH_AHEAD_SECONDS`` (at most a quarter of the session duration)
+    before expiry (other threads keep using the current credentials
+    meanwhile) and can be reused across scans.
+
+    Example:
+        >>> broker = get_credential_broker()
+        >>> session = broker.get_session("arn:aws:iam::123456789012:role/Scanner")
+    """
+
+    def __init__(
+        self,
+        source_session: Optional[boto3.Session] = None,
+        credential_cache: Optional[CredentialCache] = None,
+        max_sessions: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize credential broker.
+
+        Args:
+            source_session: Session that assumes roles (defaults to default
+                session)
+            credential_cache: Credential cache (creates new if not provided)
+            max_sessions: Maximum number of cached sessions
+        """
+        self.source_session = source_session or boto3.Session()
+        self.credential_cache = credential_cache or CredentialCache()
+        self.max_sessions = max_sessions
+        self._sts_client = self.source_session.client(
+            "sts",
+            config=Config(
+                retries={"max_attempts": 3, "mode": "adaptive"},
+                connect_timeout=5,
+                read_timeout=30,
+            ),
+        )
+        self._sessions: "OrderedDict[SessionKey, boto3.Session]" = OrderedDict()
+        # Locks only live while a thread holds or waits on them, so the map
+        # stays as small as the number of roles being assumed concurrently
+        self._role_locks: weakref.WeakValueDictionary[CredentialKey, threading.Lock]
+        self._role_locks = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.assume_calls = 0
+
+    @property
+    def sts_client(self) -> Any:
+        """Get the STS client of the source session."""
+        return self._sts_client
+
+    def assume_role(self, params: Dict[str, Any]) -> AssumedRoleCredentials:
+        """Call AssumeRole, bypassing the cache.
+
+        Args:
+            params: AssumeRole request parameters
+
+        Returns:
+            Assumed role credentials
+
+        Raises:
+            ClientError: If role assumption fails
+        """
+        role_arn = params["RoleArn"]
+        if "RoleSessionName" not in params:
+            params = {**params, "RoleSessionName": f"CloudOptimizer-{int(time.time())}"}
+        logger.info(f"Assuming role {role_arn}")
+        with self._lock:
+            self.assume_calls += 1
+        try:
+            response = self._sts_client.assume_role(**params)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            error_message = e.response.get("Error", {}).get("Message", "")
+
+            # Provide helpful error messages
+            if error_code == "AccessDenied":
+                logger.error(
+                    f"Access denied when assuming {role_arn}. "
+                    "Check trust relationship and permissions."
+                )
+            elif error_code == "MalformedPolicyDocument":
+                logger.error(f"Invalid session policy for {role_arn}")
+            elif error_code == "InvalidIdentityToken":
+                logger.error(f"External ID mismatch or invalid for {role_arn}")
+            else:
+                logger.error(f"Failed to assume {role_arn}: {error_message}")
+
+            raise
+
+        # Parse credentials
+        creds = response["Credentials"]
+        credentials = AssumedRoleCredentials(
+            access_key_id=creds["AccessKeyId"],
+            secret_access_key=creds["SecretAccessKey"],
+            session_token=creds["SessionToken"],
+            expiration=creds["Expiration"].replace(tzinfo=timezone.utc),
+            role_arn=role_arn,
+        )
+
+        logger.info(
+            f"Successfully assumed {role_arn}, "
+            f"expires in {credentials.time_remaining:.0f}s"
+        )
+
+        return credentials
+
+    def get_credentials(
+        self, params: Dict[str, Any], min_remaining: float = EXPIRY_MARGIN_SECONDS
+    ) -> AssumedRoleCredentials:
+        """Get credentials for a role from the cache or a single AssumeRole call.
+
+        Credentials are cached under ``credential_key(params)``. Requests
+        carrying an MFA ``SerialNumber`` or ``TokenCode`` always call STS and
+        their credentials are never cached.
+
+        Args:
+            params: AssumeRole request parameters; a missing
+                ``RoleSessionName`` is generated by ``assume_role``
+            min_remaining: Seconds cached credentials must still be valid for
+
+        Returns:
+            Assumed role credentials
+
+        Raises:
+            ClientError: If role assumption fails
+        """
+        if "SerialNumber" in params or "TokenCode" in params:
+            return self.assume_role(params)
+
+        role_arn = params["RoleArn"]
+        key = credential_key(params)
+        cached = self.credential_cache.get(key, min_remaining)
+        if cached:
+            logger.debug(f"Using cached credentials for {role_arn}")
+            return cached
+
+        with self._lock:
+            role_lock = self._role_locks.setdefault(key, threading.Lock())
+
+        with role_lock:
+            # Another thread may have assumed the role while we waited
+            cached = self.credential_cache.get(key, min_remaining)
+            if cached:
+                return cached
+            credentials = self.assume_role(params)
+            self.credential_cache.put(credentials, key)
+            return credentials
+
+    def get_session(
+        self,
+        role_arn: str,
+        external_id: Optional[str] = None,
+        region_name: Optional[str] = None,
+        session_name: Optional[str] = None,
+        duration_seconds: int = 3600,
+    ) -> boto3.Session:
+        """Get a cached session whose credentials renew before they expire.
+
+        Args:
+            role_arn: ARN of the role to assume
+            external_id: External ID for additional security
+            region_name: AWS region for the session
+            session_name: Role session name (auto-generated if not provided)
+            duration_seconds: Session duration for each AssumeRole call
+
+        Returns:
+            boto3 session for the role
+
+        Raises:
+            ClientError: If the initial role assumption fails
+        """
+        params: Dict[str, Any] = {
+            "RoleArn": role_arn,
+            "DurationSeconds": duration_seconds,
+        }
+        if session_name:
+            params["RoleSessionName"] = session_name
+        if external_id:
+            params["ExternalId"] = external_id
+
+        key: SessionKey = (credential_key(params), region_name)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                return session
+
+        # Short sessions would otherwise be inside the refresh window as soon
+        # as they are issued and call AssumeRole on every request
+        refresh_ahead = min(REFRESH_AHEAD_SECONDS, duration_seconds // 4)
+
+        def refresh() -> Dict[str, str]:
+            # Sessions sharing the role pick up credentials already renewed
+            creds = self.get_credentials(params, min_remaining=refresh_ahead)
+            return {
+                "access_key": creds.access_key_id,
+                "secret_key": creds.secret_access_key,
+                "token": creds.session_token,
+                "expiry_time": creds.expiration.isoformat(),
+            }
+
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=refresh(),
+            refresh_using=refresh,
+            method="sts-assume-role",
+            advisory_timeout=refresh_ahead,
+            mandatory_timeout=min(EXPIRY_MARGIN_SECONDS, refresh_ahead // 2),
+        )
+        botocore_session = botocore.session.Session()
+        botocore_session.register_component(
+            "credential_provider",
+            CredentialResolver(providers=[_BrokerCredentialProvider(credentials)]),
+        )
+        session = boto3.Session(
+            botocore_session=botocore_session, region_name=region_name
+        )
+
+        with self._lock:
+            # Keep the first session if another thread built one meanwhile
+            session = self._sessions.setdefault(key, session)
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def invalidate(self, role_arn: str) -> None:
+        """Drop cached credentials and sessions for a role.
+
+        Args:
+            role_arn: ARN of the role
+        """
+        self.credential_cache.invalidate(role_arn)
+        with self._lock:
+            for key in [key for key in self._sessions if key[0][0] == role_arn]:
+                del self._sessions[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache and AssumeRole counters.
+
+        Returns:
+            Counters for cached roles, sessions, hits, misses and STS calls
+        """
+        with self._lock:
+            sessions = len(self._sessions)
+            assume_calls = self.assume_calls
+        return {
+            "cached_roles": len(self.credential_cache),
+            "cached_sessions": sessions,
+            "cache_hits": self.credential_cache.hits,
+            "cache_misses": self.credential_cache.misses,
+            "assume_role_calls": assume_calls,
+        }
+
+
+_default_broker: Optional[CredentialBroker] = None
+_default_broker_lock = threading.Lock()
+
+
+def get_credential_broker() -> CredentialBroker:
+    """Get the process-wide credential broker.
+
+    Returns:
+        Shared CredentialBroker using the default boto3 session
+    """
+    global _default_broker
+    with _default_broker_lock:
+        if _default_broker is None:
+            _default_broker = CredentialBroker()
+        return _default_broker
 
 
 class CrossAccountRoleManager:
@@ -121,23 +507,25 @@ class CrossAccountRoleManager:
         self,
         source_session: Optional[boto3.Session] = None,
         credential_cache: Optional[CredentialCache] = None,
+        credential_broker: Optional[CredentialBroker] = None,
     ) -> None:
         """Initialize cross-account role manager.
 
         Args:
             source_session: Source boto3 session (defaults to default session)
             credential_cache: Credential cache (creates new if not provided)
+            credential_broker: Broker to share credentials with other scan
+                paths, e.g. ``get_credential_broker()``; when given, its
+                source session and cache are used
         """
-        self.source_session = source_session or boto3.Session()
-        self.credential_cache = credential_cache or CredentialCache()
-        self._sts_client = self.source_session.client(
-            "sts",
-            config=Config(
-                retries={"max_attempts": 3, "mode": "adaptive"},
-                connect_timeout=5,
-                read_timeout=30,
-            ),
-        )
+        if credential_broker is None:
+            credential_broker = CredentialBroker(
+                source_session=source_session, credential_cache=credential_cache
+            )
+        self.credential_broker = credential_broker
+        self.source_session = credential_broker.source_session
+        self.credential_cache = credential_broker.credential_cache
+        self._sts_client = credential_broker.sts_client
 
     def generate_external_id(self) -> str:
         """Generate a secure random external ID.
@@ -176,29 +564,20 @@ class CrossAccountRoleManager:
         Raises:
             ClientError: If role assumption fails
         """
-        # Check cache first
-        if use_cache:
-            cached = self.credential_cache.get(role_arn)
-            if cached:
-                logger.debug(f"Using cached credentials for {role_arn}")
-                return cached
-
         # Validate duration
         duration_seconds = max(
             self.MIN_DURATION, min(duration_seconds, self.MAX_DURATION)
         )
 
-        # Generate session name if not provided
-        if not session_name:
-            session_name = f"CloudOptimizer-{int(time.time())}"
-
-        # Build assume role parameters
+        # Build assume role parameters; the broker names unnamed sessions
         params: Dict[str, Any] = {
             "RoleArn": role_arn,
-            "RoleSessionName": session_name,
             "DurationSeconds": duration_seconds,
         }
 
+        if session_name:
+            params["RoleSessionName"] = session_name
+
         if external_id:
             params["ExternalId"] = external_id
 
@@ -209,51 +588,9 @@ class CrossAccountRoleManager:
         if policy:
             params["Policy"] = policy
 
-        # Assume role
-        logger.info(f"Assuming role {role_arn}")
-        try:
-            response = self._sts_client.assume_role(**params)
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            error_message = e.response.get("Error", {}).get("Message", "")
-
-            # Provide helpful error messages
-            if error_code == "AccessDenied":
-                logger.error(
-                    f"Access denied when assuming {role_arn}. "
-                    "Check trust relationship and permissions."
-                )
-            elif error_code == "MalformedPolicyDocument":
-                logger.error(f"Invalid session policy for {role_arn}")
-            elif error_code == "InvalidIdentityToken":
-                logger.error(
-                    f"External ID mismatch or invalid for {role_arn}"
-                )
-            else:
-                logger.error(f"Failed to assume {role_arn}: {error_message}")
-
-            raise
-
-        # Parse credentials
-        creds = response["Credentials"]
-        credentials = AssumedRoleCredentials(
-            access_key_id=creds["AccessKeyId"],
-            secret_access_key=creds["SecretAccessKey"],
-            session_token=creds["SessionToken"],
-            expiration=creds["Expiration"].replace(tzinfo=timezone.utc),
-            role_arn=role_arn,
-        )
-
-        # Cache credentials
         if use_cache:
-            self.credential_cache.put(credentials)
-
-        logger.info(
-            f"Successfully assumed {role_arn}, "
-            f"expires in {credentials.time_remaining:.0f}s"
-        )
-
-        return credentials
+            return self.credential_broker.get_credentials(params)
+        return self.credential_broker.assume_role(params)
 
     def get_session_for_role(
         self,
@@ -264,6 +601,10 @@ class CrossAccountRoleManager:
     ) -> boto3.Session:
         """Get a boto3 session for an assumed role.
 
+        The session comes from the credential broker, so it is shared with
+        other callers of the same role and renews its credentials before they
+        expire.
+
         Args:
             role_arn: ARN of the role to assume
             external_id: External ID for additional security
@@ -273,17 +614,13 @@ class CrossAccountRoleManager:
         Returns:
             Configured boto3 session
         """
-        credentials = self.assume_role(
+        return self.credential_broker.get_session(
             role_arn=role_arn,
             external_id=external_id,
-            duration_seconds=duration_seconds,
-        )
-
-        return boto3.Session(
-            aws_access_key_id=credentials.access_key_id,
-            aws_secret_access_key=credentials.secret_access_key,
-            aws_session_token=credentials.session_token,
             region_name=region_name,
+            duration_seconds=max(
+                self.MIN_DURATION, min(duration_seconds, self.MAX_DURATION)
+            ),
         )
 
     def validate_trust_relationship(
@@ -0,0 +1,480 @@
+"""Non-blocking scanner execution engine.
+
+Scanner ``scan()`` coroutines are declared ``async`` but call synchronous boto3
+clients directly, so awaiting them on the application event loop blocks every
+other request for the duration of the scan. The executor runs each scan on a
+bounded worker thread pool (each worker drives the coroutine on its own private
+event loop) and wraps boto3 clients so that concurrent API calls against a
+single AWS service, and against AWS as a whole, are capped.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from cloud_optimizer.config import get_settings
+from cloud_optimizer.scanners.streaming import DEFAULT_STREAM_CHUNK_SIZE, next_chunk
+
+if TYPE_CHECKING:
+    from cloud_optimizer.scanners.base import BaseScanner, ScanResult
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Slots (service semaphore, global budget) held by each thread, innermost last
+_held_slots = threading.local()
+
+
+def _thread_slots() -> List[Tuple[threading.BoundedSemaphore, ...]]:
+    slots: Optional[List[Tuple[threading.BoundedSemaphore, ...]]] = getattr(
+        _held_slots, "slots", None
+    )
+    if slots is None:
+        slots = _held_slots.slots = []
+    return slots
+
+
+@contextmanager
+def released_service_slot() -> Iterator[None]:
+    """Give the current thread's service slot back for the duration of a block.
+
+    For waits that happen inside an API call, such as waiting for a rate limit
+    token: other calls can use the service and the global budget meanwhile,
+    and the slot is taken again before the request is sent. Does nothing when
+    the thread holds no slot.
+    """
+    slots = _thread_slots()
+    if not slots:
+        yield
+        return
+
+    semaphore, budget = slots[-1]
+    budget.release()
+    semaphore.release()
+    try:
+        yield
+    finally:
+        semaphore.acquire()
+        budget.acquire()
+
+
+class ServiceBoundedClient:
+    """Proxy around a boto3 client that caps concurrent calls per service.
+
+    Every API operation (and every page fetched through a paginator) acquires a
+    slot from the executor's semaphore for the client's service before the
+    request is sent. Non-operation attributes such as ``exceptions`` and
+    ``meta`` are passed through untouched.
+    """
+
+    def __init__(
+        self, client: Any, service_name: str, executor: "ScannerExecutor"
+    ) -> None:
+        """Initialize bounded client proxy.
+
+        Args:
+            client: Underlying boto3 client
+            service_name: AWS service name used for the concurrency limit
+            executor: Executor that owns the per-service semaphores
+        """
+        self._client = client
+        self._service_name = service_name
+        self._executor = executor
+        try:
+            self._operations = set(client.meta.method_to_api_mapping)
+        except AttributeError:
+            self._operations = set()
+
+    @property
+    def wrapped_client(self) -> Any:
+        """Get the underlying boto3 client."""
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name == "get_paginator":
+            return self._wrap_get_paginator(attr)
+        if name in self._operations and callable(attr):
+            return self._wrap_operation(attr)
+        return attr
+
+    def _wrap_operation(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            with self._executor.service_slot(self._service_name):
+                return method(*args, **kwargs)
+
+        call.__name__ = getattr(method, "__name__", "operation")
+        call.__doc__ = getattr(method, "__doc__", None)
+        return call
+
+    def _wrap_get_paginator(
+        self, get_paginator: Callable[[str], Any]
+    ) -> Callable[[str], Any]:
+        def wrapped(operation_name: str) -> Any:
+            return _BoundedPaginator(
+                get_paginator(operation_name), self._service_name, self._executor
+            )
+
+        return wrapped
+
+
+class _BoundedPaginator:
+    """Paginator proxy that acquires a service slot for every page request."""
+
+    def __init__(
+        self, paginator: Any, service_name: str, executor: "ScannerExecutor"
+    ) -> None:
+        self._paginator = paginator
+        self._service_name = service_name
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._paginator, name)
+
+    def paginate(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate pages, holding a service slot only while a page is fetched."""
+        pages = iter(self._paginator.paginate(**kwargs))
+        while True:
+            with self._executor.service_slot(self._service_name):
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    return
+            yield page
+
+
+class ScannerExecutor:
+    """Runs scanners off the event loop on a bounded thread pool.
+
+    Example:
+        >>> executor = ScannerExecutor(max_workers=4, service_limits={"iam": 2})
+        >>> results = await executor.run(S3Scanner(session))
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        service_limits: Optional[Dict[str, int]] = None,
+        default_service_limit: int = 4,
+        unit_workers: int = 16,
+        max_in_flight_calls: int = 32,
+    ) -> None:
+        """Initialize scanner executor.
+
+        Args:
+            max_workers: Maximum number of scans running concurrently
+            service_limits: Per-service cap on in-flight API calls, keyed by
+                boto3 service name (e.g. ``{"iam": 2, "s3": 8}``)
+            default_service_limit: Cap for services without an explicit limit
+            unit_workers: Threads available to fan-out work units across all
+                running scans
+            max_in_flight_calls: Global cap on in-flight API calls across all
+                services
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if default_service_limit < 1:
+            raise ValueError("default_service_limit must be at least 1")
+        if unit_workers < 1:
+            raise ValueError("unit_workers must be at least 1")
+        if max_in_flight_calls < 1:
+            raise ValueError("max_in_flight_calls must be at least 1")
+
+        self.max_workers = max_workers
+        self.default_service_limit = default_service_limit
+        self.unit_workers = unit_workers
+        self.max_in_flight_calls = max_in_flight_calls
+        self.service_limits: Dict[str, int] = {
+            name.lower(): limit for name, limit in (service_limits or {}).items()
+        }
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scanner"
+        )
+        # Units get their own pool so a scan waiting on its units can never
+        # starve them of threads.
+        self._unit_pool = ThreadPoolExecutor(
+            max_workers=unit_workers, thread_name_prefix="scanner-unit"
+        )
+        self._call_budget = threading.BoundedSemaphore(max_in_flight_calls)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def get_service_limit(self, service_name: str) -> int:
+        """Get the concurrent call limit for a service.
+
+        Args:
+            service_name: AWS service name
+
+        Returns:
+            Maximum number of in-flight API calls for the service
+        """
+        return self.service_limits.get(service_name.lower(), self.default_service_limit)
+
+    def _get_semaphore(self, service_name: str) -> threading.BoundedSemaphore:
+        key = service_name.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.get_service_limit(key))
+                self._semaphores[key] = semaphore
+            return semaphore
+
+    @contextmanager
+    def service_slot(self, service_name: str) -> Iterator[None]:
+        """Hold one of the service's concurrent call slots.
+
+        A slot from the global in-flight budget is held as well, so the total
+        number of outstanding API calls never exceeds ``max_in_flight_calls``.
+        Waits inside the call can hand both back with ``released_service_slot``.
+
+        Args:
+            service_name: AWS service name
+        """
+        semaphore = self._get_semaphore(service_name)
+        slots = _thread_slots()
+        with semaphore, self._call_budget:
+            slots.append((semaphore, self._call_budget))
+            try:
+                yield
+            finally:
+                slots.pop()
+
+    def wrap_client(self, client: Any, service_name: str) -> ServiceBoundedClient:
+        """Wrap a boto3 client with the per-service concurrency limit.
+
+        Args:
+            client: boto3 client
+            service_name: AWS service name
+
+        Returns:
+            Client proxy that enforces the service limit
+        """
+        return ServiceBoundedClient(client, service_name, self)
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking callable on the worker pool.
+
+        Args:
+            func: Synchronous callable (e.g. a boto3 operation)
+            *args: Positional arguments for the callable
+
+        Returns:
+            Return value of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+
+    async def run_coroutine(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Drive a coroutine that performs blocking I/O on a worker thread.
+
+        The coroutine is created and awaited inside the worker on a private
+        event loop, so any synchronous calls it makes never block the caller's
+        loop.
+
+        Args:
+            func: Coroutine function, e.g. ``scanner.scan``
+            *args: Positional arguments for the coroutine function
+
+        Returns:
+            Result of the coroutine
+        """
+        return await self.run_blocking(run_coroutine_in_thread, func, args)
+
+    async def run_unit(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Drive a fan-out work unit coroutine on the unit pool.
+
+        Args:
+            func: Coroutine function implementing the unit
+            *args: Positional arguments for the coroutine function
+
+        Returns:
+            Result of the coroutine
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._unit_pool, run_coroutine_in_thread, func, args
+        )
+
+    async def stream(
+        self,
+        func: Callable[..., AsyncIterator[T]],
+        *args: Any,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncGenerator[List[T], None]:
+        """Drive an async generator on the worker pool and yield its output in chunks.
+
+        The generator lives on a private event loop that is advanced one chunk
+        at a time on a worker thread, so blocking calls never touch the
+        caller's loop and the producer never runs more than one chunk ahead of
+        the consumer.
+
+        Args:
+            func: Async generator function, e.g. ``scanner.scan_iter``
+            *args: Positional arguments for the generator function
+            chunk_size: Maximum items per yielded chunk
+
+        Yields:
+            Lists of at most ``chunk_size`` items
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        private_loop = asyncio.new_event_loop()
+        source = func(*args)
+        pending: Optional[Future[List[T]]] = None
+        try:
+            while True:
+                pending = self._pool.submit(
+                    private_loop.run_until_complete, next_chunk(source, chunk_size)
+                )
+                chunk = await asyncio.wrap_future(pending)
+                if chunk:
+                    yield chunk
+                if len(chunk) < chunk_size:
+                    return
+        finally:
+            if pending is not None and not pending.done():
+                # The consumer gave up mid-chunk; close once the worker is done.
+                pending.add_done_callback(
+                    lambda _f: _close_private_loop(private_loop, source)
+                )
+            else:
+                await asyncio.wrap_future(
+                    self._pool.submit(_close_private_loop, private_loop, source)
+                )
+
+    async def run(self, scanner: "BaseScanner") -> List["ScanResult"]:
+        """Run a scanner's ``scan()`` off the event loop.
+
+        Args:
+            scanner: Scanner to run
+
+        Returns:
+            Scan results produced by the scanner
+        """
+        return await self.run_coroutine(scanner.scan)
+
+    async def run_all(
+        self, scanners: Sequence["BaseScanner"]
+    ) -> Dict[str, List["ScanResult"]]:
+        """Run several scanners concurrently on the pool.
+
+        A scanner that raises is logged and contributes no results, mirroring
+        how ``ScannerRegistry.get_all_scanners`` treats construction errors.
+
+        Args:
+            scanners: Scanners to run
+
+        Returns:
+            Mapping of scanner class name to its scan results
+        """
+        outcomes = await asyncio.gather(
+            *(self.run(scanner) for scanner in scanners), return_exceptions=True
+        )
+
+        results: Dict[str, List["ScanResult"]] = {}
+        for scanner, outcome in zip(scanners, outcomes):
+            name = type(scanner).__name__
+            if isinstance(outcome, BaseException):
+                logger.error(f"Scanner {name} failed: {outcome}")
+                results[name] = []
+            else:
+                results[name] = outcome
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool.
+
+        Args:
+            wait: Block until running scans have finished
+        """
+        self._pool.shutdown(wait=wait)
+        self._unit_pool.shutdown(wait=wait)
+
+
+def run_coroutine_in_thread(
+    func: Callable[..., Awaitable[T]], args: Sequence[Any]
+) -> T:
+    """Run a coroutine function to completion on a private event loop.
+
+    Intended to be called on a worker thread that has no running loop.
+
+    Args:
+        func: Coroutine function
+        args: Positional arguments for the coroutine function
+
+    Returns:
+        Result of the coroutine
+    """
+
+    async def runner() -> T:
+        return await func(*args)
+
+    return asyncio.run(runner())
+
+
+def _close_private_loop(loop: asyncio.AbstractEventLoop, source: Any) -> None:
+    """Close a streamed async generator and the private loop that drove it."""
+    try:
+        loop.run_until_complete(source.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    except Exception as e:
+        logger.warning(f"Error closing scan stream: {e}")
+    finally:
+        loop.close()
+
+
+_default_executor: Optional[ScannerExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_scanner_executor() -> ScannerExecutor:
+    """Get the process-wide scanner executor configured from settings.
+
+    Returns:
+        Shared ScannerExecutor instance
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            settings = get_settings()
+            _default_executor = ScannerExecutor(
+                max_workers=settings.scanner_max_workers,
+                service_limits=settings.scanner_service_limits,
+                default_service_limit=settings.scanner_service_concurrency,
+                unit_workers=settings.scanner_unit_workers,
+                max_in_flight_calls=settings.scanner_max_in_flight_calls,
+            )
+        return _default_executor
+
+
+def shutdown_scanner_executor(wait: bool = True) -> None:
+    """Shut down and discard the process-wide scanner executor.
+
+    Args:
+        wait: Block until running scans have finished
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is not None:
+            _default_executor.shutdown(wait=wait)
+            _default_executor = None
@@ -0,0 +1,178 @@
+"""Work-unit fan-out support for scanners.
+
+Scanners split a scan into (region, resource-batch) work units which
+``BaseScanner.fan_out`` runs concurrently. Each unit is timed so slow regions or
+services are visible, and results are merged in unit order regardless of the
+order in which units complete.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """A slice of a scan that can run independently.
+
+    Attributes:
+        region: AWS region the unit covers
+        service: AWS service the unit covers (empty if the scanner has one)
+        batch_index: Position of the batch within the region
+        items: Resources (names, ARNs or descriptions) in the batch; empty when
+            the unit covers a whole region
+        label: Short description used in logs and timing reports
+    """
+
+    region: str
+    service: str = ""
+    batch_index: int = 0
+    items: Sequence[Any] = field(default_factory=tuple)
+    label: str = ""
+
+
+@dataclass
+class UnitTiming:
+    """Wall-clock timing for a completed work unit.
+
+    Attributes:
+        scanner: Scanner class name
+        region: AWS region of the unit
+        service: AWS service of the unit
+        batch_index: Batch index within the region
+        label: Unit label
+        item_count: Number of resources in the batch
+        duration_seconds: Wall-clock time spent in the unit
+        result_count: Number of results produced
+        error: Error message if the unit failed
+    """
+
+    scanner: str
+    region: str
+    service: str
+    batch_index: int
+    label: str
+    item_count: int
+    duration_seconds: float
+    result_count: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert timing to a dictionary."""
+        return {
+            "scanner": self.scanner,
+            "region": self.region,
+            "service": self.service,
+            "batch_index": self.batch_index,
+            "label": self.label,
+            "item_count": self.item_count,
+            "duration_seconds": round(self.duration_seconds, 4),
+            "result_count": self.result_count,
+            "error": self.error,
+        }
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Split a sequence into consecutive batches.
+
+    Args:
+        items: Items to split
+        size: Maximum batch size
+
+    Yields:
+        Consecutive slices of at most ``size`` items
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def summarize_timings(timings: Sequence[UnitTiming]) -> Dict[str, Any]:
+    """Summarize unit timings by region and service.
+
+    Args:
+        timings: Unit timings from one or more scans
+
+    Returns:
+        Total, per-region and per-service durations plus the slowest unit
+    """
+    by_region: Dict[str, float] = {}
+    by_service: Dict[str, float] = {}
+    for timing in timings:
+        by_region[timing.region] = (
+            by_region.get(timing.region, 0.0) + timing.duration_seconds
+        )
+        service = timing.service or timing.scanner
+        by_service[service] = by_service.get(service, 0.0) + timing.duration_seconds
+
+    slowest: Optional[UnitTiming] = None
+    if timings:
+        slowest = max(timings, key=lambda t: t.duration_seconds)
+    return {
+        "unit_count": len(timings),
+        "failed_units": sum(1 for t in timings if t.error),
+        "total_unit_seconds": round(sum(by_region.values()), 4),
+        "seconds_by_region": _rank(by_region),
+        "seconds_by_service": _rank(by_service),
+        "slowest_unit": slowest.to_dict() if slowest else None,
+    }
+
+
+def _rank(durations: Dict[str, float]) -> Dict[str, float]:
+    return {
+        key: round(seconds, 4)
+        for key, seconds in sorted(
+            durations.items(), key=lambda item: item[1], reverse=True
+        )
+    }
+
+
+def region_units(
+    regions: Sequence[str], services: Sequence[str] = ("",)
+) -> List[WorkUnit]:
+    """Build one work unit per (region, service) pair.
+
+    Args:
+        regions: Regions to cover
+        services: Services to cover in every region; the default yields a
+            single unit per region
+
+    Returns:
+        Work units ordered by region, then service
+    """
+    return [
+        WorkUnit(
+            region=region,
+            service=service,
+            label=f"{service}:{region}" if service else region,
+        )
+        for region in regions
+        for service in services
+    ]
+
+
+def batch_units(
+    region: str, items: Sequence[Any], batch_size: int, service: str = ""
+) -> List[WorkUnit]:
+    """Build work units that batch a region's resources.
+
+    Args:
+        region: Region the resources live in
+        items: Resources to batch
+        batch_size: Maximum resources per unit
+        service: Service the resources belong to
+
+    Returns:
+        Work units in batch order
+    """
+    prefix = f"{service}:{region}" if service else region
+    return [
+        WorkUnit(
+            region=region,
+            service=service,
+            batch_index=index,
+            items=tuple(batch),
+            label=f"{prefix}[{index}]",
+        )
+        for index, batch in enumerate(chunked(items, batch_size))
+    ]
@@ -0,0 +1,232 @@
+"""Resource fingerprints for incremental (delta) scanning.
+
+A fingerprint is a hash of the configuration a scanner evaluated for one
+resource. When the next scan of the same account sees the same fingerprint, the
+scanner skips evaluating the resource and carries its previous results forward
+instead. Carried-forward results are emitted like fresh ones, so persisting
+them bumps ``last_seen_at`` on the stored findings.
+
+Scanners work against a ``FingerprintSnapshot`` (one per account and scanner)
+that is loaded from a ``FingerprintStore`` before the scan and saved after it,
+so lookups during the scan never block on storage.
+"""
+
+import hashlib
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from cloud_optimizer.scanners.base import AccountContext, ScanResult
+
+# Response keys that change on every call and must not affect fingerprints
+VOLATILE_KEYS = frozenset({"ResponseMetadata"})
+
+# Resources are fully re-evaluated at least this often, even when unchanged
+DEFAULT_MAX_AGE = timedelta(days=7)
+
+
+def compute_fingerprint(config: Any) -> str:
+    """Hash a resource configuration.
+
+    Dict key order and boto3 ``ResponseMetadata`` do not affect the result.
+
+    Args:
+        config: JSON-like configuration (API responses, listing entries)
+
+    Returns:
+        Hex SHA-256 digest of the canonical configuration
+    """
+    canonical = json.dumps(
+        _strip_volatile(config), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile(item)
+            for key, item in value.items()
+            if key not in VOLATILE_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def result_to_dict(result: ScanResult) -> Dict[str, Any]:
+    """Serialize a scan result for storage, leaving out its account context."""
+    return result.to_storage_dict()
+
+
+def result_from_dict(
+    data: Dict[str, Any], context: Optional[AccountContext] = None
+) -> ScanResult:
+    """Rebuild a scan result from storage.
+
+    Args:
+        data: Result serialized by ``result_to_dict``
+        context: Account context to attach to the result
+
+    Returns:
+        The rebuilt scan result
+    """
+    return ScanResult(**data, context=context)
+
+
+@dataclass
+class FingerprintEntry:
+    """Stored fingerprint and results for one resource.
+
+    Attributes:
+        fingerprint: Hash of the evaluated configuration
+        results: Results produced when the configuration was evaluated
+        evaluated_at: When the resource was last fully evaluated
+    """
+
+    fingerprint: str
+    results: List[ScanResult] = field(default_factory=list)
+    evaluated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class FingerprintSnapshot:
+    """Fingerprints of one scanner's resources in one account.
+
+    Safe to use from the worker threads that run a scanner's work units.
+    """
+
+    def __init__(
+        self,
+        account_id: str,
+        scanner: str,
+        entries: Optional[Dict[str, FingerprintEntry]] = None,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+    ) -> None:
+        """Initialize snapshot.
+
+        Args:
+            account_id: Account the fingerprints belong to
+            scanner: Scanner class name
+            entries: Entries from the previous scan, keyed by resource ID
+            max_age: Entries older than this are re-evaluated regardless
+        """
+        self.account_id = account_id
+        self.scanner = scanner
+        self.max_age = max_age
+        self._previous: Dict[str, FingerprintEntry] = dict(entries or {})
+        self._current: Dict[str, FingerprintEntry] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self.carried_forward = 0
+        self.evaluated = 0
+
+    @staticmethod
+    def fingerprint_of(config: Any) -> str:
+        """Hash a resource configuration (see ``compute_fingerprint``)."""
+        return compute_fingerprint(config)
+
+    def carry_forward(
+        self, resource_id: str, fingerprint: str
+    ) -> Optional[List[ScanResult]]:
+        """Get previous results if the resource is unchanged.
+
+        Args:
+            resource_id: Resource identifier
+            fingerprint: Fingerprint of the resource's current configuration
+
+        Returns:
+            Copies of the previous results, or None if the resource must be
+            evaluated
+        """
+        with self._lock:
+            entry = self._previous.get(resource_id)
+            if entry is None or entry.fingerprint != fingerprint:
+                return None
+            if datetime.now(timezone.utc) - entry.evaluated_at > self.max_age:
+                return None
+            self._current[resource_id] = entry
+            self.carried_forward += 1
+        return [result_from_dict(result_to_dict(r), r.context) for r in entry.results]
+
+    def record(
+        self, resource_id: str, fingerprint: str, results: List[ScanResult]
+    ) -> None:
+        """Record the results of evaluating a resource.
+
+        Args:
+            resource_id: Resource identifier
+            fingerprint: Fingerprint of the evaluated configuration
+            results: Results produced by the evaluation
+        """
+        entry = FingerprintEntry(fingerprint=fingerprint, results=list(results))
+        with self._lock:
+            self._current[resource_id] = entry
+            self._dirty.add(resource_id)
+            self.evaluated += 1
+
+    @property
+    def entries(self) -> Dict[str, FingerprintEntry]:
+        """Get entries for every resource seen in this scan."""
+        with self._lock:
+            return dict(self._current)
+
+    def changes(self) -> Tuple[Dict[str, FingerprintEntry], Set[str]]:
+        """Get what must be written back to the store.
+
+        Returns:
+            Entries that were (re-)evaluated, and IDs of resources from the
+            previous scan that no longer exist
+        """
+        with self._lock:
+            updated = {rid: self._current[rid] for rid in self._dirty}
+            removed = set(self._previous) - set(self._current)
+        return updated, removed
+
+
+class FingerprintStore(ABC):
+    """Durable storage for fingerprint snapshots."""
+
+    @abstractmethod
+    async def load(self, account_id: str, scanner: str) -> FingerprintSnapshot:
+        """Load the snapshot left by the previous scan.
+
+        Args:
+            account_id: AWS account ID
+            scanner: Scanner class name
+
+        Returns:
+            Snapshot to attach to the scanner
+        """
+
+    @abstractmethod
+    async def save(self, snapshot: FingerprintSnapshot) -> None:
+        """Persist a snapshot after a completed scan.
+
+        Args:
+            snapshot: Snapshot the scanner recorded into
+        """
+
+
+class InMemoryFingerprintStore(FingerprintStore):
+    """Process-local fingerprint store."""
+
+    def __init__(self, max_age: timedelta = DEFAULT_MAX_AGE) -> None:
+        """Initialize store.
+
+        Args:
+            max_age: Maximum age of carried-forward results
+        """
+        self.max_age = max_age
+        self._entries: Dict[Tuple[str, str], Dict[str, FingerprintEntry]] = {}
+
+    async def load(self, account_id: str, scanner: str) -> FingerprintSnapshot:
+        """Load the snapshot left by the previous scan."""
+        entries = self._entries.get((account_id, scanner), {})
+        return FingerprintSnapshot(account_id, scanner, entries, self.max_age)
+
+    async def save(self, snapshot: FingerprintSnapshot) -> None:
+        """Replace stored entries with those seen in the snapshot's scan."""
+        self._entries[(snapshot.account_id, snapshot.scanner)] = snapshot.entries
@@ -1,8 +1,11 @@
 """IAM Security Scanner."""
 
+import asyncio
+import csv
+import io
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
@@ -15,6 +18,12 @@ class IAMScanner(BaseScanner):
     """Scanner for IAM security configurations."""
 
     SERVICE = "IAM"
+    REGIONAL = False
+    # Credentials unused for longer than this are reported (IAM_004)
+    UNUSED_CREDENTIAL_DAYS = 90
+    # Credential report generation polling
+    CREDENTIAL_REPORT_POLL_ATTEMPTS = 10
+    CREDENTIAL_REPORT_POLL_INTERVAL = 2.0
 
     def _register_rules(self) -> None:
         """Register IAM security rules."""
@@ -235,8 +244,212 @@ class IAMScanner(BaseScanner):
         return results
 
     async def _check_iam_users(self, iam: Any) -> List[ScanResult]:
-        """Check IAM_002 and IAM_004: MFA and unused credentials."""
+        """Check IAM_002 and IAM_004: MFA and unused credentials.
+
+        Users are evaluated from the IAM credential report, which covers every
+        user in one API call. If the report cannot be generated, each user is
+        checked with individual API calls instead.
+        """
+        report = await self._get_credential_report(iam)
+        if report is None:
+            return await self._check_iam_users_per_user(iam)
+        return self._check_credential_report(iam, report)
+
+    async def _get_credential_report(self, iam: Any) -> Optional[List[Dict[str, str]]]:
+        """Generate and download the IAM credential report.
+
+        Args:
+            iam: boto3 IAM client
+
+        Returns:
+            One row per user (plus the root account), or None if the report
+            is unavailable
+        """
+        try:
+            for _ in range(self.CREDENTIAL_REPORT_POLL_ATTEMPTS):
+                state = iam.generate_credential_report().get("State")
+                if state == "COMPLETE":
+                    break
+                await asyncio.sleep(self.CREDENTIAL_REPORT_POLL_INTERVAL)
+            else:
+                logger.warning("Timed out waiting for IAM credential report")
+                return None
+
+            response = iam.get_credential_report()
+        except ClientError as e:
+            logger.warning(f"IAM credential report unavailable: {e}")
+            return None
+
+        content = response.get("Content", b"")
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return list(csv.DictReader(io.StringIO(content)))
+
+    def _check_credential_report(
+        self, iam: Any, report: List[Dict[str, str]]
+    ) -> List[ScanResult]:
+        """Evaluate IAM_002 and IAM_004 from credential report rows.
+
+        Access key IDs are not in the report, so ``list_access_keys`` is only
+        called for users with a stale key.
+
+        Args:
+            iam: boto3 IAM client
+            report: Parsed credential report rows
+
+        Returns:
+            Scan results for users with findings
+        """
         results: List[ScanResult] = []
+        now = datetime.now(timezone.utc)
+
+        for row in report:
+            user_name = row.get("user", "")
+            if user_name == "<root_account>":
+                # Root access keys are covered by IAM_001
+                continue
+            user_arn = row.get("arn", "")
+            password_enabled = row.get("password_enabled") == "true"
+
+            # Check MFA (IAM_002)
+            if password_enabled and row.get("mfa_active") != "true":
+                results.append(
+                    self.create_result(
+                        rule_id="IAM_002",
+                        resource_id=user_arn,
+                        resource_name=user_name,
+                        region="global",
+                    )
+                )
+
+            # Check unused console password (IAM_004)
+            if password_enabled:
+                last_used = _report_time(row.get("password_last_used"))
+                created = _report_time(row.get("user_creation_time"))
+                if self._is_unused(now, created, last_used):
+                    results.append(
+                        self._unused_password_result(
+                            user_arn, user_name, now, last_used
+                        )
+                    )
+
+            # Check unused access keys (IAM_004)
+            stale_keys = []
+            for slot in ("access_key_1", "access_key_2"):
+                if row.get(f"{slot}_active") != "true":
+                    continue
+                rotated = _report_time(row.get(f"{slot}_last_rotated"))
+                last_used = _report_time(row.get(f"{slot}_last_used_date"))
+                if rotated is not None and self._is_unused(now, rotated, last_used):
+                    stale_keys.append((rotated, last_used))
+
+            if stale_keys:
+                key_ids = self._access_key_ids(iam, user_name)
+                for rotated, last_used in stale_keys:
+                    results.append(
+                        self._unused_key_result(
+                            user_arn,
+                            user_name,
+                            now,
+                            key_ids.get(rotated.replace(microsecond=0)),
+                            rotated,
+                            last_used,
+                        )
+                    )
+
+        return results
+
+    def _is_unused(
+        self, now: datetime, created: Optional[datetime], last_used: Optional[datetime]
+    ) -> bool:
+        """Check whether a credential went unused for ``UNUSED_CREDENTIAL_DAYS``.
+
+        Credentials that were never used count from their creation.
+
+        Args:
+            now: Current time
+            created: When the credential was created
+            last_used: When the credential was last used, if ever
+
+        Returns:
+            True if the credential should be reported (IAM_004)
+        """
+        reference = last_used or created
+        return (
+            reference is not None
+            and (now - reference).days > self.UNUSED_CREDENTIAL_DAYS
+        )
+
+    def _unused_password_result(
+        self,
+        user_arn: str,
+        user_name: str,
+        now: datetime,
+        last_used: Optional[datetime],
+    ) -> ScanResult:
+        """Build the IAM_004 result for an unused console password."""
+        return self.create_result(
+            rule_id="IAM_004",
+            resource_id=user_arn,
+            resource_name=user_name,
+            region="global",
+            metadata={
+                "credential_type": "password",
+                "last_used_days": (now - last_used).days if last_used else None,
+            },
+        )
+
+    def _unused_key_result(
+        self,
+        user_arn: str,
+        user_name: str,
+        now: datetime,
+        key_id: Optional[str],
+        created: datetime,
+        last_used: Optional[datetime],
+    ) -> ScanResult:
+        """Build the IAM_004 result for an unused access key."""
+        return self.create_result(
+            rule_id="IAM_004",
+            resource_id=user_arn,
+            resource_name=user_name,
+            region="global",
+            metadata={
+                "access_key_id": key_id,
+                "key_age_days": (now - created).days,
+                "last_used_days": (now - last_used).days if last_used else None,
+            },
+        )
+
+    def _access_key_ids(self, iam: Any, user_name: str) -> Dict[datetime, str]:
+        """Map a user's access key creation times to key IDs.
+
+        Args:
+            iam: boto3 IAM client
+            user_name: IAM user name
+
+        Returns:
+            Key ID by creation time (to the second); empty on error
+        """
+        try:
+            response = iam.list_access_keys(UserName=user_name)
+        except ClientError as e:
+            logger.error(f"Error listing access keys for {user_name}: {e}")
+            return {}
+        return {
+            key["CreateDate"].replace(microsecond=0): key["AccessKeyId"]
+            for key in response.get("AccessKeyMetadata", [])
+        }
+
+    async def _check_iam_users_per_user(self, iam: Any) -> List[ScanResult]:
+        """Check IAM_002 and IAM_004 with per-user API calls.
+
+        Applies the same rules as ``_check_credential_report``; the usage
+        times the report would carry are looked up only where they decide
+        the outcome.
+        """
+        results: List[ScanResult] = []
+        now = datetime.now(timezone.utc)
 
         try:
             # List all IAM users
@@ -248,17 +461,20 @@ class IAMScanner(BaseScanner):
                     user_name = user["UserName"]
                     user_arn = user["Arn"]
 
-                    # Check MFA (IAM_002)
+                    # Check if user has console access
+                    has_console_access = False
                     try:
-                        mfa_devices = iam.list_mfa_devices(UserName=user_name)
-                        has_mfa = len(mfa_devices.get("MFADevices", [])) > 0
+                        iam.get_login_profile(UserName=user_name)
+                        has_console_access = True
+                    except ClientError as e:
+                        if e.response.get("Error", {}).get("Code") != "NoSuchEntity":
+                            logger.error(f"Error checking login profile for {user_name}: {e}")
 
-                        # Check if user has console access
+                    # Check MFA (IAM_002)
+                    if has_console_access:
                         try:
-                            login_profile = iam.get_login_profile(UserName=user_name)
-                            has_console_access = login_profile is not None
-
-                            if has_console_access and not has_mfa:
+                            mfa_devices = iam.list_mfa_devices(UserName=user_name)
+                            if not mfa_devices.get("MFADevices", []):
                                 results.append(
                                     self.create_result(
                                         rule_id="IAM_002",
@@ -267,43 +483,47 @@ class IAMScanner(BaseScanner):
                                         region="global",
                                     )
                                 )
-
                         except ClientError as e:
-                            if e.response.get("Error", {}).get("Code") != "NoSuchEntity":
-                                logger.error(f"Error checking login profile for {user_name}: {e}")
-
-                    except ClientError as e:
-                        logger.error(f"Error checking MFA for {user_name}: {e}")
+                            logger.error(f"Error checking MFA for {user_name}: {e}")
+
+                    # Check unused console password (IAM_004)
+                    password_last_used = user.get("PasswordLastUsed")
+                    if has_console_access and self._is_unused(
+                        now, user["CreateDate"], password_last_used
+                    ):
+                        results.append(
+                            self._unused_password_result(
+                                user_arn, user_name, now, password_last_used
+                            )
+                        )
 
-                    # Check unused credentials (IAM_004)
+                    # Check unused access keys (IAM_004)
                     try:
-                        # Get credential report for user
-                        # Note: This requires generate_credential_report to be called first
-                        user_created = user["CreateDate"]
-                        days_since_creation = (datetime.now(user_created.tzinfo) - user_created).days
-
-                        # Get access keys
                         access_keys = iam.list_access_keys(UserName=user_name)
                         for key in access_keys.get("AccessKeyMetadata", []):
-                            if key["Status"] == "Active":
-                                key_age = (
-                                    datetime.now(key["CreateDate"].tzinfo) - key["CreateDate"]
-                                ).days
-
-                                # Check if key is old and potentially unused
-                                if key_age > 90:
-                                    results.append(
-                                        self.create_result(
-                                            rule_id="IAM_004",
-                                            resource_id=user_arn,
-                                            resource_name=user_name,
-                                            region="global",
-                                            metadata={
-                                                "access_key_id": key["AccessKeyId"],
-                                                "key_age_days": key_age,
-                                            },
-                                        )
+                            created = key["CreateDate"]
+                            # Younger keys cannot be stale; skip the usage lookup
+                            if key["Status"] != "Active" or not self._is_unused(
+                                now, created, None
+                            ):
+                                continue
+                            usage = iam.get_access_key_last_used(
+                                AccessKeyId=key["AccessKeyId"]
+                            )
+                            last_used = usage.get("AccessKeyLastUsed", {}).get(
+                                "LastUsedDate"
+                            )
+                            if self._is_unused(now, created, last_used):
+                                results.append(
+                                    self._unused_key_result(
+                                        user_arn,
+                                        user_name,
+                                        now,
+                                        key["AccessKeyId"],
+                                        created,
+                                        last_used,
                                     )
+                                )
 
                     except ClientError as e:
                         logger.error(f"Error checking credentials for {user_name}: {e}")
@@ -318,58 +538,73 @@ class IAMScanner(BaseScanner):
         results: List[ScanResult] = []
 
         try:
-            # List customer managed policies
-            paginator = iam.get_paginator("list_policies")
-            for page in paginator.paginate(Scope="Local"):
-                policies = page.get("Policies", [])
+            for policy in self._local_policies(iam):
+                policy_name = policy["PolicyName"]
+                policy_arn = policy["Arn"]
+
+                try:
+                    # Get default policy version (cached per scan)
+                    document = self.iam_cache.policy_version_document(
+                        iam, policy_arn, policy["DefaultVersionId"]
+                    )
 
-                for policy in policies:
-                    policy_name = policy["PolicyName"]
-                    policy_arn = policy["Arn"]
+                    # Check for overly permissive statements
+                    if "Statement" in document:
+                        for statement in document["Statement"]:
+                            if statement.get("Effect") == "Allow":
+                                # Check for wildcard actions
+                                actions = statement.get("Action", [])
+                                if not isinstance(actions, list):
+                                    actions = [actions]
 
-                    try:
-                        # Get policy version
-                        policy_version = iam.get_policy_version(
-                            PolicyArn=policy_arn, VersionId=policy["DefaultVersionId"]
-                        )
+                                # Check for wildcard resources
+                                resources = statement.get("Resource", [])
+                                if not isinstance(resources, list):
+                                    resources = [resources]
 
-                        document = policy_version.get("PolicyVersion", {}).get("Document", {})
-
-                        # Check for overly permissive statements
-                        if "Statement" in document:
-                            for statement in document["Statement"]:
-                                if statement.get("Effect") == "Allow":
-                                    # Check for wildcard actions
-                                    actions = statement.get("Action", [])
-                                    if not isinstance(actions, list):
-                                        actions = [actions]
-
-                                    # Check for wildcard resources
-                                    resources = statement.get("Resource", [])
-                                    if not isinstance(resources, list):
-                                        resources = [resources]
-
-                                    has_wildcard_action = "*" in actions
-                                    has_wildcard_resource = "*" in resources
-
-                                    if has_wildcard_action and has_wildcard_resource:
-                                        results.append(
-                                            self.create_result(
-                                                rule_id="IAM_005",
-                                                resource_id=policy_arn,
-                                                resource_name=policy_name,
-                                                region="global",
-                                                metadata={
-                                                    "issue": "wildcard_action_and_resource",
-                                                    "statement": statement,
-                                                },
-                                            )
+                                has_wildcard_action = "*" in actions
+                                has_wildcard_resource = "*" in resources
+
+                                if has_wildcard_action and has_wildcard_resource:
+                                    results.append(
+                                        self.create_result(
+                                            rule_id="IAM_005",
+                                            resource_id=policy_arn,
+                                            resource_name=policy_name,
+                                            region="global",
+                                            metadata={
+                                                "issue": "wildcard_action_and_resource",
+                                                "statement": statement,
+                                            },
                                         )
+                                    )
 
-                    except ClientError as e:
-                        logger.error(f"Error checking policy {policy_name}: {e}")
+                except ClientError as e:
+                    logger.error(f"Error checking policy {policy_name}: {e}")
 
         except ClientError as e:
             logger.error(f"Error listing IAM policies: {e}")
 
         return results
+
+    def _local_policies(self, iam: Any) -> List[Dict[str, Any]]:
+        """Get customer managed policies, from the prefetched cache if loaded."""
+        policies = self.iam_cache.local_policies()
+        if policies is not None:
+            return policies
+
+        policies = []
+        paginator = iam.get_paginator("list_policies")
+        for page in paginator.paginate(Scope="Local"):
+            policies.extend(page.get("Policies", []))
+        return policies
+
+
+def _report_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a credential report timestamp ("N/A" and similar become None)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
@@ -0,0 +1,261 @@
+"""Shared cache of IAM role and policy documents.
+
+IAM is a global, heavily throttled API, yet many checks need the same
+documents: every Lambda function that shares an execution role looks up the
+same attached and inline policies, and the IAM scanner reads the same managed
+policy versions. ``IAMPolicyCache`` memoizes those lookups so each role and
+policy version is fetched once per scan.
+
+A cache is created per scan and shared by all scanners that run against the
+same account. Passing a ``ttl`` lets a long-lived cache be reused across scans
+of one account; entries older than the TTL are fetched again.
+
+``prefetch`` fills the cache from ``GetAccountAuthorizationDetails``, which
+returns every role and customer managed policy (with their documents) in a
+few paginated calls instead of several calls per role.
+"""
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Entity types loaded by prefetch unless overridden
+DEFAULT_PREFETCH_FILTER = ("Role", "LocalManagedPolicy")
+
+
+def role_name_from_arn(role_arn: str) -> str:
+    """Get the role name from a role ARN (the segment after the last '/')."""
+    return role_arn.split("/")[-1]
+
+
+class IAMPolicyCache:
+    """Thread-safe memo of IAM role and policy lookups.
+
+    Keys are role ARNs and ``(policy ARN, version ID)`` pairs. Concurrent
+    lookups of the same key wait for a single API call instead of each making
+    their own. Errors are not cached.
+    """
+
+    def __init__(self, ttl: Optional[timedelta] = None) -> None:
+        """Initialize cache.
+
+        Args:
+            ttl: Optional maximum age of entries; None keeps entries for the
+                lifetime of the cache (one scan)
+        """
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._local_policies: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0]):
+                return False, None
+            self.hits += 1
+            return True, entry[1]
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def _expired(self, stored_at: float) -> bool:
+        return (
+            self.ttl is not None
+            and time.monotonic() - stored_at > self.ttl.total_seconds()
+        )
+
+    def _get_or_fetch(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        found, value = self._get(key)
+        if found:
+            return cast(T, value)
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have fetched the key while we waited
+            found, value = self._get(key)
+            if found:
+                return cast(T, value)
+            fetched = fetch()
+            with self._lock:
+                self.misses += 1
+            self._put(key, fetched)
+            return fetched
+
+    def attached_role_policies(self, iam: Any, role_arn: str) -> List[Dict[str, Any]]:
+        """Get managed policies attached to a role.
+
+        Args:
+            iam: boto3 IAM client
+            role_arn: Role ARN
+
+        Returns:
+            ``AttachedPolicies`` entries (``PolicyName``, ``PolicyArn``)
+        """
+
+        def fetch() -> List[Dict[str, Any]]:
+            response = iam.list_attached_role_policies(
+                RoleName=role_name_from_arn(role_arn)
+            )
+            return list(response.get("AttachedPolicies", []))
+
+        return self._get_or_fetch(("attached", role_arn), fetch)
+
+    def role_policy_names(self, iam: Any, role_arn: str) -> List[str]:
+        """Get names of a role's inline policies.
+
+        Args:
+            iam: boto3 IAM client
+            role_arn: Role ARN
+
+        Returns:
+            Inline policy names
+        """
+
+        def fetch() -> List[str]:
+            response = iam.list_role_policies(RoleName=role_name_from_arn(role_arn))
+            return list(response.get("PolicyNames", []))
+
+        return self._get_or_fetch(("inline_names", role_arn), fetch)
+
+    def role_policy_document(
+        self, iam: Any, role_arn: str, policy_name: str
+    ) -> Dict[str, Any]:
+        """Get the document of a role's inline policy.
+
+        Args:
+            iam: boto3 IAM client
+            role_arn: Role ARN
+            policy_name: Inline policy name
+
+        Returns:
+            Policy document
+        """
+
+        def fetch() -> Dict[str, Any]:
+            response = iam.get_role_policy(
+                RoleName=role_name_from_arn(role_arn), PolicyName=policy_name
+            )
+            document: Dict[str, Any] = response.get("PolicyDocument", {})
+            return document
+
+        return self._get_or_fetch(("inline", role_arn, policy_name), fetch)
+
+    def role_inline_policies(
+        self, iam: Any, role_arn: str
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get all inline policies of a role.
+
+        Args:
+            iam: boto3 IAM client
+            role_arn: Role ARN
+
+        Returns:
+            (policy name, document) pairs
+        """
+        return [
+            (name, self.role_policy_document(iam, role_arn, name))
+            for name in self.role_policy_names(iam, role_arn)
+        ]
+
+    def policy_version_document(
+        self, iam: Any, policy_arn: str, version_id: str
+    ) -> Dict[str, Any]:
+        """Get the document of a managed policy version.
+
+        Args:
+            iam: boto3 IAM client
+            policy_arn: Managed policy ARN
+            version_id: Policy version ID (e.g. ``v3``)
+
+        Returns:
+            Policy document
+        """
+
+        def fetch() -> Dict[str, Any]:
+            response = iam.get_policy_version(
+                PolicyArn=policy_arn, VersionId=version_id
+            )
+            document: Dict[str, Any] = response.get("PolicyVersion", {}).get(
+                "Document", {}
+            )
+            return document
+
+        return self._get_or_fetch(("policy", policy_arn, version_id), fetch)
+
+    def local_policies(self) -> Optional[List[Dict[str, Any]]]:
+        """Get customer managed policies loaded by ``prefetch``.
+
+        Returns:
+            ``Policies`` entries from ``GetAccountAuthorizationDetails``, or
+            None if they were not prefetched (or have expired)
+        """
+        with self._lock:
+            if self._local_policies is None or self._expired(self._local_policies[0]):
+                return None
+            return list(self._local_policies[1])
+
+    def prefetch(
+        self, iam: Any, entity_filter: Tuple[str, ...] = DEFAULT_PREFETCH_FILTER
+    ) -> None:
+        """Load roles and managed policies in bulk.
+
+        Uses ``GetAccountAuthorizationDetails`` so later lookups for any role
+        or managed policy version in the account are served from the cache.
+
+        Args:
+            iam: boto3 IAM client
+            entity_filter: Entity types to load (``Role``,
+                ``LocalManagedPolicy``, ``AWSManagedPolicy``, ...)
+        """
+        roles = 0
+        policies: List[Dict[str, Any]] = []
+        paginator = iam.get_paginator("get_account_authorization_details")
+        for page in paginator.paginate(Filter=list(entity_filter)):
+            for role in page.get("RoleDetailList", []):
+                role_arn = role["Arn"]
+                self._put(
+                    ("attached", role_arn),
+                    [
+                        {"PolicyName": p["PolicyName"], "PolicyArn": p["PolicyArn"]}
+                        for p in role.get("AttachedManagedPolicies", [])
+                    ],
+                )
+                inline = role.get("RolePolicyList", [])
+                self._put(("inline_names", role_arn), [p["PolicyName"] for p in inline])
+                for policy in inline:
+                    self._put(
+                        ("inline", role_arn, policy["PolicyName"]),
+                        policy.get("PolicyDocument", {}),
+                    )
+                roles += 1
+
+            for policy in page.get("Policies", []):
+                for version in policy.get("PolicyVersionList", []):
+                    self._put(
+                        ("policy", policy["Arn"], version["VersionId"]),
+                        version.get("Document", {}),
+                    )
+                policies.append(policy)
+
+        if "LocalManagedPolicy" in entity_filter:
+            local = [p for p in policies if ":aws:policy/" not in p["Arn"]]
+            with self._lock:
+                self._local_policies = (time.monotonic(), local)
+
+        logger.info(
+            f"Prefetched IAM authorization details: {roles} roles, "
+            f"{len(policies)} managed policies"
+        )
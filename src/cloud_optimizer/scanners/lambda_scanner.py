@@ -10,15 +10,21 @@ vulnerabilities.
 import json
 import logging
 import re
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 
 from botocore.exceptions import ClientError
 
 from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.fanout import WorkUnit, region_units
+from cloud_optimizer.scanners.metrics import MetricQuery, fetch_metric_data
 
 logger = logging.getLogger(__name__)
 
+# Functions with no invocations in this many days are reported (LAMBDA_008)
+UNUSED_FUNCTION_DAYS = 90
+
 # Patterns that may indicate secrets in environment variables
 SECRET_PATTERNS: List[re.Pattern[str]] = [
     re.compile(r"password", re.IGNORECASE),
@@ -284,26 +290,38 @@ class LambdaScanner(BaseScanner):
         Returns:
             List of scan results
         """
-        results: List[ScanResult] = []
+        return await self.fan_out(region_units(self.regions), self._scan_region)
 
-        for region in self.regions:
-            try:
-                lambda_client = self.get_client("lambda", region=region)
-                iam_client = self.get_client("iam")
-                cloudwatch_client = self.get_client("cloudwatch", region=region)
-                logger.info(f"Scanning Lambda functions in {region}")
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        """Yield Lambda findings as each region finishes."""
+        units = region_units(self.regions)
+        async for result in self.fan_out_iter(units, self._scan_region):
+            yield result
 
-                # Get all Lambda functions
-                results.extend(
-                    await self._check_lambda_functions(
-                        lambda_client, iam_client, cloudwatch_client, region
-                    )
-                )
+    async def _scan_region(self, unit: WorkUnit) -> List[ScanResult]:
+        """Scan Lambda functions in a single region.
 
-            except ClientError as e:
-                logger.error(f"Error scanning Lambda in {region}: {e}")
+        Args:
+            unit: Work unit covering the region
 
-        return results
+        Returns:
+            List of scan results for the region
+        """
+        region = unit.region
+        try:
+            lambda_client = self.get_client("lambda", region=region)
+            iam_client = self.get_client("iam")
+            cloudwatch_client = self.get_client("cloudwatch", region=region)
+            logger.info(f"Scanning Lambda functions in {region}")
+
+            # Get all Lambda functions
+            return await self._check_lambda_functions(
+                lambda_client, iam_client, cloudwatch_client, region
+            )
+
+        except ClientError as e:
+            logger.error(f"Error scanning Lambda in {region}: {e}")
+            return []
 
     def _check_secrets_in_env_vars(
         self, env_vars: Dict[str, str]
@@ -371,356 +389,448 @@ class LambdaScanner(BaseScanner):
         now = datetime.now(timezone.utc)
 
         try:
+            functions: List[Dict[str, Any]] = []
             paginator = lambda_client.get_paginator("list_functions")
             for page in paginator.paginate():
-                functions = page.get("Functions", [])
+                functions.extend(page.get("Functions", []))
+
+            # Fetch 90-day invocation totals for every function in batched
+            # GetMetricData requests instead of one call per function
+            queries = {
+                function["FunctionName"]: MetricQuery.of(
+                    "AWS/Lambda",
+                    "Invocations",
+                    {"FunctionName": function["FunctionName"]},
+                    "Sum",
+                    UNUSED_FUNCTION_DAYS * 86400,
+                )
+                for function in functions
+            }
+            invocations = fetch_metric_data(
+                cloudwatch_client,
+                list(queries.values()),
+                now - timedelta(days=UNUSED_FUNCTION_DAYS),
+                now,
+            )
 
-                for function in functions:
-                    function_name = function["FunctionName"]
-                    function_arn = function["FunctionArn"]
-                    runtime = function.get("Runtime", "")
+            for function in functions:
+                values = invocations.get(queries[function["FunctionName"]])
+                total_invocations = sum(values) if values is not None else None
+                role_policies = self._role_policies(iam_client, function.get("Role"))
+                reserved = self._has_reserved_concurrency(
+                    lambda_client, function["FunctionName"]
+                )
+                # The listing entry's RevisionId and LastModified change with
+                # the function's code, configuration and resource policy, so
+                # an unchanged function is carried forward without its
+                # get_policy call. Reserved concurrency is not covered by
+                # RevisionId and is read on every scan.
+                config = {
+                    "function": function,
+                    "invoked": (
+                        total_invocations > 0 if total_invocations is not None else None
+                    ),
+                    "role_policies": role_policies,
+                    "reserved_concurrency": reserved,
+                }
+                check = partial(
+                    self._evaluate_function,
+                    function,
+                    role_policies,
+                    reserved,
+                    lambda_client,
+                    region,
+                    total_invocations,
+                )
+                results.extend(
+                    await self.evaluate_incremental(
+                        function["FunctionArn"], config, check
+                    )
+                )
 
-                    # Check deprecated runtime (LAMBDA_001)
-                    if runtime in self.deprecated_runtimes:
-                        results.append(
-                            self.create_result(
-                                rule_id="LAMBDA_001",
-                                resource_id=function_arn,
-                                resource_name=function_name,
-                                region=region,
-                                metadata={
-                                    "runtime": runtime,
-                                    "handler": function.get("Handler"),
-                                },
-                            )
-                        )
+        except ClientError as e:
+            logger.error(f"Error checking Lambda functions in {region}: {e}")
 
-                    # Check VPC configuration (LAMBDA_002)
-                    vpc_config = function.get("VpcConfig", {})
-                    if not vpc_config.get("VpcId"):
-                        # Note: Not all functions need VPC access
-                        # This is a warning for functions that might benefit from it
-                        results.append(
-                            self.create_result(
-                                rule_id="LAMBDA_002",
-                                resource_id=function_arn,
-                                resource_name=function_name,
-                                region=region,
-                                metadata={
-                                    "runtime": runtime,
-                                },
-                            )
-                        )
+        return results
 
-                    # Check execution role permissions (LAMBDA_003)
-                    role_arn = function.get("Role")
-                    if role_arn:
-                        try:
-                            # Extract role name from ARN
-                            role_name = role_arn.split("/")[-1]
+    def _role_policies(
+        self, iam_client: Any, role_arn: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get an execution role's policies from the shared IAM cache.
 
-                            # Get attached policies
-                            attached_policies = iam_client.list_attached_role_policies(
-                                RoleName=role_name
-                            )
+        Args:
+            iam_client: boto3 IAM client
+            role_arn: Execution role ARN
 
-                            for policy in attached_policies.get("AttachedPolicies", []):
-                                policy_arn = policy["PolicyArn"]
-
-                                # Check for AWS managed policies with broad permissions
-                                if (
-                                    "AdministratorAccess" in policy_arn
-                                    or "PowerUserAccess" in policy_arn
-                                ):
-                                    results.append(
-                                        self.create_result(
-                                            rule_id="LAMBDA_003",
-                                            resource_id=function_arn,
-                                            resource_name=function_name,
-                                            region=region,
-                                            metadata={
-                                                "role_arn": role_arn,
-                                                "policy_arn": policy_arn,
-                                                "issue": "overly_permissive_managed_policy",
-                                            },
-                                        )
-                                    )
+        Returns:
+            Attached managed policies and (name, document) pairs of inline
+            policies, or None if the function has no role or it cannot be read
+        """
+        if not role_arn:
+            return None
+        try:
+            return {
+                "attached": self.iam_cache.attached_role_policies(iam_client, role_arn),
+                "inline": self.iam_cache.role_inline_policies(iam_client, role_arn),
+            }
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code != "NoSuchEntity":
+                logger.error(f"Error checking role {role_arn.split('/')[-1]}: {e}")
+            return None
 
-                            # Check inline policies
-                            inline_policies = iam_client.list_role_policies(
-                                RoleName=role_name
-                            )
+    def _has_reserved_concurrency(
+        self, lambda_client: Any, function_name: str
+    ) -> Optional[bool]:
+        """Check whether a function has reserved concurrency.
 
-                            for policy_name in inline_policies.get("PolicyNames", []):
-                                policy_doc = iam_client.get_role_policy(
-                                    RoleName=role_name, PolicyName=policy_name
-                                )
+        Args:
+            lambda_client: boto3 Lambda client
+            function_name: Function name
 
-                                document = policy_doc.get("PolicyDocument", {})
-                                if "Statement" in document:
-                                    for statement in document["Statement"]:
-                                        if statement.get("Effect") == "Allow":
-                                            actions = statement.get("Action", [])
-                                            if not isinstance(actions, list):
-                                                actions = [actions]
-
-                                            resources = statement.get("Resource", [])
-                                            if not isinstance(resources, list):
-                                                resources = [resources]
-
-                                            # Check for wildcard permissions
-                                            if "*" in actions and "*" in resources:
-                                                results.append(
-                                                    self.create_result(
-                                                        rule_id="LAMBDA_003",
-                                                        resource_id=function_arn,
-                                                        resource_name=function_name,
-                                                        region=region,
-                                                        metadata={
-                                                            "role_arn": role_arn,
-                                                            "policy_name": policy_name,
-                                                            "issue": "wildcard_permissions",
-                                                        },
-                                                    )
-                                                )
-
-                        except ClientError as e:
-                            error_code = e.response.get("Error", {}).get("Code", "")
-                            if error_code != "NoSuchEntity":
-                                logger.error(f"Error checking role {role_name}: {e}")
-
-                    # Check Dead Letter Queue (LAMBDA_004)
-                    dead_letter_config = function.get("DeadLetterConfig", {})
-                    if not dead_letter_config.get("TargetArn"):
-                        results.append(
-                            self.create_result(
-                                rule_id="LAMBDA_004",
-                                resource_id=function_arn,
-                                resource_name=function_name,
-                                region=region,
-                            )
-                        )
+        Returns:
+            Whether concurrency is reserved, or None if it cannot be read
+        """
+        try:
+            concurrency = lambda_client.get_function_concurrency(
+                FunctionName=function_name
+            )
+        except ClientError as e:
+            # Function may not have concurrency configured
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "ResourceNotFoundException":
+                return False
+            return None
+        return concurrency.get("ReservedConcurrentExecutions") is not None
+
+    async def _evaluate_function(
+        self,
+        function: Dict[str, Any],
+        role_policies: Optional[Dict[str, Any]],
+        reserved_concurrency: Optional[bool],
+        lambda_client: Any,
+        region: str,
+        total_invocations: Optional[float],
+    ) -> List[ScanResult]:
+        """Run every Lambda check against one function.
 
-                    # Check Reserved Concurrency (LAMBDA_005)
-                    # Need to get function concurrency separately
-                    try:
-                        concurrency = lambda_client.get_function_concurrency(
-                            FunctionName=function_name
-                        )
-                        reserved_concurrency = concurrency.get(
-                            "ReservedConcurrentExecutions"
-                        )
+        Args:
+            function: Function configuration from ``list_functions``
+            role_policies: Execution role policies from ``_role_policies``
+            reserved_concurrency: Result of ``_has_reserved_concurrency``
+            lambda_client: boto3 Lambda client
+            region: AWS region being scanned
+            total_invocations: Invocations over the last 90 days, or None if
+                the metric could not be fetched
 
-                        if reserved_concurrency is None:
-                            results.append(
-                                self.create_result(
-                                    rule_id="LAMBDA_005",
-                                    resource_id=function_arn,
-                                    resource_name=function_name,
-                                    region=region,
-                                )
-                            )
+        Returns:
+            List of scan results for the function
+        """
+        results = await self._check_function(function, region, total_invocations)
+        results.extend(
+            await self._check_function_access(
+                function, role_policies, reserved_concurrency, lambda_client, region
+            )
+        )
+        return results
 
-                    except ClientError as e:
-                        # Function may not have concurrency configured
-                        error_code = e.response.get("Error", {}).get("Code", "")
-                        if error_code == "ResourceNotFoundException":
-                            results.append(
-                                self.create_result(
-                                    rule_id="LAMBDA_005",
-                                    resource_id=function_arn,
-                                    resource_name=function_name,
-                                    region=region,
-                                )
-                            )
+    async def _check_function(
+        self,
+        function: Dict[str, Any],
+        region: str,
+        total_invocations: Optional[float],
+    ) -> List[ScanResult]:
+        """Run the Lambda checks that depend only on the listing entry.
 
-                    # Check for secrets in environment variables (LAMBDA_006)
-                    env_vars = function.get("Environment", {}).get("Variables", {})
-                    if env_vars:
-                        suspicious_vars = self._check_secrets_in_env_vars(env_vars)
-                        if suspicious_vars:
-                            results.append(
-                                self.create_result(
-                                    rule_id="LAMBDA_006",
-                                    resource_id=function_arn,
-                                    resource_name=function_name,
-                                    region=region,
-                                    metadata={
-                                        "suspicious_variables": suspicious_vars,
-                                        "total_env_vars": len(env_vars),
-                                    },
-                                )
-                            )
+        Args:
+            function: Function configuration from ``list_functions``
+            region: AWS region being scanned
+            total_invocations: Invocations over the last 90 days, or None if
+                the metric could not be fetched
 
-                    # Check for CloudWatch Logs permissions (LAMBDA_007)
-                    role_arn = function.get("Role", "")
-                    if role_arn:
-                        has_logs_permission = False
-                        try:
-                            role_name = role_arn.split("/")[-1]
-                            # Check attached policies for logs permissions
-                            attached = iam_client.list_attached_role_policies(
-                                RoleName=role_name
-                            )
-                            for policy in attached.get("AttachedPolicies", []):
-                                policy_arn = policy["PolicyArn"]
-                                if (
-                                    "AWSLambdaBasicExecutionRole" in policy_arn
-                                    or "CloudWatchLogsFullAccess" in policy_arn
-                                    or "CloudWatchFullAccess" in policy_arn
-                                ):
-                                    has_logs_permission = True
-                                    break
+        Returns:
+            List of scan results for the function
+        """
+        results: List[ScanResult] = []
 
-                            # Check inline policies if no managed policy found
-                            if not has_logs_permission:
-                                inline_policies = iam_client.list_role_policies(
-                                    RoleName=role_name
-                                )
-                                for policy_name in inline_policies.get(
-                                    "PolicyNames", []
-                                ):
-                                    policy_doc = iam_client.get_role_policy(
-                                        RoleName=role_name, PolicyName=policy_name
-                                    )
-                                    doc = policy_doc.get("PolicyDocument", {})
-                                    for stmt in doc.get("Statement", []):
-                                        if stmt.get("Effect") == "Allow":
-                                            actions = stmt.get("Action", [])
-                                            if not isinstance(actions, list):
-                                                actions = [actions]
-                                            for action in actions:
-                                                if (
-                                                    action.startswith("logs:")
-                                                    or action == "*"
-                                                ):
-                                                    has_logs_permission = True
-                                                    break
-                                        if has_logs_permission:
-                                            break
-
-                            if not has_logs_permission:
+        function_name = function["FunctionName"]
+        function_arn = function["FunctionArn"]
+        runtime = function.get("Runtime", "")
+
+        # Check deprecated runtime (LAMBDA_001)
+        if runtime in self.deprecated_runtimes:
+            results.append(
+                self.create_result(
+                    rule_id="LAMBDA_001",
+                    resource_id=function_arn,
+                    resource_name=function_name,
+                    region=region,
+                    metadata={
+                        "runtime": runtime,
+                        "handler": function.get("Handler"),
+                    },
+                )
+            )
+
+        # Check VPC configuration (LAMBDA_002)
+        vpc_config = function.get("VpcConfig", {})
+        if not vpc_config.get("VpcId"):
+            # Note: Not all functions need VPC access
+            # This is a warning for functions that might benefit from it
+            results.append(
+                self.create_result(
+                    rule_id="LAMBDA_002",
+                    resource_id=function_arn,
+                    resource_name=function_name,
+                    region=region,
+                    metadata={
+                        "runtime": runtime,
+                    },
+                )
+            )
+
+        # Check Dead Letter Queue (LAMBDA_004)
+        dead_letter_config = function.get("DeadLetterConfig", {})
+        if not dead_letter_config.get("TargetArn"):
+            results.append(
+                self.create_result(
+                    rule_id="LAMBDA_004",
+                    resource_id=function_arn,
+                    resource_name=function_name,
+                    region=region,
+                )
+            )
+
+        # Check for secrets in environment variables (LAMBDA_006)
+        env_vars = function.get("Environment", {}).get("Variables", {})
+        if env_vars:
+            suspicious_vars = self._check_secrets_in_env_vars(env_vars)
+            if suspicious_vars:
+                results.append(
+                    self.create_result(
+                        rule_id="LAMBDA_006",
+                        resource_id=function_arn,
+                        resource_name=function_name,
+                        region=region,
+                        metadata={
+                            "suspicious_variables": suspicious_vars,
+                            "total_env_vars": len(env_vars),
+                        },
+                    )
+                )
+
+        # Check for unused functions (LAMBDA_008)
+        if total_invocations == 0:
+            results.append(
+                self.create_result(
+                    rule_id="LAMBDA_008",
+                    resource_id=function_arn,
+                    resource_name=function_name,
+                    region=region,
+                    metadata={
+                        "last_modified": function.get("LastModified", "unknown"),
+                        "invocations_90_days": 0,
+                    },
+                )
+            )
+
+        # Check for default execution role (LAMBDA_010)
+        role_arn = function.get("Role", "")
+        if role_arn and self._is_default_role(role_arn):
+            results.append(
+                self.create_result(
+                    rule_id="LAMBDA_010",
+                    resource_id=function_arn,
+                    resource_name=function_name,
+                    region=region,
+                    metadata={
+                        "role_arn": role_arn,
+                        "role_name": role_arn.split("/")[-1],
+                    },
+                )
+            )
+
+        return results
+
+    async def _check_function_access(
+        self,
+        function: Dict[str, Any],
+        role_policies: Optional[Dict[str, Any]],
+        reserved_concurrency: Optional[bool],
+        lambda_client: Any,
+        region: str,
+    ) -> List[ScanResult]:
+        """Run the Lambda checks on the execution role and function policies.
+
+        Args:
+            function: Function configuration from ``list_functions``
+            role_policies: Execution role policies from ``_role_policies``
+            reserved_concurrency: Result of ``_has_reserved_concurrency``
+            lambda_client: boto3 Lambda client
+            region: AWS region being scanned
+
+        Returns:
+            List of scan results for the function
+        """
+        results: List[ScanResult] = []
+
+        function_name = function["FunctionName"]
+        function_arn = function["FunctionArn"]
+
+        # Check execution role permissions (LAMBDA_003)
+        role_arn = function.get("Role")
+        if role_arn and role_policies is not None:
+            for policy in role_policies["attached"]:
+                policy_arn = policy["PolicyArn"]
+
+                # Check for AWS managed policies with broad permissions
+                if (
+                    "AdministratorAccess" in policy_arn
+                    or "PowerUserAccess" in policy_arn
+                ):
+                    results.append(
+                        self.create_result(
+                            rule_id="LAMBDA_003",
+                            resource_id=function_arn,
+                            resource_name=function_name,
+                            region=region,
+                            metadata={
+                                "role_arn": role_arn,
+                                "policy_arn": policy_arn,
+                                "issue": "overly_permissive_managed_policy",
+                            },
+                        )
+                    )
+
+            # Check inline policies
+            for policy_name, document in role_policies["inline"]:
+                if "Statement" in document:
+                    for statement in document["Statement"]:
+                        if statement.get("Effect") == "Allow":
+                            actions = statement.get("Action", [])
+                            if not isinstance(actions, list):
+                                actions = [actions]
+
+                            resources = statement.get("Resource", [])
+                            if not isinstance(resources, list):
+                                resources = [resources]
+
+                            # Check for wildcard permissions
+                            if "*" in actions and "*" in resources:
                                 results.append(
                                     self.create_result(
-                                        rule_id="LAMBDA_007",
+                                        rule_id="LAMBDA_003",
                                         resource_id=function_arn,
                                         resource_name=function_name,
                                         region=region,
-                                        metadata={"role_arn": role_arn},
+                                        metadata={
+                                            "role_arn": role_arn,
+                                            "policy_name": policy_name,
+                                            "issue": "wildcard_permissions",
+                                        },
                                     )
                                 )
 
-                        except ClientError as e:
-                            logger.debug(f"Error checking logs permission: {e}")
-
-                    # Check for unused functions (LAMBDA_008)
-                    # Get function invocation metrics
-                    try:
-                        metrics_response = cloudwatch_client.get_metric_statistics(
-                            Namespace="AWS/Lambda",
-                            MetricName="Invocations",
-                            Dimensions=[
-                                {"Name": "FunctionName", "Value": function_name}
-                            ],
-                            StartTime=now.replace(
-                                day=now.day if now.day <= 28 else 28
-                            ).replace(month=now.month - 3 if now.month > 3 else 12),
-                            EndTime=now,
-                            Period=86400 * 90,  # 90 days
-                            Statistics=["Sum"],
-                        )
-                        datapoints = metrics_response.get("Datapoints", [])
-                        total_invocations = sum(dp.get("Sum", 0) for dp in datapoints)
+        # Check Reserved Concurrency (LAMBDA_005)
+        if reserved_concurrency is False:
+            results.append(
+                self.create_result(
+                    rule_id="LAMBDA_005",
+                    resource_id=function_arn,
+                    resource_name=function_name,
+                    region=region,
+                )
+            )
 
-                        if total_invocations == 0:
-                            results.append(
-                                self.create_result(
-                                    rule_id="LAMBDA_008",
-                                    resource_id=function_arn,
-                                    resource_name=function_name,
-                                    region=region,
-                                    metadata={
-                                        "last_modified": function.get(
-                                            "LastModified", "unknown"
-                                        ),
-                                        "invocations_90_days": 0,
-                                    },
-                                )
-                            )
-                    except ClientError as e:
-                        logger.debug(f"Error checking invocation metrics: {e}")
+        # Check for CloudWatch Logs permissions (LAMBDA_007)
+        if role_arn and role_policies is not None:
+            has_logs_permission = False
+            # Check attached policies for logs permissions
+            for policy in role_policies["attached"]:
+                policy_arn = policy["PolicyArn"]
+                if (
+                    "AWSLambdaBasicExecutionRole" in policy_arn
+                    or "CloudWatchLogsFullAccess" in policy_arn
+                    or "CloudWatchFullAccess" in policy_arn
+                ):
+                    has_logs_permission = True
+                    break
 
-                    # Check for public access via resource policy (LAMBDA_009)
-                    try:
-                        policy_response = lambda_client.get_policy(
-                            FunctionName=function_name
-                        )
-                        policy_str = policy_response.get("Policy", "{}")
-                        policy = json.loads(policy_str)
-
-                        for statement in policy.get("Statement", []):
-                            principal = statement.get("Principal", {})
-                            if isinstance(principal, str) and principal == "*":
-                                # Public access
-                                condition = statement.get("Condition", {})
-                                if not condition:
-                                    # No condition means truly public
-                                    results.append(
-                                        self.create_result(
-                                            rule_id="LAMBDA_009",
-                                            resource_id=function_arn,
-                                            resource_name=function_name,
-                                            region=region,
-                                            metadata={
-                                                "statement_sid": statement.get(
-                                                    "Sid", "unknown"
-                                                ),
-                                                "principal": "*",
-                                                "has_conditions": False,
-                                            },
-                                        )
-                                    )
-                            elif isinstance(principal, dict):
-                                for key, value in principal.items():
-                                    if value == "*":
-                                        results.append(
-                                            self.create_result(
-                                                rule_id="LAMBDA_009",
-                                                resource_id=function_arn,
-                                                resource_name=function_name,
-                                                region=region,
-                                                metadata={
-                                                    "statement_sid": statement.get(
-                                                        "Sid", "unknown"
-                                                    ),
-                                                    "principal_type": key,
-                                                    "principal_value": "*",
-                                                },
-                                            )
-                                        )
-
-                    except ClientError as e:
-                        # No resource policy is fine
-                        error_code = e.response.get("Error", {}).get("Code", "")
-                        if error_code != "ResourceNotFoundException":
-                            logger.debug(f"Error checking resource policy: {e}")
-
-                    # Check for default execution role (LAMBDA_010)
-                    if role_arn and self._is_default_role(role_arn):
+            # Check inline policies if no managed policy found
+            if not has_logs_permission:
+                for _, doc in role_policies["inline"]:
+                    for stmt in doc.get("Statement", []):
+                        if stmt.get("Effect") == "Allow":
+                            actions = stmt.get("Action", [])
+                            if not isinstance(actions, list):
+                                actions = [actions]
+                            for action in actions:
+                                if action.startswith("logs:") or action == "*":
+                                    has_logs_permission = True
+                                    break
+                        if has_logs_permission:
+                            break
+
+            if not has_logs_permission:
+                results.append(
+                    self.create_result(
+                        rule_id="LAMBDA_007",
+                        resource_id=function_arn,
+                        resource_name=function_name,
+                        region=region,
+                        metadata={"role_arn": role_arn},
+                    )
+                )
+
+        # Check for public access via resource policy (LAMBDA_009)
+        try:
+            policy_response = lambda_client.get_policy(FunctionName=function_name)
+            policy_str = policy_response.get("Policy", "{}")
+            policy = json.loads(policy_str)
+
+            for statement in policy.get("Statement", []):
+                principal = statement.get("Principal", {})
+                if isinstance(principal, str) and principal == "*":
+                    # Public access
+                    condition = statement.get("Condition", {})
+                    if not condition:
+                        # No condition means truly public
                         results.append(
                             self.create_result(
-                                rule_id="LAMBDA_010",
+                                rule_id="LAMBDA_009",
                                 resource_id=function_arn,
                                 resource_name=function_name,
                                 region=region,
                                 metadata={
-                                    "role_arn": role_arn,
-                                    "role_name": role_arn.split("/")[-1],
+                                    "statement_sid": statement.get("Sid", "unknown"),
+                                    "principal": "*",
+                                    "has_conditions": False,
                                 },
                             )
                         )
+                elif isinstance(principal, dict):
+                    for key, value in principal.items():
+                        if value == "*":
+                            results.append(
+                                self.create_result(
+                                    rule_id="LAMBDA_009",
+                                    resource_id=function_arn,
+                                    resource_name=function_name,
+                                    region=region,
+                                    metadata={
+                                        "statement_sid": statement.get(
+                                            "Sid", "unknown"
+                                        ),
+                                        "principal_type": key,
+                                        "principal_value": "*",
+                                    },
+                                )
+                            )
 
         except ClientError as e:
-            logger.error(f"Error checking Lambda functions in {region}: {e}")
+            # No resource policy is fine
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code != "ResourceNotFoundException":
+                logger.debug(f"Error checking resource policy: {e}")
 
         return results
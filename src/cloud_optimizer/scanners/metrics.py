@@ -0,0 +1,148 @@
+"""Batched CloudWatch metric retrieval.
+
+Checks that look at CloudWatch metrics used to call ``GetMetricStatistics``
+once per metric per resource. ``fetch_metric_data`` collects those lookups as
+``MetricQuery`` values and resolves them with ``GetMetricData``, which accepts
+up to 500 queries per request, so a fleet of resources costs a handful of
+requests instead of several per resource. Callers build queries for every
+resource first, fetch once, then evaluate each resource from the returned
+values.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# GetMetricData limit on queries per request
+MAX_QUERIES_PER_REQUEST = 500
+
+
+@dataclass(frozen=True)
+class MetricQuery:
+    """One metric statistic for one resource.
+
+    Attributes:
+        namespace: CloudWatch namespace (e.g. ``AWS/EC2``)
+        metric_name: Metric name
+        dimensions: (name, value) dimension pairs
+        statistic: Statistic (Average, Sum, Maximum, ...)
+        period: Period in seconds
+    """
+
+    namespace: str
+    metric_name: str
+    dimensions: Tuple[Tuple[str, str], ...]
+    statistic: str
+    period: int
+
+    @classmethod
+    def of(
+        cls,
+        namespace: str,
+        metric_name: str,
+        dimensions: Mapping[str, str],
+        statistic: str,
+        period: int,
+    ) -> "MetricQuery":
+        """Build a query from a dimension mapping.
+
+        Args:
+            namespace: CloudWatch namespace
+            metric_name: Metric name
+            dimensions: Dimension name to value
+            statistic: Statistic type
+            period: Period in seconds
+
+        Returns:
+            Hashable metric query
+        """
+        return cls(
+            namespace=namespace,
+            metric_name=metric_name,
+            dimensions=tuple(sorted(dimensions.items())),
+            statistic=statistic,
+            period=period,
+        )
+
+    def to_request(self, query_id: str) -> Dict[str, Any]:
+        """Build the ``MetricDataQueries`` entry for this query."""
+        return {
+            "Id": query_id,
+            "MetricStat": {
+                "Metric": {
+                    "Namespace": self.namespace,
+                    "MetricName": self.metric_name,
+                    "Dimensions": [
+                        {"Name": name, "Value": value}
+                        for name, value in self.dimensions
+                    ],
+                },
+                "Period": self.period,
+                "Stat": self.statistic,
+            },
+            "ReturnData": True,
+        }
+
+
+def fetch_metric_data(
+    cloudwatch_client: Any,
+    queries: Sequence[MetricQuery],
+    start_time: datetime,
+    end_time: datetime,
+    batch_size: int = MAX_QUERIES_PER_REQUEST,
+) -> Dict[MetricQuery, List[float]]:
+    """Fetch values for many metric queries with ``GetMetricData``.
+
+    Duplicate queries are fetched once. Each batch is paged until CloudWatch
+    has returned every datapoint. Queries in a batch that fails are left out of
+    the result so callers can tell "no data" from "not fetched".
+
+    Args:
+        cloudwatch_client: boto3 CloudWatch client
+        queries: Metric queries to resolve
+        start_time: Start of the metric window
+        end_time: End of the metric window
+        batch_size: Queries per request (at most 500)
+
+    Returns:
+        Datapoint values by query (empty when there is no data); queries
+        whose request failed are missing
+    """
+    unique = list(dict.fromkeys(queries))
+    values: Dict[MetricQuery, List[float]] = {query: [] for query in unique}
+    batch_size = min(batch_size, MAX_QUERIES_PER_REQUEST)
+
+    for offset in range(0, len(unique), batch_size):
+        batch = {
+            f"m{index}": query
+            for index, query in enumerate(unique[offset : offset + batch_size])
+        }
+        try:
+            paginator = cloudwatch_client.get_paginator("get_metric_data")
+            pages = paginator.paginate(
+                MetricDataQueries=[
+                    query.to_request(query_id) for query_id, query in batch.items()
+                ],
+                StartTime=start_time,
+                EndTime=end_time,
+            )
+            for page in pages:
+                for result in page.get("MetricDataResults", []):
+                    query = batch.get(result.get("Id", ""))
+                    if query is not None:
+                        values[query].extend(result.get("Values", []))
+        except ClientError as e:
+            logger.warning(f"Failed to get metric data for {len(batch)} queries: {e}")
+            for query in batch.values():
+                del values[query]
+
+    logger.debug(
+        f"Fetched {len(unique)} metric queries in "
+        f"{-(-len(unique) // batch_size)} GetMetricData batches"
+    )
+    return values
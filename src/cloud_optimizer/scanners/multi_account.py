@@ -8,17 +8,38 @@ result aggregation and account relationship management.
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import uuid
+from contextlib import aclosing
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
 
 import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from cloud_optimizer.scanners.base import BaseScanner, ScanResult
+from cloud_optimizer.scanners.base import AccountContext, BaseScanner, ScanResult
+from cloud_optimizer.scanners.checkpoint import (
+    GLOBAL_REGION,
+    CheckpointStore,
+    UnitCheckpoint,
+    UnitKey,
+)
+from cloud_optimizer.scanners.clients import get_client_cache
+from cloud_optimizer.scanners.columnar import FindingColumns
+from cloud_optimizer.scanners.cross_account import (
+    CredentialBroker,
+    get_credential_broker,
+)
+from cloud_optimizer.scanners.executor import ScannerExecutor
+from cloud_optimizer.scanners.fingerprint import FingerprintSnapshot, FingerprintStore
+from cloud_optimizer.scanners.iam_cache import IAMPolicyCache
+from cloud_optimizer.scanners.rate_limit import (
+    RATE_LIMITED_CLIENT_CONFIG,
+    get_rate_limiter,
+)
+from cloud_optimizer.scanners.streaming import DEFAULT_STREAM_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +115,14 @@ class AWSAccount:
 
         return True
 
+    def context(self) -> AccountContext:
+        """Get the context shared by the account's findings."""
+        return AccountContext(
+            account_id=self.account_id,
+            account_name=self.name,
+            environment=self.environment,
+        )
+
 
 @dataclass
 class AccountScanResult:
@@ -105,6 +134,9 @@ class AccountScanResult:
         scan_duration: Duration of scan in seconds
         scanners_run: List of scanner names that were executed
         error: Error message if scan failed
+        streamed_count: Findings handed to a result sink instead of being
+            kept in ``findings``
+        streamed_by_severity: Failed streamed findings counted by severity
     """
 
     account: AWSAccount
@@ -112,6 +144,8 @@ class AccountScanResult:
     scan_duration: float = 0.0
     scanners_run: List[str] = field(default_factory=list)
     error: Optional[str] = None
+    streamed_count: int = 0
+    streamed_by_severity: Dict[str, int] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
@@ -121,23 +155,62 @@ class AccountScanResult:
     @property
     def finding_count(self) -> int:
         """Get total number of findings."""
-        return len(self.findings)
+        return len(self.findings) + self.streamed_count
 
     def findings_by_severity(self) -> Dict[str, int]:
-        """Get finding counts by severity."""
-        counts: Dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-        }
-        for finding in self.findings:
-            # Count findings that didn't pass
+        """Get failed finding counts by severity.
+
+        Counted through ``FindingColumns`` so the result matches the
+        organization summaries, including case-insensitive severities.
+        """
+        aggregate = FindingColumns.from_account_results([self]).aggregate()
+        return aggregate.severity_counts(self.account.account_id)
+
+    def merge(self, other: "AccountScanResult") -> None:
+        """Add another partial result's findings and streamed counts.
+
+        Args:
+            other: Result of a subset of the account's scan
+        """
+        self.findings.extend(other.findings)
+        self.streamed_count += other.streamed_count
+        for severity, count in other.streamed_by_severity.items():
+            self.streamed_by_severity[severity] = (
+                self.streamed_by_severity.get(severity, 0) + count
+            )
+
+    def merge_checkpoint(self, checkpoint: UnitCheckpoint) -> None:
+        """Add the stored results of a unit completed by an earlier run.
+
+        Args:
+            checkpoint: Checkpoint of the completed unit
+        """
+        # Stored findings leave out the account context; attach the current one
+        context = self.account.context()
+        for finding in checkpoint.findings:
+            finding.context = context
+        self.merge(
+            AccountScanResult(
+                account=self.account,
+                findings=list(checkpoint.findings),
+                streamed_count=checkpoint.streamed_count,
+                streamed_by_severity=dict(checkpoint.streamed_by_severity),
+            )
+        )
+
+    def record_streamed(self, findings: List[ScanResult]) -> None:
+        """Count findings that were handed to a sink rather than retained.
+
+        Args:
+            findings: Chunk of findings delivered to the sink
+        """
+        self.streamed_count += len(findings)
+        for finding in findings:
             if not finding.passed:
-                severity = finding.evidence.get("severity", "medium")
-                if severity in counts:
-                    counts[severity] += 1
-        return counts
+                severity = finding.get_evidence("severity", "medium")
+                self.streamed_by_severity[severity] = (
+                    self.streamed_by_severity.get(severity, 0) + 1
+                )
 
 
 class AccountRegistry:
@@ -242,10 +315,30 @@ class AccountRegistry:
                 self._accounts[account_id].last_scan = datetime.now(timezone.utc)
 
 
+# Receives each chunk of findings (already tagged with account context)
+ResultSink = Callable[[AWSAccount, List[ScanResult]], Awaitable[None]]
+
+
 class MultiAccountScanner:
     """Orchestrates scanning across multiple AWS accounts.
 
     Provides concurrent scanning with result aggregation and error handling.
+    When a ``result_sink`` is given, findings are streamed to it in chunks as
+    scanners produce them and only counts are kept on the account result, so
+    memory does not grow with account size.
+
+    Scanners and STS calls run on a ``ScannerExecutor`` so boto3 never blocks
+    the event loop. Each account is scanned as units of one scanner and one
+    region. Up to ``max_workers`` accounts are scanned at once, each running
+    up to ``scanner_concurrency`` units in parallel, and accounts
+    start longest-first (by their previous scan duration) so an organization
+    scan takes about as long as its largest account rather than trailing a
+    large account that happened to start last.
+
+    With a ``checkpoint_store``, every completed unit is checkpointed under
+    the scan's ID; ``resume`` reruns an interrupted scan, skipping completed
+    units and merging their stored results. A scan's checkpoints are deleted
+    once every unit of every account has completed.
     """
 
     def __init__(
@@ -253,6 +346,15 @@ class MultiAccountScanner:
         registry: AccountRegistry,
         scanner_classes: List[Type[BaseScanner]],
         max_workers: int = 10,
+        result_sink: Optional[ResultSink] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        fingerprint_store: Optional[FingerprintStore] = None,
+        iam_cache_ttl: Optional[timedelta] = None,
+        prefetch_iam: bool = False,
+        scanner_concurrency: int = 4,
+        executor: Optional[ScannerExecutor] = None,
+        credential_broker: Optional[CredentialBroker] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ) -> None:
         """Initialize multi-account scanner.
 
@@ -260,11 +362,65 @@ class MultiAccountScanner:
             registry: Account registry with accounts to scan
             scanner_classes: List of scanner classes to run
             max_workers: Maximum concurrent account scans
+            result_sink: Optional coroutine that persists/scores/meters each
+                chunk of findings while the scan is running
+            chunk_size: Maximum findings per chunk handed to the sink
+            fingerprint_store: Optional store that lets scanners skip
+                resources unchanged since the previous scan of the account
+            iam_cache_ttl: Keep each account's IAM document cache across scans
+                for this long; by default a fresh cache is used per scan
+            prefetch_iam: Load all roles and customer managed policies with
+                GetAccountAuthorizationDetails before running scanners
+            scanner_concurrency: Maximum scanner/region units run in parallel
+                within one account
+            executor: Executor that runs scanners and STS calls; by default
+                one sized for ``max_workers * scanner_concurrency`` scans is
+                created and owned by this scanner
+            credential_broker: Source of assumed role sessions; defaults to
+                the process-wide broker so credentials are reused across scans
+            checkpoint_store: Optional store that records completed units so
+                interrupted scans can be resumed
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if scanner_concurrency < 1:
+            raise ValueError("scanner_concurrency must be at least 1")
+
         self.registry = registry
         self.scanner_classes = scanner_classes
         self.max_workers = max_workers
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.result_sink = result_sink
+        self.chunk_size = chunk_size
+        self.fingerprint_store = fingerprint_store
+        self.iam_cache_ttl = iam_cache_ttl
+        self.prefetch_iam = prefetch_iam
+        self.scanner_concurrency = scanner_concurrency
+        self._iam_caches: Dict[str, IAMPolicyCache] = {}
+        # Durations of previous scans, used to start large accounts first
+        self._scan_durations: Dict[str, float] = {}
+        self._owns_executor = executor is None
+        if executor is None:
+            workers = max_workers * scanner_concurrency
+            # Throttling is per account and handled by the shared rate
+            # limiter, so service caps here only bound total in-flight calls
+            executor = ScannerExecutor(
+                max_workers=workers,
+                default_service_limit=workers,
+                unit_workers=workers,
+                max_in_flight_calls=workers * 4,
+            )
+        self._executor = executor
+        self._credential_broker = credential_broker
+        self.checkpoint_store = checkpoint_store
+        # ID of the most recent scan_all, for resuming it
+        self.last_scan_id: Optional[str] = None
+
+    @property
+    def credential_broker(self) -> CredentialBroker:
+        """Get the broker that provides assumed role sessions."""
+        if self._credential_broker is None:
+            self._credential_broker = get_credential_broker()
+        return self._credential_broker
 
     def _get_session_for_account(self, account: AWSAccount) -> Optional[boto3.Session]:
         """Create boto3 session for an account.
@@ -283,28 +439,15 @@ class MultiAccountScanner:
                 )
 
             elif account.auth_method == AuthMethod.ASSUME_ROLE:
-                # Use STS to assume role
-                sts_client = boto3.client(
-                    "sts",
-                    config=Config(retries={"max_attempts": 3, "mode": "adaptive"}),
-                )
-
-                assume_params: Dict[str, Any] = {
-                    "RoleArn": account.role_arn,
-                    "RoleSessionName": f"CloudOptimizer-{account.account_id}",
-                    "DurationSeconds": 3600,  # 1 hour
-                }
-
-                if account.external_id:
-                    assume_params["ExternalId"] = account.external_id
-
-                response = sts_client.assume_role(**assume_params)
-                credentials = response["Credentials"]
-
-                return boto3.Session(
-                    aws_access_key_id=credentials["AccessKeyId"],
-                    aws_secret_access_key=credentials["SecretAccessKey"],
-                    aws_session_token=credentials["SessionToken"],
+                if not account.role_arn:
+                    logger.error(f"No role ARN for account {account.account_id}")
+                    return None
+                # Cached per role; credentials renew before they expire
+                return self.credential_broker.get_session(
+                    role_arn=account.role_arn,
+                    external_id=account.external_id,
+                    session_name=f"CloudOptimizer-{account.account_id}",
+                    duration_seconds=3600,  # 1 hour
                 )
 
             else:
@@ -315,11 +458,222 @@ class MultiAccountScanner:
             logger.error(f"Failed to get session for account {account.account_id}: {e}")
             return None
 
-    async def _scan_account(self, account: AWSAccount) -> AccountScanResult:
+    async def _get_iam_cache(
+        self, account: AWSAccount, session: boto3.Session
+    ) -> IAMPolicyCache:
+        """Get the IAM document cache for an account scan.
+
+        Args:
+            account: Account being scanned
+            session: Session for the account
+
+        Returns:
+            Cache shared by the account's scanners, prefetched if enabled
+        """
+        if self.iam_cache_ttl is None:
+            cache = IAMPolicyCache()
+        else:
+            cache = self._iam_caches.setdefault(
+                account.account_id, IAMPolicyCache(ttl=self.iam_cache_ttl)
+            )
+
+        if self.prefetch_iam and cache.local_policies() is None:
+            # Authorization details paging is the heaviest IAM call of a
+            # scan, so it shares the scanners' clients and rate limiter
+            iam = get_client_cache().get(
+                session,
+                "iam",
+                None,
+                RATE_LIMITED_CLIENT_CONFIG,
+                on_create=partial(
+                    get_rate_limiter().instrument,
+                    account_id=account.account_id,
+                    service_name="iam",
+                ),
+            )
+            try:
+                await asyncio.to_thread(cache.prefetch, iam)
+            except ClientError as e:
+                # Scanners fall back to per-role lookups
+                logger.warning(
+                    f"IAM prefetch failed for account {account.account_id}: {e}"
+                )
+        return cache
+
+    def _verify_credentials(self, session: boto3.Session) -> Dict[str, Any]:
+        """Call GetCallerIdentity with an account's session.
+
+        Args:
+            session: Session for the account
+
+        Returns:
+            Caller identity response
+        """
+        identity: Dict[str, Any] = session.client("sts").get_caller_identity()
+        return identity
+
+    def _unit_regions(
+        self, scanner_class: Type[BaseScanner], account: AWSAccount
+    ) -> List[str]:
+        """Get the regions a scanner is run for, one unit each.
+
+        Args:
+            scanner_class: Scanner to run
+            account: Account being scanned
+
+        Returns:
+            The account's regions, or ``[GLOBAL_REGION]`` for global scanners
+        """
+        if not scanner_class.REGIONAL:
+            return [GLOBAL_REGION]
+        return list(account.regions)
+
+    async def _run_unit(
+        self,
+        account: AWSAccount,
+        scanner_class: Type[BaseScanner],
+        region: str,
+        session: boto3.Session,
+        iam_cache: IAMPolicyCache,
+        fingerprints: Optional[FingerprintSnapshot],
+        result: AccountScanResult,
+        scan_id: Optional[str],
+    ) -> bool:
+        """Run one scanner in one region and collect its findings.
+
+        Args:
+            account: Account being scanned
+            scanner_class: Scanner to run
+            region: Region to scan, or ``GLOBAL_REGION``
+            session: Session for the account
+            iam_cache: IAM document cache shared by the account's scanners
+            fingerprints: Snapshot shared by the scanner's units, if any
+            result: Account result that receives findings or counts
+            scan_id: Scan to checkpoint the unit under, if checkpointing
+
+        Returns:
+            True if the unit completed
+        """
+        unit = AccountScanResult(account=account)
+        context = account.context()
+        try:
+            regions = account.regions if region == GLOBAL_REGION else [region]
+            scanner = scanner_class(
+                session=session, regions=regions, executor=self._executor
+            )
+            scanner.iam_cache = iam_cache
+            scanner.account_id = account.account_id
+            scanner.fingerprints = fingerprints
+
+            async with aclosing(scanner.stream(self.chunk_size)) as chunks:
+                async for findings in chunks:
+                    # Reference the account context rather than copying it
+                    for finding in findings:
+                        finding.context = context
+
+                    if self.result_sink is None:
+                        unit.findings.extend(findings)
+                    else:
+                        await self.result_sink(account, findings)
+                        unit.record_streamed(findings)
+
+            if self.checkpoint_store is not None and scan_id is not None:
+                await self.checkpoint_store.save(
+                    UnitCheckpoint(
+                        scan_id=scan_id,
+                        account_id=account.account_id,
+                        scanner=scanner_class.__name__,
+                        region=region,
+                        findings=unit.findings,
+                        streamed_count=unit.streamed_count,
+                        streamed_by_severity=unit.streamed_by_severity,
+                    )
+                )
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Scanner {scanner_class.__name__} failed for "
+                f"account {account.account_id} in {region}: {e}"
+            )
+            return False
+
+        finally:
+            result.merge(unit)
+
+    async def _run_scanner(
+        self,
+        account: AWSAccount,
+        scanner_class: Type[BaseScanner],
+        session: boto3.Session,
+        iam_cache: IAMPolicyCache,
+        result: AccountScanResult,
+        pending: List[str],
+        slots: asyncio.Semaphore,
+        scan_id: Optional[str],
+    ) -> bool:
+        """Run a scanner's pending region units against an account.
+
+        Args:
+            account: Account being scanned
+            scanner_class: Scanner to run
+            session: Session for the account
+            iam_cache: IAM document cache shared by the account's scanners
+            result: Account result that receives findings or counts
+            pending: Regions not yet checkpointed for this scanner
+            slots: Semaphore bounding the account's concurrent units
+            scan_id: Scan to checkpoint units under, if checkpointing
+
+        Returns:
+            True if every pending unit completed
+        """
+        name = scanner_class.__name__
+        store = self.fingerprint_store
+        fingerprints: Optional[FingerprintSnapshot] = None
+        if store is not None:
+            try:
+                fingerprints = await store.load(account.account_id, name)
+            except Exception as e:
+                logger.error(f"Scanner {name} failed for {account.account_id}: {e}")
+                return False
+
+        async def run_unit(region: str) -> bool:
+            async with slots:
+                return await self._run_unit(
+                    account,
+                    scanner_class,
+                    region,
+                    session,
+                    iam_cache,
+                    fingerprints,
+                    result,
+                    scan_id,
+                )
+
+        completed = all(await asyncio.gather(*(run_unit(r) for r in pending)))
+
+        # A partial snapshot would drop fingerprints of skipped regions
+        full_run = len(pending) == len(self._unit_regions(scanner_class, account))
+        if store is not None and fingerprints is not None and completed and full_run:
+            await store.save(fingerprints)
+            logger.info(
+                f"{name} in {account.account_id}: "
+                f"{fingerprints.evaluated} resources evaluated, "
+                f"{fingerprints.carried_forward} unchanged"
+            )
+        return completed
+
+    async def _scan_account(
+        self, account: AWSAccount, scan_id: Optional[str] = None
+    ) -> AccountScanResult:
         """Scan a single account.
 
+        With a checkpoint store and ``scan_id``, units already checkpointed
+        under the scan are skipped and their stored results merged.
+
         Args:
             account: Account to scan
+            scan_id: Scan to checkpoint and resume units under
 
         Returns:
             Scan results for the account
@@ -328,57 +682,95 @@ class MultiAccountScanner:
         result = AccountScanResult(account=account)
 
         try:
-            # Get session for account
-            session = self._get_session_for_account(account)
-            if not session:
-                result.error = "Failed to establish session"
-                self.registry.update_account_status(
-                    account.account_id,
-                    AccountStatus.ERROR,
-                    result.error,
-                )
-                return result
-
-            # Verify credentials
-            try:
-                sts = session.client("sts")
-                identity = sts.get_caller_identity()
+            done: Dict[UnitKey, UnitCheckpoint] = {}
+            if self.checkpoint_store is not None and scan_id is not None:
+                for checkpoint in await self.checkpoint_store.load(
+                    scan_id, account.account_id
+                ):
+                    done[checkpoint.key] = checkpoint
+                    result.merge_checkpoint(checkpoint)
+
+            pending: Dict[Type[BaseScanner], List[str]] = {
+                cls: [
+                    region
+                    for region in self._unit_regions(cls, account)
+                    if (cls.__name__, region) not in done
+                ]
+                for cls in self.scanner_classes
+            }
+            completed: Dict[Type[BaseScanner], bool] = {
+                cls: True for cls, regions in pending.items() if not regions
+            }
+            if done:
                 logger.info(
-                    f"Scanning account {account.account_id} as {identity.get('Arn')}"
+                    f"Resuming account {account.account_id}: "
+                    f"{len(done)} units already complete"
                 )
-            except ClientError as e:
-                result.error = f"Credential verification failed: {e}"
-                self.registry.update_account_status(
-                    account.account_id,
-                    AccountStatus.ERROR,
-                    result.error,
+
+            if len(completed) < len(self.scanner_classes):
+                # Get session for account
+                session = await self._executor.run_blocking(
+                    self._get_session_for_account, account
                 )
-                return result
+                if not session:
+                    result.error = "Failed to establish session"
+                    self.registry.update_account_status(
+                        account.account_id,
+                        AccountStatus.ERROR,
+                        result.error,
+                    )
+                    return result
 
-            # Run all scanners
-            for scanner_class in self.scanner_classes:
+                # Verify credentials
                 try:
-                    scanner = scanner_class(session=session, regions=account.regions)
-                    findings = await scanner.scan()
-
-                    # Add account context to findings
-                    for finding in findings:
-                        finding.evidence["account_id"] = account.account_id
-                        finding.evidence["account_name"] = account.name
-                        finding.evidence["environment"] = account.environment
-
-                    result.findings.extend(findings)
-                    result.scanners_run.append(scanner_class.__name__)
-
-                except Exception as e:
-                    logger.error(
-                        f"Scanner {scanner_class.__name__} failed for "
-                        f"account {account.account_id}: {e}"
+                    identity = await self._executor.run_blocking(
+                        self._verify_credentials, session
+                    )
+                    logger.info(
+                        f"Scanning account {account.account_id} as "
+                        f"{identity.get('Arn')}"
+                    )
+                except ClientError as e:
+                    result.error = f"Credential verification failed: {e}"
+                    self.registry.update_account_status(
+                        account.account_id,
+                        AccountStatus.ERROR,
+                        result.error,
                     )
+                    return result
+
+                # Scanners of one account share IAM lookups
+                iam_cache = await self._get_iam_cache(account, session)
+
+                # Run the account's scanner and region units in parallel
+                slots = asyncio.Semaphore(self.scanner_concurrency)
+                running = [cls for cls in self.scanner_classes if cls not in completed]
+                outcomes = await asyncio.gather(
+                    *(
+                        self._run_scanner(
+                            account,
+                            cls,
+                            session,
+                            iam_cache,
+                            result,
+                            pending[cls],
+                            slots,
+                            scan_id,
+                        )
+                        for cls in running
+                    )
+                )
+                completed.update(zip(running, outcomes))
+
+            result.scanners_run = [
+                cls.__name__ for cls in self.scanner_classes if completed[cls]
+            ]
 
             # Calculate duration
             end_time = datetime.now(timezone.utc)
             result.scan_duration = (end_time - start_time).total_seconds()
+            if not done:
+                self._scan_durations[account.account_id] = result.scan_duration
 
             # Update account status
             self.registry.update_account_status(
@@ -396,44 +788,148 @@ class MultiAccountScanner:
 
         return result
 
+    def estimate_scan_cost(self, account: AWSAccount) -> float:
+        """Estimate how long an account takes to scan.
+
+        Uses the account's previous scan duration when known. Other accounts
+        are estimated from their region count, scaled by the mean seconds per
+        region of accounts already scanned.
+
+        Args:
+            account: Account to estimate
+
+        Returns:
+            Estimated scan duration (relative when no account has history)
+        """
+        previous = self._scan_durations.get(account.account_id)
+        if previous is not None:
+            return previous
+
+        regions = max(len(account.regions), 1)
+        known = [
+            (duration, len(acct.regions))
+            for acct in self.registry.list_accounts()
+            if (duration := self._scan_durations.get(acct.account_id)) is not None
+        ]
+        if not known:
+            return float(regions)
+        per_region = sum(d for d, _ in known) / max(sum(r for _, r in known), 1)
+        return regions * per_region
+
+    def _accounts_to_scan(
+        self,
+        environment: Optional[str],
+        business_unit: Optional[str],
+        statuses: List[AccountStatus],
+    ) -> List[AWSAccount]:
+        """List registered accounts with any of the given statuses."""
+        accounts: List[AWSAccount] = []
+        for status in statuses:
+            accounts.extend(
+                self.registry.list_accounts(
+                    environment=environment,
+                    business_unit=business_unit,
+                    status=status,
+                )
+            )
+        return accounts
+
     async def scan_all(
         self,
         environment: Optional[str] = None,
         business_unit: Optional[str] = None,
+        scan_id: Optional[str] = None,
     ) -> List[AccountScanResult]:
         """Scan all accounts (or filtered subset) concurrently.
 
+        At most ``max_workers`` accounts are scanned at once. Accounts start
+        in longest-processing-time-first order so the largest accounts never
+        finish last on an otherwise idle pool.
+
         Args:
             environment: Filter by environment
             business_unit: Filter by business unit
+            scan_id: ID to checkpoint units under (generated when a
+                checkpoint store is configured); kept in ``last_scan_id``
 
         Returns:
             List of scan results for all accounts
         """
-        accounts = self.registry.list_accounts(
-            environment=environment,
-            business_unit=business_unit,
-            status=AccountStatus.ACTIVE,
+        accounts = self._accounts_to_scan(
+            environment,
+            business_unit,
+            [AccountStatus.ACTIVE, AccountStatus.PENDING],
         )
+        if self.checkpoint_store is not None and scan_id is None:
+            scan_id = uuid.uuid4().hex
+        return await self._scan_accounts(accounts, scan_id)
 
-        # Also include pending accounts
-        accounts.extend(
-            self.registry.list_accounts(
-                environment=environment,
-                business_unit=business_unit,
-                status=AccountStatus.PENDING,
-            )
+    async def resume(
+        self,
+        scan_id: str,
+        environment: Optional[str] = None,
+        business_unit: Optional[str] = None,
+    ) -> List[AccountScanResult]:
+        """Resume an interrupted scan from its checkpoints.
+
+        Units checkpointed under ``scan_id`` are skipped and their stored
+        results merged, so only unfinished units are scanned again. Accounts
+        that failed in the interrupted run are retried.
+
+        Args:
+            scan_id: ID of the scan to resume
+            environment: Filter by environment
+            business_unit: Filter by business unit
+
+        Returns:
+            List of scan results for all accounts, including resumed units
+
+        Raises:
+            ValueError: If no checkpoint store is configured
+        """
+        if self.checkpoint_store is None:
+            raise ValueError("Resuming a scan requires a checkpoint store")
+        accounts = self._accounts_to_scan(
+            environment,
+            business_unit,
+            [AccountStatus.ACTIVE, AccountStatus.PENDING, AccountStatus.ERROR],
         )
+        return await self._scan_accounts(accounts, scan_id)
+
+    async def _scan_accounts(
+        self, accounts: List[AWSAccount], scan_id: Optional[str]
+    ) -> List[AccountScanResult]:
+        """Scan accounts under the account concurrency limit.
+
+        Args:
+            accounts: Accounts to scan
+            scan_id: Scan to checkpoint units under, if checkpointing
 
+        Returns:
+            List of scan results for all accounts
+        """
+        self.last_scan_id = scan_id
         if not accounts:
             logger.warning("No accounts to scan")
             return []
 
-        logger.info(f"Starting scan of {len(accounts)} accounts")
+        logger.info(
+            f"Starting scan of {len(accounts)} accounts"
+            + (f" (scan {scan_id})" if scan_id else "")
+        )
+
+        # Largest first; the semaphore admits waiters in FIFO order
+        accounts.sort(key=self.estimate_scan_cost, reverse=True)
+        slots = asyncio.Semaphore(self.max_workers)
+
+        async def scan_account(account: AWSAccount) -> AccountScanResult:
+            async with slots:
+                return await self._scan_account(account, scan_id)
 
-        # Run scans concurrently
-        tasks = [self._scan_account(account) for account in accounts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(scan_account(account) for account in accounts),
+            return_exceptions=True,
+        )
 
         # Process results
         scan_results: List[AccountScanResult] = []
@@ -443,6 +939,16 @@ class MultiAccountScanner:
             elif isinstance(result, AccountScanResult):
                 scan_results.append(result)
 
+        if self.checkpoint_store is not None and scan_id is not None:
+            finished = len(scan_results) == len(accounts) and all(
+                r.success and len(r.scanners_run) == len(self.scanner_classes)
+                for r in scan_results
+            )
+            if finished:
+                # Nothing is left to resume
+                await self.checkpoint_store.delete(scan_id)
+                logger.debug(f"Deleted checkpoints of completed scan {scan_id}")
+
         # Log summary
         total_findings = sum(r.finding_count for r in scan_results)
         successful = sum(1 for r in scan_results if r.success)
@@ -453,6 +959,15 @@ class MultiAccountScanner:
 
         return scan_results
 
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor if this scanner created it.
+
+        Args:
+            wait: Block until running scans have finished
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
     def aggregate_results(
         self, results: List[AccountScanResult]
     ) -> Dict[str, Any]:
@@ -464,37 +979,22 @@ class MultiAccountScanner:
         Returns:
             Aggregated statistics and findings
         """
-        total_findings = 0
-        findings_by_severity: Dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-        }
+        # One pass over all retained findings, plus the streamed counts
+        aggregate = FindingColumns.from_account_results(results).aggregate()
         findings_by_account: Dict[str, int] = {}
-        findings_by_scanner: Dict[str, int] = {}
+        total_findings = 0
 
         for result in results:
             total_findings += result.finding_count
             findings_by_account[result.account.account_id] = result.finding_count
 
-            # Aggregate by severity
-            account_severity = result.findings_by_severity()
-            for severity, count in account_severity.items():
-                findings_by_severity[severity] += count
-
-            # Aggregate by scanner
-            for finding in result.findings:
-                scanner = finding.rule_id.split("_")[0]
-                findings_by_scanner[scanner] = findings_by_scanner.get(scanner, 0) + 1
-
         return {
             "total_accounts": len(results),
             "successful_scans": sum(1 for r in results if r.success),
             "failed_scans": sum(1 for r in results if not r.success),
             "total_findings": total_findings,
-            "findings_by_severity": findings_by_severity,
+            "findings_by_severity": aggregate.severity_counts(),
             "findings_by_account": findings_by_account,
-            "findings_by_scanner": findings_by_scanner,
+            "findings_by_scanner": aggregate.by_scanner,
             "scan_timestamp": datetime.now(timezone.utc).isoformat(),
         }
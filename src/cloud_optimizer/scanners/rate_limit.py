@@ -0,0 +1,309 @@
+"""Shared adaptive rate limiting for AWS API calls.
+
+AWS throttles API calls per account, service and region, but botocore's
+``adaptive`` retry mode keeps its rate estimate per client. Every scanner
+builds its own clients, so concurrent scanners used to hit the same API at
+full speed and back off independently. ``AdaptiveRateLimiter`` keeps one token
+bucket per (account, service, region) that every instrumented client draws
+from:
+
+- each HTTP attempt, including botocore retries, takes a token first
+- a throttling error halves the bucket's rate (at most once per second)
+- successful calls raise the rate again additively
+
+so callers converge on the highest rate the API sustains. Clients keep
+botocore's ``standard`` retry mode, whose retry quota bounds how many retries a
+client spends while the API is unhealthy.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from botocore.config import Config
+
+from cloud_optimizer.config import get_settings
+from cloud_optimizer.scanners.executor import released_service_slot
+
+logger = logging.getLogger(__name__)
+
+# Error codes AWS services use to signal throttling
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "RequestThrottled",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "ProvisionedThroughputExceededException",
+        "BandwidthLimitExceeded",
+        "SlowDown",
+        "EC2ThrottledException",
+        "PriorRequestNotComplete",
+    }
+)
+
+# Client config for rate limited clients; throttling is handled by the limiter
+RATE_LIMITED_CLIENT_CONFIG = Config(retries={"max_attempts": 3, "mode": "standard"})
+
+# Bucket account for clients whose account is not known
+DEFAULT_ACCOUNT = "default"
+
+# Bucket key: (account, service, region)
+BucketKey = Tuple[str, str, str]
+
+
+@dataclass
+class RateLimitStats:
+    """Counters for one rate limit bucket.
+
+    Attributes:
+        rate: Current allowed requests per second
+        calls: Requests sent (including retries)
+        throttles: Throttling errors received
+        wait_seconds: Total time callers waited for a token
+    """
+
+    rate: float
+    calls: int = 0
+    throttles: int = 0
+    wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate adapts to throttling (AIMD)."""
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        backoff: float = 0.5,
+        increase: float = 0.1,
+    ) -> None:
+        """Initialize bucket.
+
+        Args:
+            rate: Initial requests per second (also the burst size)
+            min_rate: Rate never drops below this
+            max_rate: Rate never rises above this (defaults to 4x ``rate``)
+            backoff: Multiplier applied to the rate on throttling
+            increase: Requests per second added per successful call
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.backoff = backoff
+        self.increase = increase
+        self.stats = RateLimitStats(rate=rate)
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._last_backoff = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Get the current rate in requests per second."""
+        return self.stats.rate
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reserve(self) -> float:
+        """Take a token without waiting for it.
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            capacity = max(self.stats.rate, 1.0)
+            self._tokens = min(
+                capacity, self._tokens + (now - self._updated) * self.stats.rate
+            )
+            self._updated = now
+            # Reserve the token now; a negative balance is the wait owed
+            self._tokens -= 1
+            wait = -self._tokens / self.stats.rate if self._tokens < 0 else 0.0
+            self.stats.calls += 1
+            self.stats.wait_seconds += wait
+        return wait
+
+    def on_throttle(self) -> None:
+        """Back off after a throttling error."""
+        with self._lock:
+            self.stats.throttles += 1
+            now = time.monotonic()
+            # Throttles from calls already in flight do not compound
+            if now - self._last_backoff >= 1.0:
+                self.stats.rate = max(self.min_rate, self.stats.rate * self.backoff)
+                self._tokens = min(self._tokens, 0.0)
+                self._last_backoff = now
+
+    def on_success(self) -> None:
+        """Probe for more capacity after a successful call."""
+        with self._lock:
+            self.stats.rate = min(self.max_rate, self.stats.rate + self.increase)
+
+
+class AdaptiveRateLimiter:
+    """Token buckets per (account, service, region), shared by all clients.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter(default_rate=10, service_rates={"iam": 5})
+        >>> iam = limiter.instrument(session.client("iam"), "123456789012", "iam")
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 10.0,
+        service_rates: Optional[Dict[str, float]] = None,
+        min_rate: float = 0.5,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            default_rate: Initial requests per second for each bucket
+            service_rates: Per-service initial rates keyed by boto3 service name
+            min_rate: Floor for rates after repeated throttling
+        """
+        if default_rate <= 0:
+            raise ValueError("default_rate must be positive")
+        self.default_rate = default_rate
+        self.service_rates: Dict[str, float] = {
+            name.lower(): rate for name, rate in (service_rates or {}).items()
+        }
+        self.min_rate = min_rate
+        self._buckets: Dict[BucketKey, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, account_id: str, service_name: str, region: str) -> TokenBucket:
+        """Get (or create) the bucket for an account, service and region.
+
+        Args:
+            account_id: AWS account ID
+            service_name: boto3 service name
+            region: AWS region (``global`` for global services)
+
+        Returns:
+            Token bucket shared by every client with this key
+        """
+        key = (account_id, service_name.lower(), region)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate = self.service_rates.get(key[1], self.default_rate)
+                bucket = TokenBucket(rate, min_rate=self.min_rate)
+                self._buckets[key] = bucket
+            return bucket
+
+    def instrument(
+        self,
+        client: Any,
+        account_id: Optional[str],
+        service_name: str,
+        region: Optional[str] = None,
+    ) -> Any:
+        """Make a boto3 client draw from the shared bucket.
+
+        Every HTTP attempt waits for a token, and each attempt's outcome
+        adjusts the bucket's rate. The wait happens with the executor's
+        service slot released, so it does not hold up other calls.
+
+        Args:
+            client: boto3 client
+            account_id: AWS account ID (None shares ``DEFAULT_ACCOUNT``)
+            service_name: boto3 service name
+            region: Region the client talks to (defaults to the client's)
+
+        Returns:
+            The same client, instrumented
+        """
+        bucket = self.bucket(
+            account_id or DEFAULT_ACCOUNT,
+            service_name,
+            region or getattr(client.meta, "region_name", None) or "global",
+        )
+
+        def before_send(**kwargs: Any) -> None:
+            wait = bucket.reserve()
+            if wait > 0:
+                # Don't hold the executor's service slot while waiting
+                with released_service_slot():
+                    time.sleep(wait)
+
+        def needs_retry(
+            response: Any = None, caught_exception: Any = None, **kwargs: Any
+        ) -> None:
+            if response is None:
+                return
+            code = response[1].get("Error", {}).get("Code", "")
+            if code in THROTTLE_ERROR_CODES:
+                bucket.on_throttle()
+            elif not code:
+                bucket.on_success()
+
+        client.meta.events.register("before-send", before_send)
+        client.meta.events.register_first("needs-retry", needs_retry)
+        return client
+
+    def get_stats(
+        self, account_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """Get throttle and wait metrics per bucket.
+
+        Args:
+            account_id: Only include buckets for this account
+
+        Returns:
+            Stats keyed by ``account/service/region``
+        """
+        with self._lock:
+            buckets = {
+                key: bucket
+                for key, bucket in self._buckets.items()
+                if account_id is None or key[0] == account_id
+            }
+        return {
+            "/".join(key): {
+                "rate": round(bucket.stats.rate, 3),
+                "calls": bucket.stats.calls,
+                "throttles": bucket.stats.throttles,
+                "wait_seconds": round(bucket.stats.wait_seconds, 3),
+            }
+            for key, bucket in buckets.items()
+        }
+
+
+_default_limiter: Optional[AdaptiveRateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Get the process-wide rate limiter configured from settings.
+
+    Returns:
+        Shared AdaptiveRateLimiter instance
+    """
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            settings = get_settings()
+            _default_limiter = AdaptiveRateLimiter(
+                default_rate=settings.scanner_api_rate,
+                service_rates=settings.scanner_service_rates,
+            )
+        return _default_limiter
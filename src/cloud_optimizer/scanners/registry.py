@@ -7,6 +7,7 @@ import boto3
 
 from cloud_optimizer.scanners.base import BaseScanner
 from cloud_optimizer.scanners.ec2 import EC2Scanner
+from cloud_optimizer.scanners.executor import ScannerExecutor, get_scanner_executor
 from cloud_optimizer.scanners.iam import IAMScanner
 from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
 from cloud_optimizer.scanners.rds import RDSScanner
@@ -28,7 +29,11 @@ class ScannerRegistry:
 
     @classmethod
     def get_scanner(
-        cls, service: str, session: boto3.Session, regions: Optional[List[str]] = None
+        cls,
+        service: str,
+        session: boto3.Session,
+        regions: Optional[List[str]] = None,
+        executor: Optional[ScannerExecutor] = None,
     ) -> BaseScanner:
         """
         Get scanner instance for a service.
@@ -37,6 +42,7 @@ class ScannerRegistry:
             service: Service name (e.g., "S3", "EC2", "IAM")
             session: Boto3 session with AWS credentials
             regions: List of AWS regions to scan (defaults to ["us-east-1"])
+            executor: Optional executor to run the scanner off the event loop
 
         Returns:
             Scanner instance for the service
@@ -51,7 +57,7 @@ class ScannerRegistry:
             )
 
         logger.debug(f"Creating {service} scanner for regions: {regions}")
-        return scanner_class(session, regions)
+        return scanner_class(session, regions, executor=executor)
 
     @classmethod
     def get_all_services(cls) -> List[str]:
@@ -65,22 +71,30 @@ class ScannerRegistry:
 
     @classmethod
     def get_all_scanners(
-        cls, session: boto3.Session, regions: Optional[List[str]] = None
+        cls,
+        session: boto3.Session,
+        regions: Optional[List[str]] = None,
+        executor: Optional[ScannerExecutor] = None,
     ) -> List[BaseScanner]:
         """
         Get all registered scanner instances.
 
+        Scanners are attached to the shared scanner executor unless one is
+        passed explicitly, so ``scanner.run()`` never blocks the event loop.
+
         Args:
             session: Boto3 session with AWS credentials
             regions: List of AWS regions to scan (defaults to ["us-east-1"])
+            executor: Executor to attach (defaults to the shared executor)
 
         Returns:
             List of all scanner instances
         """
+        executor = executor or get_scanner_executor()
         scanners = []
         for service in cls.get_all_services():
             try:
-                scanner = cls.get_scanner(service, session, regions)
+                scanner = cls.get_scanner(service, session, regions, executor)
                 scanners.append(scanner)
             except Exception as e:
                 logger.error(f"Error creating scanner for {service}: {e}")
@@ -1,11 +1,12 @@
 """S3 Security Scanner."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Sequence
 
 from botocore.exceptions import ClientError
 
 from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.fanout import WorkUnit, batch_units
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,7 @@ class S3Scanner(BaseScanner):
     """Scanner for S3 bucket security configurations."""
 
     SERVICE = "S3"
+    REGIONAL = False
 
     def _register_rules(self) -> None:
         """Register S3 security rules."""
@@ -119,39 +121,81 @@ class S3Scanner(BaseScanner):
         Returns:
             List of scan results
         """
-        results: List[ScanResult] = []
         s3 = self.get_client("s3")
+        units = self._bucket_units(s3)
+
+        # boto3 clients are thread-safe, so every unit shares the one client.
+        async def scan_batch(unit: WorkUnit) -> List[ScanResult]:
+            return await self._scan_buckets(s3, unit.items)
+
+        return await self.fan_out(units, scan_batch)
+
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        """Yield S3 findings as each batch of buckets finishes."""
+        s3 = self.get_client("s3")
+        units = self._bucket_units(s3)
+
+        async def scan_batch(unit: WorkUnit) -> List[ScanResult]:
+            return await self._scan_buckets(s3, unit.items)
 
+        async for result in self.fan_out_iter(units, scan_batch):
+            yield result
+
+    def _bucket_units(self, s3: Any) -> List[WorkUnit]:
+        """List buckets and split them into work units.
+
+        Args:
+            s3: boto3 S3 client
+
+        Returns:
+            Bucket batches, or no units if buckets cannot be listed
+        """
         try:
             # List all buckets (S3 is global)
             response = s3.list_buckets()
             buckets = response.get("Buckets", [])
-
-            logger.info(f"Scanning {len(buckets)} S3 buckets")
-
-            for bucket in buckets:
-                bucket_name = bucket["Name"]
-                try:
-                    # Get bucket region
-                    location_response = s3.get_bucket_location(Bucket=bucket_name)
-                    region = location_response.get("LocationConstraint") or "us-east-1"
-
-                    # Check each rule
-                    results.extend(await self._check_public_access(s3, bucket_name, region))
-                    results.extend(await self._check_encryption(s3, bucket_name, region))
-                    results.extend(await self._check_versioning(s3, bucket_name, region))
-                    results.extend(await self._check_logging(s3, bucket_name, region))
-                    results.extend(await self._check_lifecycle(s3, bucket_name, region))
-
-                except ClientError as e:
-                    error_code = e.response.get("Error", {}).get("Code", "")
-                    if error_code == "AccessDenied":
-                        logger.warning(f"Access denied to bucket {bucket_name}")
-                    else:
-                        logger.error(f"Error scanning bucket {bucket_name}: {e}")
-
         except ClientError as e:
             logger.error(f"Error listing S3 buckets: {e}")
+            return []
+
+        logger.info(f"Scanning {len(buckets)} S3 buckets")
+
+        bucket_names = [bucket["Name"] for bucket in buckets]
+        return batch_units("global", bucket_names, self.UNIT_BATCH_SIZE, service="s3")
+
+    async def _scan_buckets(
+        self, s3: Any, bucket_names: Sequence[str]
+    ) -> List[ScanResult]:
+        """Run every S3 check against a batch of buckets.
+
+        Args:
+            s3: boto3 S3 client
+            bucket_names: Names of the buckets in the batch
+
+        Returns:
+            List of scan results for the batch
+        """
+        results: List[ScanResult] = []
+
+        for bucket_name in bucket_names:
+            try:
+                # Get bucket region
+                location_response = s3.get_bucket_location(Bucket=bucket_name)
+                region = location_response.get("LocationConstraint") or "us-east-1"
+
+                # Check each rule
+                results.extend(await self._check_public_access(s3, bucket_name, region))
+                results.extend(await self._check_encryption(s3, bucket_name, region))
+                results.extend(await self._check_versioning(s3, bucket_name, region))
+                results.extend(await self._check_logging(s3, bucket_name, region))
+                results.extend(await self._check_lifecycle(s3, bucket_name, region))
+
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                if error_code == "AccessDenied":
+                    logger.warning(f"Access denied to bucket {bucket_name}")
+                else:
+                    logger.error(f"Error scanning bucket {bucket_name}: {e}")
 
         return results
 
@@ -9,11 +9,13 @@ checking for rotation policies, access controls, encryption, and unused secrets.
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
 from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.fanout import WorkUnit, region_units
 
 logger = logging.getLogger(__name__)
 
@@ -255,28 +257,40 @@ class SecretsScanner(BaseScanner):
         Returns:
             List of scan results
         """
-        results: List[ScanResult] = []
+        units = region_units(self.regions, services=("secretsmanager", "ssm"))
+        return await self.fan_out(units, self._scan_unit)
+
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        """Yield secrets findings as each service and region finishes."""
+        units = region_units(self.regions, services=("secretsmanager", "ssm"))
+        async for result in self.fan_out_iter(units, self._scan_unit):
+            yield result
+
+    async def _scan_unit(self, unit: WorkUnit) -> List[ScanResult]:
+        """Scan Secrets Manager or Parameter Store in one region.
+
+        Args:
+            unit: Work unit covering a service in a region
 
-        for region in self.regions:
-            try:
+        Returns:
+            List of scan results for the unit
+        """
+        region = unit.region
+        try:
+            if unit.service == "secretsmanager":
                 # Scan Secrets Manager
                 secrets_client = self.get_client("secretsmanager", region=region)
                 logger.info(f"Scanning Secrets Manager in {region}")
-                results.extend(
-                    await self._check_secrets(secrets_client, region)
-                )
-
-                # Scan Parameter Store
-                ssm_client = self.get_client("ssm", region=region)
-                logger.info(f"Scanning Parameter Store in {region}")
-                results.extend(
-                    await self._check_parameters(ssm_client, region)
-                )
+                return await self._check_secrets(secrets_client, region)
 
-            except ClientError as e:
-                logger.error(f"Error scanning secrets in {region}: {e}")
+            # Scan Parameter Store
+            ssm_client = self.get_client("ssm", region=region)
+            logger.info(f"Scanning Parameter Store in {region}")
+            return await self._check_parameters(ssm_client, region)
 
-        return results
+        except ClientError as e:
+            logger.error(f"Error scanning secrets in {region}: {e}")
+            return []
 
     async def _check_secrets(
         self,
@@ -304,18 +318,6 @@ class SecretsScanner(BaseScanner):
                     secret_arn = secret["ARN"]
                     secret_name = secret.get("Name", secret_arn)
 
-                    # Check rotation (SM_001)
-                    rotation_enabled = secret.get("RotationEnabled", False)
-                    if not rotation_enabled:
-                        results.append(
-                            self.create_result(
-                                rule_id="SM_001",
-                                resource_id=secret_arn,
-                                resource_name=secret_name,
-                                region=region,
-                            )
-                        )
-
                     # Check last accessed (SM_002)
                     last_accessed = secret.get("LastAccessedDate")
                     if last_accessed:
@@ -336,95 +338,145 @@ class SecretsScanner(BaseScanner):
                                 )
                             )
 
-                    # Check KMS encryption (SM_003)
-                    kms_key_id = secret.get("KmsKeyId", "")
-                    if not kms_key_id or kms_key_id.startswith("aws/"):
-                        results.append(
-                            self.create_result(
-                                rule_id="SM_003",
-                                resource_id=secret_arn,
-                                resource_name=secret_name,
-                                region=region,
-                                metadata={
-                                    "kms_key": kms_key_id or "default (aws/secretsmanager)",
-                                },
-                            )
+                    # LastChangedDate moves with any change to the secret,
+                    # including its resource policy, so an unchanged secret is
+                    # carried forward without its get_resource_policy call.
+                    # LastAccessedDate only feeds SM_002 above.
+                    config = {
+                        key: value
+                        for key, value in secret.items()
+                        if key != "LastAccessedDate"
+                    }
+                    results.extend(
+                        await self.evaluate_incremental(
+                            secret_arn,
+                            config,
+                            partial(
+                                self._evaluate_secret, secrets_client, secret, region
+                            ),
                         )
+                    )
 
-                    # Check resource policy (SM_004)
-                    try:
-                        policy_response = secrets_client.get_resource_policy(
-                            SecretId=secret_arn
-                        )
-                        policy_str = policy_response.get("ResourcePolicy")
-                        if policy_str:
-                            import json
-
-                            policy = json.loads(policy_str)
-                            for statement in policy.get("Statement", []):
-                                principal = statement.get("Principal", {})
-                                if principal == "*" or (
-                                    isinstance(principal, dict)
-                                    and principal.get("AWS") == "*"
-                                ):
-                                    condition = statement.get("Condition", {})
-                                    if not condition:
-                                        results.append(
-                                            self.create_result(
-                                                rule_id="SM_004",
-                                                resource_id=secret_arn,
-                                                resource_name=secret_name,
-                                                region=region,
-                                                metadata={
-                                                    "principal": str(principal),
-                                                },
-                                            )
-                                        )
-                                        break
-                    except ClientError:
-                        pass  # No resource policy
-
-                    # Check replication (SM_005) - only for primary secrets
-                    primary_region = secret.get("PrimaryRegion")
-                    if not primary_region or primary_region == region:
-                        replication_status = secret.get("ReplicationStatus", [])
-                        if not replication_status:
-                            # Check if this is a production secret based on tags
-                            tags = secret.get("Tags", [])
-                            is_production = False
-                            for tag in tags:
-                                if tag.get("Key", "").lower() in ["env", "environment"]:
-                                    if tag.get("Value", "").lower() in [
-                                        "prod",
-                                        "production",
-                                    ]:
-                                        is_production = True
-                                        break
-
-                            if is_production:
-                                results.append(
-                                    self.create_result(
-                                        rule_id="SM_005",
-                                        resource_id=secret_arn,
-                                        resource_name=secret_name,
-                                        region=region,
-                                    )
-                                )
+        except ClientError as e:
+            logger.error(f"Error listing secrets in {region}: {e}")
+
+        return results
 
-                    # Check tags (SM_006)
-                    tags = secret.get("Tags", [])
-                    if not tags:
-                        results.append(
-                            self.create_result(
-                                rule_id="SM_006",
-                                resource_id=secret_arn,
-                                resource_name=secret_name,
-                                region=region,
+    async def _evaluate_secret(
+        self,
+        secrets_client: Any,
+        secret: Dict[str, Any],
+        region: str,
+    ) -> List[ScanResult]:
+        """Run the Secrets Manager checks that depend on the secret's configuration.
+
+        Args:
+            secrets_client: boto3 Secrets Manager client
+            secret: Secret entry from ``list_secrets``
+            region: AWS region being scanned
+
+        Returns:
+            List of scan results for the secret
+        """
+        results: List[ScanResult] = []
+        secret_arn = secret["ARN"]
+        secret_name = secret.get("Name", secret_arn)
+
+        # Check rotation (SM_001)
+        rotation_enabled = secret.get("RotationEnabled", False)
+        if not rotation_enabled:
+            results.append(
+                self.create_result(
+                    rule_id="SM_001",
+                    resource_id=secret_arn,
+                    resource_name=secret_name,
+                    region=region,
+                )
+            )
+
+        # Check KMS encryption (SM_003)
+        kms_key_id = secret.get("KmsKeyId", "")
+        if not kms_key_id or kms_key_id.startswith("aws/"):
+            results.append(
+                self.create_result(
+                    rule_id="SM_003",
+                    resource_id=secret_arn,
+                    resource_name=secret_name,
+                    region=region,
+                    metadata={
+                        "kms_key": kms_key_id or "default (aws/secretsmanager)",
+                    },
+                )
+            )
+
+        # Check resource policy (SM_004)
+        try:
+            policy_response = secrets_client.get_resource_policy(SecretId=secret_arn)
+            policy_str = policy_response.get("ResourcePolicy")
+            if policy_str:
+                import json
+
+                policy = json.loads(policy_str)
+                for statement in policy.get("Statement", []):
+                    principal = statement.get("Principal", {})
+                    if principal == "*" or (
+                        isinstance(principal, dict) and principal.get("AWS") == "*"
+                    ):
+                        condition = statement.get("Condition", {})
+                        if not condition:
+                            results.append(
+                                self.create_result(
+                                    rule_id="SM_004",
+                                    resource_id=secret_arn,
+                                    resource_name=secret_name,
+                                    region=region,
+                                    metadata={
+                                        "principal": str(principal),
+                                    },
+                                )
                             )
+                            break
+        except ClientError:
+            pass  # No resource policy
+
+        # Check replication (SM_005) - only for primary secrets
+        primary_region = secret.get("PrimaryRegion")
+        if not primary_region or primary_region == region:
+            replication_status = secret.get("ReplicationStatus", [])
+            if not replication_status:
+                # Check if this is a production secret based on tags
+                tags = secret.get("Tags", [])
+                is_production = False
+                for tag in tags:
+                    if tag.get("Key", "").lower() in ["env", "environment"]:
+                        if tag.get("Value", "").lower() in [
+                            "prod",
+                            "production",
+                        ]:
+                            is_production = True
+                            break
+
+                if is_production:
+                    results.append(
+                        self.create_result(
+                            rule_id="SM_005",
+                            resource_id=secret_arn,
+                            resource_name=secret_name,
+                            region=region,
                         )
-
-        except ClientError as e:
-            logger.error(f"Error listing secrets in {region}: {e}")
+                    )
+
+        # Check tags (SM_006)
+        tags = secret.get("Tags", [])
+        if not tags:
+            results.append(
+                self.create_result(
+                    rule_id="SM_006",
+                    resource_id=secret_arn,
+                    resource_name=secret_name,
+                    region=region,
+                )
+            )
 
         return results
 
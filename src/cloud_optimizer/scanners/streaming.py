@@ -0,0 +1,61 @@
+"""Streaming support for scan results.
+
+``scan()`` returns every finding of a scanner at once, so memory grows with the
+size of the account. ``scan_iter()`` yields findings as they are produced and
+the helpers here group them into bounded chunks that callers persist, score and
+meter while the scan is still running.
+"""
+
+from typing import AsyncGenerator, AsyncIterator, List, TypeVar
+
+T = TypeVar("T")
+
+# Findings handed to consumers per chunk
+DEFAULT_STREAM_CHUNK_SIZE = 200
+
+
+async def achunked(
+    source: AsyncIterator[T], size: int
+) -> AsyncGenerator[List[T], None]:
+    """Group an async iterator into consecutive lists.
+
+    Args:
+        source: Items to group
+        size: Maximum chunk size
+
+    Yields:
+        Consecutive lists of at most ``size`` items; never empty
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+
+    chunk: List[T] = []
+    async for item in source:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def next_chunk(source: AsyncIterator[T], size: int) -> List[T]:
+    """Pull up to ``size`` items from an async iterator.
+
+    Unlike ``achunked`` this does not take ownership of ``source``; the iterator
+    stays open so the caller can keep pulling chunks.
+
+    Args:
+        source: Items to pull from
+        size: Maximum number of items
+
+    Returns:
+        Up to ``size`` items; fewer only when ``source`` is exhausted
+    """
+    chunk: List[T] = []
+    while len(chunk) < size:
+        try:
+            chunk.append(await source.__anext__())
+        except StopAsyncIteration:
+            break
+    return chunk
@@ -0,0 +1,98 @@
+"""Database-backed scan checkpoint store."""
+
+import json
+import logging
+from typing import Callable, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cloud_optimizer.models.scan_checkpoint import ScanCheckpoint
+from cloud_optimizer.scanners.checkpoint import CheckpointStore, UnitCheckpoint
+from cloud_optimizer.scanners.fingerprint import result_from_dict, result_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseCheckpointStore(CheckpointStore):
+    """Checkpoint store backed by the ``scan_checkpoints`` table.
+
+    Each call uses its own short-lived session so the store can be shared by
+    concurrent account scans.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Initialize store.
+
+        Args:
+            session_factory: Factory for async database sessions
+        """
+        self._session_factory = session_factory
+
+    async def load(self, scan_id: str, account_id: str) -> List[UnitCheckpoint]:
+        """Load the completed units of an account scan."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ScanCheckpoint).where(
+                    ScanCheckpoint.scan_id == scan_id,
+                    ScanCheckpoint.account_id == account_id,
+                )
+            )
+            return [
+                UnitCheckpoint(
+                    scan_id=row.scan_id,
+                    account_id=row.account_id,
+                    scanner=row.scanner,
+                    region=row.region,
+                    findings=[result_from_dict(r) for r in row.findings],
+                    streamed_count=row.streamed_count,
+                    streamed_by_severity=dict(row.streamed_by_severity),
+                    completed_at=row.completed_at,
+                )
+                for row in result.scalars()
+            ]
+
+    async def save(self, checkpoint: UnitCheckpoint) -> None:
+        """Upsert a completed unit."""
+        stmt = pg_insert(ScanCheckpoint).values(
+            scan_id=checkpoint.scan_id,
+            account_id=checkpoint.account_id,
+            scanner=checkpoint.scanner,
+            region=checkpoint.region,
+            # Round-trip through JSON so datetimes in evidence are storable
+            findings=json.loads(
+                json.dumps(
+                    [result_to_dict(r) for r in checkpoint.findings], default=str
+                )
+            ),
+            streamed_count=checkpoint.streamed_count,
+            streamed_by_severity=checkpoint.streamed_by_severity,
+            completed_at=checkpoint.completed_at,
+        )
+        async with self._session_factory() as session:
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["scan_id", "account_id", "scanner", "region"],
+                    set_={
+                        "findings": stmt.excluded.findings,
+                        "streamed_count": stmt.excluded.streamed_count,
+                        "streamed_by_severity": stmt.excluded.streamed_by_severity,
+                        "completed_at": stmt.excluded.completed_at,
+                    },
+                )
+            )
+            await session.commit()
+
+        logger.debug(
+            f"Checkpointed {checkpoint.scanner} in {checkpoint.account_id}/"
+            f"{checkpoint.region} for scan {checkpoint.scan_id}"
+        )
+
+    async def delete(self, scan_id: str) -> None:
+        """Drop every checkpoint of a scan."""
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(ScanCheckpoint).where(ScanCheckpoint.scan_id == scan_id)
+            )
+            await session.commit()
@@ -8,12 +8,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from cloud_optimizer.models.aws_account import AWSAccount
 from cloud_optimizer.models.compliance import (
     ComplianceControl,
     ComplianceFramework,
     RuleComplianceMapping,
 )
 from cloud_optimizer.models.finding import Finding
+from cloud_optimizer.services.finding_summary import get_compliance_summary
 
 logger = logging.getLogger(__name__)
 
@@ -111,37 +113,48 @@ class ComplianceService:
                 result[framework_name] = [c.control_number for c in framework.controls]
         return result
 
-    async def get_compliance_summary(
-        self, findings: List[Finding]
+    async def get_account_compliance_summary(
+        self, aws_account_id: Optional[UUID] = None
     ) -> Dict[str, Dict[str, int]]:
-        """Generate compliance summary from findings.
+        """Get the compliance summary of stored findings.
+
+        Counts are read from the materialized summary counters instead of
+        loading the findings. Resolved findings count as passed.
 
         Args:
-            findings: List of security/cost findings
+            aws_account_id: Account to summarize; None summarizes every account
 
         Returns:
             Dictionary with compliance summary statistics
         """
-        summary: Dict[str, Dict[str, int]] = {}
-        for finding in findings:
-            for framework in finding.compliance_frameworks:
-                if framework not in summary:
-                    summary[framework] = {"total": 0, "passed": 0, "failed": 0}
-                summary[framework]["total"] += 1
-                if finding.status.value == "resolved":
-                    summary[framework]["passed"] += 1
-                else:
-                    summary[framework]["failed"] += 1
-        return summary
+        return await get_compliance_summary(self.db, aws_account_id)
+
+    async def user_owns_account(self, aws_account_id: UUID, user_id: UUID) -> bool:
+        """Check that an AWS account belongs to a user.
+
+        Args:
+            aws_account_id: AWS account ID
+            user_id: User ID
+
+        Returns:
+            True if the account exists and is owned by the user
+        """
+        result = await self.db.execute(
+            select(AWSAccount.account_id).where(
+                AWSAccount.account_id == aws_account_id,
+                AWSAccount.user_id == user_id,
+            )
+        )
+        return result.scalar_one_or_none() is not None
 
     async def get_framework_compliance_status(
-        self, framework_name: str, findings: List[Finding]
+        self, framework_name: str, aws_account_id: Optional[UUID] = None
     ) -> Dict[str, Any]:
         """Get detailed compliance status for a specific framework.
 
         Args:
             framework_name: Name of the compliance framework
-            findings: List of security/cost findings
+            aws_account_id: Account to report on; None reports every account
 
         Returns:
             Dictionary with detailed compliance status
@@ -150,15 +163,13 @@ class ComplianceService:
         if not framework:
             return {}
 
-        # Filter findings for this framework
-        framework_findings = [
-            f for f in findings if framework_name in f.compliance_frameworks
-        ]
+        summary = await self.get_account_compliance_summary(aws_account_id)
+        counts = summary.get(framework_name, {"total": 0, "passed": 0, "failed": 0})
 
         # Calculate compliance percentage
-        total_findings = len(framework_findings)
-        passed_findings = len([f for f in framework_findings if f.status.value == "resolved"])
-        failed_findings = total_findings - passed_findings
+        total_findings = counts["total"]
+        passed_findings = counts["passed"]
+        failed_findings = counts["failed"]
 
         compliance_percentage = (
             (passed_findings / total_findings * 100) if total_findings > 0 else 100.0
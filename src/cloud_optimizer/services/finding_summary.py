@@ -0,0 +1,435 @@
+"""Materialized findings summary counters.
+
+Account summaries used to GROUP BY over the whole ``findings`` table, and
+compliance summaries loaded every finding into Python. Instead, the
+``finding_summary_counters`` table keeps a count per account, severity,
+status, service and compliance framework. Writers collect changes in a
+``SummaryDeltas`` and apply them in the same transaction as the findings
+they describe, so summaries read a handful of counter rows.
+
+Counters can still drift, for example when findings are deleted by a cascade
+or written by a path that bypasses ``FindingsService``.
+``FindingSummaryReconciler`` recounts from ``findings`` and repairs any
+drift it finds.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cloud_optimizer.models.finding import Finding, FindingSeverity, FindingStatus
+from cloud_optimizer.models.finding_summary import FindingSummaryCounter
+
+logger = logging.getLogger(__name__)
+
+# Framework value of the counter rows that count every finding once
+ALL_FINDINGS = "*"
+
+# Counter identity: (account, severity, status, service, framework)
+CounterKey = Tuple[UUID, FindingSeverity, FindingStatus, str, str]
+
+
+def counter_keys(
+    aws_account_id: UUID,
+    severity: FindingSeverity,
+    status: FindingStatus,
+    service: str,
+    compliance_frameworks: Iterable[str],
+) -> List[CounterKey]:
+    """Get the counters a finding contributes to.
+
+    Args:
+        aws_account_id: AWS account ID
+        severity: Finding severity
+        status: Finding status
+        service: AWS service name
+        compliance_frameworks: Frameworks the finding is tagged with
+
+    Returns:
+        The ``ALL_FINDINGS`` counter followed by one per framework
+    """
+    keys = [(aws_account_id, severity, status, service, ALL_FINDINGS)]
+    keys.extend(
+        (aws_account_id, severity, status, service, framework)
+        for framework in compliance_frameworks
+    )
+    return keys
+
+
+class SummaryDeltas:
+    """Counter changes collected during one transaction."""
+
+    def __init__(self) -> None:
+        """Initialize with no changes."""
+        self._deltas: Counter[CounterKey] = Counter()
+
+    def __bool__(self) -> bool:
+        """Check if any counter changes."""
+        return any(self._deltas.values())
+
+    def add(
+        self,
+        aws_account_id: UUID,
+        severity: FindingSeverity,
+        status: FindingStatus,
+        service: str,
+        compliance_frameworks: Iterable[str],
+        count: int = 1,
+    ) -> None:
+        """Count findings in (or, with a negative count, out of) counters.
+
+        Args:
+            aws_account_id: AWS account ID
+            severity: Finding severity
+            status: Finding status
+            service: AWS service name
+            compliance_frameworks: Frameworks the findings are tagged with
+            count: Number of findings
+        """
+        for key in counter_keys(
+            aws_account_id, severity, status, service, compliance_frameworks
+        ):
+            self._deltas[key] += count
+
+    def add_key(self, key: CounterKey, count: int) -> None:
+        """Change a single counter.
+
+        Args:
+            key: Counter to change
+            count: Amount to add
+        """
+        self._deltas[key] += count
+
+    def move(
+        self,
+        aws_account_id: UUID,
+        severity: FindingSeverity,
+        old_status: FindingStatus,
+        new_status: FindingStatus,
+        service: str,
+        compliance_frameworks: List[str],
+    ) -> None:
+        """Move a finding between statuses.
+
+        Args:
+            aws_account_id: AWS account ID
+            severity: Finding severity
+            old_status: Status before the change
+            new_status: Status after the change
+            service: AWS service name
+            compliance_frameworks: Frameworks the finding is tagged with
+        """
+        self.add(
+            aws_account_id, severity, old_status, service, compliance_frameworks, -1
+        )
+        self.add(aws_account_id, severity, new_status, service, compliance_frameworks)
+
+    async def apply(self, db: AsyncSession) -> None:
+        """Write the changes without committing.
+
+        Call before committing the transaction that changed the findings.
+        Rows are upserted in key order so concurrent writers lock counters
+        in the same order.
+
+        Args:
+            db: Session of the transaction that changed the findings
+        """
+        rows = [
+            {
+                "aws_account_id": key[0],
+                "severity": key[1],
+                "status": key[2],
+                "service": key[3],
+                "framework": key[4],
+                "count": count,
+            }
+            for key, count in sorted(
+                self._deltas.items(), key=lambda item: tuple(map(str, item[0]))
+            )
+            if count
+        ]
+        if not rows:
+            return
+
+        stmt = pg_insert(FindingSummaryCounter).values(rows)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    "aws_account_id",
+                    "severity",
+                    "status",
+                    "service",
+                    "framework",
+                ],
+                set_={"count": FindingSummaryCounter.count + stmt.excluded.count},
+            )
+        )
+        self._deltas.clear()
+
+
+async def get_account_summary(db: AsyncSession, aws_account_id: UUID) -> Dict[str, Any]:
+    """Read an account's findings summary from the counters.
+
+    Args:
+        db: Database session
+        aws_account_id: AWS account ID
+
+    Returns:
+        Summary dictionary with counts by severity and status
+    """
+    result = await db.execute(
+        select(
+            FindingSummaryCounter.severity,
+            FindingSummaryCounter.status,
+            func.sum(FindingSummaryCounter.count).label("total"),
+        )
+        .where(
+            FindingSummaryCounter.aws_account_id == aws_account_id,
+            FindingSummaryCounter.framework == ALL_FINDINGS,
+        )
+        .group_by(FindingSummaryCounter.severity, FindingSummaryCounter.status)
+    )
+
+    total = 0
+    by_severity: Dict[str, int] = {severity.value: 0 for severity in FindingSeverity}
+    by_status: Dict[str, int] = {status.value: 0 for status in FindingStatus}
+    for row in result:
+        count = int(row.total)
+        total += count
+        by_severity[row.severity.value] += count
+        by_status[row.status.value] += count
+    return {"total": total, "by_severity": by_severity, "by_status": by_status}
+
+
+async def get_compliance_summary(
+    db: AsyncSession, aws_account_id: Optional[UUID] = None
+) -> Dict[str, Dict[str, int]]:
+    """Read per-framework finding counts from the counters.
+
+    Resolved findings count as passed; every other status as failed.
+
+    Args:
+        db: Database session
+        aws_account_id: Account to summarize; None summarizes every account
+
+    Returns:
+        Counts keyed by framework name
+    """
+    query = select(
+        FindingSummaryCounter.framework,
+        FindingSummaryCounter.status,
+        func.sum(FindingSummaryCounter.count).label("total"),
+    ).where(FindingSummaryCounter.framework != ALL_FINDINGS)
+    if aws_account_id is not None:
+        query = query.where(FindingSummaryCounter.aws_account_id == aws_account_id)
+    result = await db.execute(
+        query.group_by(FindingSummaryCounter.framework, FindingSummaryCounter.status)
+    )
+
+    summary: Dict[str, Dict[str, int]] = {}
+    for row in result:
+        count = int(row.total)
+        if not count:
+            continue
+        counts = summary.setdefault(
+            row.framework, {"total": 0, "passed": 0, "failed": 0}
+        )
+        counts["total"] += count
+        if row.status == FindingStatus.RESOLVED:
+            counts["passed"] += count
+        else:
+            counts["failed"] += count
+    return summary
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of a counter reconciliation.
+
+    Attributes:
+        checked: Counters compared
+        drift: Counters whose stored value was wrong, with the correction
+        repaired: Whether the drift was written back
+    """
+
+    checked: int = 0
+    drift: Dict[CounterKey, int] = field(default_factory=dict)
+    repaired: bool = False
+
+    @property
+    def drifted(self) -> bool:
+        """Check if any counter was wrong."""
+        return bool(self.drift)
+
+
+class FindingSummaryReconciler:
+    """Recounts findings and repairs drifted summary counters.
+
+    Example:
+        >>> reconciler = FindingSummaryReconciler(get_session_factory())
+        >>> result = await reconciler.reconcile()
+        >>> await reconciler.start(interval=3600)
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Initialize reconciler.
+
+        Args:
+            session_factory: Factory for database sessions
+        """
+        self._session_factory = session_factory
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def reconcile(
+        self, aws_account_id: Optional[UUID] = None, repair: bool = True
+    ) -> ReconcileResult:
+        """Compare the counters with a recount of ``findings``.
+
+        Both are read from one REPEATABLE READ snapshot. Repairs are written
+        as increments rather than absolute values, so ingests that commit
+        during the reconciliation are not lost.
+
+        Args:
+            aws_account_id: Account to check; None checks every account
+            repair: Write corrections for drifted counters
+
+        Returns:
+            Drift found and whether it was repaired
+        """
+        result = ReconcileResult()
+        async with self._session_factory() as session:
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+            expected = await self._count_findings(session, aws_account_id)
+            stored = await self._read_counters(session, aws_account_id)
+
+            deltas = SummaryDeltas()
+            for key in expected.keys() | stored.keys():
+                result.checked += 1
+                difference = expected.get(key, 0) - stored.get(key, 0)
+                if difference:
+                    result.drift[key] = difference
+                    deltas.add_key(key, difference)
+
+            if result.drift:
+                logger.warning(
+                    f"Findings summary drift in {len(result.drift)} of "
+                    f"{result.checked} counters"
+                )
+            if repair:
+                await deltas.apply(session)
+                cleanup = delete(FindingSummaryCounter).where(
+                    FindingSummaryCounter.count == 0
+                )
+                if aws_account_id is not None:
+                    cleanup = cleanup.where(
+                        FindingSummaryCounter.aws_account_id == aws_account_id
+                    )
+                await session.execute(cleanup)
+                await session.commit()
+                result.repaired = result.drifted
+        return result
+
+    async def start(self, interval: float) -> None:
+        """Reconcile every account periodically in the background.
+
+        Args:
+            interval: Seconds between reconciliations
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(interval))
+            logger.info(f"Reconciling findings summary counters every {interval}s")
+
+    async def stop(self) -> None:
+        """Stop the background reconciliation."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Findings summary reconciliation failed: {e}")
+
+    @staticmethod
+    async def _count_findings(
+        session: AsyncSession, aws_account_id: Optional[UUID]
+    ) -> Dict[CounterKey, int]:
+        columns = (
+            Finding.aws_account_id,
+            Finding.severity,
+            Finding.status,
+            Finding.service,
+        )
+        framework = func.jsonb_array_elements_text(Finding.compliance_frameworks)
+        untagged = select(*columns, literal(ALL_FINDINGS).label("framework"))
+        tagged = select(*columns, framework.label("framework"))
+        if aws_account_id is not None:
+            untagged = untagged.where(Finding.aws_account_id == aws_account_id)
+            tagged = tagged.where(Finding.aws_account_id == aws_account_id)
+
+        rows = union_all(untagged, tagged).subquery()
+        result = await session.execute(
+            select(rows, func.count().label("total")).group_by(*rows.c)
+        )
+        return {
+            (
+                row.aws_account_id,
+                row.severity,
+                row.status,
+                row.service,
+                row.framework,
+            ): row.total
+            for row in result
+        }
+
+    @staticmethod
+    async def _read_counters(
+        session: AsyncSession, aws_account_id: Optional[UUID]
+    ) -> Dict[CounterKey, int]:
+        query = select(FindingSummaryCounter).where(FindingSummaryCounter.count != 0)
+        if aws_account_id is not None:
+            query = query.where(FindingSummaryCounter.aws_account_id == aws_account_id)
+        result = await session.execute(query)
+        return {
+            (
+                row.aws_account_id,
+                row.severity,
+                row.status,
+                row.service,
+                row.framework,
+            ): row.count
+            for row in result.scalars()
+        }
+
+
+# Singleton instance
+_reconciler: Optional[FindingSummaryReconciler] = None
+
+
+def get_summary_reconciler() -> FindingSummaryReconciler:
+    """Get the singleton summary counter reconciler."""
+    global _reconciler
+    if _reconciler is None:
+        from cloud_optimizer.database import get_session_factory
+
+        _reconciler = FindingSummaryReconciler(get_session_factory())
+    return _reconciler
@@ -1,21 +1,124 @@
 """Findings management service."""
+import base64
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, any_, func, literal, literal_column, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cloud_optimizer.models.aws_account import AWSAccount
 from cloud_optimizer.models.finding import (
     Finding,
     FindingSeverity,
     FindingStatus,
     FindingType,
 )
+from cloud_optimizer.services.finding_summary import SummaryDeltas, get_account_summary
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT ... ON CONFLICT statement; ~16 bind params per row keeps each
+# statement well under PostgreSQL's 32767 parameter limit.
+BULK_CHUNK_SIZE = 500
+
+# Columns a bulk ingest row may carry (same fields as create_finding).
+_BULK_COLUMNS = (
+    "scan_job_id",
+    "aws_account_id",
+    "rule_id",
+    "finding_type",
+    "severity",
+    "service",
+    "resource_type",
+    "resource_id",
+    "resource_arn",
+    "region",
+    "title",
+    "description",
+    "recommendation",
+    "evidence",
+    "compliance_frameworks",
+    "potential_savings",
+)
+
+
+class DuplicateOpenFindingError(Exception):
+    """Reopening a finding would duplicate an open finding for its resource."""
+
+    pass
+
+
+@dataclass
+class BulkIngestResult:
+    """Outcome of a bulk findings ingest.
+
+    Attributes:
+        created: Number of new open findings inserted
+        updated: Number of existing open findings refreshed
+    """
+
+    created: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        """Get number of findings written."""
+        return self.created + self.updated
+
+
+def encode_cursor(finding: Finding) -> str:
+    """Encode the position after a finding in the listing order.
+
+    Args:
+        finding: Last finding of a page
+
+    Returns:
+        Opaque URL-safe cursor
+    """
+    position = f"{finding.first_seen_at.isoformat()}|{finding.finding_id}"
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor from a previous page
+
+    Returns:
+        (first_seen_at, finding_id) of the last finding of that page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        first_seen_at, finding_id = (
+            base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(first_seen_at), UUID(finding_id)
+    except ValueError as e:  # includes binascii.Error and UnicodeDecodeError
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class FindingsPage:
+    """One page of a findings listing.
+
+    Attributes:
+        findings: Findings on the page
+        next_cursor: Cursor for the next page, or None on the last page
+    """
+
+    findings: list[Finding] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
 
 class FindingsService:
     """Service for managing security and cost findings."""
@@ -98,10 +201,108 @@ class FindingsService:
             potential_savings=potential_savings,
         )
         self.db.add(finding)
+        deltas = SummaryDeltas()
+        deltas.add(
+            aws_account_id,
+            severity,
+            FindingStatus.OPEN,
+            service,
+            finding.compliance_frameworks,
+        )
+        await deltas.apply(self.db)
         await self.db.commit()
         await self.db.refresh(finding)
         return finding
 
+    async def bulk_upsert_findings(
+        self,
+        findings: Sequence[dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> BulkIngestResult:
+        """Create or refresh many findings in one transaction.
+
+        Each row takes the same fields as ``create_finding``. Rows are
+        deduplicated in memory on (aws_account_id, rule_id, resource_id), with
+        the last occurrence winning, and then written with one
+        ``INSERT ... ON CONFLICT DO UPDATE`` per chunk against the unique index
+        on open findings. Existing open findings get ``last_seen_at`` and
+        ``evidence`` refreshed, matching ``create_finding``. Summary counters
+        are updated for the inserted findings in the same transaction.
+
+        Args:
+            findings: Finding rows to ingest
+            chunk_size: Maximum rows per statement
+            commit: Commit the transaction; pass False to commit the findings
+                together with the caller's own writes
+
+        Returns:
+            Counts of created and updated findings
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        rows: dict[tuple[Any, Any, Any], dict[str, Any]] = {}
+        for finding in findings:
+            row = {column: finding.get(column) for column in _BULK_COLUMNS}
+            row["evidence"] = row["evidence"] or {}
+            row["compliance_frameworks"] = row["compliance_frameworks"] or []
+            row["status"] = FindingStatus.OPEN
+            key = (row["aws_account_id"], row["rule_id"], row["resource_id"])
+            rows[key] = row
+
+        result = BulkIngestResult()
+        if not rows:
+            return result
+
+        deltas = SummaryDeltas()
+        unique_rows = list(rows.values())
+        for start in range(0, len(unique_rows), chunk_size):
+            chunk = unique_rows[start : start + chunk_size]
+            insert_stmt = pg_insert(Finding).values(chunk)
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=[
+                    Finding.aws_account_id,
+                    Finding.rule_id,
+                    Finding.resource_id,
+                ],
+                index_where=text("status = 'OPEN'"),
+                set_={
+                    "last_seen_at": func.now(),
+                    "evidence": insert_stmt.excluded.evidence,
+                },
+            ).returning(
+                literal_column("(xmax = 0)").label("inserted"),
+                Finding.aws_account_id,
+                Finding.severity,
+                Finding.service,
+                Finding.compliance_frameworks,
+            )
+
+            # xmax is 0 only for rows this statement inserted.
+            outcome = await self.db.execute(stmt)
+            for written in outcome:
+                if written.inserted:
+                    result.created += 1
+                    deltas.add(
+                        written.aws_account_id,
+                        written.severity,
+                        FindingStatus.OPEN,
+                        written.service,
+                        written.compliance_frameworks,
+                    )
+                else:
+                    result.updated += 1
+
+        await deltas.apply(self.db)
+        if commit:
+            await self.db.commit()
+        logger.info(
+            f"Bulk ingested {result.total} findings "
+            f"({result.created} created, {result.updated} updated)"
+        )
+        return result
+
     async def _find_existing(
         self, aws_account_id: UUID, rule_id: str, resource_id: str
     ) -> Optional[Finding]:
@@ -136,6 +337,35 @@ class FindingsService:
         """
         return await self.db.get(Finding, finding_id)
 
+    async def get_findings_bulk(
+        self, finding_ids: Sequence[UUID], user_id: Optional[UUID] = None
+    ) -> list[Finding]:
+        """Get several findings by ID in one query.
+
+        Args:
+            finding_ids: Finding IDs to load
+            user_id: Only return findings of AWS accounts owned by this user;
+                None skips the ownership check
+
+        Returns:
+            Findings in the order requested, without duplicates. IDs that do
+            not exist or belong to another user are left out.
+        """
+        unique_ids = list(dict.fromkeys(finding_ids))
+        if not unique_ids:
+            return []
+
+        # One array parameter, so every batch size shares a prepared statement
+        ids = literal(unique_ids, ARRAY(PGUUID(as_uuid=True)))
+        query = select(Finding).where(Finding.finding_id == any_(ids))
+        if user_id is not None:
+            query = query.join(
+                AWSAccount, AWSAccount.account_id == Finding.aws_account_id
+            ).where(AWSAccount.user_id == user_id)
+        result = await self.db.execute(query)
+        found = {finding.finding_id: finding for finding in result.scalars()}
+        return [found[fid] for fid in unique_ids if fid in found]
+
     async def get_findings_by_account(
         self,
         aws_account_id: UUID,
@@ -147,6 +377,9 @@ class FindingsService:
     ) -> list[Finding]:
         """Get findings for an AWS account with optional filters.
 
+        Offsets make deep pages scan every skipped row; prefer
+        ``get_findings_page`` for paging through large accounts.
+
         Args:
             aws_account_id: AWS account ID
             severity: Filter by severity level
@@ -158,6 +391,66 @@ class FindingsService:
         Returns:
             List of findings
         """
+        query = self._account_query(aws_account_id, severity, status, service)
+        query = query.limit(limit).offset(offset)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_findings_page(
+        self,
+        aws_account_id: UUID,
+        severity: Optional[FindingSeverity] = None,
+        status: Optional[FindingStatus] = None,
+        service: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> FindingsPage:
+        """Get a page of an account's findings using keyset pagination.
+
+        Pages are ordered like ``get_findings_by_account`` (newest first).
+        Instead of skipping ``offset`` rows, each page seeks past the
+        (first_seen_at, finding_id) position of the previous page's last
+        finding, so every page costs the same however deep it is.
+
+        Args:
+            aws_account_id: AWS account ID
+            severity: Filter by severity level
+            status: Filter by status
+            service: Filter by AWS service
+            limit: Maximum number of results
+            cursor: ``next_cursor`` of the previous page; None for the first
+
+        Returns:
+            The page and the cursor of the next one
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self._account_query(aws_account_id, severity, status, service)
+        if cursor is not None:
+            first_seen_at, finding_id = decode_cursor(cursor)
+            query = query.where(
+                tuple_(Finding.first_seen_at, Finding.finding_id)
+                < tuple_(first_seen_at, finding_id)
+            )
+
+        # One extra row tells whether another page follows
+        result = await self.db.execute(query.limit(limit + 1))
+        findings = list(result.scalars().all())
+
+        page = FindingsPage(findings=findings[:limit])
+        if len(findings) > limit:
+            page.next_cursor = encode_cursor(page.findings[-1])
+        return page
+
+    def _account_query(
+        self,
+        aws_account_id: UUID,
+        severity: Optional[FindingSeverity],
+        status: Optional[FindingStatus],
+        service: Optional[str],
+    ) -> Select[Finding]:
+        """Build the filtered, ordered listing query for an account."""
         query = select(Finding).where(Finding.aws_account_id == aws_account_id)
 
         if severity:
@@ -167,9 +460,8 @@ class FindingsService:
         if service:
             query = query.where(Finding.service == service)
 
-        query = query.order_by(Finding.first_seen_at.desc()).limit(limit).offset(offset)
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        # finding_id breaks ties so the order (and cursors) are stable
+        return query.order_by(Finding.first_seen_at.desc(), Finding.finding_id.desc())
 
     async def update_status(
         self, finding_id: UUID, status: FindingStatus
@@ -182,9 +474,34 @@ class FindingsService:
 
         Returns:
             Updated finding if found, None otherwise
+
+        Raises:
+            DuplicateOpenFindingError: If reopening the finding would conflict
+                with an open finding for the same rule and resource, e.g. one
+                a later scan created after this one was resolved
         """
         finding = await self.get_finding(finding_id)
         if finding:
+            if status == FindingStatus.OPEN and finding.status != status:
+                existing = await self._find_existing(
+                    finding.aws_account_id, finding.rule_id, finding.resource_id
+                )
+                if existing is not None:
+                    raise DuplicateOpenFindingError(
+                        f"Finding {existing.finding_id} is already open for "
+                        f"{finding.rule_id} on {finding.resource_id}"
+                    )
+            if finding.status != status:
+                deltas = SummaryDeltas()
+                deltas.move(
+                    finding.aws_account_id,
+                    finding.severity,
+                    finding.status,
+                    status,
+                    finding.service,
+                    finding.compliance_frameworks,
+                )
+                await deltas.apply(self.db)
             finding.status = status
             if status == FindingStatus.RESOLVED:
                 finding.resolved_at = datetime.now(timezone.utc)
@@ -195,32 +512,12 @@ class FindingsService:
     async def get_summary(self, aws_account_id: UUID) -> dict:
         """Get findings summary for an account.
 
+        Reads the materialized summary counters instead of counting findings.
+
         Args:
             aws_account_id: AWS account ID
 
         Returns:
             Summary dictionary with counts by severity and status
         """
-        result = await self.db.execute(
-            select(
-                Finding.severity,
-                Finding.status,
-                func.count(Finding.finding_id).label("count"),
-            )
-            .where(Finding.aws_account_id == aws_account_id)
-            .group_by(Finding.severity, Finding.status)
-        )
-
-        summary = {
-            "total": 0,
-            "by_severity": {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0},
-            "by_status": {"open": 0, "resolved": 0, "suppressed": 0, "false_positive": 0},
-        }
-
-        for row in result:
-            count = row.count
-            summary["total"] += count
-            summary["by_severity"][row.severity.value] += count
-            summary["by_status"][row.status.value] += count
-
-        return summary
+        return await get_account_summary(self.db, aws_account_id)
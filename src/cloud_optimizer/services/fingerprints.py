@@ -0,0 +1,117 @@
+"""Database-backed resource fingerprint store."""
+
+import json
+import logging
+from datetime import timedelta
+from typing import Callable, Dict, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cloud_optimizer.models.resource_fingerprint import ResourceFingerprint
+from cloud_optimizer.scanners.fingerprint import (
+    DEFAULT_MAX_AGE,
+    FingerprintEntry,
+    FingerprintSnapshot,
+    FingerprintStore,
+    result_from_dict,
+    result_to_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows per upsert statement
+SAVE_CHUNK_SIZE = 500
+
+
+class DatabaseFingerprintStore(FingerprintStore):
+    """Fingerprint store backed by the ``resource_fingerprints`` table.
+
+    Each ``load``/``save`` uses its own short-lived session so the store can be
+    shared by concurrent account scans.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_age: timedelta = DEFAULT_MAX_AGE,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            session_factory: Factory for async database sessions
+            max_age: Maximum age of carried-forward results
+        """
+        self._session_factory = session_factory
+        self.max_age = max_age
+
+    async def load(self, account_id: str, scanner: str) -> FingerprintSnapshot:
+        """Load the fingerprints recorded by the previous scan."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ResourceFingerprint).where(
+                    ResourceFingerprint.account_id == account_id,
+                    ResourceFingerprint.scanner == scanner,
+                )
+            )
+            entries: Dict[str, FingerprintEntry] = {
+                row.resource_id: FingerprintEntry(
+                    fingerprint=row.fingerprint,
+                    results=[result_from_dict(r) for r in row.results],
+                    evaluated_at=row.evaluated_at,
+                )
+                for row in result.scalars()
+            }
+
+        return FingerprintSnapshot(account_id, scanner, entries, self.max_age)
+
+    async def save(self, snapshot: FingerprintSnapshot) -> None:
+        """Upsert re-evaluated resources and drop resources that disappeared."""
+        updated, removed = snapshot.changes()
+        rows: List[Dict[str, object]] = [
+            {
+                "account_id": snapshot.account_id,
+                "scanner": snapshot.scanner,
+                "resource_id": resource_id,
+                "fingerprint": entry.fingerprint,
+                # Round-trip through JSON so datetimes in evidence are storable
+                "results": json.loads(
+                    json.dumps([result_to_dict(r) for r in entry.results], default=str)
+                ),
+                "evaluated_at": entry.evaluated_at,
+            }
+            for resource_id, entry in updated.items()
+        ]
+
+        async with self._session_factory() as session:
+            for start in range(0, len(rows), SAVE_CHUNK_SIZE):
+                stmt = pg_insert(ResourceFingerprint).values(
+                    rows[start : start + SAVE_CHUNK_SIZE]
+                )
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["account_id", "scanner", "resource_id"],
+                        set_={
+                            "fingerprint": stmt.excluded.fingerprint,
+                            "results": stmt.excluded.results,
+                            "evaluated_at": stmt.excluded.evaluated_at,
+                        },
+                    )
+                )
+
+            if removed:
+                await session.execute(
+                    delete(ResourceFingerprint).where(
+                        ResourceFingerprint.account_id == snapshot.account_id,
+                        ResourceFingerprint.scanner == snapshot.scanner,
+                        ResourceFingerprint.resource_id.in_(removed),
+                    )
+                )
+            await session.commit()
+
+        logger.info(
+            f"Saved fingerprints for {snapshot.scanner} in {snapshot.account_id}: "
+            f"{len(rows)} updated, {len(removed)} removed, "
+            f"{snapshot.carried_forward} carried forward"
+        )
@@ -0,0 +1,474 @@
+"""Background scan job queue and worker pool.
+
+Scan requests persist a pending ``ScanJob`` and return immediately. Workers
+claim pending jobs and run them through ``SecurityScanEngine.run_scan_job``,
+which reports progress on the job row as the scan advances. While a job runs
+its worker also bumps ``heartbeat_at`` on a fixed interval, so a scanner that
+goes a long time without producing findings is not mistaken for a dead one.
+
+Two queue implementations are provided:
+
+- ``DatabaseScanQueue`` claims jobs from the ``scan_jobs`` table with
+  ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of API or worker
+  processes can share the queue durably.
+- ``LocalScanQueue`` hands job IDs to workers in the same process through an
+  ``asyncio.Queue``; it is intended for tests and single-process development.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Protocol, cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, Update, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cloud_optimizer.models.scan_job import ScanJob, ScanStatus
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+async def _update_rows(session: AsyncSession, statement: Update) -> int:
+    """Execute an UPDATE and return the number of rows it matched."""
+    result = cast(CursorResult[Any], await session.execute(statement))
+    return result.rowcount
+
+
+class ScanEngine(Protocol):
+    """Runs a claimed scan job (implemented by ``SecurityScanEngine``)."""
+
+    async def run_scan_job(self, job_id: UUID) -> object:
+        """Run the scan job with the given ID; the result is ignored."""
+
+
+class ScanQueue(ABC):
+    """Queue of scan jobs waiting for a worker."""
+
+    @abstractmethod
+    async def submit(self, job_id: UUID) -> None:
+        """Make a committed pending job available to workers.
+
+        Args:
+            job_id: ID of the pending scan job
+        """
+
+    @abstractmethod
+    async def claim(self, worker_id: str, timeout: float) -> Optional[UUID]:
+        """Claim the next pending job, waiting up to ``timeout`` seconds.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            timeout: Maximum seconds to wait for a job
+
+        Returns:
+            Claimed job ID, or None if no job became available
+        """
+
+    @abstractmethod
+    async def release(self, job_id: UUID, worker_id: str) -> None:
+        """Return a claimed job to the queue without counting the attempt.
+
+        Args:
+            job_id: ID of the claimed job
+            worker_id: Identifier of the worker that claimed it
+        """
+
+    @abstractmethod
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> bool:
+        """Record that the worker running a claimed job is still alive.
+
+        Args:
+            job_id: ID of the claimed job
+            worker_id: Identifier of the worker that claimed it
+
+        Returns:
+            False if the worker no longer holds the job
+        """
+
+
+class LocalScanQueue(ScanQueue):
+    """In-process queue for tests and single-process development."""
+
+    def __init__(self) -> None:
+        """Initialize local queue."""
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+
+    async def submit(self, job_id: UUID) -> None:
+        """Queue a job ID for the in-process workers."""
+        await self._queue.put(job_id)
+
+    async def claim(self, worker_id: str, timeout: float) -> Optional[UUID]:
+        """Take the next queued job ID."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def release(self, job_id: UUID, worker_id: str) -> None:
+        """Queue the job ID again."""
+        await self._queue.put(job_id)
+
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> bool:
+        """Nothing to record; in-process jobs cannot be reclaimed."""
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Get number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+
+class DatabaseScanQueue(ScanQueue):
+    """Durable queue backed by the ``scan_jobs`` table."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        job_timeout_seconds: int = 3600,
+        max_attempts: int = 3,
+    ) -> None:
+        """Initialize database queue.
+
+        Args:
+            session_factory: Factory for async database sessions
+            job_timeout_seconds: Running jobs without a heartbeat for this
+                long are assumed to belong to a dead worker and are requeued
+            max_attempts: Claims allowed per job before it is failed
+        """
+        self._session_factory = session_factory
+        self.job_timeout_seconds = job_timeout_seconds
+        self.max_attempts = max_attempts
+        self._wakeup = asyncio.Event()
+        self._last_recovery: Optional[datetime] = None
+
+    async def submit(self, job_id: UUID) -> None:
+        """Wake local workers; remote workers pick the job up on their next poll."""
+        self._wakeup.set()
+
+    async def claim(self, worker_id: str, timeout: float) -> Optional[UUID]:
+        """Claim the oldest pending job with ``FOR UPDATE SKIP LOCKED``."""
+        await self._maybe_recover_stale()
+
+        job_id = await self._claim_once(worker_id)
+        if job_id is not None:
+            return job_id
+
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return await self._claim_once(worker_id)
+
+    async def _claim_once(self, worker_id: str) -> Optional[UUID]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ScanJob)
+                .where(ScanJob.status == ScanStatus.PENDING)
+                .order_by(ScanJob.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            job = result.scalar_one_or_none()
+            if job is None:
+                return None
+
+            job.status = ScanStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            job.heartbeat_at = job.started_at
+            job.worker_id = worker_id
+            job.attempts = (job.attempts or 0) + 1
+            await session.commit()
+            job_id: UUID = job.job_id
+            logger.info(f"Worker {worker_id} claimed scan job {job_id}")
+            return job_id
+
+    async def release(self, job_id: UUID, worker_id: str) -> None:
+        """Reset the job to pending if this worker still holds it."""
+        async with self._session_factory() as session:
+            await session.execute(
+                update(ScanJob)
+                .where(
+                    ScanJob.job_id == job_id,
+                    ScanJob.status == ScanStatus.RUNNING,
+                    ScanJob.worker_id == worker_id,
+                )
+                .values(
+                    status=ScanStatus.PENDING,
+                    worker_id=None,
+                    heartbeat_at=None,
+                    attempts=func.greatest(ScanJob.attempts - 1, 0),
+                )
+            )
+            await session.commit()
+        self._wakeup.set()
+        logger.info(f"Worker {worker_id} released scan job {job_id}")
+
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> bool:
+        """Bump ``heartbeat_at`` if this worker still holds the job."""
+        async with self._session_factory() as session:
+            updated = await _update_rows(
+                session,
+                update(ScanJob)
+                .where(
+                    ScanJob.job_id == job_id,
+                    ScanJob.status == ScanStatus.RUNNING,
+                    ScanJob.worker_id == worker_id,
+                )
+                .values(heartbeat_at=datetime.now(timezone.utc)),
+            )
+            await session.commit()
+        return updated > 0
+
+    async def _maybe_recover_stale(self) -> None:
+        now = datetime.now(timezone.utc)
+        interval = timedelta(seconds=max(self.job_timeout_seconds // 4, 1))
+        if self._last_recovery and now - self._last_recovery < interval:
+            return
+        self._last_recovery = now
+        await self.recover_stale_jobs()
+
+    async def recover_stale_jobs(self) -> int:
+        """Requeue running jobs whose worker appears to have died.
+
+        A job is stale when its heartbeat (or its start, if it has none) is
+        older than ``job_timeout_seconds``. Jobs that have exhausted
+        ``max_attempts`` are marked failed instead.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            seconds=self.job_timeout_seconds
+        )
+        stale = (
+            ScanJob.status == ScanStatus.RUNNING,
+            func.coalesce(ScanJob.heartbeat_at, ScanJob.started_at) < cutoff,
+        )
+
+        async with self._session_factory() as session:
+            failed = await _update_rows(
+                session,
+                update(ScanJob)
+                .where(*stale, ScanJob.attempts >= self.max_attempts)
+                .values(
+                    status=ScanStatus.FAILED,
+                    error_message="Scan worker stopped responding",
+                    progress=100,
+                    completed_at=datetime.now(timezone.utc),
+                ),
+            )
+            requeued = await _update_rows(
+                session,
+                update(ScanJob)
+                .where(*stale, ScanJob.attempts < self.max_attempts)
+                .values(status=ScanStatus.PENDING, worker_id=None),
+            )
+            await session.commit()
+
+        count = failed + requeued
+        if count:
+            logger.warning(f"Recovered {count} stale scan jobs")
+        return count
+
+
+class ScanWorkerPool:
+    """Runs claimed scan jobs with bounded concurrency.
+
+    Example:
+        >>> pool = ScanWorkerPool(queue, get_session_factory(), concurrency=4)
+        >>> await pool.start()
+        >>> ...
+        >>> await pool.stop()
+    """
+
+    def __init__(
+        self,
+        queue: ScanQueue,
+        session_factory: SessionFactory,
+        engine_factory: Optional[Callable[[AsyncSession], ScanEngine]] = None,
+        concurrency: int = 2,
+        poll_interval: float = 2.0,
+        heartbeat_interval: float = 60.0,
+    ) -> None:
+        """Initialize worker pool.
+
+        Args:
+            queue: Queue to claim jobs from
+            session_factory: Factory for the per-job database session
+            engine_factory: Builds the scan engine for a session (defaults to
+                ``SecurityScanEngine``)
+            concurrency: Number of jobs run concurrently
+            poll_interval: Seconds a worker waits for a job before polling again
+            heartbeat_interval: Seconds between heartbeats of a running job;
+                keep this well under the queue's job timeout
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._session_factory = session_factory
+        self._engine_factory = engine_factory
+        self._tasks: List[asyncio.Task[None]] = []
+        self._stopping = asyncio.Event()
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    @property
+    def running(self) -> bool:
+        """Check if workers are running."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._work(f"{self._worker_prefix}:{index}"))
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"Started {self.concurrency} scan workers")
+
+    async def stop(self) -> None:
+        """Stop the workers, returning any scan in progress to the queue."""
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _work(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                job_id = await self.queue.claim(worker_id, self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed to claim a job: {e}")
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            if job_id is None:
+                continue
+            try:
+                await self.run_job(job_id, worker_id)
+            except asyncio.CancelledError:
+                await self._release(job_id, worker_id)
+                raise
+
+    async def _release(self, job_id: UUID, worker_id: str) -> None:
+        try:
+            await self.queue.release(job_id, worker_id)
+        except Exception as e:
+            logger.error(f"Worker {worker_id} failed to release job {job_id}: {e}")
+
+    async def run_job(self, job_id: UUID, worker_id: Optional[str] = None) -> None:
+        """Run a single claimed job in its own database session.
+
+        While the scan runs, a heartbeat is recorded every
+        ``heartbeat_interval`` seconds whether or not the scan reports
+        progress.
+
+        Args:
+            job_id: ID of the claimed job
+            worker_id: Identifier of the worker that claimed it; no heartbeat
+                is recorded without one
+        """
+        heartbeat: Optional[asyncio.Task[None]] = None
+        if worker_id is not None:
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, worker_id))
+        try:
+            async with self._session_factory() as session:
+                engine = self._build_engine(session)
+                try:
+                    await engine.run_scan_job(job_id)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Scan job {job_id} failed: {e}")
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+                with suppress(asyncio.CancelledError):
+                    await heartbeat
+
+    async def _heartbeat(self, job_id: UUID, worker_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                owned = await self.queue.heartbeat(job_id, worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker {worker_id} heartbeat for {job_id} failed: {e}")
+                continue
+            if not owned:
+                # The engine checks ownership again before completing the job
+                logger.warning(f"Worker {worker_id} no longer holds scan job {job_id}")
+                return
+
+    def _build_engine(self, session: AsyncSession) -> ScanEngine:
+        if self._engine_factory is not None:
+            return self._engine_factory(session)
+
+        from cloud_optimizer.services.security_scanner import SecurityScanEngine
+
+        return SecurityScanEngine(session)
+
+
+# Singleton instances
+_scan_queue: Optional[ScanQueue] = None
+_worker_pool: Optional[ScanWorkerPool] = None
+
+
+def get_scan_queue() -> ScanQueue:
+    """Get the singleton scan queue configured from settings."""
+    global _scan_queue
+    if _scan_queue is None:
+        from cloud_optimizer.config import get_settings
+        from cloud_optimizer.database import get_session_factory
+
+        settings = get_settings()
+        if settings.scan_queue_mode == "local":
+            _scan_queue = LocalScanQueue()
+        else:
+            _scan_queue = DatabaseScanQueue(
+                get_session_factory(),
+                job_timeout_seconds=settings.scan_job_timeout_seconds,
+                max_attempts=settings.scan_job_max_attempts,
+            )
+    return _scan_queue
+
+
+def get_scan_worker_pool() -> ScanWorkerPool:
+    """Get the singleton scan worker pool configured from settings."""
+    global _worker_pool
+    if _worker_pool is None:
+        from cloud_optimizer.config import get_settings
+        from cloud_optimizer.database import get_session_factory
+
+        settings = get_settings()
+        _worker_pool = ScanWorkerPool(
+            get_scan_queue(),
+            get_session_factory(),
+            concurrency=settings.scan_worker_concurrency,
+            poll_interval=settings.scan_worker_poll_interval,
+            heartbeat_interval=settings.scan_job_timeout_seconds / 6,
+        )
+    return _worker_pool
@@ -0,0 +1,620 @@
+"""Security score history for dashboard trends.
+
+The dashboard used to keep every recorded ``AccountScanResult`` list for 90
+days and re-score all of them whenever a trend was requested. Instead, scores
+are computed once when scan results are recorded: one ``ScoreSnapshot`` per
+account plus one for the organization (``ORG_SCOPE``). Each snapshot is also
+folded into daily and weekly ``ScoreRollup`` buckets, so trend reads return
+stored points rather than recomputing them.
+
+``ScoreHistory`` holds the series in process; a ``ScoreHistoryStore``
+persists it so trends survive restarts.
+"""
+
+import bisect
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, case, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cloud_optimizer.models.security_score import (
+    SecurityScoreRollup,
+    SecurityScoreSnapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+# Scope of organization-wide snapshots (other scopes are account IDs)
+ORG_SCOPE = "organization"
+
+# Snapshots are kept this long; rollups are kept longer
+HISTORY_DAYS = 90
+ROLLUP_RETENTION_DAYS = 365
+
+
+class RollupPeriod(str, Enum):
+    """Rollup bucket size."""
+
+    DAY = "day"
+    WEEK = "week"
+
+
+def bucket_start(timestamp: datetime, period: RollupPeriod) -> datetime:
+    """Get the start of the rollup bucket containing a timestamp.
+
+    Days start at midnight and weeks on Monday, in the timestamp's timezone.
+
+    Args:
+        timestamp: Timestamp to bucket
+        period: Bucket size
+
+    Returns:
+        Start of the bucket
+    """
+    start = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == RollupPeriod.WEEK:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+@dataclass
+class ScoreSnapshot:
+    """Security score of one scope after one recorded scan.
+
+    Attributes:
+        scope: AWS account ID, or ``ORG_SCOPE``
+        recorded_at: When the scan results were recorded
+        score: Security score (0-100)
+        findings_count: Failed findings
+        critical_count: Critical severity findings
+        high_count: High severity findings
+        medium_count: Medium severity findings
+        low_count: Low severity findings
+    """
+
+    scope: str
+    recorded_at: datetime
+    score: float
+    findings_count: int = 0
+    critical_count: int = 0
+    high_count: int = 0
+    medium_count: int = 0
+    low_count: int = 0
+
+    def to_point(self) -> Dict[str, Any]:
+        """Get the snapshot as a trend data point."""
+        return {
+            "timestamp": self.recorded_at.isoformat(),
+            "score": self.score,
+            "findings_count": self.findings_count,
+            "critical_count": self.critical_count,
+        }
+
+
+@dataclass
+class ScoreRollup:
+    """Snapshots of one scope within one day or week.
+
+    Attributes:
+        scope: AWS account ID, or ``ORG_SCOPE``
+        period: Bucket size
+        bucket_start: Start of the bucket
+        samples: Snapshots in the bucket
+        score_sum: Sum of their scores
+        score_min: Lowest score
+        score_max: Highest score
+        last_recorded_at: Time of the latest snapshot
+        last_score: Score of the latest snapshot
+        findings_count: Findings of the latest snapshot
+        critical_count: Critical findings of the latest snapshot
+    """
+
+    scope: str
+    period: RollupPeriod
+    bucket_start: datetime
+    samples: int = 0
+    score_sum: float = 0.0
+    score_min: float = 100.0
+    score_max: float = 0.0
+    last_recorded_at: Optional[datetime] = None
+    last_score: float = 0.0
+    findings_count: int = 0
+    critical_count: int = 0
+
+    @classmethod
+    def of(cls, snapshot: ScoreSnapshot, period: RollupPeriod) -> "ScoreRollup":
+        """Create the bucket of a snapshot, containing only that snapshot."""
+        rollup = cls(
+            scope=snapshot.scope,
+            period=period,
+            bucket_start=bucket_start(snapshot.recorded_at, period),
+        )
+        rollup.add(snapshot)
+        return rollup
+
+    @property
+    def average(self) -> float:
+        """Get the mean score of the bucket."""
+        return round(self.score_sum / self.samples, 1) if self.samples else 0.0
+
+    def add(self, snapshot: ScoreSnapshot) -> None:
+        """Fold a snapshot into the bucket.
+
+        Args:
+            snapshot: Snapshot within the bucket
+        """
+        self.samples += 1
+        self.score_sum += snapshot.score
+        self.score_min = min(self.score_min, snapshot.score)
+        self.score_max = max(self.score_max, snapshot.score)
+        if (
+            self.last_recorded_at is None
+            or snapshot.recorded_at >= self.last_recorded_at
+        ):
+            self.last_recorded_at = snapshot.recorded_at
+            self.last_score = snapshot.score
+            self.findings_count = snapshot.findings_count
+            self.critical_count = snapshot.critical_count
+
+    def to_point(self) -> Dict[str, Any]:
+        """Get the rollup as a trend data point."""
+        return {
+            "timestamp": self.bucket_start.isoformat(),
+            "score": self.average,
+            "min_score": self.score_min,
+            "max_score": self.score_max,
+            "samples": self.samples,
+            "findings_count": self.findings_count,
+            "critical_count": self.critical_count,
+        }
+
+
+# Rollups by (scope, period), then by bucket start
+RollupIndex = Dict[Tuple[str, RollupPeriod], Dict[datetime, ScoreRollup]]
+
+
+def rollup_snapshots(snapshots: Iterable[ScoreSnapshot], rollups: RollupIndex) -> None:
+    """Fold snapshots into daily and weekly rollups.
+
+    Args:
+        snapshots: Snapshots to fold in
+        rollups: Rollups to update
+    """
+    for snapshot in snapshots:
+        for period in RollupPeriod:
+            buckets = rollups.setdefault((snapshot.scope, period), {})
+            start = bucket_start(snapshot.recorded_at, period)
+            if start in buckets:
+                buckets[start].add(snapshot)
+            else:
+                buckets[start] = ScoreRollup.of(snapshot, period)
+
+
+def _all_rollups(rollups: RollupIndex) -> List[ScoreRollup]:
+    """Flatten a rollup index."""
+    return [rollup for buckets in rollups.values() for rollup in buckets.values()]
+
+
+def _prune_rollups(rollups: RollupIndex, before: datetime) -> None:
+    """Drop buckets that end before a time.
+
+    The bucket containing ``before`` is kept whole, matching what
+    ``ScoreHistory.rollups`` returns for the same time.
+    """
+    for (_, period), buckets in rollups.items():
+        first = bucket_start(before, period)
+        for start in [start for start in buckets if start < first]:
+            del buckets[start]
+
+
+class ScoreHistory:
+    """In-process score time series with daily and weekly rollups.
+
+    Snapshots are kept in time order per scope so range reads are a binary
+    search plus a slice.
+    """
+
+    def __init__(
+        self,
+        history_days: int = HISTORY_DAYS,
+        rollup_retention_days: int = ROLLUP_RETENTION_DAYS,
+    ) -> None:
+        """Initialize history.
+
+        Args:
+            history_days: Days of snapshots to keep
+            rollup_retention_days: Days of rollups to keep
+        """
+        self.history_days = history_days
+        self.rollup_retention_days = rollup_retention_days
+        self._snapshots: Dict[str, List[ScoreSnapshot]] = {}
+        self._rollups: RollupIndex = {}
+
+    def add(
+        self, snapshots: Iterable[ScoreSnapshot], now: Optional[datetime] = None
+    ) -> None:
+        """Add snapshots and fold them into their rollups.
+
+        Args:
+            snapshots: Snapshots to add
+            now: Reference time for retention; defaults to the latest snapshot
+        """
+        added = list(snapshots)
+        for snapshot in added:
+            self._insert(snapshot)
+        rollup_snapshots(added, self._rollups)
+        latest = max((s.recorded_at for s in added), default=None)
+
+        if now is None:
+            now = latest
+        if now is not None:
+            self.prune(now)
+
+    def load(
+        self, snapshots: Iterable[ScoreSnapshot], rollups: Iterable[ScoreRollup]
+    ) -> None:
+        """Replace the history with stored snapshots and rollups.
+
+        Args:
+            snapshots: Stored snapshots
+            rollups: Stored rollups, already covering the snapshots
+        """
+        self._snapshots = {}
+        self._rollups = {}
+        for snapshot in snapshots:
+            self._insert(snapshot)
+        for rollup in rollups:
+            key = (rollup.scope, rollup.period)
+            self._rollups.setdefault(key, {})[rollup.bucket_start] = rollup
+
+    def snapshots(
+        self, scope: str, since: Optional[datetime] = None
+    ) -> List[ScoreSnapshot]:
+        """Get a scope's snapshots in time order.
+
+        Args:
+            scope: AWS account ID, or ``ORG_SCOPE``
+            since: Earliest time to include
+
+        Returns:
+            Snapshots recorded at or after ``since``
+        """
+        series = self._snapshots.get(scope, [])
+        if since is None:
+            return list(series)
+        start = bisect.bisect_left(series, since, key=lambda s: s.recorded_at)
+        return series[start:]
+
+    def rollups(
+        self, scope: str, period: RollupPeriod, since: Optional[datetime] = None
+    ) -> List[ScoreRollup]:
+        """Get a scope's rollups in time order.
+
+        Args:
+            scope: AWS account ID, or ``ORG_SCOPE``
+            period: Bucket size
+            since: Earliest time to include; its whole bucket is included
+
+        Returns:
+            Rollups from the bucket containing ``since`` onwards
+        """
+        buckets = self._rollups.get((scope, period), {})
+        first = bucket_start(since, period) if since is not None else None
+        return [
+            buckets[start]
+            for start in sorted(buckets)
+            if first is None or start >= first
+        ]
+
+    def prune(self, now: datetime) -> None:
+        """Drop snapshots and rollups past their retention.
+
+        Args:
+            now: Reference time
+        """
+        cutoff = now - timedelta(days=self.history_days)
+        for scope, series in list(self._snapshots.items()):
+            start = bisect.bisect_right(series, cutoff, key=lambda s: s.recorded_at)
+            if start == len(series):
+                del self._snapshots[scope]
+            elif start:
+                del series[:start]
+
+        _prune_rollups(self._rollups, now - timedelta(days=self.rollup_retention_days))
+
+    def _insert(self, snapshot: ScoreSnapshot) -> None:
+        series = self._snapshots.setdefault(snapshot.scope, [])
+        if series and snapshot.recorded_at < series[-1].recorded_at:
+            bisect.insort(series, snapshot, key=lambda s: s.recorded_at)
+        else:
+            series.append(snapshot)
+
+
+class ScoreHistoryStore(ABC):
+    """Durable storage for score snapshots and rollups."""
+
+    @abstractmethod
+    async def save(self, snapshots: List[ScoreSnapshot]) -> None:
+        """Persist snapshots and fold them into the stored rollups.
+
+        Args:
+            snapshots: Snapshots of one recorded scan
+        """
+
+    @abstractmethod
+    async def load_snapshots(self, since: datetime) -> List[ScoreSnapshot]:
+        """Load snapshots recorded at or after a time.
+
+        Args:
+            since: Earliest time to include
+
+        Returns:
+            Snapshots of every scope
+        """
+
+    @abstractmethod
+    async def load_rollups(self, since: datetime) -> List[ScoreRollup]:
+        """Load rollups from the bucket containing a time onwards.
+
+        Args:
+            since: Earliest time to include; its whole bucket is included
+
+        Returns:
+            Rollups of every scope and period
+        """
+
+    @abstractmethod
+    async def prune(self, snapshots_before: datetime, rollups_before: datetime) -> None:
+        """Drop old snapshots and rollups.
+
+        Args:
+            snapshots_before: Drop snapshots recorded before this time
+            rollups_before: Drop rollups of buckets that end before this time;
+                the bucket containing it is kept
+        """
+
+
+def _take_inserted(
+    snapshots: List[ScoreSnapshot], inserted: Set[Tuple[str, datetime]]
+) -> List[ScoreSnapshot]:
+    """Get the snapshots whose (scope, recorded_at) key was inserted.
+
+    Only the first snapshot with a key is taken, as only it was inserted.
+    """
+    taken: List[ScoreSnapshot] = []
+    for snapshot in snapshots:
+        key = (snapshot.scope, snapshot.recorded_at)
+        if key in inserted:
+            inserted.discard(key)
+            taken.append(snapshot)
+    return taken
+
+
+def _rollup_upsert(rollups: List[ScoreRollup]) -> Any:
+    """Build the statement adding rollups to the stored ones."""
+    rollup_stmt = pg_insert(SecurityScoreRollup).values(
+        [
+            {
+                "scope": r.scope,
+                "period": r.period.value,
+                "bucket_start": r.bucket_start,
+                "samples": r.samples,
+                "score_sum": r.score_sum,
+                "score_min": r.score_min,
+                "score_max": r.score_max,
+                "last_recorded_at": r.last_recorded_at,
+                "last_score": r.last_score,
+                "findings_count": r.findings_count,
+                "critical_count": r.critical_count,
+            }
+            for r in rollups
+        ]
+    )
+    excluded = rollup_stmt.excluded
+    is_newer = excluded.last_recorded_at >= SecurityScoreRollup.last_recorded_at
+
+    def latest(column: str) -> Any:
+        return case(
+            (is_newer, getattr(excluded, column)),
+            else_=getattr(SecurityScoreRollup, column),
+        )
+
+    return rollup_stmt.on_conflict_do_update(
+        index_elements=["scope", "period", "bucket_start"],
+        set_={
+            "samples": SecurityScoreRollup.samples + excluded.samples,
+            "score_sum": SecurityScoreRollup.score_sum + excluded.score_sum,
+            "score_min": func.least(SecurityScoreRollup.score_min, excluded.score_min),
+            "score_max": func.greatest(
+                SecurityScoreRollup.score_max, excluded.score_max
+            ),
+            "last_score": latest("last_score"),
+            "findings_count": latest("findings_count"),
+            "critical_count": latest("critical_count"),
+            "last_recorded_at": func.greatest(
+                SecurityScoreRollup.last_recorded_at,
+                excluded.last_recorded_at,
+            ),
+        },
+    )
+
+
+def _from_bucket_of(since: datetime) -> Any:
+    """Match stored rollups from the bucket containing a time onwards."""
+    return or_(
+        *(
+            and_(
+                SecurityScoreRollup.period == period.value,
+                SecurityScoreRollup.bucket_start >= bucket_start(since, period),
+            )
+            for period in RollupPeriod
+        )
+    )
+
+
+class InMemoryScoreHistoryStore(ScoreHistoryStore):
+    """Process-local score history store."""
+
+    def __init__(self) -> None:
+        """Initialize store."""
+        self._snapshots: List[ScoreSnapshot] = []
+        self._rollups: RollupIndex = {}
+
+    async def save(self, snapshots: List[ScoreSnapshot]) -> None:
+        """Store new snapshots and update their rollups.
+
+        Snapshots with an already stored (scope, recorded_at) are skipped.
+        """
+        stored = {(s.scope, s.recorded_at) for s in self._snapshots}
+        candidates = {
+            key for s in snapshots if (key := (s.scope, s.recorded_at)) not in stored
+        }
+        new = _take_inserted(snapshots, candidates)
+        self._snapshots.extend(new)
+        rollup_snapshots(new, self._rollups)
+
+    async def load_snapshots(self, since: datetime) -> List[ScoreSnapshot]:
+        """Load snapshots recorded at or after a time."""
+        return [s for s in self._snapshots if s.recorded_at >= since]
+
+    async def load_rollups(self, since: datetime) -> List[ScoreRollup]:
+        """Load rollups from the bucket containing a time onwards."""
+        return [
+            r
+            for r in _all_rollups(self._rollups)
+            if r.bucket_start >= bucket_start(since, r.period)
+        ]
+
+    async def prune(self, snapshots_before: datetime, rollups_before: datetime) -> None:
+        """Drop old snapshots and rollups."""
+        self._snapshots = [
+            s for s in self._snapshots if s.recorded_at >= snapshots_before
+        ]
+        _prune_rollups(self._rollups, rollups_before)
+
+
+class DatabaseScoreHistoryStore(ScoreHistoryStore):
+    """Score history store backed by the ``security_score_*`` tables.
+
+    Rollups are updated in the database with one upsert per recorded scan,
+    so readers never aggregate snapshots themselves.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Initialize store.
+
+        Args:
+            session_factory: Factory for async database sessions
+        """
+        self._session_factory = session_factory
+
+    async def save(self, snapshots: List[ScoreSnapshot]) -> None:
+        """Insert snapshots and upsert the rollups of those newly inserted.
+
+        Snapshots already stored (e.g. by a retried save) are skipped and not
+        counted in the rollups again.
+        """
+        if not snapshots:
+            return
+
+        snapshot_stmt = pg_insert(SecurityScoreSnapshot).values(
+            [
+                {
+                    "scope": s.scope,
+                    "recorded_at": s.recorded_at,
+                    "score": s.score,
+                    "findings_count": s.findings_count,
+                    "critical_count": s.critical_count,
+                    "high_count": s.high_count,
+                    "medium_count": s.medium_count,
+                    "low_count": s.low_count,
+                }
+                for s in snapshots
+            ]
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                snapshot_stmt.on_conflict_do_nothing().returning(
+                    SecurityScoreSnapshot.scope, SecurityScoreSnapshot.recorded_at
+                )
+            )
+            inserted = {(row.scope, row.recorded_at) for row in result}
+            new = _take_inserted(snapshots, inserted)
+
+            # Pre-aggregate the batch so each bucket is upserted once
+            batch: RollupIndex = {}
+            rollup_snapshots(new, batch)
+            rollups = _all_rollups(batch)
+            if rollups:
+                await session.execute(_rollup_upsert(rollups))
+            await session.commit()
+
+        logger.debug(
+            f"Recorded {len(new)} of {len(snapshots)} score snapshots "
+            f"into {len(rollups)} rollups"
+        )
+
+    async def load_snapshots(self, since: datetime) -> List[ScoreSnapshot]:
+        """Load snapshots recorded at or after a time."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(SecurityScoreSnapshot)
+                .where(SecurityScoreSnapshot.recorded_at >= since)
+                .order_by(SecurityScoreSnapshot.recorded_at)
+            )
+            return [
+                ScoreSnapshot(
+                    scope=row.scope,
+                    recorded_at=row.recorded_at,
+                    score=row.score,
+                    findings_count=row.findings_count,
+                    critical_count=row.critical_count,
+                    high_count=row.high_count,
+                    medium_count=row.medium_count,
+                    low_count=row.low_count,
+                )
+                for row in result.scalars()
+            ]
+
+    async def load_rollups(self, since: datetime) -> List[ScoreRollup]:
+        """Load rollups from the bucket containing a time onwards."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(SecurityScoreRollup).where(_from_bucket_of(since))
+            )
+            return [
+                ScoreRollup(
+                    scope=row.scope,
+                    period=RollupPeriod(row.period),
+                    bucket_start=row.bucket_start,
+                    samples=row.samples,
+                    score_sum=row.score_sum,
+                    score_min=row.score_min,
+                    score_max=row.score_max,
+                    last_recorded_at=row.last_recorded_at,
+                    last_score=row.last_score,
+                    findings_count=row.findings_count,
+                    critical_count=row.critical_count,
+                )
+                for row in result.scalars()
+            ]
+
+    async def prune(self, snapshots_before: datetime, rollups_before: datetime) -> None:
+        """Drop old snapshots and rollups."""
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(SecurityScoreSnapshot).where(
+                    SecurityScoreSnapshot.recorded_at < snapshots_before
+                )
+            )
+            await session.execute(
+                delete(SecurityScoreRollup).where(~_from_bucket_of(rollups_before))
+            )
+            await session.commit()
@@ -11,10 +11,20 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from cloud_optimizer.scanners.base import ScanResult
+from cloud_optimizer.scanners.columnar import FindingColumns, FindingsAggregate
 from cloud_optimizer.scanners.multi_account import AccountScanResult, AWSAccount
+from cloud_optimizer.services.score_history import (
+    HISTORY_DAYS,
+    ORG_SCOPE,
+    ROLLUP_RETENTION_DAYS,
+    RollupPeriod,
+    ScoreHistory,
+    ScoreHistoryStore,
+    ScoreSnapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -184,9 +194,6 @@ class SecurityScoreCalculator:
         Returns:
             Calculated security score
         """
-        base_score = 100.0
-        penalty = 0.0
-
         # Count findings by severity
         counts = {
             "critical": 0,
@@ -200,25 +207,70 @@ class SecurityScoreCalculator:
                 continue
 
             # Get severity from evidence or rule lookup
-            severity = finding.evidence.get("severity", "medium").lower()
+            severity = finding.get_evidence("severity", "medium").lower()
             if severity not in counts:
                 severity = "medium"
 
             counts[severity] += 1
-            penalty += cls.SEVERITY_WEIGHTS.get(severity, 2.0)
+
+        return cls.score_from_counts(counts)
+
+    @classmethod
+    def score_from_counts(cls, counts: Dict[str, int], other: int = 0) -> SecurityScore:
+        """Calculate security score from failed finding counts.
+
+        Args:
+            counts: Failed findings per severity
+            other: Failed findings with an unknown severity (scored as medium)
+
+        Returns:
+            Calculated security score
+        """
+        base_score = 100.0
+        medium = counts.get("medium", 0) + other
+        penalty = (
+            counts.get("critical", 0) * cls.SEVERITY_WEIGHTS["critical"]
+            + counts.get("high", 0) * cls.SEVERITY_WEIGHTS["high"]
+            + medium * cls.SEVERITY_WEIGHTS["medium"]
+            + counts.get("low", 0) * cls.SEVERITY_WEIGHTS["low"]
+        )
 
         # Calculate final score
         score = max(0.0, base_score - penalty)
 
         return SecurityScore(
             score=round(score, 1),
-            findings_count=sum(counts.values()),
-            critical_count=counts["critical"],
-            high_count=counts["high"],
-            medium_count=counts["medium"],
-            low_count=counts["low"],
+            findings_count=(
+                counts.get("critical", 0)
+                + counts.get("high", 0)
+                + medium
+                + counts.get("low", 0)
+            ),
+            critical_count=counts.get("critical", 0),
+            high_count=counts.get("high", 0),
+            medium_count=medium,
+            low_count=counts.get("low", 0),
         )
 
+    @classmethod
+    def score_from_aggregate(
+        cls, aggregate: FindingsAggregate, account_id: Optional[str] = None
+    ) -> SecurityScore:
+        """Calculate security score from aggregated findings.
+
+        Args:
+            aggregate: Aggregated findings
+            account_id: Account to score; None scores every finding together
+
+        Returns:
+            Calculated security score
+        """
+        if account_id is None:
+            other = sum(aggregate.other.values())
+        else:
+            other = aggregate.other.get(account_id, 0)
+        return cls.score_from_counts(aggregate.severity_counts(account_id), other)
+
     @classmethod
     def calculate_org_score(
         cls,
@@ -267,80 +319,157 @@ class SecurityDashboard:
     based on scan results across all AWS accounts.
     """
 
-    def __init__(self) -> None:
-        """Initialize dashboard."""
-        self._scan_history: List[Tuple[datetime, List[AccountScanResult]]] = []
+    def __init__(self, history_store: Optional[ScoreHistoryStore] = None) -> None:
+        """Initialize dashboard.
+
+        Args:
+            history_store: Optional store that persists score history
+        """
+        self._history = ScoreHistory()
+        self._history_store = history_store
         self._calculator = SecurityScoreCalculator()
 
-    def record_scan_results(self, results: List[AccountScanResult]) -> None:
+    def record_scan_results(
+        self,
+        results: List[AccountScanResult],
+        aggregate: Optional[FindingsAggregate] = None,
+    ) -> List[ScoreSnapshot]:
         """Record scan results for trend tracking.
 
+        Scores are computed once here; only the per-account and organization
+        snapshots are kept, not the findings.
+
         Args:
             results: Scan results to record
+            aggregate: Pre-computed ``aggregate(results)``
+
+        Returns:
+            Recorded snapshots, the organization snapshot last
         """
-        now = datetime.now(timezone.utc)
-        self._scan_history.append((now, results))
+        if aggregate is None:
+            aggregate = self.aggregate(results)
 
-        # Keep only last 90 days of history
-        cutoff = now - timedelta(days=90)
-        self._scan_history = [
-            (ts, r) for ts, r in self._scan_history if ts > cutoff
+        now = datetime.now(timezone.utc)
+        snapshots = [
+            self._snapshot(
+                result.account.account_id,
+                now,
+                self._calculator.score_from_aggregate(
+                    aggregate, result.account.account_id
+                ),
+            )
+            for result in results
         ]
+        snapshots.append(
+            self._snapshot(
+                ORG_SCOPE, now, self._calculator.score_from_aggregate(aggregate)
+            )
+        )
+        self._history.add(snapshots, now)
+        return snapshots
+
+    async def persist_scan_results(
+        self,
+        results: List[AccountScanResult],
+        aggregate: Optional[FindingsAggregate] = None,
+    ) -> List[ScoreSnapshot]:
+        """Record scan results and write their snapshots to the history store.
+
+        Args:
+            results: Scan results to record
+            aggregate: Pre-computed ``aggregate(results)``
+
+        Returns:
+            Recorded snapshots
+        """
+        snapshots = self.record_scan_results(results, aggregate)
+        if self._history_store is not None:
+            now = snapshots[-1].recorded_at
+            await self._history_store.save(snapshots)
+            await self._history_store.prune(
+                snapshots_before=now - timedelta(days=HISTORY_DAYS),
+                rollups_before=now - timedelta(days=ROLLUP_RETENTION_DAYS),
+            )
+        return snapshots
+
+    async def load_history(self) -> None:
+        """Load score history from the history store, e.g. after a restart."""
+        if self._history_store is None:
+            return
+
+        now = datetime.now(timezone.utc)
+        snapshots = await self._history_store.load_snapshots(
+            now - timedelta(days=HISTORY_DAYS)
+        )
+        rollups = await self._history_store.load_rollups(
+            now - timedelta(days=ROLLUP_RETENTION_DAYS)
+        )
+        self._history.load(snapshots, rollups)
+        logger.info(
+            f"Loaded {len(snapshots)} score snapshots and {len(rollups)} rollups"
+        )
+
+    @staticmethod
+    def _snapshot(
+        scope: str, recorded_at: datetime, score: SecurityScore
+    ) -> ScoreSnapshot:
+        return ScoreSnapshot(
+            scope=scope,
+            recorded_at=recorded_at,
+            score=score.score,
+            findings_count=score.findings_count,
+            critical_count=score.critical_count,
+            high_count=score.high_count,
+            medium_count=score.medium_count,
+            low_count=score.low_count,
+        )
+
+    @staticmethod
+    def aggregate(results: List[AccountScanResult]) -> FindingsAggregate:
+        """Aggregate scan results in one columnar pass.
+
+        The dashboard methods accept the result so callers rendering several
+        views of the same scan aggregate it only once.
+
+        Args:
+            results: Scan results
+
+        Returns:
+            Aggregated findings
+        """
+        return FindingColumns.from_account_results(results).aggregate()
 
     def get_organization_summary(
         self,
         results: List[AccountScanResult],
+        aggregate: Optional[FindingsAggregate] = None,
     ) -> OrganizationSummary:
         """Get organization-wide security summary.
 
         Args:
             results: Current scan results
+            aggregate: Pre-computed ``aggregate(results)``
 
         Returns:
             Organization summary
         """
+        if aggregate is None:
+            aggregate = self.aggregate(results)
+
         summary = OrganizationSummary()
         summary.total_accounts = len(results)
 
         # Calculate per-account scores
-        account_scores: List[SecurityScore] = []
-        findings_by_severity: Dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-        }
-        findings_by_service: Dict[str, int] = {}
-        all_findings: List[ScanResult] = []
-
-        for result in results:
-            # Calculate account score
-            score = self._calculator.calculate_score(result.findings)
-            account_scores.append(score)
-
-            # Aggregate findings
-            all_findings.extend(result.findings)
-
-            for finding in result.findings:
-                if finding.passed:
-                    continue
-
-                # Count by severity
-                severity = finding.evidence.get("severity", "medium").lower()
-                if severity in findings_by_severity:
-                    findings_by_severity[severity] += 1
-
-                # Count by service
-                service = finding.rule_id.split("_")[0]
-                findings_by_service[service] = (
-                    findings_by_service.get(service, 0) + 1
-                )
+        account_scores: List[SecurityScore] = [
+            self._calculator.score_from_aggregate(aggregate, result.account.account_id)
+            for result in results
+        ]
 
         # Calculate org score
         summary.org_score = self._calculator.calculate_org_score(account_scores)
         summary.total_findings = summary.org_score.findings_count
-        summary.findings_by_severity = findings_by_severity
-        summary.findings_by_service = findings_by_service
+        summary.findings_by_severity = aggregate.severity_counts()
+        summary.findings_by_service = dict(aggregate.by_service)
 
         # Categorize accounts by score
         summary.accounts_by_score = {
@@ -352,7 +481,9 @@ class SecurityDashboard:
         }
 
         # Get top issues
-        summary.top_issues = self._get_top_issues(all_findings)
+        summary.top_issues = self._get_top_issues(
+            aggregate.by_rule, aggregate.rule_severity
+        )
 
         # Calculate trends
         summary.trend_30d = self._calculate_trend(days=30)
@@ -373,42 +504,46 @@ class SecurityDashboard:
         Returns:
             Account security summary
         """
-        score = self._calculator.calculate_score(result.findings)
-
-        # Group findings by service
-        findings_by_service: Dict[str, int] = {}
-        for finding in result.findings:
-            if finding.passed:
-                continue
-            service = finding.rule_id.split("_")[0]
-            findings_by_service[service] = findings_by_service.get(service, 0) + 1
+        account_id = result.account.account_id
+        aggregate = self.aggregate([result])
 
         return AccountSecuritySummary(
-            account_id=result.account.account_id,
+            account_id=account_id,
             account_name=result.account.name,
             environment=result.account.environment,
-            score=score,
-            findings_by_service=findings_by_service,
-            top_issues=self._get_top_issues(result.findings, limit=5),
+            score=self._calculator.score_from_aggregate(aggregate, account_id),
+            findings_by_service=dict(aggregate.account_service.get(account_id, {})),
+            top_issues=self._get_top_issues(
+                aggregate.account_rule.get(account_id, {}),
+                aggregate.rule_severity,
+                limit=5,
+            ),
             last_scan=datetime.now(timezone.utc),
         )
 
     def get_heat_map_data(
         self,
         results: List[AccountScanResult],
+        aggregate: Optional[FindingsAggregate] = None,
     ) -> List[Dict[str, Any]]:
         """Get data for account heat map visualization.
 
         Args:
             results: Scan results
+            aggregate: Pre-computed ``aggregate(results)``
 
         Returns:
             List of account data for heat map
         """
+        if aggregate is None:
+            aggregate = self.aggregate(results)
+
         heat_map_data: List[Dict[str, Any]] = []
 
         for result in results:
-            score = self._calculator.calculate_score(result.findings)
+            score = self._calculator.score_from_aggregate(
+                aggregate, result.account.account_id
+            )
 
             # Determine color based on score
             if score.score >= 90:
@@ -440,64 +575,42 @@ class SecurityDashboard:
         self,
         results: List[AccountScanResult],
         limit: int = 10,
+        aggregate: Optional[FindingsAggregate] = None,
     ) -> List[Dict[str, Any]]:
         """Get prioritized recommendations based on findings.
 
         Args:
             results: Scan results
             limit: Maximum number of recommendations
+            aggregate: Pre-computed ``aggregate(results)``
 
         Returns:
             List of recommendations
         """
-        # Aggregate all findings
-        all_findings: List[Dict[str, Any]] = []
-        for result in results:
-            for finding in result.findings:
-                if finding.passed:
-                    continue
-                all_findings.append({
-                    "rule_id": finding.rule_id,
-                    "account_id": result.account.account_id,
-                    "severity": finding.evidence.get("severity", "medium"),
-                    "resource_id": finding.resource_id,
-                    "remediation": finding.evidence.get("remediation", ""),
-                })
-
-        # Group by rule_id and count occurrences
-        rule_counts: Dict[str, Dict[str, Any]] = {}
-        for finding in all_findings:
-            rule_id = finding["rule_id"]
-            if rule_id not in rule_counts:
-                rule_counts[rule_id] = {
-                    "rule_id": rule_id,
-                    "severity": finding["severity"],
-                    "count": 0,
-                    "affected_accounts": set(),
-                    "remediation": finding["remediation"],
-                }
-            rule_counts[rule_id]["count"] += 1
-            rule_counts[rule_id]["affected_accounts"].add(finding["account_id"])
+        if aggregate is None:
+            aggregate = self.aggregate(results)
 
         # Calculate priority score
         severity_priority = {"critical": 4, "high": 3, "medium": 2, "low": 1}
         recommendations: List[Dict[str, Any]] = []
 
-        for rule_id, data in rule_counts.items():
+        for rule_id, count in aggregate.by_rule.items():
+            severity = aggregate.rule_severity.get(rule_id, "medium")
+            affected_accounts = len(aggregate.rule_accounts.get(rule_id, ()))
             priority = (
-                severity_priority.get(data["severity"], 2) * 100
-                + len(data["affected_accounts"]) * 10
-                + data["count"]
+                severity_priority.get(severity, 2) * 100
+                + affected_accounts * 10
+                + count
             )
 
             recommendations.append({
                 "rule_id": rule_id,
-                "severity": data["severity"],
-                "occurrence_count": data["count"],
-                "affected_accounts_count": len(data["affected_accounts"]),
+                "severity": severity,
+                "occurrence_count": count,
+                "affected_accounts_count": affected_accounts,
                 "priority_score": priority,
-                "remediation": data["remediation"],
-                "impact": self._estimate_impact(data["severity"], data["count"]),
+                "remediation": aggregate.rule_remediation.get(rule_id, ""),
+                "impact": self._estimate_impact(severity, count),
             })
 
         # Sort by priority (highest first)
@@ -507,29 +620,20 @@ class SecurityDashboard:
 
     def _get_top_issues(
         self,
-        findings: List[ScanResult],
+        rule_counts: Dict[str, int],
+        rule_severity: Dict[str, str],
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
-        """Get top issues from findings.
+        """Get top issues from failed finding counts per rule.
 
         Args:
-            findings: List of findings
+            rule_counts: Failed findings per rule
+            rule_severity: Severity per rule
             limit: Maximum number of issues
 
         Returns:
             List of top issues
         """
-        # Count findings by rule
-        rule_counts: Dict[str, int] = {}
-        rule_severity: Dict[str, str] = {}
-
-        for finding in findings:
-            if finding.passed:
-                continue
-            rule_id = finding.rule_id
-            rule_counts[rule_id] = rule_counts.get(rule_id, 0) + 1
-            rule_severity[rule_id] = finding.evidence.get("severity", "medium")
-
         # Sort by count
         sorted_rules = sorted(
             rule_counts.items(),
@@ -546,41 +650,40 @@ class SecurityDashboard:
             for rule_id, count in sorted_rules[:limit]
         ]
 
-    def _calculate_trend(self, days: int) -> List[Dict[str, Any]]:
-        """Calculate trend data for a time period.
+    def get_score_trend(
+        self,
+        days: int = 30,
+        period: Optional[RollupPeriod] = None,
+        account_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get recorded scores over a time period.
+
+        Reads stored points only; nothing is re-scored.
 
         Args:
             days: Number of days to include
+            period: Roll points up per day or week; None returns every scan
+            account_id: Account to report; None reports the organization
 
         Returns:
-            List of trend data points
+            List of trend data points, oldest first
         """
-        if not self._scan_history:
-            return []
+        scope = account_id or ORG_SCOPE
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        if period is None:
+            return [s.to_point() for s in self._history.snapshots(scope, since)]
+        return [r.to_point() for r in self._history.rollups(scope, period, since)]
 
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(days=days)
-
-        trend_data: List[Dict[str, Any]] = []
-        for ts, results in self._scan_history:
-            if ts < cutoff:
-                continue
-
-            # Calculate aggregate score for this scan
-            all_findings: List[ScanResult] = []
-            for result in results:
-                all_findings.extend(result.findings)
-
-            score = self._calculator.calculate_score(all_findings)
+    def _calculate_trend(self, days: int) -> List[Dict[str, Any]]:
+        """Calculate trend data for a time period.
 
-            trend_data.append({
-                "timestamp": ts.isoformat(),
-                "score": score.score,
-                "findings_count": score.findings_count,
-                "critical_count": score.critical_count,
-            })
+        Args:
+            days: Number of days to include
 
-        return trend_data
+        Returns:
+            List of trend data points
+        """
+        return self.get_score_trend(days)
 
     def _estimate_impact(self, severity: str, count: int) -> str:
         """Estimate impact of addressing an issue.
@@ -617,9 +720,10 @@ class SecurityDashboard:
         Returns:
             Dictionary with all dashboard data
         """
-        org_summary = self.get_organization_summary(results)
-        heat_map = self.get_heat_map_data(results)
-        recommendations = self.get_recommendations(results)
+        aggregate = self.aggregate(results)
+        org_summary = self.get_organization_summary(results, aggregate)
+        heat_map = self.get_heat_map_data(results, aggregate)
+        recommendations = self.get_recommendations(results, aggregate=aggregate)
 
         return {
             "organization": {
@@ -639,6 +743,7 @@ class SecurityDashboard:
                 "30_day": org_summary.trend_30d,
                 "60_day": org_summary.trend_60d,
                 "90_day": org_summary.trend_90d,
+                "weekly": self.get_score_trend(90, RollupPeriod.WEEK),
             },
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import logging
+from contextlib import aclosing
 from datetime import datetime, timezone
-from typing import Callable, Dict, Iterable, List, Sequence
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    cast,
+)
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cloud_optimizer.integrations.aws import (
@@ -19,6 +30,7 @@ from cloud_optimizer.integrations.aws import (
 from cloud_optimizer.models.aws_account import AWSAccount
 from cloud_optimizer.models.finding import FindingSeverity, FindingType
 from cloud_optimizer.models.scan_job import ScanJob, ScanStatus, ScanType
+from cloud_optimizer.scanners.executor import ScannerExecutor, get_scanner_executor
 from cloud_optimizer.security.rule_metadata import get_rule_metadata
 from cloud_optimizer.services.aws_connection import AWSConnectionService
 from cloud_optimizer.services.findings import FindingsService
@@ -45,6 +57,9 @@ SEVERITY_MAP = {
 class SecurityScanEngine:
     """Coordinates AWS security scans and persists findings."""
 
+    # Findings persisted per transaction while a scanner is still running
+    STREAM_CHUNK_SIZE = 200
+
     def __init__(
         self,
         db: AsyncSession,
@@ -55,12 +70,14 @@ class SecurityScanEngine:
         trial_service_factory: Callable[[AsyncSession], TrialService] | None = None,
         findings_service_factory: Callable[[AsyncSession], FindingsService]
         | None = None,
+        scanner_executor: ScannerExecutor | None = None,
     ) -> None:
         self.db = db
         self._scanner_registry = scanner_registry or DEFAULT_SCAN_TYPES
         self._aws_conn_factory = aws_connection_service_factory or AWSConnectionService
         self._trial_service_factory = trial_service_factory or TrialService
         self._findings_service_factory = findings_service_factory or FindingsService
+        self._scanner_executor = scanner_executor
 
     async def start_security_scan(
         self,
@@ -70,8 +87,22 @@ class SecurityScanEngine:
         scan_types: Sequence[str] | None = None,
         region: str = "us-east-1",
     ) -> ScanJob:
-        """Kick off a security scan for the given account."""
-        aws_account = await self._get_account_for_user(account_id, user_id)
+        """Create a scan job and run it to completion in the caller's task."""
+        job = await self.enqueue_security_scan(
+            user_id, account_id, scan_types=scan_types, region=region
+        )
+        return await self.run_scan_job(job.job_id)
+
+    async def enqueue_security_scan(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        *,
+        scan_types: Sequence[str] | None = None,
+        region: str = "us-east-1",
+    ) -> ScanJob:
+        """Validate the request and persist a pending scan job for the workers."""
+        await self._get_account_for_user(account_id, user_id)
         scan_type_list = self._sanitize_scan_types(scan_types)
         trial_service = self._trial_service_factory(self.db)
         await trial_service.check_limit(user_id, "scans")
@@ -82,23 +113,51 @@ class SecurityScanEngine:
             scan_type=ScanType.SECURITY,
             status=ScanStatus.PENDING,
             services_to_scan=list(scan_type_list),
+            region=region,
         )
         self.db.add(job)
         await self.db.commit()
         await self.db.refresh(job)
+        return job
+
+    async def run_scan_job(self, job_id: UUID) -> ScanJob:
+        """Execute a persisted scan job, recording failure on the job row."""
+        result = await self.db.execute(select(ScanJob).where(ScanJob.job_id == job_id))
+        job = result.scalar_one_or_none()
+        if not job:
+            raise ValueError("Scan job not found")
 
+        trial_service = self._trial_service_factory(self.db)
+        # The claim this run holds; a requeue or a new claim changes it
+        claim = (job.worker_id, job.attempts)
         try:
-            await self._execute_scan(job, aws_account, scan_type_list, region)
+            aws_account = await self._get_account_for_user(
+                job.aws_account_id, job.user_id
+            )
+            completed = await self._execute_scan(
+                job,
+                aws_account,
+                job.services_to_scan,
+                job.region or "us-east-1",
+                claim,
+            )
         except Exception as exc:  # noqa: BLE001
             logger.exception("Security scan failed for job %s", job.job_id)
-            job.status = ScanStatus.FAILED
-            job.error_message = str(exc)
-            job.progress = 100
-            job.completed_at = datetime.now(timezone.utc)
-            await self.db.commit()
+            await self.db.rollback()
+            # Only the run still holding the job may fail it
+            if not await self._update_claimed(
+                job_id,
+                claim,
+                status=ScanStatus.FAILED,
+                error_message=str(exc)[:1000],
+                progress=100,
+                completed_at=datetime.now(timezone.utc),
+            ):
+                await self._abandon(job)
             raise
         else:
-            await trial_service.record_usage(user_id, "scans", 1)
+            if completed:
+                await trial_service.record_usage(job.user_id, "scans", 1)
 
         return job
 
@@ -118,16 +177,24 @@ class SecurityScanEngine:
         aws_account: AWSAccount,
         scan_type_list: Iterable[str],
         region: str,
-    ) -> None:
+        claim: Tuple[str | None, int],
+    ) -> bool:
         aws_service = self._aws_conn_factory(self.db)
         session = await aws_service.get_session(aws_account.account_id)
         findings_service = self._findings_service_factory(self.db)
 
-        job.status = ScanStatus.RUNNING
-        job.started_at = datetime.now(timezone.utc)
-        job.progress = 5
-        job.services_to_scan = list(scan_type_list)
-        await self.db.commit()
+        started_at = datetime.now(timezone.utc)
+        if not await self._update_claimed(
+            job.job_id,
+            claim,
+            status=ScanStatus.RUNNING,
+            started_at=started_at,
+            heartbeat_at=started_at,
+            progress=5,
+            services_to_scan=list(scan_type_list),
+        ):
+            await self._abandon(job)
+            return False
 
         total_findings = 0
         scan_types = list(scan_type_list)
@@ -138,58 +205,155 @@ class SecurityScanEngine:
                 continue
 
             scanner = scanner_cls(region=region, session=session)
-            findings = await scanner.scan(aws_account.aws_account_id)
-
-            created = await self._persist_findings(
-                findings_service, job, aws_account, findings
+            scanner.account_id = aws_account.aws_account_id
+            # Scanners make blocking boto3 calls; keep them off the event loop
+            # and persist findings chunk by chunk so memory stays flat and
+            # results are visible before the scan finishes.
+            executor = self._scanner_executor or get_scanner_executor()
+            chunks = executor.stream(
+                self._finding_source(scanner),
+                aws_account.aws_account_id,
+                chunk_size=self.STREAM_CHUNK_SIZE,
             )
-            total_findings += created
-            job.progress = self._calc_progress(idx, len(scan_types))
-            await self.db.commit()
+            async with aclosing(chunks):
+                async for findings in chunks:
+                    total_findings += await self._persist_findings(
+                        findings_service, job, aws_account, findings
+                    )
+                    if not await self._update_claimed(
+                        job.job_id,
+                        claim,
+                        total_findings=total_findings,
+                        heartbeat_at=datetime.now(timezone.utc),
+                    ):
+                        await self._abandon(job)
+                        return False
+
+            if not await self._update_claimed(
+                job.job_id,
+                claim,
+                progress=self._calc_progress(idx, len(scan_types)),
+                heartbeat_at=datetime.now(timezone.utc),
+            ):
+                await self._abandon(job)
+                return False
+
+        if not await self._holds_claim(job, claim):
+            await self._abandon(job)
+            return False
 
         job.total_findings = total_findings
         job.status = ScanStatus.COMPLETED
         job.progress = 100
         job.completed_at = datetime.now(timezone.utc)
         await self.db.commit()
+        return True
+
+    async def _update_claimed(
+        self, job_id: UUID, claim: Tuple[str | None, int], **values: Any
+    ) -> bool:
+        """Write ``values`` to the job row only while it is held under ``claim``.
+
+        Commits the transaction (including any findings persisted in it) when
+        the claim still holds and rolls it back otherwise.
+        """
+        worker_id, attempts = claim
+        result = cast(
+            CursorResult[Any],
+            await self.db.execute(
+                update(ScanJob)
+                .where(
+                    ScanJob.job_id == job_id,
+                    ScanJob.worker_id == worker_id,
+                    ScanJob.attempts == attempts,
+                )
+                .values(**values)
+            ),
+        )
+        if not result.rowcount:
+            await self.db.rollback()
+            return False
+        await self.db.commit()
+        return True
+
+    async def _abandon(self, job: ScanJob) -> None:
+        """Leave a job that was requeued as stale to the run now holding it."""
+        await self.db.rollback()
+        await self.db.refresh(job)
+        logger.warning("Scan job %s was reclaimed; not updating it", job.job_id)
+
+    async def _holds_claim(self, job: ScanJob, claim: Tuple[str | None, int]) -> bool:
+        """Lock the job row and check it is still running under ``claim``."""
+        result = await self.db.execute(
+            select(ScanJob.status, ScanJob.worker_id, ScanJob.attempts)
+            .where(ScanJob.job_id == job.job_id)
+            .with_for_update()
+        )
+        row = result.one()
+        return (
+            row.status == ScanStatus.RUNNING and (row.worker_id, row.attempts) == claim
+        )
+
+    @staticmethod
+    def _finding_source(
+        scanner: object,
+    ) -> Callable[[str], AsyncIterator[Dict[str, Any]]]:
+        """Return the scanner's streaming entry point, adapting list-only scanners."""
+        scan_iter = getattr(scanner, "scan_iter", None)
+        if scan_iter is not None:
+            return cast(Callable[[str], AsyncIterator[Dict[str, Any]]], scan_iter)
+
+        async def from_scan(account_id: str) -> AsyncIterator[Dict[str, Any]]:
+            for finding in await scanner.scan(account_id):  # type: ignore[attr-defined]
+                yield finding
+
+        return from_scan
 
     async def _persist_findings(
         self,
         findings_service: FindingsService,
         job: ScanJob,
         aws_account: AWSAccount,
-        findings: List[Dict[str, object]],
+        findings: List[Dict[str, Any]],
     ) -> int:
-        created = 0
+        rows = []
         for finding in findings:
             metadata = get_rule_metadata(finding.get("finding_type", ""))
             severity = self._map_severity(finding.get("severity"))
             if severity is None:
                 continue
 
-            await findings_service.create_finding(
-                scan_job_id=job.job_id,
-                aws_account_id=aws_account.account_id,
-                rule_id=metadata.rule_id,
-                finding_type=FindingType.SECURITY,
-                severity=severity,
-                service=finding.get("service") or metadata.service,
-                resource_type=finding.get("resource_type", "aws_resource"),
-                resource_id=finding.get("resource_id", "unknown"),
-                region=finding.get("region", job.aws_account.default_region),
-                title=finding.get("title", "Security finding"),
-                description=finding.get("description", ""),
-                recommendation=finding.get("remediation", "Review configuration."),
-                evidence={
-                    **finding.get("metadata", {}),
-                    "aws_account": aws_account.aws_account_id,
-                    "resource_name": finding.get("resource_name"),
-                },
-                compliance_frameworks=list(metadata.frameworks),
-                resource_arn=finding.get("resource_arn"),
+            rows.append(
+                {
+                    "scan_job_id": job.job_id,
+                    "aws_account_id": aws_account.account_id,
+                    "rule_id": metadata.rule_id,
+                    "finding_type": FindingType.SECURITY,
+                    "severity": severity,
+                    "service": finding.get("service") or metadata.service,
+                    "resource_type": finding.get("resource_type", "aws_resource"),
+                    "resource_id": finding.get("resource_id", "unknown"),
+                    "region": finding.get("region", aws_account.default_region),
+                    "title": finding.get("title", "Security finding"),
+                    "description": finding.get("description", ""),
+                    "recommendation": finding.get(
+                        "remediation", "Review configuration."
+                    ),
+                    "evidence": {
+                        **finding.get("metadata", {}),
+                        "aws_account": aws_account.aws_account_id,
+                        "resource_name": finding.get("resource_name"),
+                    },
+                    "compliance_frameworks": list(metadata.frameworks),
+                    "resource_arn": finding.get("resource_arn"),
+                }
             )
-            created += 1
-        return created
+
+        if not rows:
+            return 0
+        # Committed by the claim-checked progress update that follows
+        result = await findings_service.bulk_upsert_findings(rows, commit=False)
+        return result.total
 
     def _sanitize_scan_types(self, scan_types: Sequence[str] | None) -> List[str]:
         if not scan_types:
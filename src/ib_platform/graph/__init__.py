@@ -5,6 +5,12 @@ This module provides a unified interface for graph operations across
 different backend implementations (PostgreSQL CTE, Memgraph, etc.).
 """
 
+from .cache import (
+    AdjacencyCache,
+    CachedGraphBackend,
+    GraphVersion,
+    PostgresGraphVersion,
+)
 from .factory import GraphBackendFactory, GraphBackendType
 from .protocol import (
     GraphBackendProtocol,
@@ -13,6 +19,7 @@ from .protocol import (
     GraphPath,
     TraversalDirection,
     TraversalParams,
+    TraversalStrategy,
 )
 
 __all__ = [
@@ -23,7 +30,13 @@ __all__ = [
     "GraphPath",
     "TraversalParams",
     "TraversalDirection",
+    "TraversalStrategy",
     # Factory
     "GraphBackendFactory",
     "GraphBackendType",
+    # Read cache
+    "AdjacencyCache",
+    "CachedGraphBackend",
+    "GraphVersion",
+    "PostgresGraphVersion",
 ]
@@ -3,14 +3,18 @@ Memgraph-based Graph Backend.
 
 Uses native Cypher queries for graph operations.
 Optimal for complex traversals and pattern matching.
+
+Queries go through the neo4j async driver, so a graph call waits on the
+event loop instead of blocking it, and concurrent calls run on separate
+pooled connections.
 """
 
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from neo4j import Driver, GraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncManagedTransaction, Record
 
 from ..protocol import (
     GraphBackendProtocol,
@@ -23,6 +27,29 @@ from ..protocol import (
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to Memgraph; concurrent calls beyond this wait
+MAX_CONNECTION_POOL_SIZE = 100
+# Seconds a call waits for a free connection before failing
+CONNECTION_ACQUISITION_TIMEOUT = 60.0
+
+
+async def _fetch(
+    tx: AsyncManagedTransaction, query: str, parameters: Dict[str, Any]
+) -> List[Record]:
+    """Run a query in a transaction and fetch all of its records."""
+    result = await tx.run(query, parameters)
+    return [record async for record in result]
+
+
+async def _fetch_all(
+    tx: AsyncManagedTransaction, queries: List[Tuple[str, Dict[str, Any]]]
+) -> List[Record]:
+    """Run queries one after another in a transaction and fetch all records."""
+    records: List[Record] = []
+    for query, parameters in queries:
+        records.extend(await _fetch(tx, query, parameters))
+    return records
+
 
 class MemgraphBackend:
     """
@@ -30,6 +57,11 @@ class MemgraphBackend:
 
     Uses native Cypher for graph operations.
     Optimal for complex traversals and pattern matching.
+
+    Reads and writes run as managed transactions, which the driver retries
+    on transient errors. Batch operations run all their queries in one
+    write transaction. Cancelling a call (e.g. with ``asyncio.wait_for``)
+    rolls back its transaction and discards its connection.
     """
 
     def __init__(
@@ -38,6 +70,8 @@ class MemgraphBackend:
         username: Optional[str] = None,
         password: Optional[str] = None,
         database: Optional[str] = None,
+        max_connection_pool_size: int = MAX_CONNECTION_POOL_SIZE,
+        connection_acquisition_timeout: float = CONNECTION_ACQUISITION_TIMEOUT,
     ) -> None:
         """
         Initialize Memgraph backend.
@@ -47,12 +81,17 @@ class MemgraphBackend:
             username: Optional username for authentication
             password: Optional password for authentication
             database: Optional specific database name
+            max_connection_pool_size: Maximum number of pooled connections
+            connection_acquisition_timeout: Seconds to wait for a pooled
+                connection
         """
         self._uri = uri
         self._username = username
         self._password = password
         self._database = database
-        self._driver: Optional[Driver] = None
+        self._max_connection_pool_size = max_connection_pool_size
+        self._connection_acquisition_timeout = connection_acquisition_timeout
+        self._driver: Optional[AsyncDriver] = None
 
     async def connect(self) -> None:
         """Establish connection to Memgraph."""
@@ -61,21 +100,31 @@ class MemgraphBackend:
             auth = (self._username, self._password)
 
         try:
-            self._driver = GraphDatabase.driver(self._uri, auth=auth)
+            self._driver = AsyncGraphDatabase.driver(
+                self._uri,
+                auth=auth,
+                max_connection_pool_size=self._max_connection_pool_size,
+                connection_acquisition_timeout=self._connection_acquisition_timeout,
+            )
 
-            # Verify connection
-            with self._driver.session(database=self._database) as session:
-                session.run("RETURN 1")
+            # Verify connection (auto-commit, so a down server fails fast
+            # instead of being retried)
+            async with self._driver.session(database=self._database) as session:
+                result = await session.run("RETURN 1")
+                await result.consume()
 
             logger.info("MemgraphBackend connected successfully")
         except Exception as e:
             logger.error(f"Failed to connect to Memgraph: {e}")
+            if self._driver:
+                await self._driver.close()
+                self._driver = None
             raise ConnectionError(f"Failed to connect to Memgraph: {e}") from e
 
     async def disconnect(self) -> None:
         """Close connection."""
         if self._driver:
-            self._driver.close()
+            await self._driver.close()
             self._driver = None
             logger.info("MemgraphBackend disconnected")
 
@@ -84,12 +133,38 @@ class MemgraphBackend:
         """Check if backend is connected."""
         return self._driver is not None
 
-    def _ensure_connected(self) -> Driver:
+    def _ensure_connected(self) -> AsyncDriver:
         """Ensure backend is connected."""
         if not self._driver:
             raise RuntimeError("Backend not connected. Call connect() first.")
         return self._driver
 
+    async def _read(
+        self, query: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> List[Record]:
+        """Run a query in a read transaction and fetch its records."""
+        driver = self._ensure_connected()
+        async with driver.session(database=self._database) as session:
+            records: List[Record] = await session.execute_read(
+                _fetch, query, parameters or {}
+            )
+        return records
+
+    async def _write(
+        self, query: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> List[Record]:
+        """Run a query in a write transaction and fetch its records."""
+        return await self._write_all([(query, parameters or {})])
+
+    async def _write_all(
+        self, queries: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Record]:
+        """Run queries in one write transaction and fetch all their records."""
+        driver = self._ensure_connected()
+        async with driver.session(database=self._database) as session:
+            records: List[Record] = await session.execute_write(_fetch_all, queries)
+        return records
+
     # --- Node Operations ---
 
     async def create_node(
@@ -99,7 +174,7 @@ class MemgraphBackend:
         node_id: Optional[UUID] = None,
     ) -> GraphNode:
         """Create a node in Memgraph."""
-        driver = self._ensure_connected()
+        self._ensure_connected()
 
         if not labels:
             raise ValueError("labels cannot be empty")
@@ -116,10 +191,8 @@ class MemgraphBackend:
         """
 
         try:
-            with driver.session(database=self._database) as session:
-                result = session.run(query, props=props)
-                record = result.single()
-                node = record["n"]
+            records = await self._write(query, {"props": props})
+            node = records[0]["n"]
 
             logger.debug(f"Created node {node_id} with labels {labels}")
 
@@ -134,26 +207,21 @@ class MemgraphBackend:
 
     async def get_node(self, node_id: UUID) -> Optional[GraphNode]:
         """Get a node by ID."""
-        driver = self._ensure_connected()
-
         query = """
             MATCH (n {id: $node_id})
             RETURN n
         """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, node_id=str(node_id))
-            record = result.single()
-
-            if not record:
-                return None
+        records = await self._read(query, {"node_id": str(node_id)})
+        if not records:
+            return None
 
-            node = record["n"]
-            return GraphNode(
-                id=UUID(node["id"]),
-                labels=list(node.labels),
-                properties=dict(node),
-            )
+        node = records[0]["n"]
+        return GraphNode(
+            id=UUID(node["id"]),
+            labels=list(node.labels),
+            properties=dict(node),
+        )
 
     async def update_node(
         self,
@@ -162,8 +230,6 @@ class MemgraphBackend:
         merge: bool = True,
     ) -> GraphNode:
         """Update node properties."""
-        driver = self._ensure_connected()
-
         if merge:
             # Merge properties with existing
             query = """
@@ -180,26 +246,23 @@ class MemgraphBackend:
                 RETURN n
             """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, node_id=str(node_id), props=properties)
-            record = result.single()
-
-            if not record:
-                raise ValueError(f"Node {node_id} not found")
+        records = await self._write(
+            query, {"node_id": str(node_id), "props": properties}
+        )
+        if not records:
+            raise ValueError(f"Node {node_id} not found")
 
-            node = record["n"]
-            logger.debug(f"Updated node {node_id}")
+        node = records[0]["n"]
+        logger.debug(f"Updated node {node_id}")
 
-            return GraphNode(
-                id=UUID(node["id"]),
-                labels=list(node.labels),
-                properties=dict(node),
-            )
+        return GraphNode(
+            id=UUID(node["id"]),
+            labels=list(node.labels),
+            properties=dict(node),
+        )
 
     async def delete_node(self, node_id: UUID, soft: bool = True) -> bool:
         """Delete a node."""
-        driver = self._ensure_connected()
-
         if soft:
             # Soft delete by setting deleted_at property
             query = """
@@ -216,27 +279,23 @@ class MemgraphBackend:
                 RETURN count(n) as deleted_count
             """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, node_id=str(node_id))
-            record = result.single()
+        records = await self._write(query, {"node_id": str(node_id)})
 
-            deleted = record is not None
-            if deleted:
-                logger.debug(f"{'Soft' if soft else 'Hard'} deleted node {node_id}")
-            return deleted
+        deleted = bool(records)
+        if deleted:
+            logger.debug(f"{'Soft' if soft else 'Hard'} deleted node {node_id}")
+        return deleted
 
     async def batch_create_nodes(
         self,
         nodes: List[Dict[str, Any]],
     ) -> List[GraphNode]:
-        """Batch create nodes using UNWIND."""
-        driver = self._ensure_connected()
+        """Batch create nodes using UNWIND, in one transaction."""
+        self._ensure_connected()
 
         if not nodes:
             return []
 
-        created = []
-
         # Group by label combination for efficient queries
         by_labels: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
@@ -253,25 +312,27 @@ class MemgraphBackend:
                 {"id": node_id, "labels": labels, "props": props}
             )
 
-        with driver.session(database=self._database) as session:
-            for labels_str, group in by_labels.items():
-                query = f"""
+        queries = [
+            (
+                f"""
                     UNWIND $nodes AS node
                     CREATE (n:{labels_str})
                     SET n = node.props
                     RETURN n
-                """
-
-                result = session.run(query, nodes=group)
-                for record in result:
-                    node = record["n"]
-                    created.append(
-                        GraphNode(
-                            id=UUID(node["id"]),
-                            labels=list(node.labels),
-                            properties=dict(node),
-                        )
-                    )
+                """,
+                {"nodes": group},
+            )
+            for labels_str, group in by_labels.items()
+        ]
+
+        created = [
+            GraphNode(
+                id=UUID(record["n"]["id"]),
+                labels=list(record["n"].labels),
+                properties=dict(record["n"]),
+            )
+            for record in await self._write_all(queries)
+        ]
 
         logger.info(f"Batch created {len(created)} nodes")
         return created
@@ -287,7 +348,7 @@ class MemgraphBackend:
         edge_id: Optional[UUID] = None,
     ) -> GraphEdge:
         """Create a single edge."""
-        driver = self._ensure_connected()
+        self._ensure_connected()
 
         if not edge_type:
             raise ValueError("edge_type cannot be empty")
@@ -306,62 +367,57 @@ class MemgraphBackend:
         """
 
         try:
-            with driver.session(database=self._database) as session:
-                result = session.run(
-                    query,
-                    source_id=str(source_id),
-                    target_id=str(target_id),
-                    props=props,
-                )
-                record = result.single()
-
-                if not record:
-                    raise ValueError(f"Source or target node not found")
+            records = await self._write(
+                query,
+                {
+                    "source_id": str(source_id),
+                    "target_id": str(target_id),
+                    "props": props,
+                },
+            )
+            if not records:
+                raise ValueError(f"Source or target node not found")
 
-                rel = record["r"]
+            rel = records[0]["r"]
 
-                logger.debug(f"Created edge {edge_id}: {source_id} -> {target_id}")
+            logger.debug(f"Created edge {edge_id}: {source_id} -> {target_id}")
 
-                return GraphEdge(
-                    id=UUID(rel.get("id", str(edge_id))),
-                    source_id=source_id,
-                    target_id=target_id,
-                    edge_type=rel.type,
-                    properties=dict(rel),
-                    weight=float(rel.get("weight", 1.0)),
-                    confidence=float(rel.get("confidence", 1.0)),
-                )
+            return GraphEdge(
+                id=UUID(rel.get("id", str(edge_id))),
+                source_id=source_id,
+                target_id=target_id,
+                edge_type=rel.type,
+                properties=dict(rel),
+                weight=float(rel.get("weight", 1.0)),
+                confidence=float(rel.get("confidence", 1.0)),
+            )
         except Exception as e:
             logger.error(f"Failed to create edge: {e}")
             raise
 
     async def get_edge(self, edge_id: UUID) -> Optional[GraphEdge]:
         """Get an edge by ID (excludes soft-deleted edges)."""
-        driver = self._ensure_connected()
-
         query = """
             MATCH (source)-[r {id: $edge_id}]->(target)
             WHERE r.deleted_at IS NULL
             RETURN r, source.id as source_id, target.id as target_id
         """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, edge_id=str(edge_id))
-            record = result.single()
-
-            if not record:
-                return None
-
-            rel = record["r"]
-            return GraphEdge(
-                id=UUID(rel["id"]),
-                source_id=UUID(record["source_id"]),
-                target_id=UUID(record["target_id"]),
-                edge_type=rel.type,
-                properties=dict(rel),
-                weight=float(rel.get("weight", 1.0)),
-                confidence=float(rel.get("confidence", 1.0)),
-            )
+        records = await self._read(query, {"edge_id": str(edge_id)})
+        if not records:
+            return None
+
+        record = records[0]
+        rel = record["r"]
+        return GraphEdge(
+            id=UUID(rel["id"]),
+            source_id=UUID(record["source_id"]),
+            target_id=UUID(record["target_id"]),
+            edge_type=rel.type,
+            properties=dict(rel),
+            weight=float(rel.get("weight", 1.0)),
+            confidence=float(rel.get("confidence", 1.0)),
+        )
 
     async def update_edge(
         self,
@@ -370,8 +426,6 @@ class MemgraphBackend:
         merge: bool = True,
     ) -> GraphEdge:
         """Update edge properties."""
-        driver = self._ensure_connected()
-
         if merge:
             query = """
                 MATCH (source)-[r {id: $edge_id}]->(target)
@@ -386,30 +440,28 @@ class MemgraphBackend:
                 RETURN r, source.id as source_id, target.id as target_id
             """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, edge_id=str(edge_id), props=properties)
-            record = result.single()
-
-            if not record:
-                raise ValueError(f"Edge {edge_id} not found")
-
-            rel = record["r"]
-            logger.debug(f"Updated edge {edge_id}")
-
-            return GraphEdge(
-                id=UUID(rel["id"]),
-                source_id=UUID(record["source_id"]),
-                target_id=UUID(record["target_id"]),
-                edge_type=rel.type,
-                properties=dict(rel),
-                weight=float(rel.get("weight", 1.0)),
-                confidence=float(rel.get("confidence", 1.0)),
-            )
+        records = await self._write(
+            query, {"edge_id": str(edge_id), "props": properties}
+        )
+        if not records:
+            raise ValueError(f"Edge {edge_id} not found")
+
+        record = records[0]
+        rel = record["r"]
+        logger.debug(f"Updated edge {edge_id}")
+
+        return GraphEdge(
+            id=UUID(rel["id"]),
+            source_id=UUID(record["source_id"]),
+            target_id=UUID(record["target_id"]),
+            edge_type=rel.type,
+            properties=dict(rel),
+            weight=float(rel.get("weight", 1.0)),
+            confidence=float(rel.get("confidence", 1.0)),
+        )
 
     async def delete_edge(self, edge_id: UUID, soft: bool = True) -> bool:
         """Delete an edge."""
-        driver = self._ensure_connected()
-
         if soft:
             query = """
                 MATCH ()-[r {id: $edge_id}]->()
@@ -424,21 +476,19 @@ class MemgraphBackend:
                 RETURN count(r) as deleted_count
             """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, edge_id=str(edge_id))
-            record = result.single()
+        records = await self._write(query, {"edge_id": str(edge_id)})
 
-            deleted = record is not None
-            if deleted:
-                logger.debug(f"{'Soft' if soft else 'Hard'} deleted edge {edge_id}")
-            return deleted
+        deleted = bool(records)
+        if deleted:
+            logger.debug(f"{'Soft' if soft else 'Hard'} deleted edge {edge_id}")
+        return deleted
 
     async def batch_create_edges(
         self,
         edges: List[Dict[str, Any]],
     ) -> List[GraphEdge]:
-        """Batch create edges using UNWIND."""
-        driver = self._ensure_connected()
+        """Batch create edges using UNWIND, in one transaction."""
+        self._ensure_connected()
 
         if not edges:
             return []
@@ -466,33 +516,33 @@ class MemgraphBackend:
                 }
             )
 
-        created = []
-
-        with driver.session(database=self._database) as session:
-            for edge_type, group in by_type.items():
-                query = f"""
+        queries = [
+            (
+                f"""
                     UNWIND $edges AS edge
                     MATCH (source {{id: edge.source_id}})
                     MATCH (target {{id: edge.target_id}})
                     CREATE (source)-[r:{edge_type}]->(target)
                     SET r = edge.props
                     RETURN r, source.id as source_id, target.id as target_id
-                """
-
-                result = session.run(query, edges=group)
-                for record in result:
-                    rel = record["r"]
-                    created.append(
-                        GraphEdge(
-                            id=UUID(rel["id"]),
-                            source_id=UUID(record["source_id"]),
-                            target_id=UUID(record["target_id"]),
-                            edge_type=rel.type,
-                            properties=dict(rel),
-                            weight=float(rel.get("weight", 1.0)),
-                            confidence=float(rel.get("confidence", 1.0)),
-                        )
-                    )
+                """,
+                {"edges": group},
+            )
+            for edge_type, group in by_type.items()
+        ]
+
+        created = [
+            GraphEdge(
+                id=UUID(record["r"]["id"]),
+                source_id=UUID(record["source_id"]),
+                target_id=UUID(record["target_id"]),
+                edge_type=record["r"].type,
+                properties=dict(record["r"]),
+                weight=float(record["r"].get("weight", 1.0)),
+                confidence=float(record["r"].get("confidence", 1.0)),
+            )
+            for record in await self._write_all(queries)
+        ]
 
         logger.info(f"Batch created {len(created)} edges")
         return created
@@ -504,9 +554,11 @@ class MemgraphBackend:
         start_node_id: UUID,
         params: TraversalParams,
     ) -> List[GraphNode]:
-        """Traverse graph using Memgraph-compatible Cypher."""
-        driver = self._ensure_connected()
+        """Traverse graph using Memgraph-compatible Cypher.
 
+        Each node is returned once at its minimum depth whichever
+        ``TraversalStrategy`` is requested.
+        """
         # Build relationship pattern
         rel_pattern = ""
         if params.edge_types:
@@ -540,20 +592,17 @@ class MemgraphBackend:
         if params.limit:
             query += f" LIMIT {params.limit}"
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, start_id=str(start_node_id))
-
-            nodes = []
-            for record in result:
-                node = record["connected"]
-                nodes.append(
-                    GraphNode(
-                        id=UUID(node["id"]),
-                        labels=list(node.labels),
-                        properties=dict(node),
-                        depth=record["depth"],
-                    )
-                )
+        records = await self._read(query, {"start_id": str(start_node_id)})
+
+        nodes = [
+            GraphNode(
+                id=UUID(record["connected"]["id"]),
+                labels=list(record["connected"].labels),
+                properties=dict(record["connected"]),
+                depth=record["depth"],
+            )
+            for record in records
+        ]
 
         logger.debug(
             f"Traversed from {start_node_id}, found {len(nodes)} nodes at max depth {params.max_depth}"
@@ -568,8 +617,6 @@ class MemgraphBackend:
         edge_types: Optional[List[str]] = None,
     ) -> Optional[GraphPath]:
         """Find shortest path using Memgraph-compatible BFS."""
-        driver = self._ensure_connected()
-
         rel_pattern = ""
         if edge_types:
             rel_types = "|".join(edge_types)
@@ -584,18 +631,72 @@ class MemgraphBackend:
             LIMIT 1
         """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(
-                query,
-                start_id=str(start_node_id),
-                end_id=str(end_node_id),
+        records = await self._read(
+            query,
+            {"start_id": str(start_node_id), "end_id": str(end_node_id)},
+        )
+        if not records:
+            logger.debug(f"No path found from {start_node_id} to {end_node_id}")
+            return None
+
+        path = records[0]["path"]
+
+        nodes = [
+            GraphNode(
+                id=UUID(node["id"]),
+                labels=list(node.labels),
+                properties=dict(node),
             )
-            record = result.single()
+            for node in path.nodes
+        ]
+
+        edges = [
+            GraphEdge(
+                id=UUID(rel.get("id", str(uuid4()))),
+                source_id=UUID(rel.start_node["id"]),
+                target_id=UUID(rel.end_node["id"]),
+                edge_type=rel.type,
+                properties=dict(rel),
+                weight=float(rel.get("weight", 1.0)),
+                confidence=float(rel.get("confidence", 1.0)),
+            )
+            for rel in path.relationships
+        ]
+
+        logger.debug(
+            f"Found path from {start_node_id} to {end_node_id} with length {len(edges)}"
+        )
+
+        return GraphPath(
+            nodes=nodes,
+            edges=edges,
+            total_weight=float(len(edges)),
+            length=len(edges),
+        )
 
-            if not record:
-                logger.debug(f"No path found from {start_node_id} to {end_node_id}")
-                return None
+    async def find_all_paths(
+        self,
+        start_node_id: UUID,
+        end_node_id: UUID,
+        max_depth: int = 5,
+        limit: int = 10,
+    ) -> List[GraphPath]:
+        """Find all paths between two nodes."""
+        query = f"""
+            MATCH (start {{id: $start_id}}), (end {{id: $end_id}})
+            MATCH path = (start)-[*1..{max_depth}]-(end)
+            RETURN path
+            ORDER BY length(path)
+            LIMIT {limit}
+        """
+
+        records = await self._read(
+            query,
+            {"start_id": str(start_node_id), "end_id": str(end_node_id)},
+        )
 
+        paths = []
+        for record in records:
             path = record["path"]
 
             nodes = [
@@ -620,76 +721,14 @@ class MemgraphBackend:
                 for rel in path.relationships
             ]
 
-            logger.debug(
-                f"Found path from {start_node_id} to {end_node_id} with length {len(edges)}"
-            )
-
-            return GraphPath(
-                nodes=nodes,
-                edges=edges,
-                total_weight=float(len(edges)),
-                length=len(edges),
-            )
-
-    async def find_all_paths(
-        self,
-        start_node_id: UUID,
-        end_node_id: UUID,
-        max_depth: int = 5,
-        limit: int = 10,
-    ) -> List[GraphPath]:
-        """Find all paths between two nodes."""
-        driver = self._ensure_connected()
-
-        query = f"""
-            MATCH (start {{id: $start_id}}), (end {{id: $end_id}})
-            MATCH path = (start)-[*1..{max_depth}]-(end)
-            RETURN path
-            ORDER BY length(path)
-            LIMIT {limit}
-        """
-
-        with driver.session(database=self._database) as session:
-            result = session.run(
-                query,
-                start_id=str(start_node_id),
-                end_id=str(end_node_id),
-            )
-
-            paths = []
-            for record in result:
-                path = record["path"]
-
-                nodes = [
-                    GraphNode(
-                        id=UUID(node["id"]),
-                        labels=list(node.labels),
-                        properties=dict(node),
-                    )
-                    for node in path.nodes
-                ]
-
-                edges = [
-                    GraphEdge(
-                        id=UUID(rel.get("id", str(uuid4()))),
-                        source_id=UUID(rel.start_node["id"]),
-                        target_id=UUID(rel.end_node["id"]),
-                        edge_type=rel.type,
-                        properties=dict(rel),
-                        weight=float(rel.get("weight", 1.0)),
-                        confidence=float(rel.get("confidence", 1.0)),
-                    )
-                    for rel in path.relationships
-                ]
-
-                paths.append(
-                    GraphPath(
-                        nodes=nodes,
-                        edges=edges,
-                        total_weight=float(len(edges)),
-                        length=len(edges),
-                    )
+            paths.append(
+                GraphPath(
+                    nodes=nodes,
+                    edges=edges,
+                    total_weight=float(len(edges)),
+                    length=len(edges),
                 )
+            )
 
         logger.debug(f"Found {len(paths)} paths from {start_node_id} to {end_node_id}")
         return paths
@@ -702,8 +741,6 @@ class MemgraphBackend:
         limit: Optional[int] = None,
     ) -> List[GraphNode]:
         """Get immediate neighbors of a node."""
-        driver = self._ensure_connected()
-
         # Build relationship pattern
         rel_pattern = ""
         if edge_types:
@@ -729,17 +766,16 @@ class MemgraphBackend:
         if limit:
             query += f" LIMIT {limit}"
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, node_id=str(node_id))
+        records = await self._read(query, {"node_id": str(node_id)})
 
-            neighbors = [
-                GraphNode(
-                    id=UUID(record["neighbor"]["id"]),
-                    labels=list(record["neighbor"].labels),
-                    properties=dict(record["neighbor"]),
-                )
-                for record in result
-            ]
+        neighbors = [
+            GraphNode(
+                id=UUID(record["neighbor"]["id"]),
+                labels=list(record["neighbor"].labels),
+                properties=dict(record["neighbor"]),
+            )
+            for record in records
+        ]
 
         logger.debug(f"Found {len(neighbors)} neighbors for node {node_id}")
         return neighbors
@@ -750,7 +786,7 @@ class MemgraphBackend:
         include_edges: bool = True,
     ) -> Dict[str, Any]:
         """Extract a subgraph containing specified nodes."""
-        driver = self._ensure_connected()
+        self._ensure_connected()
 
         if not node_ids:
             return {"nodes": [], "edges": []}
@@ -763,17 +799,18 @@ class MemgraphBackend:
             RETURN n
         """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query_nodes, node_ids=[str(nid) for nid in node_ids])
+        records = await self._read(
+            query_nodes, {"node_ids": [str(nid) for nid in node_ids]}
+        )
 
-            nodes = [
-                GraphNode(
-                    id=UUID(record["n"]["id"]),
-                    labels=list(record["n"].labels),
-                    properties=dict(record["n"]),
-                )
-                for record in result
-            ]
+        nodes = [
+            GraphNode(
+                id=UUID(record["n"]["id"]),
+                labels=list(record["n"].labels),
+                properties=dict(record["n"]),
+            )
+            for record in records
+        ]
 
         result_dict: Dict[str, Any] = {"nodes": nodes}
 
@@ -787,25 +824,22 @@ class MemgraphBackend:
                 RETURN DISTINCT r, source.id as source_id, target.id as target_id
             """
 
-            with driver.session(database=self._database) as session:
-                result = session.run(
-                    query_edges, node_ids=[str(nid) for nid in node_ids]
-                )
+            records = await self._read(
+                query_edges, {"node_ids": [str(nid) for nid in node_ids]}
+            )
 
-                edges = [
-                    GraphEdge(
-                        id=UUID(record["r"].get("id", str(uuid4()))),
-                        source_id=UUID(record["source_id"]),
-                        target_id=UUID(record["target_id"]),
-                        edge_type=record["r"].type,
-                        properties=dict(record["r"]),
-                        weight=float(record["r"].get("weight", 1.0)),
-                        confidence=float(record["r"].get("confidence", 1.0)),
-                    )
-                    for record in result
-                ]
-
-                result_dict["edges"] = edges
+            result_dict["edges"] = [
+                GraphEdge(
+                    id=UUID(record["r"].get("id", str(uuid4()))),
+                    source_id=UUID(record["source_id"]),
+                    target_id=UUID(record["target_id"]),
+                    edge_type=record["r"].type,
+                    properties=dict(record["r"]),
+                    weight=float(record["r"].get("weight", 1.0)),
+                    confidence=float(record["r"].get("confidence", 1.0)),
+                )
+                for record in records
+            ]
 
         logger.debug(
             f"Extracted subgraph with {len(nodes)} nodes"
@@ -826,8 +860,6 @@ class MemgraphBackend:
         limit: Optional[int] = None,
     ) -> List[GraphNode]:
         """Find nodes matching criteria."""
-        driver = self._ensure_connected()
-
         # Build label filter
         label_filter = ""
         if labels:
@@ -854,17 +886,16 @@ class MemgraphBackend:
         if limit:
             query += f" LIMIT {limit}"
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, **params)
+        records = await self._read(query, params)
 
-            nodes = [
-                GraphNode(
-                    id=UUID(record["n"]["id"]),
-                    labels=list(record["n"].labels),
-                    properties=dict(record["n"]),
-                )
-                for record in result
-            ]
+        nodes = [
+            GraphNode(
+                id=UUID(record["n"]["id"]),
+                labels=list(record["n"].labels),
+                properties=dict(record["n"]),
+            )
+            for record in records
+        ]
 
         logger.debug(f"Found {len(nodes)} nodes matching criteria")
         return nodes
@@ -877,8 +908,6 @@ class MemgraphBackend:
         limit: Optional[int] = None,
     ) -> List[GraphEdge]:
         """Find edges matching criteria."""
-        driver = self._ensure_connected()
-
         # Build type filter
         type_filter = ""
         if edge_types:
@@ -908,21 +937,20 @@ class MemgraphBackend:
         if limit:
             query += f" LIMIT {limit}"
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, **params)
+        records = await self._read(query, params)
 
-            edges = [
-                GraphEdge(
-                    id=UUID(record["r"].get("id", str(uuid4()))),
-                    source_id=UUID(record["source_id"]),
-                    target_id=UUID(record["target_id"]),
-                    edge_type=record["r"].type,
-                    properties=dict(record["r"]),
-                    weight=float(record["r"].get("weight", 1.0)),
-                    confidence=float(record["r"].get("confidence", 1.0)),
-                )
-                for record in result
-            ]
+        edges = [
+            GraphEdge(
+                id=UUID(record["r"].get("id", str(uuid4()))),
+                source_id=UUID(record["source_id"]),
+                target_id=UUID(record["target_id"]),
+                edge_type=record["r"].type,
+                properties=dict(record["r"]),
+                weight=float(record["r"].get("weight", 1.0)),
+                confidence=float(record["r"].get("confidence", 1.0)),
+            )
+            for record in records
+        ]
 
         logger.debug(f"Found {len(edges)} edges matching criteria")
         return edges
@@ -932,7 +960,13 @@ class MemgraphBackend:
         query: str,
         parameters: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Execute a native Cypher query."""
+        """
+        Execute a native Cypher query.
+
+        Runs as an auto-commit query rather than a managed transaction, so
+        statements Memgraph refuses inside explicit transactions (such as
+        index and constraint DDL) work, and the query is not retried.
+        """
         driver = self._ensure_connected()
 
         if not query.strip():
@@ -940,11 +974,11 @@ class MemgraphBackend:
 
         parameters = parameters or {}
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query, **parameters)
+        async with driver.session(database=self._database) as session:
+            result = await session.run(query, parameters)
 
             results = []
-            for record in result:
+            async for record in result:
                 # Convert neo4j types to standard Python types
                 result_dict = {}
                 for key in record.keys():
@@ -968,8 +1002,6 @@ class MemgraphBackend:
         labels: Optional[List[str]] = None,
     ) -> int:
         """Count nodes, optionally filtered by labels."""
-        driver = self._ensure_connected()
-
         label_filter = ""
         if labels:
             label_filter = ":" + ":".join(labels)
@@ -980,9 +1012,7 @@ class MemgraphBackend:
             RETURN count(n) as count
         """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query)
-            count = result.single()["count"]
+        count = (await self._read(query))[0]["count"]
 
         logger.debug(
             f"Counted {count} nodes" + (f" with labels {labels}" if labels else "")
@@ -994,8 +1024,6 @@ class MemgraphBackend:
         edge_types: Optional[List[str]] = None,
     ) -> int:
         """Count edges, optionally filtered by type."""
-        driver = self._ensure_connected()
-
         type_filter = ""
         if edge_types:
             type_filter = ":" + "|".join(edge_types)
@@ -1006,9 +1034,7 @@ class MemgraphBackend:
             RETURN count(r) as count
         """
 
-        with driver.session(database=self._database) as session:
-            result = session.run(query)
-            count = result.single()["count"]
+        count = (await self._read(query))[0]["count"]
 
         logger.debug(
             f"Counted {count} edges"
@@ -7,11 +7,12 @@ This is the default backend - no additional infrastructure required.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID, uuid4
 
 import asyncpg
 
+from ..pathfinding import Step, bidirectional_bfs, bidirectional_dijkstra
 from ..protocol import (
     GraphBackendProtocol,
     GraphEdge,
@@ -19,11 +20,44 @@ from ..protocol import (
     GraphPath,
     TraversalDirection,
     TraversalParams,
+    TraversalStrategy,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Batches of at least this many rows are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 5000
+
+# Rows per multi-VALUES INSERT statement
+INSERT_BATCH_SIZE = 1000
+
+_NODE_COLUMNS = ("entity_id", "entity_type", "name", "description", "metadata", "tags")
+_NODE_STAGING_DDL = """
+    entity_id UUID, entity_type TEXT, name TEXT, description TEXT,
+    metadata JSONB, tags TEXT[]
+"""
+_NODE_RETURNING = "entity_id, entity_type, name, description, metadata, tags"
+
+_EDGE_COLUMNS = (
+    "relationship_id",
+    "from_entity_id",
+    "to_entity_id",
+    "relationship_type",
+    "weight",
+    "confidence",
+    "properties",
+)
+_EDGE_STAGING_DDL = """
+    relationship_id UUID, from_entity_id UUID, to_entity_id UUID,
+    relationship_type TEXT, weight FLOAT8, confidence FLOAT8, properties JSONB
+"""
+_EDGE_RETURNING = (
+    "relationship_id, from_entity_id, to_entity_id, "
+    "relationship_type, weight, confidence, properties"
+)
+
+
 def _parse_json_field(value: Any) -> Dict[str, Any]:
     """Parse a JSON field that may be a dict or JSON string."""
     if value is None:
@@ -38,6 +72,83 @@ def _parse_json_field(value: Any) -> Dict[str, Any]:
     return {}
 
 
+def _node_row(node_spec: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Convert a batch node spec to an entities row."""
+    node_id = node_spec.get("id") or uuid4()
+    labels = node_spec.get("labels", ["entity"])
+    props = node_spec.get("properties", {}).copy()
+
+    if not labels:
+        raise ValueError("Each node must have at least one label")
+
+    entity_type = labels[0]
+    name = props.pop("name", str(node_id))
+    description = props.pop("description", None)
+    # Serialize props to JSON for JSONB column
+    return (node_id, entity_type, name, description, json.dumps(props), labels)
+
+
+def _edge_row(edge_spec: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Convert a batch edge spec to a relationships row."""
+    edge_id = edge_spec.get("id") or uuid4()
+    source_id = edge_spec.get("source_id")
+    target_id = edge_spec.get("target_id")
+    edge_type = edge_spec.get("edge_type")
+    props = edge_spec.get("properties", {}).copy()
+
+    if not all([source_id, target_id, edge_type]):
+        raise ValueError("Each edge must have source_id, target_id, and edge_type")
+
+    weight = props.pop("weight", 1.0)
+    confidence = props.pop("confidence", 1.0)
+    # Serialize props to JSON for JSONB column
+    return (
+        edge_id,
+        source_id,
+        target_id,
+        edge_type,
+        weight,
+        confidence,
+        json.dumps(props),
+    )
+
+
+def _record_to_node(record: asyncpg.Record) -> GraphNode:
+    """Convert an entities record to a GraphNode."""
+    return GraphNode(
+        id=record["entity_id"],
+        labels=record["tags"] or [],
+        properties={
+            "name": record["name"],
+            "description": record["description"],
+            **_parse_json_field(record["metadata"]),
+        },
+    )
+
+
+def _record_to_edge(record: asyncpg.Record) -> GraphEdge:
+    """Convert a relationships record to a GraphEdge."""
+    return GraphEdge(
+        id=record["relationship_id"],
+        source_id=record["from_entity_id"],
+        target_id=record["to_entity_id"],
+        edge_type=record["relationship_type"],
+        properties=_parse_json_field(record["properties"]),
+        weight=float(record["weight"]),
+        confidence=float(record["confidence"]),
+    )
+
+
+def _parent_path(parents: Dict[UUID, Optional[UUID]], node_id: UUID) -> List[UUID]:
+    """Get the node IDs from the traversal start to a node."""
+    path = [node_id]
+    parent = parents[node_id]
+    while parent is not None:
+        path.append(parent)
+        parent = parents[parent]
+    return path[::-1]
+
+
 class PostgresCTEBackend:
     """
     PostgreSQL CTE-based graph backend.
@@ -56,6 +167,7 @@ class PostgresCTEBackend:
         schema: str = "intelligence",
         entities_table: str = "entities",
         relationships_table: str = "relationships",
+        copy_threshold: Optional[int] = COPY_THRESHOLD,
     ) -> None:
         """
         Initialize PostgreSQL CTE backend.
@@ -65,11 +177,14 @@ class PostgresCTEBackend:
             schema: Database schema name
             entities_table: Name of entities table
             relationships_table: Name of relationships table
+            copy_threshold: Smallest batch loaded with COPY; None always
+                uses multi-value INSERT
         """
         self._pool = connection_pool
         self._schema = schema
         self._entities_table = f"{schema}.{entities_table}"
         self._relationships_table = f"{schema}.{relationships_table}"
+        self._copy_threshold = copy_threshold
         self._connected = False
 
     async def connect(self) -> None:
@@ -276,68 +391,31 @@ class PostgresCTEBackend:
         self,
         nodes: List[Dict[str, Any]],
     ) -> List[GraphNode]:
-        """Batch create nodes using multi-value INSERT."""
+        """Batch create nodes.
+
+        Batches of at least ``copy_threshold`` nodes are loaded with COPY;
+        smaller ones use multi-value INSERT.
+        """
         self._ensure_connected()
 
         if not nodes:
             return []
 
-        created = []
-
-        # Process in batches of 1000
-        batch_size = 1000
-        for i in range(0, len(nodes), batch_size):
-            batch = nodes[i : i + batch_size]
-
-            # Build multi-value INSERT
-            values = []
-            params = []
-            param_idx = 1
-
-            for node_spec in batch:
-                node_id = node_spec.get("id") or uuid4()
-                labels = node_spec.get("labels", ["entity"])
-                props = node_spec.get("properties", {}).copy()
-
-                if not labels:
-                    raise ValueError("Each node must have at least one label")
-
-                entity_type = labels[0]
-                name = props.pop("name", str(node_id))
-                description = props.pop("description", None)
-
-                values.append(
-                    f"(${param_idx}, ${param_idx+1}, ${param_idx+2}, "
-                    f"${param_idx+3}, ${param_idx+4}, ${param_idx+5})"
-                )
-                params.extend(
-                    [node_id, entity_type, name, description, json.dumps(props), labels]
-                )  # Serialize props to JSON
-                param_idx += 6
-
-            query = f"""
-                INSERT INTO {self._entities_table}
-                (entity_id, entity_type, name, description, metadata, tags)
-                VALUES {', '.join(values)}
-                RETURNING entity_id, entity_type, name, description, metadata, tags
-            """
-
-            async with self._pool.acquire() as conn:
-                records = await conn.fetch(query, *params)
-
-            for record in records:
-                created.append(
-                    GraphNode(
-                        id=record["entity_id"],
-                        labels=record["tags"] or [],
-                        properties={
-                            "name": record["name"],
-                            "description": record["description"],
-                            **_parse_json_field(record["metadata"]),
-                        },
-                    )
-                )
+        rows = [_node_row(node_spec) for node_spec in nodes]
+        if self._use_copy(rows):
+            records = await self._copy_rows(
+                self._entities_table,
+                _NODE_STAGING_DDL,
+                _NODE_COLUMNS,
+                _NODE_RETURNING,
+                rows,
+            )
+        else:
+            records = await self._insert_rows(
+                self._entities_table, _NODE_COLUMNS, _NODE_RETURNING, rows
+            )
 
+        created = [_record_to_node(record) for record in records]
         logger.info(f"Batch created {len(created)} nodes")
         return created
 
@@ -514,82 +592,101 @@ class PostgresCTEBackend:
         self,
         edges: List[Dict[str, Any]],
     ) -> List[GraphEdge]:
-        """Batch create edges using multi-value INSERT."""
+        """Batch create edges.
+
+        Batches of at least ``copy_threshold`` edges are loaded with COPY;
+        smaller ones use multi-value INSERT.
+        """
         self._ensure_connected()
 
         if not edges:
             return []
 
-        created = []
-
-        # Process in batches of 1000
-        batch_size = 1000
-        for i in range(0, len(edges), batch_size):
-            batch = edges[i : i + batch_size]
-
-            values = []
-            params = []
-            param_idx = 1
+        rows = [_edge_row(edge_spec) for edge_spec in edges]
+        if self._use_copy(rows):
+            records = await self._copy_rows(
+                self._relationships_table,
+                _EDGE_STAGING_DDL,
+                _EDGE_COLUMNS,
+                _EDGE_RETURNING,
+                rows,
+            )
+        else:
+            records = await self._insert_rows(
+                self._relationships_table, _EDGE_COLUMNS, _EDGE_RETURNING, rows
+            )
 
-            for edge_spec in batch:
-                edge_id = edge_spec.get("id") or uuid4()
-                source_id = edge_spec.get("source_id")
-                target_id = edge_spec.get("target_id")
-                edge_type = edge_spec.get("edge_type")
-                props = edge_spec.get("properties", {}).copy()
+        created = [_record_to_edge(record) for record in records]
+        logger.info(f"Batch created {len(created)} edges")
+        return created
 
-                if not all([source_id, target_id, edge_type]):
-                    raise ValueError(
-                        "Each edge must have source_id, target_id, and edge_type"
-                    )
+    # --- Bulk Loading ---
 
-                weight = props.pop("weight", 1.0)
-                confidence = props.pop("confidence", 1.0)
+    def _use_copy(self, rows: Sequence[Tuple[Any, ...]]) -> bool:
+        """Check if a batch is large enough to load with COPY."""
+        return self._copy_threshold is not None and len(rows) >= self._copy_threshold
 
-                values.append(
-                    f"(${param_idx}, ${param_idx+1}, ${param_idx+2}, "
-                    f"${param_idx+3}, ${param_idx+4}, ${param_idx+5}, ${param_idx+6})"
-                )
-                params.extend(
-                    [
-                        edge_id,
-                        source_id,
-                        target_id,
-                        edge_type,
-                        weight,
-                        confidence,
-                        json.dumps(props),
-                    ]  # Serialize to JSON for JSONB column
-                )
-                param_idx += 7
+    async def _insert_rows(
+        self,
+        table: str,
+        columns: Sequence[str],
+        returning: str,
+        rows: Sequence[Tuple[Any, ...]],
+    ) -> List[asyncpg.Record]:
+        """Insert rows with multi-value INSERT statements."""
+        width = len(columns)
+        records: List[asyncpg.Record] = []
+        for i in range(0, len(rows), INSERT_BATCH_SIZE):
+            batch = rows[i : i + INSERT_BATCH_SIZE]
+            values = ", ".join(
+                "(" + ", ".join(f"${n * width + c + 1}" for c in range(width)) + ")"
+                for n in range(len(batch))
+            )
+            params = [value for row in batch for value in row]
 
             query = f"""
-                INSERT INTO {self._relationships_table}
-                (relationship_id, from_entity_id, to_entity_id, relationship_type,
-                 weight, confidence, properties)
-                VALUES {', '.join(values)}
-                RETURNING relationship_id, from_entity_id, to_entity_id,
-                          relationship_type, weight, confidence, properties
+                INSERT INTO {table} ({', '.join(columns)})
+                VALUES {values}
+                RETURNING {returning}
             """
 
             async with self._pool.acquire() as conn:
-                records = await conn.fetch(query, *params)
-
-            for record in records:
-                created.append(
-                    GraphEdge(
-                        id=record["relationship_id"],
-                        source_id=record["from_entity_id"],
-                        target_id=record["to_entity_id"],
-                        edge_type=record["relationship_type"],
-                        properties=_parse_json_field(record["properties"]),
-                        weight=float(record["weight"]),
-                        confidence=float(record["confidence"]),
-                    )
-                )
+                records.extend(await conn.fetch(query, *params))
+        return records
 
-        logger.info(f"Batch created {len(created)} edges")
-        return created
+    async def _copy_rows(
+        self,
+        table: str,
+        staging_ddl: str,
+        columns: Sequence[str],
+        returning: str,
+        rows: Sequence[Tuple[Any, ...]],
+    ) -> List[asyncpg.Record]:
+        """Load rows with COPY into a staging table, then merge them.
+
+        COPY cannot return rows, so rows are streamed into a temporary table
+        with ``copy_records_to_table`` and moved into ``table`` with a single
+        ``INSERT ... SELECT ... RETURNING``. Everything runs in one
+        transaction: either all rows are created or none are.
+        """
+        staging = f"_bulk_{table.replace('.', '_')}"
+        column_list = ", ".join(columns)
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE {staging} ({staging_ddl}) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(
+                    staging, records=rows, columns=list(columns)
+                )
+                query = f"""
+                    INSERT INTO {table} ({column_list})
+                    SELECT {column_list} FROM {staging}
+                    RETURNING {returning}
+                """
+                records: List[asyncpg.Record] = await conn.fetch(query)
+        return records
 
     # --- Traversal Operations ---
 
@@ -598,9 +695,16 @@ class PostgresCTEBackend:
         start_node_id: UUID,
         params: TraversalParams,
     ) -> List[GraphNode]:
-        """Traverse graph using recursive CTE."""
+        """Traverse graph using recursive CTE.
+
+        ``TraversalStrategy.FRONTIER`` uses level-by-level frontier queries
+        instead (see ``_traverse_frontier``).
+        """
         self._ensure_connected()
 
+        if params.strategy == TraversalStrategy.FRONTIER:
+            return await self._traverse_frontier(start_node_id, params)
+
         # Build direction-specific join condition
         if params.direction == TraversalDirection.OUTGOING:
             rel_filter = "r.from_entity_id = node.entity_id"
@@ -692,79 +796,172 @@ class PostgresCTEBackend:
         )
         return nodes
 
+    async def _traverse_frontier(
+        self,
+        start_node_id: UUID,
+        params: TraversalParams,
+    ) -> List[GraphNode]:
+        """Traverse level by level with one visited set.
+
+        Each level is a single query for the edges of the whole frontier.
+        Nodes already visited are skipped, so every node is expanded once
+        and returned once, at its minimum depth, with one shortest path.
+        With a limit, no further levels are loaded once it is reached.
+        """
+        directions = []
+        if params.direction != TraversalDirection.INCOMING:
+            directions.append(("from_entity_id", "to_entity_id"))
+        if params.direction != TraversalDirection.OUTGOING:
+            directions.append(("to_entity_id", "from_entity_id"))
+
+        type_filter = ""
+        extra_params: List[Any] = []
+        if params.edge_types:
+            type_filter = "AND r.relationship_type = ANY($2::text[])"
+            extra_params.append(params.edge_types)
+
+        # Edges from the frontier to live neighbors, in each direction
+        level_queries = [f"""
+                SELECT r.{near} AS node_id, r.{far} AS neighbor_id
+                FROM {self._relationships_table} r
+                JOIN {self._entities_table} e ON e.entity_id = r.{far}
+                    AND e.deleted_at IS NULL
+                WHERE r.{near} = ANY($1::uuid[])
+                  AND r.deleted_at IS NULL
+                  {type_filter}
+            """ for near, far in directions]
+        level_query = " UNION ALL ".join(level_queries)
+
+        nodes_query = f"""
+            SELECT e.entity_id, e.name, e.entity_type, e.metadata, e.tags, v.depth
+            FROM unnest($1::uuid[], $2::int[]) AS v(entity_id, depth)
+            JOIN {self._entities_table} e ON e.entity_id = v.entity_id
+            ORDER BY v.depth, e.name
+        """
+        if params.limit:
+            nodes_query += f" LIMIT {params.limit}"
+
+        async with self._pool.acquire() as conn:
+            exists = await conn.fetchval(
+                f"""
+                SELECT 1 FROM {self._entities_table}
+                WHERE entity_id = $1 AND deleted_at IS NULL
+                """,
+                start_node_id,
+            )
+            if not exists:
+                return []
+
+            parents: Dict[UUID, Optional[UUID]] = {start_node_id: None}
+            depths: Dict[UUID, int] = {start_node_id: 0}
+            frontier = [start_node_id]
+            for depth in range(1, params.max_depth + 1):
+                if not frontier or (params.limit and len(depths) >= params.limit):
+                    break
+                next_frontier = []
+                for record in await conn.fetch(level_query, frontier, *extra_params):
+                    neighbor = record["neighbor_id"]
+                    if neighbor not in depths:
+                        depths[neighbor] = depth
+                        parents[neighbor] = record["node_id"]
+                        next_frontier.append(neighbor)
+                frontier = next_frontier
+
+            records = await conn.fetch(nodes_query, list(depths), list(depths.values()))
+
+        nodes = [
+            GraphNode(
+                id=r["entity_id"],
+                labels=r["tags"] or [r["entity_type"]],
+                properties={"name": r["name"], **_parse_json_field(r["metadata"])},
+                depth=r["depth"],
+                path=_parent_path(parents, r["entity_id"]),
+            )
+            for r in records
+        ]
+
+        logger.debug(
+            f"Frontier traversal from {start_node_id} visited {len(depths)} nodes "
+            f"at max depth {params.max_depth}"
+        )
+        return nodes
+
     async def find_shortest_path(
         self,
         start_node_id: UUID,
         end_node_id: UUID,
         max_depth: int = 10,
         edge_types: Optional[List[str]] = None,
+        weighted: bool = False,
     ) -> Optional[GraphPath]:
-        """Find shortest path using recursive CTE with BFS."""
+        """Find shortest path with a bidirectional search.
+
+        Searches forward from the start and backward from the end, loading
+        the edges of a whole frontier per query, and stops where the two
+        searches meet. Unweighted searches find the fewest edges with BFS;
+        weighted searches use Dijkstra on an edge cost of ``1 - weight``,
+        so strong relationships are preferred, with fewer edges breaking
+        ties. ``total_weight`` is the summed cost in both cases.
+        """
         self._ensure_connected()
 
         type_filter = ""
-        query_params: List[Any] = [start_node_id, end_node_id, max_depth]
-
         if edge_types:
-            placeholders = ", ".join([f"${i}" for i in range(4, 4 + len(edge_types))])
-            type_filter = f"AND r.relationship_type IN ({placeholders})"
-            query_params.extend(edge_types)
+            type_filter = "AND relationship_type = ANY($2::text[])"
 
-        query = f"""
-            WITH RECURSIVE path_search AS (
-                -- Base case
-                SELECT
-                    $1::uuid as current_node,
-                    ARRAY[$1::uuid] as node_path,
-                    ARRAY[]::uuid[] as edge_path,
-                    0.0::double precision as total_weight,
-                    0 as length
-
-                UNION ALL
+        async with self._pool.acquire() as conn:
 
-                -- Recursive case
-                SELECT
-                    r.to_entity_id as current_node,
-                    ps.node_path || r.to_entity_id as node_path,
-                    ps.edge_path || r.relationship_id as edge_path,
-                    ps.total_weight + (1.0 - COALESCE(r.weight, 1.0)::float) as total_weight,
-                    ps.length + 1 as length
-                FROM path_search ps
-                JOIN {self._relationships_table} r
-                    ON r.from_entity_id = ps.current_node
-                    AND r.deleted_at IS NULL
-                    {type_filter}
-                WHERE ps.length < $3
-                  AND NOT (r.to_entity_id = ANY(ps.node_path))
-                  AND ps.current_node != $2
-            )
-            SELECT node_path, edge_path, total_weight, length
-            FROM path_search
-            WHERE current_node = $2
-            ORDER BY total_weight, length
-            LIMIT 1
-        """
+            async def expand(
+                node_ids: Sequence[UUID], reverse: bool
+            ) -> Dict[UUID, List[Step]]:
+                near, far = (
+                    ("to_entity_id", "from_entity_id")
+                    if reverse
+                    else ("from_entity_id", "to_entity_id")
+                )
+                query = f"""
+                    SELECT {near} AS node_id, relationship_id, {far} AS neighbor_id,
+                           GREATEST(1.0 - COALESCE(weight, 1.0)::float, 0.0) AS cost
+                    FROM {self._relationships_table}
+                    WHERE {near} = ANY($1::uuid[])
+                      AND deleted_at IS NULL
+                      {type_filter}
+                """
+                args: List[Any] = [list(node_ids)]
+                if edge_types:
+                    args.append(edge_types)
+
+                adjacency: Dict[UUID, List[Step]] = {}
+                for record in await conn.fetch(query, *args):
+                    adjacency.setdefault(record["node_id"], []).append(
+                        (
+                            record["relationship_id"],
+                            record["neighbor_id"],
+                            record["cost"],
+                        )
+                    )
+                return adjacency
 
-        async with self._pool.acquire() as conn:
-            record = await conn.fetchrow(query, *query_params)
+            search = bidirectional_dijkstra if weighted else bidirectional_bfs
+            result = await search(start_node_id, end_node_id, expand, max_depth)
 
-        if not record:
+        if result is None:
             logger.debug(f"No path found from {start_node_id} to {end_node_id}")
             return None
 
         # Fetch actual nodes and edges for the path
-        nodes = await self._fetch_nodes_by_ids(record["node_path"])
-        edges = await self._fetch_edges_by_ids(record["edge_path"])
+        nodes = await self._fetch_nodes_by_ids(result.node_ids)
+        edges = await self._fetch_edges_by_ids(result.edge_ids)
 
         logger.debug(
-            f"Found path from {start_node_id} to {end_node_id} with length {record['length']}"
+            f"Found path from {start_node_id} to {end_node_id} with length {result.length}"
         )
 
         return GraphPath(
             nodes=nodes,
             edges=edges,
-            total_weight=float(record["total_weight"]),
-            length=record["length"],
+            total_weight=result.total_cost,
+            length=result.length,
         )
 
     async def find_all_paths(
@@ -0,0 +1,745 @@
+"""
+Read-through adjacency cache for graph backends.
+
+Vulnerability-context and similar lookups read the same neighborhoods over
+and over. ``CachedGraphBackend`` wraps any ``GraphBackendProtocol`` and keeps
+the results of ``get_neighbors``, ``traverse`` and ``get_subgraph`` in an
+``AdjacencyCache``. Each node is interned once into a shared table, and each
+cached result is a row of ``array`` integer node indices, with traversal
+paths stored CSR-style as offsets into one flat index array. Entries are
+evicted least recently used to stay within a memory budget.
+
+Writes made through the wrapper invalidate the entries that contain the
+nodes they touch. Writes made by other processes are picked up through a
+``GraphVersion`` counter, which every wrapper bumps on write and polls
+before serving reads.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from dataclasses import replace
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from uuid import UUID
+
+import asyncpg
+
+from .protocol import (
+    GraphBackendProtocol,
+    GraphEdge,
+    GraphNode,
+    GraphPath,
+    TraversalDirection,
+    TraversalParams,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+# Rough per-object costs used to keep the cache within its budget
+_NODE_BYTES = 256
+_EDGE_BYTES = 320
+_ENTRY_BYTES = 200
+
+# Depth stored for nodes returned without one
+_NO_DEPTH = -1
+
+
+class _Entry:
+    """One cached result: node indices plus optional depths, paths, edges."""
+
+    __slots__ = ("nodes", "depths", "path_offsets", "path_nodes", "edges", "touched")
+
+    def __init__(
+        self,
+        nodes: "array[int]",
+        depths: "Optional[array[int]]",
+        path_offsets: "Optional[array[int]]",
+        path_nodes: "Optional[array[int]]",
+        edges: Optional[Tuple[GraphEdge, ...]],
+        touched: Set[int],
+    ) -> None:
+        self.nodes = nodes
+        self.depths = depths
+        self.path_offsets = path_offsets
+        self.path_nodes = path_nodes
+        self.edges = edges
+        self.touched = touched
+
+    @property
+    def size(self) -> int:
+        """Approximate memory used by the entry in bytes."""
+        arrays = (self.nodes, self.depths, self.path_offsets, self.path_nodes)
+        size = _ENTRY_BYTES + sum(a.itemsize * len(a) for a in arrays if a)
+        if self.edges:
+            size += _EDGE_BYTES * len(self.edges)
+        return size
+
+
+class AdjacencyCache:
+    """
+    Memory-bounded LRU cache of graph read results.
+
+    Not thread-safe; share one instance per event loop.
+
+    Attributes:
+        budget_bytes: Approximate memory limit
+        size_bytes: Approximate memory in use
+        hits: Lookups served from the cache
+        misses: Lookups that were not cached
+        generation: Incremented whenever entries are invalidated
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            budget_bytes: Approximate memory limit for cached results
+        """
+        self.budget_bytes = budget_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+        # Interned nodes, by index
+        self._ids: List[Optional[UUID]] = []
+        self._payloads: List[Optional[Tuple[List[str], Dict[str, Any]]]] = []
+        self._payload_bytes = array("I")
+        self._refs = array("I")
+        self._index: Dict[UUID, int] = {}
+        self._free: List[int] = []
+
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        # Node index -> keys of the entries that contain it
+        self._containing: Dict[int, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+    def get_nodes(self, key: Hashable) -> Optional[List[GraphNode]]:
+        """
+        Get cached nodes.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Fresh GraphNode copies, or None if not cached
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        return self._materialize(entry)
+
+    def get_edges(self, key: Hashable) -> Optional[List[GraphEdge]]:
+        """
+        Get the edges cached with a result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            GraphEdge copies, or None if the result is not cached with edges
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.edges is None:
+            return None
+        return list(_copy_edges(entry.edges))
+
+    def put(
+        self,
+        key: Hashable,
+        nodes: Sequence[GraphNode],
+        anchors: Iterable[UUID] = (),
+        edges: Optional[Sequence[GraphEdge]] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a result.
+
+        Args:
+            key: Cache key
+            nodes: Nodes of the result
+            anchors: Other node IDs the result depends on, such as the start
+                node of a traversal
+            edges: Edges of the result, if any
+            generation: ``generation`` read before the result was loaded;
+                the result is dropped if entries were invalidated since
+        """
+        if generation is not None and generation != self.generation:
+            return
+        if key in self._entries:
+            self._drop(key)
+
+        indices = array("I", (self._intern(node.id, node) for node in nodes))
+        touched = set(indices)
+        touched.update(self._intern(node_id) for node_id in anchors)
+
+        depths = None
+        if any(node.depth is not None for node in nodes):
+            depths = array(
+                "i",
+                (_NO_DEPTH if node.depth is None else node.depth for node in nodes),
+            )
+
+        path_offsets = path_nodes = None
+        if any(node.path for node in nodes):
+            path_offsets = array("I", [0])
+            path_nodes = array("I")
+            for node in nodes:
+                path_nodes.extend(self._intern(node_id) for node_id in node.path or ())
+                path_offsets.append(len(path_nodes))
+            touched.update(path_nodes)
+
+        entry = _Entry(
+            indices,
+            depths,
+            path_offsets,
+            path_nodes,
+            _copy_edges(edges) if edges is not None else None,
+            touched,
+        )
+        for index in touched:
+            self._refs[index] += 1
+            self._containing.setdefault(index, set()).add(key)
+        self._entries[key] = entry
+        self.size_bytes += entry.size
+
+        while self.size_bytes > self.budget_bytes and self._entries:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, node_ids: Iterable[UUID]) -> int:
+        """
+        Drop every cached result that contains any of the nodes.
+
+        Args:
+            node_ids: Nodes that changed
+
+        Returns:
+            Number of results dropped
+        """
+        self.generation += 1
+        keys: Set[Hashable] = set()
+        for node_id in node_ids:
+            index = self._index.get(node_id)
+            if index is not None:
+                keys.update(self._containing.get(index, ()))
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self.generation += 1
+        self._ids.clear()
+        self._payloads.clear()
+        self._payload_bytes = array("I")
+        self._refs = array("I")
+        self._index.clear()
+        self._free.clear()
+        self._entries.clear()
+        self._containing.clear()
+        self.size_bytes = 0
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _intern(self, node_id: UUID, node: Optional[GraphNode] = None) -> int:
+        index = self._index.get(node_id)
+        if index is None:
+            if self._free:
+                index = self._free.pop()
+                self._ids[index] = node_id
+            else:
+                index = len(self._ids)
+                self._ids.append(node_id)
+                self._payloads.append(None)
+                self._payload_bytes.append(0)
+                self._refs.append(0)
+            self._index[node_id] = index
+        if node is not None and self._payloads[index] is None:
+            self._payloads[index] = (list(node.labels), dict(node.properties))
+            size = _NODE_BYTES + sum(
+                len(str(k)) + len(str(v)) for k, v in node.properties.items()
+            )
+            self._payload_bytes[index] = size
+            self.size_bytes += size
+        return index
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= entry.size
+        for index in entry.touched:
+            self._containing[index].discard(key)
+            self._refs[index] -= 1
+            if not self._refs[index]:
+                self._release(index)
+
+    def _node_id(self, index: int) -> UUID:
+        node_id = self._ids[index]
+        assert node_id is not None, "index refers to a released node"
+        return node_id
+
+    def _release(self, index: int) -> None:
+        del self._index[self._node_id(index)]
+        del self._containing[index]
+        self.size_bytes -= self._payload_bytes[index]
+        self._ids[index] = None
+        self._payloads[index] = None
+        self._payload_bytes[index] = 0
+        self._free.append(index)
+
+    def _materialize(self, entry: _Entry) -> List[GraphNode]:
+        nodes = []
+        for i, index in enumerate(entry.nodes):
+            payload = self._payloads[index]
+            assert payload is not None, "cached node has no payload"
+            labels, properties = payload
+            depth = None
+            if entry.depths is not None and entry.depths[i] != _NO_DEPTH:
+                depth = entry.depths[i]
+            path = None
+            if entry.path_offsets is not None and entry.path_nodes is not None:
+                start, end = entry.path_offsets[i], entry.path_offsets[i + 1]
+                if end > start:
+                    path = [self._node_id(j) for j in entry.path_nodes[start:end]]
+            nodes.append(
+                GraphNode(
+                    id=self._node_id(index),
+                    labels=list(labels),
+                    properties=dict(properties),
+                    depth=depth,
+                    path=path,
+                )
+            )
+        return nodes
+
+
+class GraphVersion(ABC):
+    """Counter of graph writes shared by every process using the graph."""
+
+    @abstractmethod
+    async def current(self) -> int:
+        """Get the current version."""
+
+    @abstractmethod
+    async def bump(self) -> int:
+        """Record a write and get the new version."""
+
+
+class PostgresGraphVersion(GraphVersion):
+    """
+    Graph version kept in a PostgreSQL sequence.
+
+    The sequence is created on first use.
+    """
+
+    def __init__(
+        self,
+        connection_pool: asyncpg.Pool,
+        schema: str = "intelligence",
+        sequence: str = "graph_cache_version",
+    ) -> None:
+        """
+        Initialize version counter.
+
+        Args:
+            connection_pool: asyncpg connection pool
+            schema: Database schema name
+            sequence: Name of the sequence
+        """
+        self._pool = connection_pool
+        self._sequence = f"{schema}.{sequence}"
+        self._created = False
+
+    async def current(self) -> int:
+        """Get the current version."""
+        async with self._pool.acquire() as conn:
+            await self._ensure_sequence(conn)
+            record = await conn.fetchrow(
+                f"SELECT last_value, is_called FROM {self._sequence}"
+            )
+        return int(record["last_value"]) if record["is_called"] else 0
+
+    async def bump(self) -> int:
+        """Record a write and get the new version."""
+        async with self._pool.acquire() as conn:
+            await self._ensure_sequence(conn)
+            version = await conn.fetchval(
+                "SELECT nextval($1::regclass)", self._sequence
+            )
+        return int(version)
+
+    async def _ensure_sequence(self, conn: asyncpg.Connection) -> None:
+        if not self._created:
+            await conn.execute(f"CREATE SEQUENCE IF NOT EXISTS {self._sequence}")
+            self._created = True
+
+
+class CachedGraphBackend:
+    """
+    Graph backend wrapper that caches neighborhood reads.
+
+    ``get_neighbors``, ``traverse`` and ``get_subgraph`` are served from an
+    ``AdjacencyCache``. Node and edge writes made through the wrapper
+    invalidate cached results containing the nodes involved;
+    ``execute_query`` may write anything, so it clears the cache. With a
+    ``GraphVersion``, writes are also announced to other processes, and the
+    version is polled at most every ``version_check_interval`` seconds,
+    which bounds how long another process's write can go unnoticed.
+    Writes that bypass every wrapper are not detected.
+
+    Example:
+        >>> backend = CachedGraphBackend(
+        ...     PostgresCTEBackend(pool),
+        ...     version=PostgresGraphVersion(pool),
+        ... )
+        >>> await backend.connect()
+        >>> await backend.get_neighbors(cve_node_id)  # loads
+        >>> await backend.get_neighbors(cve_node_id)  # served from memory
+    """
+
+    def __init__(
+        self,
+        backend: GraphBackendProtocol,
+        cache: Optional[AdjacencyCache] = None,
+        version: Optional[GraphVersion] = None,
+        version_check_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize cached backend.
+
+        Args:
+            backend: Backend to read from and write to
+            cache: Cache to use; defaults to one with the default budget
+            version: Cross-process write counter; None only sees writes
+                made through this wrapper
+            version_check_interval: Seconds between version polls
+        """
+        self._backend = backend
+        self.cache = cache if cache is not None else AdjacencyCache()
+        self._version = version
+        self._version_check_interval = version_check_interval
+        self._seen_version: Optional[int] = None
+        self._checked_at = 0.0
+
+    @property
+    def backend(self) -> GraphBackendProtocol:
+        """The wrapped backend."""
+        return self._backend
+
+    # --- Connection ---
+
+    async def connect(self) -> None:
+        """Connect the wrapped backend."""
+        await self._backend.connect()
+
+    async def disconnect(self) -> None:
+        """Disconnect the wrapped backend and clear the cache."""
+        self.cache.clear()
+        await self._backend.disconnect()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the wrapped backend is connected."""
+        return self._backend.is_connected
+
+    # --- Cached Reads ---
+
+    async def get_neighbors(
+        self,
+        node_id: UUID,
+        direction: TraversalDirection = TraversalDirection.BOTH,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[GraphNode]:
+        """Get immediate neighbors of a node, from the cache if possible."""
+        await self._check_version()
+        key = ("neighbors", node_id, direction, _key_list(edge_types), limit)
+        cached = self.cache.get_nodes(key)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation
+        nodes = await self._backend.get_neighbors(node_id, direction, edge_types, limit)
+        self.cache.put(key, nodes, anchors=[node_id], generation=generation)
+        return nodes
+
+    async def traverse(
+        self,
+        start_node_id: UUID,
+        params: TraversalParams,
+    ) -> List[GraphNode]:
+        """Traverse the graph, from the cache if possible."""
+        await self._check_version()
+        key = (
+            "traverse",
+            start_node_id,
+            params.max_depth,
+            params.direction,
+            _key_list(params.edge_types),
+            _key_list(params.node_labels),
+            params.limit,
+            params.strategy,
+        )
+        cached = self.cache.get_nodes(key)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation
+        nodes = await self._backend.traverse(start_node_id, params)
+        self.cache.put(key, nodes, anchors=[start_node_id], generation=generation)
+        return nodes
+
+    async def get_subgraph(
+        self,
+        node_ids: List[UUID],
+        include_edges: bool = True,
+    ) -> Dict[str, Any]:
+        """Extract a subgraph, from the cache if possible."""
+        if not node_ids:
+            return await self._backend.get_subgraph(node_ids, include_edges)
+
+        await self._check_version()
+        key = ("subgraph", tuple(node_ids), include_edges)
+        cached = self.cache.get_nodes(key)
+        if cached is not None:
+            result: Dict[str, Any] = {"nodes": cached}
+            if include_edges:
+                result["edges"] = self.cache.get_edges(key)
+            return result
+
+        generation = self.cache.generation
+        result = await self._backend.get_subgraph(node_ids, include_edges)
+        self.cache.put(
+            key,
+            result["nodes"],
+            anchors=node_ids,
+            edges=result.get("edges", []) if include_edges else None,
+            generation=generation,
+        )
+        return result
+
+    # --- Writes ---
+
+    async def create_node(
+        self,
+        labels: List[str],
+        properties: Dict[str, Any],
+        node_id: Optional[UUID] = None,
+    ) -> GraphNode:
+        """Create a node."""
+        node = await self._backend.create_node(labels, properties, node_id)
+        await self._invalidate([node.id])
+        return node
+
+    async def update_node(
+        self,
+        node_id: UUID,
+        properties: Dict[str, Any],
+        merge: bool = True,
+    ) -> GraphNode:
+        """Update node properties."""
+        node = await self._backend.update_node(node_id, properties, merge)
+        await self._invalidate([node_id])
+        return node
+
+    async def delete_node(self, node_id: UUID, soft: bool = True) -> bool:
+        """Delete a node."""
+        deleted = await self._backend.delete_node(node_id, soft)
+        await self._invalidate([node_id])
+        return deleted
+
+    async def batch_create_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+    ) -> List[GraphNode]:
+        """Batch create nodes."""
+        created = await self._backend.batch_create_nodes(nodes)
+        await self._invalidate(node.id for node in created)
+        return created
+
+    async def create_edge(
+        self,
+        source_id: UUID,
+        target_id: UUID,
+        edge_type: str,
+        properties: Optional[Dict[str, Any]] = None,
+        edge_id: Optional[UUID] = None,
+    ) -> GraphEdge:
+        """Create an edge."""
+        edge = await self._backend.create_edge(
+            source_id, target_id, edge_type, properties, edge_id
+        )
+        await self._invalidate([source_id, target_id])
+        return edge
+
+    async def update_edge(
+        self,
+        edge_id: UUID,
+        properties: Dict[str, Any],
+        merge: bool = True,
+    ) -> GraphEdge:
+        """Update edge properties."""
+        edge = await self._backend.update_edge(edge_id, properties, merge)
+        await self._invalidate([edge.source_id, edge.target_id])
+        return edge
+
+    async def delete_edge(self, edge_id: UUID, soft: bool = True) -> bool:
+        """Delete an edge."""
+        # The endpoints are needed to find the cached results to drop
+        edge = await self._backend.get_edge(edge_id)
+        deleted = await self._backend.delete_edge(edge_id, soft)
+        if edge is not None:
+            await self._invalidate([edge.source_id, edge.target_id])
+        return deleted
+
+    async def batch_create_edges(
+        self,
+        edges: List[Dict[str, Any]],
+    ) -> List[GraphEdge]:
+        """Batch create edges."""
+        created = await self._backend.batch_create_edges(edges)
+        await self._invalidate(
+            node_id for edge in created for node_id in (edge.source_id, edge.target_id)
+        )
+        return created
+
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute a native query and clear the cache, as it may write."""
+        result = await self._backend.execute_query(query, parameters)
+        self.cache.clear()
+        await self._announce_write()
+        return result
+
+    # --- Uncached Reads ---
+
+    async def get_node(self, node_id: UUID) -> Optional[GraphNode]:
+        """Get a node by ID."""
+        return await self._backend.get_node(node_id)
+
+    async def get_edge(self, edge_id: UUID) -> Optional[GraphEdge]:
+        """Get an edge by ID."""
+        return await self._backend.get_edge(edge_id)
+
+    async def find_shortest_path(
+        self,
+        start_node_id: UUID,
+        end_node_id: UUID,
+        max_depth: int = 10,
+        edge_types: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Optional[GraphPath]:
+        """Find the shortest path between two nodes."""
+        return await self._backend.find_shortest_path(
+            start_node_id, end_node_id, max_depth, edge_types, **kwargs
+        )
+
+    async def find_all_paths(
+        self,
+        start_node_id: UUID,
+        end_node_id: UUID,
+        max_depth: int = 5,
+        limit: int = 10,
+    ) -> List[GraphPath]:
+        """Find all paths between two nodes."""
+        return await self._backend.find_all_paths(
+            start_node_id, end_node_id, max_depth, limit
+        )
+
+    async def find_nodes(
+        self,
+        labels: Optional[List[str]] = None,
+        properties: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[GraphNode]:
+        """Find nodes by labels and properties."""
+        return await self._backend.find_nodes(labels, properties, limit)
+
+    async def find_edges(
+        self,
+        edge_types: Optional[List[str]] = None,
+        source_id: Optional[UUID] = None,
+        target_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+    ) -> List[GraphEdge]:
+        """Find edges by type and endpoints."""
+        return await self._backend.find_edges(edge_types, source_id, target_id, limit)
+
+    async def count_nodes(self, labels: Optional[List[str]] = None) -> int:
+        """Count nodes."""
+        return await self._backend.count_nodes(labels)
+
+    async def count_edges(self, edge_types: Optional[List[str]] = None) -> int:
+        """Count edges."""
+        return await self._backend.count_edges(edge_types)
+
+    # --- Invalidation ---
+
+    async def _invalidate(self, node_ids: Iterable[UUID]) -> None:
+        dropped = self.cache.invalidate(node_ids)
+        if dropped:
+            logger.debug(f"Graph write invalidated {dropped} cached results")
+        await self._announce_write()
+
+    async def _announce_write(self) -> None:
+        if self._version is None:
+            return
+        version = await self._version.bump()
+        # Only our own write happened since the last check; otherwise leave
+        # the old version so the next check clears the cache
+        if self._seen_version is not None and version == self._seen_version + 1:
+            self._seen_version = version
+
+    async def _check_version(self) -> None:
+        if self._version is None:
+            return
+        now = time.monotonic()
+        if (
+            self._seen_version is not None
+            and now - self._checked_at < self._version_check_interval
+        ):
+            return
+        version = await self._version.current()
+        self._checked_at = now
+        if version != self._seen_version:
+            if self._seen_version is not None:
+                logger.debug(f"Graph version changed to {version}, clearing cache")
+            self.cache.clear()
+            self._seen_version = version
+
+
+def _key_list(values: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """Make a list argument usable in a cache key."""
+    return tuple(values) if values else None
+
+
+def _copy_edges(edges: Iterable[GraphEdge]) -> Tuple[GraphEdge, ...]:
+    """Copy edges so callers and the cache never share property dicts."""
+    return tuple(replace(e, properties=dict(e.properties)) for e in edges)
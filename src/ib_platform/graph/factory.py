@@ -8,8 +8,13 @@ import logging
 from enum import Enum
 from typing import Any, Dict
 
-from .backends.memgraph import MemgraphBackend
-from .backends.postgres_cte import PostgresCTEBackend
+from .backends.memgraph import (
+    CONNECTION_ACQUISITION_TIMEOUT,
+    MAX_CONNECTION_POOL_SIZE,
+    MemgraphBackend,
+)
+from .backends.postgres_cte import COPY_THRESHOLD, PostgresCTEBackend
+from .cache import AdjacencyCache, CachedGraphBackend
 from .protocol import GraphBackendProtocol
 
 logger = logging.getLogger(__name__)
@@ -45,7 +50,10 @@ class GraphBackendFactory:
 
         Args:
             backend_type: Type of backend to create
-            **kwargs: Backend-specific configuration parameters
+            **kwargs: Backend-specific configuration parameters, plus
+                ``cache_budget_bytes`` to wrap the backend in a
+                CachedGraphBackend and ``cache_version`` (a GraphVersion)
+                for cross-process invalidation
 
         Returns:
             Configured GraphBackendProtocol instance
@@ -71,15 +79,28 @@ class GraphBackendFactory:
         """
         logger.info(f"Creating graph backend: {backend_type}")
 
+        cache_budget_bytes = kwargs.pop("cache_budget_bytes", None)
+        cache_version = kwargs.pop("cache_version", None)
+
+        backend: GraphBackendProtocol
         if backend_type == GraphBackendType.POSTGRES_CTE:
-            return GraphBackendFactory._create_postgres_cte(**kwargs)
+            backend = GraphBackendFactory._create_postgres_cte(**kwargs)
 
         elif backend_type == GraphBackendType.MEMGRAPH:
-            return GraphBackendFactory._create_memgraph(**kwargs)
+            backend = GraphBackendFactory._create_memgraph(**kwargs)
 
         else:
             raise ValueError(f"Unknown backend type: {backend_type}")
 
+        if cache_budget_bytes:
+            logger.debug(f"Caching graph reads within {cache_budget_bytes} bytes")
+            return CachedGraphBackend(
+                backend,
+                cache=AdjacencyCache(cache_budget_bytes),
+                version=cache_version,
+            )
+        return backend
+
     @staticmethod
     def _create_postgres_cte(**kwargs: Any) -> PostgresCTEBackend:
         """
@@ -92,6 +113,8 @@ class GraphBackendFactory:
             schema: Database schema name (default: "intelligence")
             entities_table: Entities table name (default: "entities")
             relationships_table: Relationships table name (default: "relationships")
+            copy_threshold: Smallest batch loaded with COPY (default: 5000);
+                None disables COPY
         """
         connection_pool = kwargs.get("connection_pool")
         if not connection_pool:
@@ -102,6 +125,7 @@ class GraphBackendFactory:
             schema=kwargs.get("schema", "intelligence"),
             entities_table=kwargs.get("entities_table", "entities"),
             relationships_table=kwargs.get("relationships_table", "relationships"),
+            copy_threshold=kwargs.get("copy_threshold", COPY_THRESHOLD),
         )
 
         logger.debug(
@@ -121,6 +145,9 @@ class GraphBackendFactory:
             username: Authentication username
             password: Authentication password
             database: Specific database name
+            max_connection_pool_size: Maximum pooled connections (default: 100)
+            connection_acquisition_timeout: Seconds to wait for a pooled
+                connection (default: 60.0)
         """
         uri = kwargs.get("uri")
         if not uri:
@@ -131,6 +158,12 @@ class GraphBackendFactory:
             username=kwargs.get("username"),
             password=kwargs.get("password"),
             database=kwargs.get("database"),
+            max_connection_pool_size=kwargs.get(
+                "max_connection_pool_size", MAX_CONNECTION_POOL_SIZE
+            ),
+            connection_acquisition_timeout=kwargs.get(
+                "connection_acquisition_timeout", CONNECTION_ACQUISITION_TIMEOUT
+            ),
         )
 
         logger.debug(f"Created MemgraphBackend with URI: {uri}")
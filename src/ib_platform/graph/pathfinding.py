@@ -0,0 +1,223 @@
+"""
+Bidirectional shortest-path search.
+
+Backends supply an ``expand`` callback that loads the edges of many nodes
+at once, so a search costs one round-trip per BFS level (or per batch of
+Dijkstra settlements) instead of enumerating every path from the source.
+Searching from both ends means each side only has to reach about half the
+path length, which keeps the explored part of dense graphs small.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+# An edge reached from a node: (edge ID, node at the other end, cost)
+Step = Tuple[UUID, UUID, float]
+
+# Loads the edges of nodes: outgoing edges, or incoming edges when the
+# second argument is True. Nodes without edges may be left out.
+ExpandFn = Callable[[Sequence[UUID], bool], Awaitable[Dict[UUID, List[Step]]]]
+
+# Nodes whose edges are loaded together in one Dijkstra expansion
+DIJKSTRA_BATCH_SIZE = 256
+
+
+@dataclass
+class PathResult:
+    """
+    A path found by a shortest-path search.
+
+    Attributes:
+        node_ids: Nodes from start to end
+        edge_ids: Edges between consecutive nodes
+        total_cost: Sum of the edge costs
+    """
+
+    node_ids: List[UUID]
+    edge_ids: List[UUID]
+    total_cost: float = 0.0
+
+    @property
+    def length(self) -> int:
+        """Number of edges in the path."""
+        return len(self.edge_ids)
+
+
+@dataclass
+class _Side:
+    """State of the search from one end of the path."""
+
+    reverse: bool
+    # node -> (neighbor toward this side's origin, edge ID, edge cost)
+    parents: Dict[UUID, Optional[Step]]
+    # node -> (cost, hops) from this side's origin
+    dist: Dict[UUID, Tuple[float, int]]
+    frontier: List[UUID] = field(default_factory=list)
+    heap: List[Tuple[float, int, int, UUID]] = field(default_factory=list)
+    adjacency: Dict[UUID, List[Step]] = field(default_factory=dict)
+    settled: Set[UUID] = field(default_factory=set)
+
+    @classmethod
+    def start(cls, origin: UUID, reverse: bool) -> "_Side":
+        side = cls(reverse=reverse, parents={origin: None}, dist={origin: (0.0, 0)})
+        side.frontier.append(origin)
+        side.heap.append((0.0, 0, 0, origin))
+        return side
+
+    def chain(self, node: UUID) -> Tuple[List[UUID], List[UUID], float]:
+        """Walk parents from a node back to this side's origin."""
+        nodes = [node]
+        edges: List[UUID] = []
+        cost = 0.0
+        step = self.parents[node]
+        while step is not None:
+            neighbor, edge_id, edge_cost = step
+            nodes.append(neighbor)
+            edges.append(edge_id)
+            cost += edge_cost
+            step = self.parents[neighbor]
+        return nodes, edges, cost
+
+
+def _join(forward: _Side, backward: _Side, meet: UUID) -> PathResult:
+    """Build the start-to-end path through a node both sides reached."""
+    head_nodes, head_edges, head_cost = forward.chain(meet)
+    tail_nodes, tail_edges, tail_cost = backward.chain(meet)
+    return PathResult(
+        node_ids=head_nodes[::-1] + tail_nodes[1:],
+        edge_ids=head_edges[::-1] + tail_edges,
+        total_cost=head_cost + tail_cost,
+    )
+
+
+async def bidirectional_bfs(
+    start: UUID, end: UUID, expand: ExpandFn, max_depth: int
+) -> Optional[PathResult]:
+    """
+    Find a path with the fewest edges.
+
+    Expands one whole level at a time from whichever side has the smaller
+    frontier, and stops at the first level where the two searches meet.
+
+    Args:
+        start: Start node ID
+        end: End node ID
+        expand: Edge loader (see ``ExpandFn``)
+        max_depth: Maximum number of edges in the path
+
+    Returns:
+        PathResult if a path exists within max_depth, None otherwise
+    """
+    if start == end:
+        return PathResult(node_ids=[start], edge_ids=[])
+
+    forward = _Side.start(start, reverse=False)
+    backward = _Side.start(end, reverse=True)
+    depth = 0
+    while forward.frontier and backward.frontier and depth < max_depth:
+        if len(forward.frontier) <= len(backward.frontier):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        adjacency = await expand(side.frontier, side.reverse)
+        next_frontier: List[UUID] = []
+        best: Optional[Tuple[int, UUID]] = None
+        for node in side.frontier:
+            hops = side.dist[node][1] + 1
+            for edge_id, neighbor, cost in adjacency.get(node, ()):
+                if neighbor in side.parents:
+                    continue
+                side.parents[neighbor] = (node, edge_id, cost)
+                side.dist[neighbor] = (side.dist[node][0] + cost, hops)
+                next_frontier.append(neighbor)
+                if neighbor in other.dist:
+                    total = hops + other.dist[neighbor][1]
+                    if best is None or total < best[0]:
+                        best = (total, neighbor)
+        side.frontier = next_frontier
+        depth += 1
+
+        if best is not None:
+            return _join(forward, backward, best[1])
+    return None
+
+
+async def bidirectional_dijkstra(
+    start: UUID, end: UUID, expand: ExpandFn, max_depth: int
+) -> Optional[PathResult]:
+    """
+    Find the path with the lowest total cost.
+
+    Runs Dijkstra from both ends, comparing (cost, edges) so that fewer
+    edges break ties between equal costs. Edge costs must not be negative.
+    When a node's edges are needed, the edges of up to
+    ``DIJKSTRA_BATCH_SIZE`` queued nodes are loaded with it. Nodes more
+    than max_depth edges from either end along their cheapest route are
+    not expanded.
+
+    Args:
+        start: Start node ID
+        end: End node ID
+        expand: Edge loader (see ``ExpandFn``)
+        max_depth: Maximum number of edges in the path
+
+    Returns:
+        PathResult if a path exists within max_depth, None otherwise
+    """
+    if start == end:
+        return PathResult(node_ids=[start], edge_ids=[])
+
+    forward = _Side.start(start, reverse=False)
+    backward = _Side.start(end, reverse=True)
+    best: Optional[Tuple[float, int, UUID]] = None
+    sequence = 0
+
+    while forward.heap and backward.heap:
+        top_f = forward.heap[0]
+        top_b = backward.heap[0]
+        if best is not None and (top_f[0] + top_b[0], top_f[1] + top_b[1]) >= (
+            best[0],
+            best[1],
+        ):
+            break
+
+        side, other = (forward, backward) if top_f <= top_b else (backward, forward)
+        cost, hops, _, node = heapq.heappop(side.heap)
+        if node in side.settled or (cost, hops) > side.dist[node]:
+            continue
+        side.settled.add(node)
+        if hops >= max_depth:
+            continue
+
+        if node not in side.adjacency:
+            batch = [node]
+            for _, _, _, queued in side.heap:
+                if len(batch) >= DIJKSTRA_BATCH_SIZE:
+                    break
+                if queued not in side.adjacency and queued not in side.settled:
+                    batch.append(queued)
+            loaded = await expand(batch, side.reverse)
+            for batch_node in batch:
+                side.adjacency[batch_node] = loaded.get(batch_node, [])
+
+        for edge_id, neighbor, edge_cost in side.adjacency[node]:
+            candidate = (cost + edge_cost, hops + 1)
+            if neighbor in side.dist and candidate >= side.dist[neighbor]:
+                continue
+            side.dist[neighbor] = candidate
+            side.parents[neighbor] = (node, edge_id, edge_cost)
+            sequence += 1
+            heapq.heappush(side.heap, (*candidate, sequence, neighbor))
+
+            if neighbor in other.dist:
+                other_cost, other_hops = other.dist[neighbor]
+                total = (candidate[0] + other_cost, candidate[1] + other_hops)
+                if total[1] <= max_depth and (best is None or total < best[:2]):
+                    best = (*total, neighbor)
+
+    if best is None:
+        return None
+    return _join(forward, backward, best[2])
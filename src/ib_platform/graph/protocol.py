@@ -23,6 +23,18 @@ class TraversalDirection(str, Enum):
     BOTH = "both"
 
 
+class TraversalStrategy(str, Enum):
+    """How a traversal explores the graph.
+
+    PATHS follows every cycle-free path, so a node reachable by k paths is
+    expanded k times. FRONTIER expands level by level with one visited set,
+    so each node is expanded once and returned at its minimum depth.
+    """
+
+    PATHS = "paths"
+    FRONTIER = "frontier"
+
+
 @dataclass
 class GraphNode:
     """
@@ -130,6 +142,7 @@ class TraversalParams:
         edge_types: Optional filter for edge types
         node_labels: Optional filter for node labels
         limit: Optional limit on number of results
+        strategy: How to explore the graph (see TraversalStrategy)
     """
 
     max_depth: int = 3
@@ -137,6 +150,7 @@ class TraversalParams:
     edge_types: Optional[List[str]] = None
     node_labels: Optional[List[str]] = None
     limit: Optional[int] = None
+    strategy: TraversalStrategy = TraversalStrategy.PATHS
 
     def __post_init__(self) -> None:
         """Validate traversal parameters."""
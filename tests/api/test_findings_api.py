@@ -98,3 +98,24 @@ async def test_findings_service_integration(db_session, test_user, test_aws_acco
     summary = await service.get_summary(scan_job.aws_account_id)
     assert summary["total"] == 1
     assert summary["by_severity"]["critical"] == 1
+
+
+@pytest.mark.asyncio
+async def test_compliance_summary_hides_other_users_accounts(
+    async_client, authorized_account, test_aws_account
+):
+    """Compliance summaries of accounts owned by another user are not found."""
+    account = authorized_account["account"]
+    headers = authorized_account["headers"]
+
+    own = await async_client.get(
+        f"/api/v1/findings/accounts/{account.account_id}/compliance",
+        headers=headers,
+    )
+    other = await async_client.get(
+        f"/api/v1/findings/accounts/{test_aws_account.account_id}/compliance",
+        headers=headers,
+    )
+
+    assert own.status_code == 200
+    assert other.status_code == 404
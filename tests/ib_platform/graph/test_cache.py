@@ -0,0 +1,286 @@
+"""
+Tests for the read-through adjacency cache.
+
+Uses a small in-memory backend that counts the reads reaching it.
+"""
+
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.ib_platform.graph.cache import (
+    AdjacencyCache,
+    CachedGraphBackend,
+    GraphVersion,
+)
+from src.ib_platform.graph.protocol import (
+    GraphEdge,
+    GraphNode,
+    TraversalDirection,
+    TraversalParams,
+)
+
+
+class MemoryBackend:
+    """Directed graph in memory, counting reads."""
+
+    def __init__(self) -> None:
+        self.nodes: Dict[UUID, GraphNode] = {}
+        self.edges: Dict[UUID, GraphEdge] = {}
+        self.reads = 0
+
+    async def create_node(
+        self,
+        labels: List[str],
+        properties: Dict[str, Any],
+        node_id: Optional[UUID] = None,
+    ) -> GraphNode:
+        node = GraphNode(id=node_id or uuid4(), labels=labels, properties=properties)
+        self.nodes[node.id] = node
+        return node
+
+    async def update_node(
+        self, node_id: UUID, properties: Dict[str, Any], merge: bool = True
+    ) -> GraphNode:
+        self.nodes[node_id].properties.update(properties)
+        return self.nodes[node_id]
+
+    async def create_edge(
+        self,
+        source_id: UUID,
+        target_id: UUID,
+        edge_type: str,
+        properties: Optional[Dict[str, Any]] = None,
+        edge_id: Optional[UUID] = None,
+    ) -> GraphEdge:
+        edge = GraphEdge(
+            id=edge_id or uuid4(),
+            source_id=source_id,
+            target_id=target_id,
+            edge_type=edge_type,
+            properties=properties or {},
+        )
+        self.edges[edge.id] = edge
+        return edge
+
+    async def get_edge(self, edge_id: UUID) -> Optional[GraphEdge]:
+        return self.edges.get(edge_id)
+
+    async def delete_edge(self, edge_id: UUID, soft: bool = True) -> bool:
+        return self.edges.pop(edge_id, None) is not None
+
+    async def get_neighbors(
+        self,
+        node_id: UUID,
+        direction: TraversalDirection = TraversalDirection.BOTH,
+        edge_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[GraphNode]:
+        self.reads += 1
+        return [
+            GraphNode(
+                id=e.target_id,
+                labels=list(self.nodes[e.target_id].labels),
+                properties=dict(self.nodes[e.target_id].properties),
+            )
+            for e in self.edges.values()
+            if e.source_id == node_id
+        ]
+
+    async def traverse(
+        self, start_node_id: UUID, params: TraversalParams
+    ) -> List[GraphNode]:
+        self.reads += 1
+        result = []
+        frontier = [(start_node_id, [start_node_id])]
+        for depth in range(params.max_depth + 1):
+            next_frontier = []
+            for node_id, path in frontier:
+                node = self.nodes[node_id]
+                result.append(
+                    GraphNode(
+                        id=node_id,
+                        labels=list(node.labels),
+                        properties=dict(node.properties),
+                        depth=depth,
+                        path=path,
+                    )
+                )
+                next_frontier.extend(
+                    (e.target_id, path + [e.target_id])
+                    for e in self.edges.values()
+                    if e.source_id == node_id
+                )
+            frontier = next_frontier
+        return result
+
+    async def get_subgraph(
+        self, node_ids: List[UUID], include_edges: bool = True
+    ) -> Dict[str, Any]:
+        self.reads += 1
+        result: Dict[str, Any] = {"nodes": [self.nodes[n] for n in node_ids]}
+        if include_edges:
+            result["edges"] = [
+                e
+                for e in self.edges.values()
+                if e.source_id in node_ids and e.target_id in node_ids
+            ]
+        return result
+
+
+class CounterVersion(GraphVersion):
+    """Version counter shared in memory, standing in for another process."""
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    async def current(self) -> int:
+        return self.value
+
+    async def bump(self) -> int:
+        self.value += 1
+        return self.value
+
+
+async def cve_graph(backend: CachedGraphBackend) -> List[GraphNode]:
+    """CVE -> control -> asset, plus CVE -> remediation."""
+    nodes = [
+        await backend.create_node(["vulnerability"], {"name": "CVE-2024-0001"}),
+        await backend.create_node(["control"], {"name": "patching"}),
+        await backend.create_node(["asset"], {"name": "web-1"}),
+        await backend.create_node(["remediation"], {"name": "upgrade"}),
+    ]
+    await backend.create_edge(nodes[0].id, nodes[1].id, "MITIGATED_BY")
+    await backend.create_edge(nodes[1].id, nodes[2].id, "PROTECTS")
+    await backend.create_edge(nodes[0].id, nodes[3].id, "FIXED_BY")
+    return nodes
+
+
+class TestCachedGraphBackend:
+    """Tests for CachedGraphBackend."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_cached(self):
+        """Neighbors, traversals and subgraphs are loaded once."""
+        inner = MemoryBackend()
+        backend = CachedGraphBackend(inner)
+        cve, control, asset, _ = await cve_graph(backend)
+        params = TraversalParams(max_depth=2, direction=TraversalDirection.OUTGOING)
+
+        first = await backend.traverse(cve.id, params)
+        neighbors = await backend.get_neighbors(cve.id)
+        subgraph = await backend.get_subgraph([cve.id, control.id])
+        assert inner.reads == 3
+
+        again = await backend.traverse(cve.id, params)
+        assert await backend.get_neighbors(cve.id) == neighbors
+        cached_subgraph = await backend.get_subgraph([cve.id, control.id])
+        assert inner.reads == 3
+
+        assert again == first
+        assert again[-1].path == [cve.id, control.id, asset.id]
+        assert [e.id for e in cached_subgraph["edges"]] == [
+            e.id for e in subgraph["edges"]
+        ]
+        # Results are copies
+        again[0].properties["name"] = "changed"
+        assert (await backend.traverse(cve.id, params))[0].properties["name"] == (
+            "CVE-2024-0001"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_edges_are_copies(self):
+        """Changing returned edges does not change the cached subgraph."""
+        inner = MemoryBackend()
+        backend = CachedGraphBackend(inner)
+        cve, control, *_ = await cve_graph(backend)
+
+        loaded = await backend.get_subgraph([cve.id, control.id])
+        loaded["edges"][0].properties["weight"] = 5
+        cached = await backend.get_subgraph([cve.id, control.id])
+        cached["edges"][0].properties["weight"] = 7
+
+        assert inner.reads == 1
+        again = await backend.get_subgraph([cve.id, control.id])
+        assert "weight" not in again["edges"][0].properties
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_touched_results(self):
+        """Edge and node writes drop only results containing their nodes."""
+        inner = MemoryBackend()
+        backend = CachedGraphBackend(inner)
+        cve, control, asset, remediation = await cve_graph(backend)
+        other = await backend.create_node(["asset"], {"name": "db-1"})
+
+        await backend.get_neighbors(asset.id)
+        await backend.get_neighbors(remediation.id)
+        edge = await backend.create_edge(control.id, other.id, "PROTECTS")
+        # Neither result contains the control or db-1 nodes
+        assert len(backend.cache) == 2
+
+        assert len(await backend.get_neighbors(control.id)) == 2
+        await backend.delete_edge(edge.id)
+        assert len(backend.cache) == 2
+        assert [n.id for n in await backend.get_neighbors(control.id)] == [asset.id]
+
+        await backend.get_neighbors(cve.id)
+        await backend.update_node(remediation.id, {"name": "upgrade to 2.0"})
+        assert len(backend.cache) == 2
+        names = {n.properties["name"] for n in await backend.get_neighbors(cve.id)}
+        assert names == {"patching", "upgrade to 2.0"}
+
+    @pytest.mark.asyncio
+    async def test_other_process_writes_clear_cache(self):
+        """A version bump from elsewhere clears the cache on the next check."""
+        version = CounterVersion()
+        inner = MemoryBackend()
+        backend = CachedGraphBackend(inner, version=version, version_check_interval=0)
+        cve, *_ = await cve_graph(backend)
+
+        await backend.get_neighbors(cve.id)
+        await backend.get_neighbors(cve.id)
+        assert inner.reads == 1
+
+        # Our own write does not clear unrelated results
+        await backend.create_node(["asset"], {"name": "web-2"})
+        await backend.get_neighbors(cve.id)
+        assert inner.reads == 1
+
+        await version.bump()
+        await backend.get_neighbors(cve.id)
+        assert inner.reads == 2
+
+
+class TestAdjacencyCache:
+    """Tests for AdjacencyCache."""
+
+    def test_lru_eviction_within_budget(self):
+        """Least recently used results are evicted to fit the budget."""
+        cache = AdjacencyCache(budget_bytes=2000)
+        nodes = [
+            GraphNode(id=uuid4(), labels=["asset"], properties={"name": f"n{i}"})
+            for i in range(6)
+        ]
+        cache.put("a", nodes[0:2])
+        cache.put("b", nodes[2:4])
+        assert cache.get_nodes("a") is not None
+        cache.put("c", nodes[4:6])
+
+        assert cache.size_bytes <= cache.budget_bytes
+        assert cache.get_nodes("b") is None
+        assert [n.id for n in cache.get_nodes("a")] == [n.id for n in nodes[0:2]]
+
+    def test_nodes_are_shared_and_released(self):
+        """Nodes in several results are stored once and freed with the last."""
+        cache = AdjacencyCache()
+        shared = GraphNode(id=uuid4(), labels=["control"], properties={"name": "x"})
+        cache.put("a", [shared])
+        cache.put("b", [shared])
+        with_both = cache.size_bytes
+
+        cache.invalidate([uuid4()])
+        assert cache.size_bytes == with_both
+        cache.invalidate([shared.id])
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
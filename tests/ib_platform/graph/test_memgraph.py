@@ -8,6 +8,7 @@ Requirements:
     docker-compose -f docker/docker-compose.test.yml up -d
 """
 
+import asyncio
 import time
 
 import pytest
@@ -60,6 +61,29 @@ class TestMemgraphBackendUnit:
         with pytest.raises(RuntimeError, match="not connected"):
             backend._ensure_connected()
 
+    def test_initialization_pool_settings(self):
+        """Test backend initialization with connection pool settings."""
+        backend = MemgraphBackend(
+            uri="bolt://localhost:7687",
+            max_connection_pool_size=8,
+            connection_acquisition_timeout=5.0,
+        )
+
+        assert backend._max_connection_pool_size == 8
+        assert backend._connection_acquisition_timeout == 5.0
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_fails_fast(self):
+        """Test that an unreachable server fails without retrying."""
+        backend = MemgraphBackend(uri="bolt://127.0.0.1:1")
+
+        start_time = time.time()
+        with pytest.raises(ConnectionError):
+            await backend.connect()
+
+        assert time.time() - start_time < 5.0
+        assert not backend.is_connected
+
 
 # ============================================================================
 # Integration Tests - Node Operations
@@ -679,6 +703,56 @@ class TestMemgraphBatchOperations:
         assert count == 10
 
 
+# ============================================================================
+# Integration Tests - Concurrency
+# ============================================================================
+
+
+@pytest.mark.integration
+@pytest.mark.memgraph
+@pytest.mark.asyncio
+class TestMemgraphConcurrency:
+    """Test concurrent and cancelled calls against real Memgraph database."""
+
+    async def test_concurrent_reads(self, populated_memgraph_backend):
+        """Test that concurrent reads return the same results as serial ones."""
+        backend = populated_memgraph_backend
+        node_ids = [node.id for node in backend._test_nodes]
+
+        serial = [await backend.get_neighbors(node_id) for node_id in node_ids]
+        concurrent = await asyncio.gather(
+            *(backend.get_neighbors(node_id) for node_id in node_ids)
+        )
+
+        assert [[n.id for n in nodes] for nodes in concurrent] == [
+            [n.id for n in nodes] for nodes in serial
+        ]
+
+    async def test_cancelled_query_leaves_backend_usable(self, memgraph_backend):
+        """Test that cancelling a running query does not break the backend."""
+        slow_query = "UNWIND range(1, 100000000) AS x RETURN sum(x) AS total"
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(memgraph_backend.execute_query(slow_query), 0.05)
+
+        results = await memgraph_backend.execute_query("RETURN 1 as value")
+        assert results == [{"value": 1}]
+
+    async def test_batch_create_nodes_mixed_labels(self, memgraph_backend):
+        """Test that a batch with several label groups creates every node."""
+        nodes = await memgraph_backend.batch_create_nodes(
+            [
+                {"labels": ["BatchA"], "properties": {"name": "a-1"}},
+                {"labels": ["BatchB"], "properties": {"name": "b-1"}},
+                {"labels": ["BatchA"], "properties": {"name": "a-2"}},
+            ]
+        )
+
+        assert sorted(n.properties["name"] for n in nodes) == ["a-1", "a-2", "b-1"]
+        assert await memgraph_backend.count_nodes(labels=["BatchA"]) == 2
+        assert await memgraph_backend.count_nodes(labels=["BatchB"]) == 1
+
+
 # ============================================================================
 # Integration Tests - Performance
 # ============================================================================
@@ -0,0 +1,150 @@
+"""
+Tests for bidirectional shortest-path search.
+
+Runs the search against in-memory adjacency, counting how many batched
+edge loads each search makes.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.ib_platform.graph.pathfinding import (
+    Step,
+    bidirectional_bfs,
+    bidirectional_dijkstra,
+)
+
+
+class InMemoryGraph:
+    """Directed graph serving batched edge loads."""
+
+    def __init__(self, size: int) -> None:
+        self.nodes = [uuid4() for _ in range(size)]
+        self.edges: List[Tuple[UUID, int, int, float]] = []
+        self.calls = 0
+
+    def add(self, source: int, target: int, cost: float = 0.0) -> UUID:
+        edge_id = uuid4()
+        self.edges.append((edge_id, source, target, cost))
+        return edge_id
+
+    async def expand(
+        self, node_ids: Sequence[UUID], reverse: bool
+    ) -> Dict[UUID, List[Step]]:
+        self.calls += 1
+        wanted = set(node_ids)
+        adjacency: Dict[UUID, List[Step]] = {}
+        for edge_id, source, target, cost in self.edges:
+            near, far = self.nodes[source], self.nodes[target]
+            if reverse:
+                near, far = far, near
+            if near in wanted:
+                adjacency.setdefault(near, []).append((edge_id, far, cost))
+        return adjacency
+
+
+def chain_with_shortcut() -> InMemoryGraph:
+    """0 -> 1 -> ... -> 9, plus a 0 -> 5 shortcut."""
+    graph = InMemoryGraph(10)
+    for i in range(9):
+        graph.add(i, i + 1)
+    graph.add(0, 5)
+    return graph
+
+
+class TestBidirectionalBFS:
+    """Tests for fewest-edges search."""
+
+    @pytest.mark.asyncio
+    async def test_uses_shortcut(self):
+        """The shortcut gives the fewest edges."""
+        graph = chain_with_shortcut()
+        result = await bidirectional_bfs(
+            graph.nodes[0], graph.nodes[9], graph.expand, max_depth=10
+        )
+
+        assert result.length == 5
+        assert result.node_ids == [graph.nodes[i] for i in (0, 5, 6, 7, 8, 9)]
+        # One load per level, split between the two sides
+        assert graph.calls == 5
+
+    @pytest.mark.asyncio
+    async def test_follows_edge_direction(self):
+        """Edges are only followed from source to target."""
+        graph = chain_with_shortcut()
+        assert (
+            await bidirectional_bfs(
+                graph.nodes[9], graph.nodes[0], graph.expand, max_depth=10
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_respects_max_depth(self):
+        """Paths longer than max_depth are not found."""
+        graph = chain_with_shortcut()
+        assert (
+            await bidirectional_bfs(
+                graph.nodes[0], graph.nodes[9], graph.expand, max_depth=4
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_same_node(self):
+        """A node reaches itself with an empty path."""
+        graph = chain_with_shortcut()
+        result = await bidirectional_bfs(
+            graph.nodes[3], graph.nodes[3], graph.expand, max_depth=1
+        )
+        assert result.node_ids == [graph.nodes[3]]
+        assert graph.calls == 0
+
+
+class TestBidirectionalDijkstra:
+    """Tests for lowest-cost search."""
+
+    @pytest.mark.asyncio
+    async def test_prefers_cheaper_longer_path(self):
+        """A costly shortcut loses to a cheap chain."""
+        graph = InMemoryGraph(4)
+        shortcut = graph.add(0, 3, cost=0.9)
+        graph.add(0, 1, cost=0.1)
+        graph.add(1, 2, cost=0.1)
+        graph.add(2, 3, cost=0.1)
+
+        result = await bidirectional_dijkstra(
+            graph.nodes[0], graph.nodes[3], graph.expand, max_depth=5
+        )
+        assert result.length == 3
+        assert result.total_cost == pytest.approx(0.3)
+        assert shortcut not in result.edge_ids
+
+        # The chain does not fit in two edges
+        limited = await bidirectional_dijkstra(
+            graph.nodes[0], graph.nodes[3], graph.expand, max_depth=2
+        )
+        assert limited.edge_ids == [shortcut]
+
+    @pytest.mark.asyncio
+    async def test_fewer_edges_break_ties(self):
+        """With equal costs, the path with fewer edges wins."""
+        graph = chain_with_shortcut()
+        result = await bidirectional_dijkstra(
+            graph.nodes[0], graph.nodes[9], graph.expand, max_depth=10
+        )
+        assert result.length == 5
+        assert result.total_cost == 0.0
+
+    @pytest.mark.asyncio
+    async def test_no_path(self):
+        """Disconnected nodes have no path."""
+        graph = InMemoryGraph(2)
+        assert (
+            await bidirectional_dijkstra(
+                graph.nodes[0], graph.nodes[1], graph.expand, max_depth=5
+            )
+            is None
+        )
@@ -23,6 +23,7 @@ from src.ib_platform.graph.protocol import (
     GraphNode,
     TraversalDirection,
     TraversalParams,
+    TraversalStrategy,
 )
 
 # ============================================================================
@@ -341,6 +342,43 @@ class TestPostgresBatchOperations:
         assert len(edges) == 9
         assert all(e.edge_type == "NEXT" for e in edges)
 
+    @pytest.mark.asyncio
+    async def test_batch_create_with_copy(self, asyncpg_pool, postgres_backend):
+        """Batches above the COPY threshold return the same rows as INSERT."""
+        copy_backend = PostgresCTEBackend(
+            connection_pool=asyncpg_pool, schema="intelligence", copy_threshold=1
+        )
+        await copy_backend.connect()
+
+        nodes = await copy_backend.batch_create_nodes(
+            [
+                {
+                    "labels": ["Node", "Copied"],
+                    "properties": {"name": f"N{i}", "index": i},
+                }
+                for i in range(10)
+            ]
+        )
+        assert len(nodes) == 10
+        stored = await postgres_backend.get_node(nodes[3].id)
+        assert stored.labels == ["Node", "Copied"]
+        assert stored.properties["index"] == nodes[3].properties["index"]
+
+        edges = await copy_backend.batch_create_edges(
+            [
+                {
+                    "source_id": nodes[i].id,
+                    "target_id": nodes[i + 1].id,
+                    "edge_type": "NEXT",
+                    "properties": {"weight": 0.5, "order": i},
+                }
+                for i in range(9)
+            ]
+        )
+        assert len(edges) == 9
+        assert all(e.weight == 0.5 for e in edges)
+        assert await postgres_backend.count_edges(edge_types=["NEXT"]) == 9
+
 
 # ============================================================================
 # Traversal Tests
@@ -475,6 +513,40 @@ class TestPostgresTraversal:
         result_ids = {n.id for n in result}
         assert len(result_ids) <= 3
 
+    @pytest.mark.asyncio
+    async def test_traverse_frontier(
+        self, populated_postgres_backend: PostgresCTEBackend
+    ):
+        """Frontier traversal returns each node once at its minimum depth."""
+        nodes = populated_postgres_backend._test_nodes
+        params = TraversalParams(
+            max_depth=9,
+            direction=TraversalDirection.OUTGOING,
+            strategy=TraversalStrategy.FRONTIER,
+        )
+
+        result = await populated_postgres_backend.traverse(nodes[0].id, params)
+
+        assert len(result) == len({n.id for n in result}) == 10
+        depths = {n.id: n.depth for n in result}
+        # 0 -> 5 and 0 -> 1 -> 2 -> 3 -> 8 shortcuts
+        assert depths[nodes[5].id] == 1
+        assert depths[nodes[8].id] == 4
+        by_id = {n.id: n for n in result}
+        assert by_id[nodes[6].id].path == [nodes[0].id, nodes[5].id, nodes[6].id]
+        assert [n.depth for n in result] == sorted(n.depth for n in result)
+
+        limited = await populated_postgres_backend.traverse(
+            nodes[0].id,
+            TraversalParams(
+                max_depth=9,
+                direction=TraversalDirection.OUTGOING,
+                strategy=TraversalStrategy.FRONTIER,
+                limit=3,
+            ),
+        )
+        assert [n.depth for n in limited] == [0, 1, 1]
+
 
 # ============================================================================
 # Path Finding Tests
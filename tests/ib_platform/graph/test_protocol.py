@@ -14,6 +14,7 @@ from src.ib_platform.graph.protocol import (
     GraphPath,
     TraversalDirection,
     TraversalParams,
+    TraversalStrategy,
 )
 
 
@@ -255,6 +256,7 @@ class TestTraversalParams:
         assert params.edge_types is None
         assert params.node_labels is None
         assert params.limit is None
+        assert params.strategy == TraversalStrategy.PATHS
 
     def test_create_custom_params(self):
         """Test creating custom traversal params."""
@@ -52,15 +52,7 @@ class TestGraphPerformance:
         ]
 
         start = time.perf_counter()
-
-        created_nodes = []
-        for spec in nodes_spec:
-            node = await postgres_backend.create_node(
-                labels=spec["labels"],
-                properties=spec["properties"],
-            )
-            created_nodes.append(node)
-
+        created_nodes = await postgres_backend.batch_create_nodes(nodes_spec)
         elapsed = time.perf_counter() - start
 
         assert len(created_nodes) == 1000
@@ -113,32 +105,27 @@ class TestGraphPerformance:
     ):
         """Batch create 1000 edges < 2s on PostgreSQL."""
         # First create nodes
-        nodes = []
-        for i in range(100):
-            node = await postgres_backend.create_node(
-                labels=["EdgePerfNode"],
-                properties={"name": f"edge-perf-{i}"},
-            )
-            nodes.append(node)
+        nodes = await postgres_backend.batch_create_nodes(
+            [
+                {"labels": ["EdgePerfNode"], "properties": {"name": f"edge-perf-{i}"}}
+                for i in range(100)
+            ]
+        )
 
         # Create 1000 edges (10 edges per node pair)
-        start = time.perf_counter()
-
-        edge_count = 0
-        for i in range(99):
-            for j in range(10):
-                await postgres_backend.create_edge(
-                    source_id=nodes[i].id,
-                    target_id=nodes[i + 1].id,
-                    edge_type="PERF_EDGE",
-                    properties={"iteration": j},
-                )
-                edge_count += 1
-                if edge_count >= 1000:
-                    break
-            if edge_count >= 1000:
-                break
+        edges_spec = [
+            {
+                "source_id": nodes[i].id,
+                "target_id": nodes[i + 1].id,
+                "edge_type": "PERF_EDGE",
+                "properties": {"iteration": j},
+            }
+            for i in range(99)
+            for j in range(10)
+        ][:1000]
 
+        start = time.perf_counter()
+        edge_count = len(await postgres_backend.batch_create_edges(edges_spec))
         elapsed = time.perf_counter() - start
 
         # May create slightly fewer due to duplicate prevention
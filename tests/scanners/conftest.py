@@ -57,6 +57,14 @@ def boto_session(aws_credentials: dict[str, str]) -> boto3.Session:
         return boto3.Session(**aws_credentials)
 
 
+@pytest.fixture
+def session() -> boto3.Session:
+    """Create an offline boto3 session."""
+    return boto3.Session(
+        aws_access_key_id="test", aws_secret_access_key="test", region_name="us-east-1"
+    )
+
+
 @pytest.fixture(scope="session")
 def aws_config() -> Config:
     """Get boto3 config for testing."""
@@ -0,0 +1,230 @@
+"""Unit tests for checkpointed, resumable multi-account scans."""
+
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cloud_optimizer.scanners.base import BaseScanner, ScanResult
+from cloud_optimizer.scanners.checkpoint import GLOBAL_REGION, InMemoryCheckpointStore
+from cloud_optimizer.scanners.multi_account import (
+    AccountRegistry,
+    AuthMethod,
+    AWSAccount,
+    MultiAccountScanner,
+)
+
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1"]
+
+
+class RegionScanner(BaseScanner):
+    """Scanner producing one finding per region, failing in ``failing``."""
+
+    SERVICE = "Test"
+    calls: List[str] = []
+    failing: List[str] = []
+
+    def _register_rules(self) -> None:
+        pass
+
+    async def scan(self) -> List[ScanResult]:
+        results = []
+        for region in self.regions:
+            RegionScanner.calls.append(region)
+            if region in RegionScanner.failing:
+                raise RuntimeError(f"connection lost in {region}")
+            results.append(
+                ScanResult(
+                    rule_id="TEST_001",
+                    passed=False,
+                    resource_id=f"thing-{region}",
+                    region=region,
+                    evidence={"severity": "high"},
+                )
+            )
+        return results
+
+
+class GlobalScanner(RegionScanner):
+    """Global scanner producing one finding per scan."""
+
+    REGIONAL = False
+
+    async def scan(self) -> List[ScanResult]:
+        RegionScanner.calls.append(GLOBAL_REGION)
+        return [ScanResult(rule_id="TEST_002", passed=False, resource_id="global")]
+
+
+@pytest.fixture(autouse=True)
+def reset_scanner() -> None:
+    """Reset recorded calls and failures."""
+    RegionScanner.calls = []
+    RegionScanner.failing = []
+
+
+@pytest.fixture
+def registry() -> AccountRegistry:
+    """Create a registry with one account in three regions."""
+    registry = AccountRegistry()
+    registry.add_account(
+        AWSAccount(
+            account_id="123456789012",
+            name="Prod",
+            auth_method=AuthMethod.IAM_ROLE,
+            regions=list(REGIONS),
+        )
+    )
+    return registry
+
+
+def make_scanner(registry: AccountRegistry, **kwargs: Any) -> MultiAccountScanner:
+    """Create a checkpointing multi-account scanner."""
+    return MultiAccountScanner(
+        registry=registry,
+        scanner_classes=[RegionScanner, GlobalScanner],
+        checkpoint_store=kwargs.pop("checkpoint_store", InMemoryCheckpointStore()),
+        **kwargs,
+    )
+
+
+def patch_session(scanner: MultiAccountScanner) -> Any:
+    """Patch session creation; the patch records how often it is used."""
+    return patch.object(scanner, "_get_session_for_account", return_value=MagicMock())
+
+
+class TestResumableScans:
+    """Tests for MultiAccountScanner checkpoints and resume."""
+
+    @pytest.mark.asyncio
+    async def test_units_run_per_region_and_global_scanners_once(
+        self, registry: AccountRegistry
+    ) -> None:
+        """Regional scanners run once per region, global scanners once."""
+        scanner = make_scanner(registry)
+
+        with patch_session(scanner):
+            results = await scanner.scan_all()
+        scanner.shutdown()
+
+        assert sorted(RegionScanner.calls) == sorted(REGIONS + [GLOBAL_REGION])
+        assert results[0].finding_count == 4
+        assert results[0].scanners_run == ["RegionScanner", "GlobalScanner"]
+        assert scanner.last_scan_id is not None
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_units(
+        self, registry: AccountRegistry
+    ) -> None:
+        """Only the failed unit is rescanned; stored findings are merged."""
+        store = InMemoryCheckpointStore()
+        scanner = make_scanner(registry, checkpoint_store=store)
+        RegionScanner.failing = ["us-west-2"]
+
+        with patch_session(scanner):
+            first = await scanner.scan_all()
+        scan_id = scanner.last_scan_id
+        assert first[0].finding_count == 3
+        assert first[0].scanners_run == ["GlobalScanner"]
+
+        RegionScanner.calls = []
+        RegionScanner.failing = []
+        resumed_scanner = make_scanner(registry, checkpoint_store=store)
+        with patch_session(resumed_scanner):
+            resumed = await resumed_scanner.resume(scan_id)
+        scanner.shutdown()
+        resumed_scanner.shutdown()
+
+        assert RegionScanner.calls == ["us-west-2"]
+        assert sorted(f.resource_id for f in resumed[0].findings) == [
+            "global",
+            "thing-eu-west-1",
+            "thing-us-east-1",
+            "thing-us-west-2",
+        ]
+        assert {f.get_evidence("account_name") for f in resumed[0].findings} == {
+            "Prod"
+        }
+        assert resumed[0].scanners_run == ["RegionScanner", "GlobalScanner"]
+
+    @pytest.mark.asyncio
+    async def test_resume_merges_streamed_counts(
+        self, registry: AccountRegistry
+    ) -> None:
+        """With a sink, resumed units contribute counts, not re-sent findings."""
+        received: List[ScanResult] = []
+
+        async def sink(account: AWSAccount, findings: List[ScanResult]) -> None:
+            received.extend(findings)
+
+        store = InMemoryCheckpointStore()
+        scanner = make_scanner(registry, checkpoint_store=store, result_sink=sink)
+        RegionScanner.failing = ["eu-west-1"]
+        with patch_session(scanner):
+            await scanner.scan_all()
+
+        RegionScanner.failing = []
+        received.clear()
+        with patch_session(scanner):
+            resumed = await scanner.resume(scanner.last_scan_id)
+        scanner.shutdown()
+
+        assert [f.resource_id for f in received] == ["thing-eu-west-1"]
+        assert resumed[0].finding_count == 4
+        assert resumed[0].findings_by_severity()["high"] == 3
+
+    @pytest.mark.asyncio
+    async def test_completed_account_skips_session(
+        self, registry: AccountRegistry
+    ) -> None:
+        """Accounts whose units are all checkpointed need no credentials."""
+        registry.add_account(
+            AWSAccount(
+                account_id="210987654321",
+                name="Dev",
+                auth_method=AuthMethod.IAM_ROLE,
+                regions=["ap-south-1"],
+            )
+        )
+        scanner = make_scanner(registry)
+        RegionScanner.failing = ["ap-south-1"]
+        with patch_session(scanner):
+            await scanner.scan_all()
+
+        RegionScanner.failing = []
+        with patch_session(scanner) as get_session:
+            resumed = await scanner.resume(scanner.last_scan_id)
+        scanner.shutdown()
+
+        assert [call.args[0].account_id for call in get_session.call_args_list] == [
+            "210987654321"
+        ]
+        counts = {r.account.account_id: r.finding_count for r in resumed}
+        assert counts == {"123456789012": 4, "210987654321": 2}
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_deleted_when_scan_completes(
+        self, registry: AccountRegistry
+    ) -> None:
+        """Checkpoints are kept while units are unfinished, then deleted."""
+        store = InMemoryCheckpointStore()
+        scanner = make_scanner(registry, checkpoint_store=store)
+        RegionScanner.failing = ["us-west-2"]
+        with patch_session(scanner):
+            await scanner.scan_all()
+        scan_id = scanner.last_scan_id
+        assert len(await store.load(scan_id, "123456789012")) == 3
+
+        RegionScanner.failing = []
+        with patch_session(scanner):
+            await scanner.resume(scan_id)
+        scanner.shutdown()
+
+        assert await store.load(scan_id, "123456789012") == []
+
+    @pytest.mark.asyncio
+    async def test_resume_requires_store(self, registry: AccountRegistry) -> None:
+        """Resuming without a checkpoint store is an error."""
+        scanner = MultiAccountScanner(registry=registry, scanner_classes=[])
+        with pytest.raises(ValueError):
+            await scanner.resume("scan-1")
+        scanner.shutdown()
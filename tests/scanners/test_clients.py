@@ -0,0 +1,117 @@
+"""Unit tests for the boto3 client cache."""
+
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.config import Config
+
+from cloud_optimizer.scanners.clients import ClientCache
+from cloud_optimizer.scanners.iam_cache import IAMPolicyCache
+from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
+from cloud_optimizer.scanners.multi_account import (
+    AccountRegistry,
+    AuthMethod,
+    AWSAccount,
+    MultiAccountScanner,
+)
+
+CONFIG = Config(retries={"max_attempts": 3, "mode": "standard"})
+
+
+def make_session() -> boto3.Session:
+    """Create an offline boto3 session."""
+    return boto3.Session(
+        aws_access_key_id="test", aws_secret_access_key="test", region_name="us-east-1"
+    )
+
+
+class TestClientCache:
+    """Tests for ClientCache."""
+
+    def test_clients_are_reused_per_service_region_config(self) -> None:
+        """The same key returns the same client; any difference creates one."""
+        cache = ClientCache()
+        session = make_session()
+
+        s3 = cache.get(session, "s3", "us-east-1", CONFIG)
+        assert cache.get(session, "s3", "us-east-1", CONFIG) is s3
+        assert cache.get(session, "s3", "eu-west-1", CONFIG) is not s3
+        assert cache.get(session, "s3", "us-east-1", Config()) is not s3
+        assert cache.get(make_session(), "s3", "us-east-1", CONFIG) is not s3
+        assert cache.created == 4
+        assert cache.reused == 1
+
+    def test_on_create_runs_once(self) -> None:
+        """Hooks run only when a client is created, even under contention."""
+        cache = ClientCache()
+        session = MagicMock()
+        on_create = MagicMock()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(
+                pool.map(
+                    lambda _: cache.get(session, "iam", None, CONFIG, on_create),
+                    range(32),
+                )
+            )
+
+        assert len({id(client) for client in clients}) == 1
+        session.client.assert_called_once_with(
+            service_name="iam", region_name=None, config=CONFIG
+        )
+        on_create.assert_called_once_with(clients[0])
+
+    def test_sessions_share_a_data_loader(self) -> None:
+        """Service models are loaded once for all sessions."""
+        cache = ClientCache()
+        first, second = make_session(), make_session()
+
+        cache.get(first, "ec2", "us-east-1", CONFIG)
+        cache.get(second, "ec2", "us-east-1", CONFIG)
+
+        assert first._session.get_component(
+            "data_loader"
+        ) is second._session.get_component("data_loader")
+
+    def test_entries_are_dropped_with_the_session(self) -> None:
+        """Caching does not keep sessions (and credentials) alive."""
+        cache = ClientCache()
+        session = make_session()
+        cache.get(session, "sts", "us-east-1", CONFIG)
+
+        del session
+        gc.collect()
+
+        assert len(cache._sessions) == 0
+
+
+@pytest.mark.parametrize("region", ["us-east-1", None])
+def test_scanner_get_client_is_cached(region) -> None:
+    """Scanners reuse clients across get_client calls and scanner instances."""
+    session = make_session()
+    first = LambdaScanner(session).get_client("lambda", region=region)
+    second = LambdaScanner(session).get_client("lambda", region=region)
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_iam_prefetch_uses_cached_rate_limited_client() -> None:
+    """The multi-account IAM prefetch shares the scanners' IAM client."""
+    session = make_session()
+    scanner = MultiAccountScanner(
+        registry=AccountRegistry(), scanner_classes=[], prefetch_iam=True
+    )
+    account = AWSAccount(
+        account_id="123456789012", name="Prod", auth_method=AuthMethod.IAM_ROLE
+    )
+
+    with patch.object(IAMPolicyCache, "prefetch") as prefetch:
+        await scanner._get_iam_cache(account, session)
+    scanner.shutdown()
+
+    (client,), _ = prefetch.call_args
+    assert client is LambdaScanner(session).get_client("iam")
@@ -0,0 +1,195 @@
+"""Unit tests for columnar findings aggregation."""
+
+from typing import List
+
+from cloud_optimizer.scanners.base import ScanResult
+from cloud_optimizer.scanners.columnar import FindingColumns
+from cloud_optimizer.scanners.multi_account import (
+    AccountRegistry,
+    AccountScanResult,
+    AuthMethod,
+    AWSAccount,
+    MultiAccountScanner,
+)
+from cloud_optimizer.services.security_dashboard import (
+    SecurityDashboard,
+    SecurityScoreCalculator,
+)
+
+
+def finding(
+    rule_id: str,
+    severity: str = "high",
+    passed: bool = False,
+    region: str = "us-east-1",
+    remediation: str = "",
+) -> ScanResult:
+    """Build a finding with a severity (and optional remediation) in evidence."""
+    return ScanResult(
+        rule_id=rule_id,
+        passed=passed,
+        resource_id=f"{rule_id}-resource",
+        region=region,
+        evidence={"severity": severity, "remediation": remediation},
+    )
+
+
+def account_result(account_id: str, findings: List[ScanResult]) -> AccountScanResult:
+    """Build an account result."""
+    account = AWSAccount(
+        account_id=account_id, name=account_id, auth_method=AuthMethod.IAM_ROLE
+    )
+    return AccountScanResult(account=account, findings=findings)
+
+
+RESULTS = [
+    account_result(
+        "111111111111",
+        [
+            finding("S3_001", "critical", remediation="Block public access"),
+            finding("S3_001", "critical"),
+            finding("S3_002", "HIGH", region="eu-west-1"),
+            finding("IAM_001", "informational"),
+            finding("EC2_001", "low", passed=True),
+        ],
+    ),
+    account_result(
+        "222222222222",
+        [finding("S3_001", "critical"), finding("EC2_001", "low")],
+    ),
+    account_result("333333333333", []),
+]
+
+
+class TestFindingColumns:
+    """Tests for FindingColumns."""
+
+    def test_strings_are_interned(self) -> None:
+        """Repeated strings are stored once; rows hold small integer codes."""
+        columns = FindingColumns.from_account_results(RESULTS)
+
+        assert len(columns) == 7
+        assert columns.rule_table.values == ["S3_001", "S3_002", "IAM_001", "EC2_001"]
+        assert columns.service_table.values == ["S3", "IAM", "EC2"]
+        assert columns.account_table.values[-1] == "333333333333"
+        assert columns.accounts.itemsize <= 4 and columns.severities.itemsize == 1
+
+    def test_aggregate(self) -> None:
+        """All group-bys come out of one aggregate call."""
+        agg = FindingColumns.from_account_results(RESULTS).aggregate()
+
+        assert agg.total == 7
+        assert agg.failed == 6
+        assert agg.by_account == {
+            "111111111111": 5,
+            "222222222222": 2,
+            "333333333333": 0,
+        }
+        assert agg.by_scanner == {"S3": 4, "IAM": 1, "EC2": 2}
+        assert agg.by_severity == {"critical": 3, "high": 1, "medium": 0, "low": 1}
+        assert agg.by_service == {"S3": 4, "IAM": 1, "EC2": 1}
+        assert agg.by_rule == {"S3_001": 3, "S3_002": 1, "IAM_001": 1, "EC2_001": 1}
+        assert agg.severity_counts("222222222222") == {
+            "critical": 1,
+            "high": 0,
+            "medium": 0,
+            "low": 1,
+        }
+        assert agg.other == {"111111111111": 1}
+        assert agg.rule_accounts["S3_001"] == {"111111111111", "222222222222"}
+        assert agg.rule_remediation["S3_001"] == "Block public access"
+
+    def test_aggregate_includes_streamed_counts(self) -> None:
+        """Streamed findings count towards totals and severities."""
+        streamed = account_result("444444444444", [finding("S3_001", "low")])
+        streamed.record_streamed(
+            [
+                finding("RDS_001", "critical"),
+                finding("RDS_002", "unknown"),
+                finding("RDS_003", "low", passed=True),
+            ]
+        )
+
+        agg = FindingColumns.from_account_results([streamed]).aggregate()
+
+        assert agg.total == 4
+        assert agg.failed == 3
+        assert agg.by_account == {"444444444444": 4}
+        assert agg.severity_counts("444444444444") == {
+            "critical": 1,
+            "high": 0,
+            "medium": 0,
+            "low": 1,
+        }
+        assert agg.other == {"444444444444": 1}
+        assert agg.by_rule == {"S3_001": 1}
+
+    def test_counts_by_region(self) -> None:
+        """Single columns can be grouped directly."""
+        columns = FindingColumns.from_account_results(RESULTS)
+
+        assert columns.counts_by("region") == {"us-east-1": 5, "eu-west-1": 1}
+        assert columns.counts_by("region", failed_only=False)["us-east-1"] == 6
+
+
+class TestColumnarSummaries:
+    """Summaries built on the aggregate match per-finding computations."""
+
+    def test_scores_match_calculate_score(self) -> None:
+        """Aggregate scores equal scoring the account's findings directly."""
+        agg = SecurityDashboard.aggregate(RESULTS)
+
+        for result in RESULTS:
+            expected = SecurityScoreCalculator.calculate_score(result.findings)
+            actual = SecurityScoreCalculator.score_from_aggregate(
+                agg, result.account.account_id
+            )
+            assert actual == expected
+
+    def test_streamed_findings_lower_scores(self) -> None:
+        """Findings sent to a result sink are scored like retained ones."""
+        retained = account_result("444444444444", [finding("RDS_001", "critical")])
+        streamed = account_result("444444444444", [])
+        streamed.record_streamed([finding("RDS_001", "critical")])
+
+        expected = SecurityScoreCalculator.score_from_aggregate(
+            SecurityDashboard.aggregate([retained]), "444444444444"
+        )
+        actual = SecurityScoreCalculator.score_from_aggregate(
+            SecurityDashboard.aggregate([streamed]), "444444444444"
+        )
+
+        assert actual == expected
+        assert actual.critical_count == 1
+
+    def test_multi_account_aggregate_results(self) -> None:
+        """aggregate_results keeps its output, including streamed counts."""
+        streamed = account_result("444444444444", [])
+        streamed.record_streamed([finding("RDS_001", "medium")])
+        scanner = MultiAccountScanner(registry=AccountRegistry(), scanner_classes=[])
+
+        aggregated = scanner.aggregate_results(RESULTS + [streamed])
+        scanner.shutdown()
+
+        assert aggregated["total_findings"] == 8
+        assert aggregated["findings_by_severity"] == {
+            "critical": 3,
+            "high": 1,
+            "medium": 1,
+            "low": 1,
+        }
+        assert aggregated["findings_by_scanner"] == {"S3": 4, "IAM": 1, "EC2": 2}
+        assert aggregated["findings_by_account"]["444444444444"] == 1
+
+    def test_dashboard_export(self) -> None:
+        """The dashboard export is computed from a single aggregate."""
+        export = SecurityDashboard().export_summary_to_dict(RESULTS)
+
+        assert export["findings_by_severity"]["critical"] == 3
+        assert export["top_issues"][0] == {
+            "rule_id": "S3_001",
+            "count": 3,
+            "severity": "critical",
+        }
+        assert export["recommendations"][0]["affected_accounts_count"] == 2
+        assert [row["account_id"] for row in export["heat_map"]][-1] == "333333333333"
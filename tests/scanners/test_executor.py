@@ -0,0 +1,226 @@
+"""Unit tests for the non-blocking scanner executor."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+
+from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.executor import (
+    ScannerExecutor,
+    ServiceBoundedClient,
+    released_service_slot,
+)
+from cloud_optimizer.scanners.registry import ScannerRegistry
+
+
+class SlowScanner(BaseScanner):
+    """Scanner whose scan blocks the calling thread like a boto3 call."""
+
+    SERVICE = "Slow"
+
+    def _register_rules(self) -> None:
+        self.register_rule(
+            ScannerRule(
+                rule_id="SLOW_001",
+                title="Slow",
+                description="Slow rule",
+                severity="low",
+                service="Slow",
+                resource_type="AWS::Slow::Thing",
+                recommendation="None",
+            )
+        )
+
+    async def scan(self) -> List[ScanResult]:
+        time.sleep(0.2)
+        return [
+            self.create_result(
+                rule_id="SLOW_001",
+                resource_id="thing-1",
+                resource_name="thing-1",
+                metadata={"thread": threading.current_thread().name},
+            )
+        ]
+
+
+class FakeClient:
+    """Minimal stand-in for a boto3 client."""
+
+    def __init__(self, tracker: Dict[str, int], delay: float = 0.05) -> None:
+        self.meta = MagicMock()
+        self.meta.method_to_api_mapping = {"describe_things": "DescribeThings"}
+        self.exceptions = "exceptions"
+        self._tracker = tracker
+        self._lock = threading.Lock()
+        self._delay = delay
+
+    def describe_things(self) -> Dict[str, Any]:
+        with self._lock:
+            self._tracker["active"] += 1
+            self._tracker["peak"] = max(self._tracker["peak"], self._tracker["active"])
+        time.sleep(self._delay)
+        with self._lock:
+            self._tracker["active"] -= 1
+        return {"Things": []}
+
+    def get_paginator(self, operation_name: str) -> Any:
+        paginator = MagicMock()
+        paginator.paginate.return_value = iter([{"Page": 1}, {"Page": 2}])
+        return paginator
+
+
+class TestScannerExecutor:
+    """Tests for ScannerExecutor."""
+
+    def test_invalid_configuration(self) -> None:
+        """Executor rejects non-positive limits."""
+        with pytest.raises(ValueError):
+            ScannerExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            ScannerExecutor(default_service_limit=0)
+
+    def test_service_limits_case_insensitive(self) -> None:
+        """Per-service limits are looked up case-insensitively."""
+        executor = ScannerExecutor(service_limits={"IAM": 2}, default_service_limit=5)
+        assert executor.get_service_limit("iam") == 2
+        assert executor.get_service_limit("s3") == 5
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_block_event_loop(self) -> None:
+        """Event loop keeps ticking while a blocking scan runs."""
+        executor = ScannerExecutor(max_workers=2)
+        scanner = SlowScanner(boto3.Session(region_name="us-east-1"))
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        results, _ = await asyncio.gather(executor.run(scanner), ticker())
+
+        assert ticks == 10
+        assert len(results) == 1
+        assert results[0].evidence["thread"].startswith("scanner")
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_all_runs_scanners_concurrently(self) -> None:
+        """Several blocking scanners overlap on the pool."""
+        executor = ScannerExecutor(max_workers=4)
+        session = boto3.Session(region_name="us-east-1")
+        scanners = [SlowScanner(session) for _ in range(4)]
+
+        start = time.perf_counter()
+        results = await executor.run_all(scanners)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+        assert len(results["SlowScanner"]) == 1
+        executor.shutdown()
+
+    def test_wrapped_client_enforces_service_limit(self) -> None:
+        """Concurrent calls through a wrapped client never exceed the limit."""
+        executor = ScannerExecutor(service_limits={"things": 2})
+        tracker = {"active": 0, "peak": 0}
+        client = executor.wrap_client(FakeClient(tracker), "things")
+
+        threads = [threading.Thread(target=client.describe_things) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tracker["peak"] <= 2
+        executor.shutdown()
+
+    def test_released_slot_is_usable_while_waiting(self) -> None:
+        """A call waiting inside its slot lets others use the service and budget."""
+        executor = ScannerExecutor(service_limits={"things": 1}, max_in_flight_calls=1)
+        released = threading.Event()
+        done = threading.Event()
+
+        def waiting_call() -> None:
+            with executor.service_slot("things"):
+                with released_service_slot():
+                    released.set()
+                    done.wait(timeout=5)
+
+        thread = threading.Thread(target=waiting_call)
+        thread.start()
+        assert released.wait(timeout=5)
+
+        tracker = {"active": 0, "peak": 0}
+        client = executor.wrap_client(FakeClient(tracker, delay=0), "things")
+        other = threading.Thread(target=client.describe_things)
+        other.start()
+        other.join(timeout=5)
+        done.set()
+        thread.join(timeout=5)
+
+        assert not other.is_alive()
+        assert not thread.is_alive()
+        assert tracker["peak"] == 1
+        with released_service_slot():
+            pass
+        executor.shutdown()
+
+    def test_wrapped_client_passes_through_attributes(self) -> None:
+        """Non-operation attributes and paginators still work."""
+        executor = ScannerExecutor()
+        tracker = {"active": 0, "peak": 0}
+        client = executor.wrap_client(FakeClient(tracker), "things")
+
+        assert isinstance(client, ServiceBoundedClient)
+        assert client.exceptions == "exceptions"
+        pages = list(client.get_paginator("describe_things").paginate())
+        assert pages == [{"Page": 1}, {"Page": 2}]
+        executor.shutdown()
+
+
+class TestScannerIntegration:
+    """Tests for executor wiring in BaseScanner and ScannerRegistry."""
+
+    def test_get_client_wraps_when_executor_attached(self) -> None:
+        """BaseScanner.get_client returns a bounded client with an executor."""
+        executor = ScannerExecutor()
+        scanner = SlowScanner(
+            boto3.Session(
+                aws_access_key_id="test",
+                aws_secret_access_key="test",
+                region_name="us-east-1",
+            ),
+            executor=executor,
+        )
+        client = scanner.get_client("s3")
+        assert isinstance(client, ServiceBoundedClient)
+        assert client.meta.service_model.service_name == "s3"
+        executor.shutdown()
+
+    def test_get_client_unwrapped_without_executor(self) -> None:
+        """Without an executor get_client returns the raw boto3 client."""
+        scanner = SlowScanner(
+            boto3.Session(
+                aws_access_key_id="test",
+                aws_secret_access_key="test",
+                region_name="us-east-1",
+            )
+        )
+        assert not isinstance(scanner.get_client("s3"), ServiceBoundedClient)
+
+    def test_registry_attaches_executor(self) -> None:
+        """get_all_scanners attaches the executor to every scanner."""
+        executor = ScannerExecutor()
+        scanners = ScannerRegistry.get_all_scanners(
+            boto3.Session(region_name="us-east-1"), executor=executor
+        )
+        assert scanners
+        assert all(scanner.executor is executor for scanner in scanners)
+        executor.shutdown()
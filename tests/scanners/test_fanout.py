@@ -0,0 +1,246 @@
+"""Unit tests for scanner work-unit fan-out."""
+
+import threading
+import time
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.executor import ScannerExecutor
+from cloud_optimizer.scanners.fanout import (
+    UnitTiming,
+    WorkUnit,
+    batch_units,
+    chunked,
+    region_units,
+    summarize_timings,
+)
+from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
+from cloud_optimizer.scanners.secrets_scanner import SecretsScanner
+
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "ap-south-1"]
+
+
+class RegionScanner(BaseScanner):
+    """Scanner that sleeps a region-dependent time per unit."""
+
+    SERVICE = "Test"
+    DELAYS = {"us-east-1": 0.2, "us-west-2": 0.05, "eu-west-1": 0.1, "ap-south-1": 0.0}
+
+    def _register_rules(self) -> None:
+        self.register_rule(
+            ScannerRule(
+                rule_id="TEST_001",
+                title="Test",
+                description="Test rule",
+                severity="low",
+                service="Test",
+                resource_type="AWS::Test::Thing",
+                recommendation="None",
+            )
+        )
+
+    async def scan(self) -> List[ScanResult]:
+        return await self.fan_out(region_units(self.regions), self._scan_region)
+
+    async def _scan_region(self, unit: WorkUnit) -> List[ScanResult]:
+        if unit.region == "eu-west-1":
+            raise RuntimeError("boom")
+        time.sleep(self.DELAYS[unit.region])
+        return [
+            self.create_result("TEST_001", f"{unit.region}-a", "a", unit.region),
+            self.create_result("TEST_001", f"{unit.region}-b", "b", unit.region),
+        ]
+
+
+class TestUnitBuilders:
+    """Tests for work unit helpers."""
+
+    def test_chunked(self) -> None:
+        """Batches are consecutive and bounded."""
+        assert list(chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+        with pytest.raises(ValueError):
+            list(chunked([1], 0))
+
+    def test_region_units_cross_services(self) -> None:
+        """One unit per region and service, ordered by region."""
+        units = region_units(["a", "b"], services=("eks", "ecs"))
+        assert [(u.region, u.service) for u in units] == [
+            ("a", "eks"),
+            ("a", "ecs"),
+            ("b", "eks"),
+            ("b", "ecs"),
+        ]
+        assert units[0].label == "eks:a"
+
+    def test_batch_units(self) -> None:
+        """Resources are split into indexed batches."""
+        units = batch_units("global", ["x", "y", "z"], 2, service="s3")
+        assert [u.items for u in units] == [("x", "y"), ("z",)]
+        assert [u.batch_index for u in units] == [0, 1]
+        assert units[1].label == "s3:global[1]"
+
+    def test_summarize_timings(self) -> None:
+        """Summary ranks regions and reports the slowest unit."""
+        timings = [
+            UnitTiming("S", "us-east-1", "lambda", 0, "a", 0, 0.5),
+            UnitTiming("S", "us-west-2", "lambda", 0, "b", 0, 1.5),
+            UnitTiming("S", "us-west-2", "iam", 0, "c", 0, 0.25, error="x"),
+        ]
+        summary = summarize_timings(timings)
+        assert list(summary["seconds_by_region"]) == ["us-west-2", "us-east-1"]
+        assert summary["seconds_by_service"]["lambda"] == 2.0
+        assert summary["failed_units"] == 1
+        assert summary["slowest_unit"]["label"] == "b"
+
+
+class TestFanOut:
+    """Tests for BaseScanner.fan_out."""
+
+    @pytest.mark.asyncio
+    async def test_merge_order_is_deterministic(self, session) -> None:
+        """Results follow unit order, not completion order."""
+        scanner = RegionScanner(session, regions=REGIONS)
+        results = await scanner.scan()
+
+        assert [r.resource_id for r in results] == [
+            "us-east-1-a",
+            "us-east-1-b",
+            "us-west-2-a",
+            "us-west-2-b",
+            "ap-south-1-a",
+            "ap-south-1-b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_units_run_concurrently(self, session) -> None:
+        """Wall-clock time tracks the slowest unit, not the sum."""
+        scanner = RegionScanner(session, regions=REGIONS)
+        start = time.perf_counter()
+        await scanner.scan()
+        assert time.perf_counter() - start < 0.33
+
+    @pytest.mark.asyncio
+    async def test_failed_unit_is_recorded(self, session) -> None:
+        """A failing unit contributes no results but is timed with its error."""
+        scanner = RegionScanner(session, regions=REGIONS)
+        await scanner.scan()
+
+        report = scanner.get_timing_report()
+        assert report["scanner"] == "RegionScanner"
+        assert report["unit_count"] == 4
+        assert report["failed_units"] == 1
+        assert next(iter(report["seconds_by_region"])) == "us-east-1"
+        failed = [t for t in scanner.unit_timings if t.error]
+        assert failed[0].region == "eu-west-1"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_per_scan(self, session) -> None:
+        """No more than MAX_CONCURRENT_UNITS units are in flight."""
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        class BoundedScanner(RegionScanner):
+            MAX_CONCURRENT_UNITS = 2
+
+            async def _scan_region(self, unit: WorkUnit) -> List[ScanResult]:
+                with lock:
+                    active["now"] += 1
+                    active["peak"] = max(active["peak"], active["now"])
+                time.sleep(0.05)
+                with lock:
+                    active["now"] -= 1
+                return []
+
+        scanner = BoundedScanner(session, regions=REGIONS * 2)
+        await scanner.scan()
+        assert active["peak"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_fan_out_uses_executor_unit_pool(self, session) -> None:
+        """Units run on the executor's unit pool when one is attached."""
+        executor = ScannerExecutor(unit_workers=4)
+        names: List[str] = []
+
+        class NamingScanner(RegionScanner):
+            async def _scan_region(self, unit: WorkUnit) -> List[ScanResult]:
+                names.append(threading.current_thread().name)
+                return []
+
+        scanner = NamingScanner(session, regions=REGIONS, executor=executor)
+        await scanner.run()
+        assert names and all(name.startswith("scanner-unit") for name in names)
+        executor.shutdown()
+
+    def test_global_call_budget(self) -> None:
+        """service_slot never lets more than max_in_flight_calls through."""
+        executor = ScannerExecutor(default_service_limit=10, max_in_flight_calls=3)
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def call(service: str) -> None:
+            with executor.service_slot(service):
+                with lock:
+                    active["now"] += 1
+                    active["peak"] = max(active["peak"], active["now"])
+                time.sleep(0.02)
+                with lock:
+                    active["now"] -= 1
+
+        threads = [
+            threading.Thread(target=call, args=(service,))
+            for service in ["s3", "iam", "ec2", "lambda"] * 3
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert active["peak"] <= 3
+        executor.shutdown()
+
+
+class TestScannerFanOut:
+    """Tests for scanners migrated to fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_lambda_scanner_fans_out_regions(self, session) -> None:
+        """LambdaScanner scans every region and keeps region order."""
+        scanner = LambdaScanner(session, regions=REGIONS)
+
+        async def fake_check(lambda_client, iam_client, cw_client, region):
+            return [scanner.create_result("LAMBDA_004", f"fn-{region}", "fn", region)]
+
+        with patch.object(scanner, "_check_lambda_functions", side_effect=fake_check):
+            results = await scanner.scan()
+
+        assert [r.region for r in results] == REGIONS
+        assert len(scanner.unit_timings) == len(REGIONS)
+
+    @pytest.mark.asyncio
+    async def test_secrets_scanner_units_per_service(self, session) -> None:
+        """SecretsScanner creates one unit per region and service."""
+        scanner = SecretsScanner(session, regions=REGIONS[:2])
+
+        async def fake_secrets(client, region):
+            return [scanner.create_result("SM_001", f"secret-{region}", "s", region)]
+
+        async def fake_params(client, region):
+            return [scanner.create_result("SM_002", f"param-{region}", "p", region)]
+
+        with (
+            patch.object(scanner, "_check_secrets", side_effect=fake_secrets),
+            patch.object(scanner, "_check_parameters", side_effect=fake_params),
+        ):
+            results = await scanner.scan()
+
+        assert [r.resource_id for r in results] == [
+            "secret-us-east-1",
+            "param-us-east-1",
+            "secret-us-west-2",
+            "param-us-west-2",
+        ]
+        services = {t.service for t in scanner.unit_timings}
+        assert services == {"secretsmanager", "ssm"}
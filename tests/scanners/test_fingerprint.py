@@ -0,0 +1,301 @@
+"""Unit tests for incremental scanning with resource fingerprints."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from cloud_optimizer.scanners.base import ScanResult
+from cloud_optimizer.scanners.fingerprint import (
+    FingerprintEntry,
+    FingerprintSnapshot,
+    InMemoryFingerprintStore,
+    compute_fingerprint,
+)
+from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
+from cloud_optimizer.scanners.secrets_scanner import SecretsScanner
+
+
+class TestComputeFingerprint:
+    """Tests for configuration hashing."""
+
+    def test_key_order_and_metadata_ignored(self) -> None:
+        """Equivalent configurations hash the same."""
+        first = {"a": 1, "b": [1, 2], "ResponseMetadata": {"RequestId": "x"}}
+        second = {"b": [1, 2], "a": 1, "ResponseMetadata": {"RequestId": "y"}}
+        assert compute_fingerprint(first) == compute_fingerprint(second)
+
+    def test_changes_are_detected(self) -> None:
+        """Any configuration change produces a new fingerprint."""
+        assert compute_fingerprint({"Status": "Enabled"}) != compute_fingerprint(
+            {"Status": "Suspended"}
+        )
+
+
+class TestFingerprintSnapshot:
+    """Tests for FingerprintSnapshot bookkeeping."""
+
+    def test_carry_forward_returns_copies(self) -> None:
+        """Unchanged resources return copies of their previous results."""
+        previous = ScanResult("S3_003", False, "bucket", evidence={"k": "v"})
+        snapshot = FingerprintSnapshot(
+            "123456789012", "S3Scanner", {"bucket": FingerprintEntry("fp", [previous])}
+        )
+
+        carried = snapshot.carry_forward("bucket", "fp")
+
+        assert carried == [previous]
+        assert carried[0] is not previous
+        carried[0].set_evidence("k", "changed")
+        assert previous.evidence["k"] == "v"
+        assert snapshot.carried_forward == 1
+
+    def test_changed_or_stale_resources_are_evaluated(self) -> None:
+        """A new fingerprint or an entry older than max_age is not carried."""
+        old = datetime.now(timezone.utc) - timedelta(days=30)
+        snapshot = FingerprintSnapshot(
+            "123456789012",
+            "S3Scanner",
+            {
+                "a": FingerprintEntry("fp-a"),
+                "b": FingerprintEntry("fp-b", evaluated_at=old),
+            },
+            max_age=timedelta(days=7),
+        )
+
+        assert snapshot.carry_forward("a", "fp-new") is None
+        assert snapshot.carry_forward("b", "fp-b") is None
+
+    def test_changes_report_updates_and_removals(self) -> None:
+        """Only re-evaluated entries are dirty; unseen resources are removed."""
+        snapshot = FingerprintSnapshot(
+            "123456789012",
+            "S3Scanner",
+            {
+                "kept": FingerprintEntry("fp-kept"),
+                "gone": FingerprintEntry("fp-gone"),
+            },
+        )
+        snapshot.carry_forward("kept", "fp-kept")
+        snapshot.record("new", "fp-new", [])
+
+        updated, removed = snapshot.changes()
+        assert set(updated) == {"new"}
+        assert removed == {"gone"}
+        assert set(snapshot.entries) == {"kept", "new"}
+
+
+class TestLambdaIncrementalScan:
+    """Tests for delta scanning in LambdaScanner."""
+
+    FUNCTION = {
+        "FunctionName": "fn",
+        "FunctionArn": "arn:aws:lambda:us-east-1:123456789012:function:fn",
+        "Runtime": "python3.12",
+        "RevisionId": "rev-1",
+    }
+
+    @staticmethod
+    def make_lambda_client(function: dict) -> MagicMock:
+        """Build a fake Lambda client listing one function without a policy."""
+        lambda_client = MagicMock()
+        lambda_client.get_paginator.return_value.paginate.return_value = [
+            {"Functions": [function]}
+        ]
+        lambda_client.get_policy.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException"}}, "GetPolicy"
+        )
+        return lambda_client
+
+    @staticmethod
+    async def scan_once(
+        session: boto3.Session,
+        store: InMemoryFingerprintStore,
+        lambda_client,
+        iam_client=None,
+    ) -> Tuple[FingerprintSnapshot, List[ScanResult]]:
+        """Scan with fingerprints loaded from and saved to the store."""
+        scanner = LambdaScanner(session)
+        scanner.fingerprints = await store.load("123456789012", "LambdaScanner")
+        results = await scanner._check_lambda_functions(
+            lambda_client, iam_client or MagicMock(), MagicMock(), "us-east-1"
+        )
+        await store.save(scanner.fingerprints)
+        return scanner.fingerprints, results
+
+    @staticmethod
+    def make_iam_client(inline_document: dict) -> MagicMock:
+        """Build a fake IAM client for a role with one inline policy."""
+        iam_client = MagicMock()
+        iam_client.list_attached_role_policies.return_value = {"AttachedPolicies": []}
+        iam_client.list_role_policies.return_value = {"PolicyNames": ["inline"]}
+        iam_client.get_role_policy.return_value = {"PolicyDocument": inline_document}
+        return iam_client
+
+    @pytest.mark.asyncio
+    async def test_unchanged_functions_skip_detail_calls(self, session) -> None:
+        """Unchanged functions are carried forward without a get_policy call."""
+        lambda_client = self.make_lambda_client(self.FUNCTION)
+        store = InMemoryFingerprintStore()
+
+        _, first = await self.scan_once(session, store, lambda_client)
+        snapshot, second = await self.scan_once(session, store, lambda_client)
+
+        assert snapshot.carried_forward == 1
+        assert lambda_client.get_function_concurrency.call_count == 2
+        assert lambda_client.get_policy.call_count == 1
+        assert [r.rule_id for r in second] == [r.rule_id for r in first]
+
+    @pytest.mark.asyncio
+    async def test_new_revision_is_reevaluated(self, session) -> None:
+        """A resource policy change bumps RevisionId and is reported."""
+        lambda_client = self.make_lambda_client(self.FUNCTION)
+        store = InMemoryFingerprintStore()
+        _, first = await self.scan_once(session, store, lambda_client)
+        assert "LAMBDA_009" not in {r.rule_id for r in first}
+
+        lambda_client = self.make_lambda_client(
+            {**self.FUNCTION, "RevisionId": "rev-2"}
+        )
+        lambda_client.get_policy.side_effect = None
+        lambda_client.get_policy.return_value = {
+            "Policy": json.dumps({"Statement": [{"Sid": "public", "Principal": "*"}]})
+        }
+        snapshot, second = await self.scan_once(session, store, lambda_client)
+
+        assert snapshot.evaluated == 1
+        assert lambda_client.get_policy.call_count == 1
+        assert "LAMBDA_009" in {r.rule_id for r in second}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_change_is_reevaluated(self, session) -> None:
+        """Removing reserved concurrency is reported on the next scan."""
+        lambda_client = self.make_lambda_client(self.FUNCTION)
+        lambda_client.get_function_concurrency.return_value = {
+            "ReservedConcurrentExecutions": 10
+        }
+        store = InMemoryFingerprintStore()
+        _, first = await self.scan_once(session, store, lambda_client)
+        assert "LAMBDA_005" not in {r.rule_id for r in first}
+
+        lambda_client.get_function_concurrency.return_value = {}
+        snapshot, second = await self.scan_once(session, store, lambda_client)
+
+        assert snapshot.evaluated == 1
+        assert "LAMBDA_005" in {r.rule_id for r in second}
+
+    @pytest.mark.asyncio
+    async def test_role_policy_change_is_reevaluated(self, session) -> None:
+        """A role that gains *:* is reported though the listing is unchanged."""
+        function = {**self.FUNCTION, "Role": "arn:aws:iam::123456789012:role/app"}
+        lambda_client = self.make_lambda_client(function)
+        store = InMemoryFingerprintStore()
+        logs_only = {
+            "Statement": [{"Effect": "Allow", "Action": "logs:*", "Resource": "*"}]
+        }
+        admin = {"Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}]}
+
+        _, first = await self.scan_once(
+            session, store, lambda_client, self.make_iam_client(logs_only)
+        )
+        snapshot, second = await self.scan_once(
+            session, store, lambda_client, self.make_iam_client(admin)
+        )
+
+        assert "LAMBDA_003" not in {r.rule_id for r in first}
+        assert snapshot.evaluated == 1
+        assert "LAMBDA_003" in {r.rule_id for r in second}
+
+
+class TestSecretsIncrementalScan:
+    """Tests for delta scanning in SecretsScanner."""
+
+    SECRET = {
+        "ARN": "arn:aws:secretsmanager:us-east-1:123456789012:secret:db-AbCdEf",
+        "Name": "db",
+        "RotationEnabled": True,
+        "KmsKeyId": "arn:aws:kms:us-east-1:123456789012:key/1234",
+        "Tags": [{"Key": "team", "Value": "data"}],
+        "LastChangedDate": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+
+    @staticmethod
+    def make_secrets_client(secret: dict) -> MagicMock:
+        """Build a fake Secrets Manager client listing one secret."""
+        secrets_client = MagicMock()
+        secrets_client.get_paginator.return_value.paginate.return_value = [
+            {"SecretList": [secret]}
+        ]
+        secrets_client.get_resource_policy.return_value = {}
+        return secrets_client
+
+    @staticmethod
+    async def scan_once(
+        session: boto3.Session, store: InMemoryFingerprintStore, secrets_client
+    ) -> Tuple[FingerprintSnapshot, List[ScanResult]]:
+        """Scan with fingerprints loaded from and saved to the store."""
+        scanner = SecretsScanner(session)
+        scanner.fingerprints = await store.load("123456789012", "SecretsScanner")
+        results = await scanner._check_secrets(secrets_client, "us-east-1")
+        await store.save(scanner.fingerprints)
+        return scanner.fingerprints, results
+
+    @pytest.mark.asyncio
+    async def test_unchanged_secrets_skip_policy_call(self, session) -> None:
+        """Unchanged secrets are carried forward without get_resource_policy."""
+        secrets_client = self.make_secrets_client(self.SECRET)
+        store = InMemoryFingerprintStore()
+
+        await self.scan_once(session, store, secrets_client)
+        snapshot, _ = await self.scan_once(session, store, secrets_client)
+
+        assert snapshot.carried_forward == 1
+        assert secrets_client.get_resource_policy.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_policy_change_is_reevaluated(self, session) -> None:
+        """A resource policy change bumps LastChangedDate and is reported."""
+        store = InMemoryFingerprintStore()
+        _, first = await self.scan_once(
+            session, store, self.make_secrets_client(self.SECRET)
+        )
+        assert "SM_004" not in {r.rule_id for r in first}
+
+        secrets_client = self.make_secrets_client(
+            {
+                **self.SECRET,
+                "LastChangedDate": datetime(2026, 2, 1, tzinfo=timezone.utc),
+            }
+        )
+        secrets_client.get_resource_policy.return_value = {
+            "ResourcePolicy": json.dumps({"Statement": [{"Principal": "*"}]})
+        }
+        snapshot, second = await self.scan_once(session, store, secrets_client)
+
+        assert snapshot.evaluated == 1
+        assert "SM_004" in {r.rule_id for r in second}
+
+    @pytest.mark.asyncio
+    async def test_last_access_is_checked_every_scan(self, session) -> None:
+        """Access age is not fingerprinted and is reported on carried scans."""
+        store = InMemoryFingerprintStore()
+        recent = datetime.now(timezone.utc) - timedelta(days=1)
+        await self.scan_once(
+            session,
+            store,
+            self.make_secrets_client({**self.SECRET, "LastAccessedDate": recent}),
+        )
+
+        stale = datetime.now(timezone.utc) - timedelta(days=120)
+        snapshot, results = await self.scan_once(
+            session,
+            store,
+            self.make_secrets_client({**self.SECRET, "LastAccessedDate": stale}),
+        )
+
+        assert snapshot.carried_forward == 1
+        assert [r.rule_id for r in results].count("SM_002") == 1
@@ -0,0 +1,187 @@
+"""Unit tests for the shared IAM policy document cache."""
+
+import time
+from datetime import timedelta
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from cloud_optimizer.scanners.iam import IAMScanner
+from cloud_optimizer.scanners.iam_cache import IAMPolicyCache
+from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/service-role/shared-role"
+POLICY_ARN = "arn:aws:iam::123456789012:policy/admin"
+WILDCARD_DOCUMENT: Dict[str, Any] = {
+    "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}]
+}
+
+
+def make_iam_client() -> MagicMock:
+    """Build a fake IAM client for a role with one attached and one inline policy."""
+    iam = MagicMock()
+    iam.list_attached_role_policies.return_value = {
+        "AttachedPolicies": [
+            {
+                "PolicyName": "AWSLambdaBasicExecutionRole",
+                "PolicyArn": "arn:aws:iam::aws:policy/service-role/"
+                "AWSLambdaBasicExecutionRole",
+            }
+        ]
+    }
+    iam.list_role_policies.return_value = {"PolicyNames": ["inline"]}
+    iam.get_role_policy.return_value = {"PolicyDocument": WILDCARD_DOCUMENT}
+    return iam
+
+
+def make_authorization_details_client() -> MagicMock:
+    """Build a fake IAM client that only serves GetAccountAuthorizationDetails."""
+    iam = MagicMock()
+    iam.get_paginator.return_value.paginate.return_value = [
+        {
+            "RoleDetailList": [
+                {
+                    "RoleName": "shared-role",
+                    "Arn": ROLE_ARN,
+                    "RolePolicyList": [
+                        {"PolicyName": "inline", "PolicyDocument": WILDCARD_DOCUMENT}
+                    ],
+                    "AttachedManagedPolicies": [
+                        {"PolicyName": "admin", "PolicyArn": POLICY_ARN}
+                    ],
+                }
+            ]
+        },
+        {
+            "Policies": [
+                {
+                    "PolicyName": "admin",
+                    "Arn": POLICY_ARN,
+                    "DefaultVersionId": "v2",
+                    "PolicyVersionList": [
+                        {"VersionId": "v1", "Document": {"Statement": []}},
+                        {"VersionId": "v2", "Document": WILDCARD_DOCUMENT},
+                    ],
+                }
+            ]
+        },
+    ]
+    return iam
+
+
+class TestIAMPolicyCache:
+    """Tests for IAMPolicyCache lookups."""
+
+    def test_lookups_are_memoized(self) -> None:
+        """Each role is fetched once no matter how often it is looked up."""
+        iam = make_iam_client()
+        cache = IAMPolicyCache()
+
+        for _ in range(3):
+            assert cache.role_inline_policies(iam, ROLE_ARN) == [
+                ("inline", WILDCARD_DOCUMENT)
+            ]
+            cache.attached_role_policies(iam, ROLE_ARN)
+
+        iam.list_role_policies.assert_called_once_with(RoleName="shared-role")
+        iam.get_role_policy.assert_called_once_with(
+            RoleName="shared-role", PolicyName="inline"
+        )
+        assert iam.list_attached_role_policies.call_count == 1
+        assert cache.misses == 3
+
+    def test_errors_are_not_cached(self) -> None:
+        """A failed lookup is retried on the next call."""
+        iam = make_iam_client()
+        iam.list_role_policies.side_effect = [
+            ClientError({"Error": {"Code": "Throttling"}}, "ListRolePolicies"),
+            {"PolicyNames": []},
+        ]
+        cache = IAMPolicyCache()
+
+        with pytest.raises(ClientError):
+            cache.role_policy_names(iam, ROLE_ARN)
+        assert cache.role_policy_names(iam, ROLE_ARN) == []
+
+    def test_expired_entries_are_refetched(self) -> None:
+        """Entries older than the TTL are fetched again."""
+        iam = make_iam_client()
+        cache = IAMPolicyCache(ttl=timedelta(seconds=0))
+
+        cache.role_policy_names(iam, ROLE_ARN)
+        time.sleep(0.01)
+        cache.role_policy_names(iam, ROLE_ARN)
+
+        assert iam.list_role_policies.call_count == 2
+
+    def test_prefetch_serves_roles_and_policy_versions(self) -> None:
+        """Prefetched roles and policy versions need no further API calls."""
+        iam = make_authorization_details_client()
+        cache = IAMPolicyCache()
+
+        cache.prefetch(iam)
+
+        iam.get_paginator.assert_called_once_with("get_account_authorization_details")
+        assert cache.attached_role_policies(iam, ROLE_ARN) == [
+            {"PolicyName": "admin", "PolicyArn": POLICY_ARN}
+        ]
+        assert cache.role_inline_policies(iam, ROLE_ARN) == [
+            ("inline", WILDCARD_DOCUMENT)
+        ]
+        assert cache.policy_version_document(iam, POLICY_ARN, "v2") == WILDCARD_DOCUMENT
+        assert [p["Arn"] for p in cache.local_policies() or []] == [POLICY_ARN]
+        iam.list_attached_role_policies.assert_not_called()
+        iam.list_role_policies.assert_not_called()
+        iam.get_policy_version.assert_not_called()
+
+
+class TestScannersShareCache:
+    """Tests for scanners using a shared cache."""
+
+    @pytest.mark.asyncio
+    async def test_lambda_functions_sharing_a_role(self, session) -> None:
+        """Functions sharing an execution role look it up once."""
+        functions = [
+            {
+                "FunctionName": f"fn-{i}",
+                "FunctionArn": f"arn:aws:lambda:us-east-1:123456789012:function:fn-{i}",
+                "Runtime": "python3.12",
+                "Role": ROLE_ARN,
+            }
+            for i in range(5)
+        ]
+        lambda_client = MagicMock()
+        lambda_client.get_paginator.return_value.paginate.return_value = [
+            {"Functions": functions}
+        ]
+        lambda_client.get_policy.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException"}}, "GetPolicy"
+        )
+        iam = make_iam_client()
+
+        scanner = LambdaScanner(session)
+        results = await scanner._check_lambda_functions(
+            lambda_client, iam, MagicMock(), "us-east-1"
+        )
+
+        assert [r.rule_id for r in results].count("LAMBDA_003") == 5
+        assert iam.list_attached_role_policies.call_count == 1
+        assert iam.list_role_policies.call_count == 1
+        assert iam.get_role_policy.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_iam_scanner_uses_prefetched_policies(self, session) -> None:
+        """IAMScanner reads customer managed policies from a prefetched cache."""
+        iam = make_authorization_details_client()
+        scanner = IAMScanner(session)
+        scanner.iam_cache.prefetch(iam)
+
+        results = await scanner._check_iam_policies(iam)
+
+        assert [(r.rule_id, r.resource_id) for r in results] == [
+            ("IAM_005", POLICY_ARN)
+        ]
+        assert iam.get_paginator.call_count == 1
+        iam.get_policy_version.assert_not_called()
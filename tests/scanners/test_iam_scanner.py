@@ -0,0 +1,188 @@
+"""Unit tests for IAMScanner user checks."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from cloud_optimizer.scanners.iam import IAMScanner
+
+REPORT_HEADER = (
+    "user,arn,user_creation_time,password_enabled,password_last_used,"
+    "mfa_active,access_key_1_active,access_key_1_last_rotated,"
+    "access_key_1_last_used_date,access_key_2_active,access_key_2_last_rotated,"
+    "access_key_2_last_used_date"
+)
+
+
+def days_ago(days: int) -> datetime:
+    """Get a UTC timestamp ``days`` days in the past, to the second."""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).replace(microsecond=0)
+
+
+def make_report(rows: List[str]) -> bytes:
+    """Build credential report CSV content."""
+    return "\n".join([REPORT_HEADER, *rows]).encode("utf-8")
+
+
+def make_iam_client(report: bytes) -> MagicMock:
+    """Build a fake IAM client whose credential report is ready."""
+    iam = MagicMock()
+    iam.generate_credential_report.return_value = {"State": "COMPLETE"}
+    iam.get_credential_report.return_value = {
+        "Content": report,
+        "ReportFormat": "text/csv",
+    }
+    return iam
+
+
+class TestCredentialReport:
+    """Tests for credential report based user checks."""
+
+    @pytest.mark.asyncio
+    async def test_users_evaluated_without_per_user_calls(self, session) -> None:
+        """MFA and credential age come from the report alone."""
+        old = days_ago(200).isoformat()
+        recent = days_ago(5).isoformat()
+        report = make_report(
+            [
+                f"<root_account>,arn:aws:iam::1:root,{old},not_supported,{recent},"
+                "true,false,N/A,N/A,false,N/A,N/A",
+                f"alice,arn:aws:iam::1:user/alice,{old},true,{recent},"
+                f"false,true,{old},{recent},false,N/A,N/A",
+                f"bob,arn:aws:iam::1:user/bob,{old},false,N/A,"
+                "false,false,N/A,N/A,false,N/A,N/A",
+            ]
+        )
+        iam = make_iam_client(report)
+
+        results = await IAMScanner(session)._check_iam_users(iam)
+
+        # alice: console without MFA; her old key was used recently
+        assert [(r.rule_id, r.resource_id) for r in results] == [
+            ("IAM_002", "arn:aws:iam::1:user/alice")
+        ]
+        iam.get_paginator.assert_not_called()
+        iam.list_mfa_devices.assert_not_called()
+        iam.get_login_profile.assert_not_called()
+        iam.list_access_keys.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unused_keys_and_passwords(self, session) -> None:
+        """Stale keys are reported with their key ID, fetched only for that user."""
+        created = days_ago(300)
+        report = make_report(
+            [
+                f"carol,arn:aws:iam::1:user/carol,{created.isoformat()},true,"
+                f"{days_ago(120).isoformat()},true,true,{created.isoformat()},N/A,"
+                "false,N/A,N/A",
+            ]
+        )
+        iam = make_iam_client(report)
+        iam.list_access_keys.return_value = {
+            "AccessKeyMetadata": [
+                {
+                    "AccessKeyId": "AKIAOLD",
+                    "Status": "Active",
+                    "CreateDate": created + timedelta(microseconds=500),
+                }
+            ]
+        }
+
+        results = await IAMScanner(session)._check_iam_users(iam)
+
+        evidence = {
+            r.evidence.get("credential_type", "key"): r.evidence for r in results
+        }
+        assert [r.rule_id for r in results] == ["IAM_004", "IAM_004"]
+        assert evidence["password"]["last_used_days"] == 120
+        assert evidence["key"]["access_key_id"] == "AKIAOLD"
+        assert evidence["key"]["key_age_days"] == 300
+        assert evidence["key"]["last_used_days"] is None
+        iam.list_access_keys.assert_called_once_with(UserName="carol")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_user_calls(self, session) -> None:
+        """Without a credential report each user is checked individually."""
+        iam = MagicMock()
+        iam.generate_credential_report.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "GenerateCredentialReport"
+        )
+        iam.get_paginator.return_value.paginate.return_value = [
+            {
+                "Users": [
+                    {
+                        "UserName": "dave",
+                        "Arn": "arn:aws:iam::1:user/dave",
+                        "CreateDate": days_ago(10),
+                    }
+                ]
+            }
+        ]
+        iam.list_mfa_devices.return_value = {"MFADevices": []}
+        iam.get_login_profile.return_value = {"LoginProfile": {}}
+        iam.list_access_keys.return_value = {"AccessKeyMetadata": []}
+
+        results = await IAMScanner(session)._check_iam_users(iam)
+
+        assert [r.rule_id for r in results] == ["IAM_002"]
+        iam.list_mfa_devices.assert_called_once_with(UserName="dave")
+
+    @pytest.mark.asyncio
+    async def test_fallback_applies_report_rules(self, session) -> None:
+        """Per-user checks skip recently used keys and report unused passwords."""
+        iam = MagicMock()
+        iam.generate_credential_report.side_effect = ClientError(
+            {"Error": {"Code": "Throttling"}}, "GenerateCredentialReport"
+        )
+        iam.get_paginator.return_value.paginate.return_value = [
+            {
+                "Users": [
+                    {
+                        "UserName": "erin",
+                        "Arn": "arn:aws:iam::1:user/erin",
+                        "CreateDate": days_ago(300),
+                        "PasswordLastUsed": days_ago(120),
+                    }
+                ]
+            }
+        ]
+        iam.list_mfa_devices.return_value = {"MFADevices": [{"SerialNumber": "m"}]}
+        iam.get_login_profile.return_value = {"LoginProfile": {}}
+        iam.list_access_keys.return_value = {
+            "AccessKeyMetadata": [
+                {
+                    "AccessKeyId": "AKIAUSED",
+                    "Status": "Active",
+                    "CreateDate": days_ago(200),
+                },
+                {
+                    "AccessKeyId": "AKIAIDLE",
+                    "Status": "Active",
+                    "CreateDate": days_ago(200),
+                },
+                {
+                    "AccessKeyId": "AKIANEW",
+                    "Status": "Active",
+                    "CreateDate": days_ago(10),
+                },
+            ]
+        }
+        iam.get_access_key_last_used.side_effect = lambda AccessKeyId: {
+            "AccessKeyLastUsed": (
+                {"LastUsedDate": days_ago(3)} if AccessKeyId == "AKIAUSED" else {}
+            )
+        }
+
+        results = await IAMScanner(session)._check_iam_users(iam)
+
+        evidence = {
+            r.evidence.get("credential_type", "key"): r.evidence for r in results
+        }
+        assert [r.rule_id for r in results] == ["IAM_004", "IAM_004"]
+        assert evidence["password"]["last_used_days"] == 120
+        assert evidence["key"]["access_key_id"] == "AKIAIDLE"
+        assert evidence["key"]["last_used_days"] is None
+        assert iam.get_access_key_last_used.call_count == 2
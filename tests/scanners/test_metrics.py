@@ -0,0 +1,165 @@
+"""Unit tests for batched CloudWatch metric retrieval."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from cloud_optimizer.integrations.aws.performance import CloudWatchScanner
+from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
+from cloud_optimizer.scanners.metrics import MetricQuery, fetch_metric_data
+
+END = datetime(2026, 1, 2, tzinfo=timezone.utc)
+START = END - timedelta(days=1)
+
+
+def make_cloudwatch_client(values: Dict[str, List[float]]) -> MagicMock:
+    """Build a fake CloudWatch client answering GetMetricData by metric name.
+
+    Each request is returned as two pages to exercise pagination.
+    """
+    cloudwatch = MagicMock()
+
+    def paginate(MetricDataQueries: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        for half in (0, 1):
+            yield {
+                "MetricDataResults": [
+                    {
+                        "Id": query["Id"],
+                        "Values": values.get(
+                            query["MetricStat"]["Metric"]["MetricName"], []
+                        )[half::2],
+                    }
+                    for query in MetricDataQueries
+                ]
+            }
+
+    cloudwatch.get_paginator.return_value.paginate.side_effect = paginate
+    return cloudwatch
+
+
+class TestFetchMetricData:
+    """Tests for fetch_metric_data."""
+
+    def test_batches_dedupes_and_pages(self) -> None:
+        """Queries are batched, duplicates fetched once, pages merged."""
+        cloudwatch = make_cloudwatch_client({"CPUUtilization": [1.0, 2.0, 3.0]})
+        queries = [
+            MetricQuery.of(
+                "AWS/EC2", "CPUUtilization", {"InstanceId": f"i-{i}"}, "Average", 3600
+            )
+            for i in range(5)
+        ]
+
+        values = fetch_metric_data(
+            cloudwatch, queries + queries[:2], START, END, batch_size=2
+        )
+
+        paginate = cloudwatch.get_paginator.return_value.paginate
+        assert paginate.call_count == 3
+        sizes = [len(c.kwargs["MetricDataQueries"]) for c in paginate.call_args_list]
+        assert sizes == [2, 2, 1]
+        assert set(values) == set(queries)
+        assert sorted(values[queries[0]]) == [1.0, 2.0, 3.0]
+
+    def test_failed_batch_is_omitted(self) -> None:
+        """Queries whose request failed are missing from the result."""
+        cloudwatch = MagicMock()
+        cloudwatch.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "Throttling"}}, "GetMetricData"
+        )
+        query = MetricQuery.of("AWS/Lambda", "Errors", {"FunctionName": "f"}, "Sum", 60)
+
+        assert fetch_metric_data(cloudwatch, [query], START, END) == {}
+
+    def test_request_shape(self) -> None:
+        """Queries map onto GetMetricData MetricStat entries."""
+        query = MetricQuery.of(
+            "AWS/RDS", "CPUUtilization", {"DBInstanceIdentifier": "db"}, "Average", 300
+        )
+        assert query.to_request("m0") == {
+            "Id": "m0",
+            "MetricStat": {
+                "Metric": {
+                    "Namespace": "AWS/RDS",
+                    "MetricName": "CPUUtilization",
+                    "Dimensions": [{"Name": "DBInstanceIdentifier", "Value": "db"}],
+                },
+                "Period": 300,
+                "Stat": "Average",
+            },
+            "ReturnData": True,
+        }
+
+
+class TestBatchedScanners:
+    """Tests for scanners fetching metrics in batches."""
+
+    def test_ec2_performance_single_request(self) -> None:
+        """All instances' metrics are fetched in one GetMetricData request."""
+        ec2 = MagicMock()
+        ec2.describe_instances.return_value = {
+            "Reservations": [
+                {"Instances": [{"InstanceId": f"i-{i}", "InstanceType": "t3.micro"}]}
+                for i in range(50)
+            ]
+        }
+        cloudwatch = make_cloudwatch_client({"CPUUtilization": [90.0, 85.0]})
+
+        findings = CloudWatchScanner()._check_ec2_performance(
+            ec2, cloudwatch, "123456789012"
+        )
+
+        assert len(findings) == 50
+        assert {f["severity"] for f in findings} == {"high"}
+        assert cloudwatch.get_paginator.return_value.paginate.call_count == 1
+        cloudwatch.get_metric_statistics.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lambda_unused_functions(self) -> None:
+        """LAMBDA_008 uses batched invocation totals and skips failed fetches."""
+        session = boto3.Session(
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+            region_name="us-east-1",
+        )
+        lambda_client = MagicMock()
+        lambda_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Functions": [
+                    {
+                        "FunctionName": f"fn-{i}",
+                        "FunctionArn": f"arn:aws:lambda:us-east-1:1:function:fn-{i}",
+                    }
+                    for i in range(3)
+                ]
+            }
+        ]
+        lambda_client.get_policy.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException"}}, "GetPolicy"
+        )
+
+        unused = await LambdaScanner(session)._check_lambda_functions(
+            lambda_client, MagicMock(), make_cloudwatch_client({}), "us-east-1"
+        )
+        assert len([r for r in unused if r.rule_id == "LAMBDA_008"]) == 3
+
+        used = await LambdaScanner(session)._check_lambda_functions(
+            lambda_client,
+            MagicMock(),
+            make_cloudwatch_client({"Invocations": [4.0]}),
+            "us-east-1",
+        )
+        assert [r for r in used if r.rule_id == "LAMBDA_008"] == []
+
+        failing = MagicMock()
+        failing.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "GetMetricData"
+        )
+        unknown = await LambdaScanner(session)._check_lambda_functions(
+            lambda_client, MagicMock(), failing, "us-east-1"
+        )
+        assert [r for r in unknown if r.rule_id == "LAMBDA_008"] == []
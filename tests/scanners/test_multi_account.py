@@ -4,9 +4,12 @@ Issue #147: Multi-account scanning support
 Tests for multi-account scanning orchestration and account management.
 """
 
+import threading
+import time
 import pytest
 from datetime import datetime, timezone
 from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
 
 from cloud_optimizer.scanners.multi_account import (
     AccountRegistry,
@@ -16,7 +19,8 @@ from cloud_optimizer.scanners.multi_account import (
     AWSAccount,
     MultiAccountScanner,
 )
-from cloud_optimizer.scanners.base import ScanResult
+from cloud_optimizer.scanners.base import BaseScanner, ScanResult
+from cloud_optimizer.scanners.columnar import FindingColumns
 
 
 class TestAWSAccount:
@@ -339,6 +343,36 @@ class TestAccountScanResult:
         assert severity_counts["medium"] == 0
         assert severity_counts["low"] == 0
 
+    def test_findings_by_severity_matches_columnar(
+        self, sample_account: AWSAccount
+    ) -> None:
+        """Test severity counts ignore case like the columnar aggregate."""
+        result = AccountScanResult(
+            account=sample_account,
+            findings=[
+                ScanResult(
+                    rule_id="TEST_001",
+                    resource_id="res1",
+                    passed=False,
+                    evidence={"severity": "HIGH"},
+                ),
+                ScanResult(rule_id="TEST_002", resource_id="res2", passed=False),
+            ],
+            streamed_by_severity={"Critical": 2},
+        )
+
+        aggregate = FindingColumns.from_account_results([result]).aggregate()
+
+        assert result.findings_by_severity() == {
+            "critical": 2,
+            "high": 1,
+            "medium": 1,
+            "low": 0,
+        }
+        assert result.findings_by_severity() == aggregate.severity_counts(
+            sample_account.account_id
+        )
+
 
 class TestMultiAccountScanner:
     """Test MultiAccountScanner class."""
@@ -435,3 +469,155 @@ class TestMultiAccountScanner:
         assert aggregated["findings_by_severity"]["medium"] == 1
         assert aggregated["findings_by_account"]["111111111111"] == 2
         assert aggregated["findings_by_account"]["222222222222"] == 1
+
+
+class SleepingScanner(BaseScanner):
+    """Scanner that blocks like a boto3 call and records concurrency."""
+
+    SERVICE = "Test"
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    started: List[str] = []
+
+    def _register_rules(self) -> None:
+        pass
+
+    async def scan(self) -> List[ScanResult]:
+        cls = SleepingScanner
+        with cls.lock:
+            cls.running += 1
+            cls.peak = max(cls.peak, cls.running)
+            cls.started.append(self.account_id)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.running -= 1
+        return []
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.running = 0
+        cls.peak = 0
+        cls.started = []
+
+
+class OtherSleepingScanner(SleepingScanner):
+    """Second scanner class sharing SleepingScanner's counters."""
+
+
+class TestMultiAccountScheduling:
+    """Test parallel scheduling of account scans."""
+
+    @pytest.fixture(autouse=True)
+    def reset_counters(self) -> None:
+        SleepingScanner.reset()
+
+    @staticmethod
+    def make_registry(count: int) -> AccountRegistry:
+        registry = AccountRegistry()
+        for i in range(count):
+            registry.add_account(
+                AWSAccount(
+                    account_id=f"{i + 1:012d}",
+                    name=f"Account{i}",
+                    auth_method=AuthMethod.IAM_ROLE,
+                    status=AccountStatus.ACTIVE,
+                )
+            )
+        return registry
+
+    @staticmethod
+    def patch_sessions(scanner: MultiAccountScanner) -> Any:
+        session = MagicMock()
+        session.client.return_value.get_caller_identity.return_value = {}
+        return patch.object(scanner, "_get_session_for_account", return_value=session)
+
+    @pytest.mark.asyncio
+    async def test_accounts_and_scanners_run_in_parallel(self) -> None:
+        """Blocking scanners overlap across accounts and within an account."""
+        scanner = MultiAccountScanner(
+            registry=self.make_registry(4),
+            scanner_classes=[SleepingScanner, OtherSleepingScanner],
+            max_workers=4,
+            scanner_concurrency=2,
+        )
+
+        start = time.monotonic()
+        with self.patch_sessions(scanner):
+            results = await scanner.scan_all()
+        elapsed = time.monotonic() - start
+        scanner.shutdown()
+
+        assert len(results) == 4
+        assert all(
+            r.scanners_run == ["SleepingScanner", "OtherSleepingScanner"]
+            for r in results
+        )
+        assert SleepingScanner.peak == 8
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_max_workers_bounds_concurrent_accounts(self) -> None:
+        """No more than max_workers accounts are scanned at once."""
+        scanner = MultiAccountScanner(
+            registry=self.make_registry(5),
+            scanner_classes=[SleepingScanner],
+            max_workers=2,
+        )
+
+        with self.patch_sessions(scanner):
+            results = await scanner.scan_all()
+        scanner.shutdown()
+
+        assert len(results) == 5
+        assert SleepingScanner.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_largest_accounts_start_first(self) -> None:
+        """Accounts are started longest-processing-time-first."""
+        registry = self.make_registry(3)
+        scanner = MultiAccountScanner(
+            registry=registry,
+            scanner_classes=[SleepingScanner],
+            max_workers=1,
+        )
+        # Account 3 took longest last time; account 2 is new and estimated
+        # from the mean seconds per region
+        scanner._scan_durations = {"000000000001": 1.0, "000000000003": 5.0}
+
+        assert scanner.estimate_scan_cost(registry.get_account("000000000002")) == 3.0
+        with self.patch_sessions(scanner):
+            await scanner.scan_all()
+        scanner.shutdown()
+
+        assert SleepingScanner.started == [
+            "000000000003",
+            "000000000002",
+            "000000000001",
+        ]
+
+    def test_assume_role_sessions_come_from_broker(self) -> None:
+        """Assumed role sessions are reused across scans via the broker."""
+        account = AWSAccount(
+            account_id="111111111111",
+            name="Production",
+            auth_method=AuthMethod.ASSUME_ROLE,
+            role_arn="arn:aws:iam::111111111111:role/Scanner",
+            external_id="ext-123",
+        )
+        broker = MagicMock()
+        scanner = MultiAccountScanner(
+            registry=AccountRegistry(), scanner_classes=[], credential_broker=broker
+        )
+
+        first = scanner._get_session_for_account(account)
+        second = scanner._get_session_for_account(account)
+        scanner.shutdown()
+
+        assert first is second is broker.get_session.return_value
+        broker.get_session.assert_called_with(
+            role_arn="arn:aws:iam::111111111111:role/Scanner",
+            external_id="ext-123",
+            session_name="CloudOptimizer-111111111111",
+            duration_seconds=3600,
+        )
@@ -0,0 +1,141 @@
+"""Unit tests for the shared adaptive AWS API rate limiter."""
+
+import threading
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import boto3
+from botocore.hooks import HierarchicalEmitter
+
+from cloud_optimizer.scanners.executor import ScannerExecutor
+from cloud_optimizer.scanners.lambda_scanner import LambdaScanner
+from cloud_optimizer.scanners.rate_limit import AdaptiveRateLimiter, TokenBucket
+
+
+def make_client(region: str = "us-east-1") -> MagicMock:
+    """Build a fake client with a real botocore event emitter."""
+    client = MagicMock()
+    client.meta.events = HierarchicalEmitter()
+    client.meta.region_name = region
+    return client
+
+
+def emit_response(client: MagicMock, parsed: Dict[str, Any]) -> None:
+    """Emit the events botocore sends around one HTTP attempt."""
+    client.meta.events.emit("before-send.iam.ListRoles", request=None)
+    client.meta.events.emit(
+        "needs-retry.iam.ListRoles",
+        response=(MagicMock(), parsed),
+        caught_exception=None,
+        attempts=1,
+    )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_waits_once_burst_is_spent(self) -> None:
+        """Calls beyond the burst wait for tokens to refill."""
+        bucket = TokenBucket(rate=50)
+
+        waits = [bucket.acquire() for _ in range(51)]
+
+        assert waits[:50] == [0.0] * 50
+        assert 0 < waits[50] <= 0.03
+        assert bucket.stats.calls == 51
+        assert bucket.stats.wait_seconds == waits[50]
+
+    def test_throttles_back_off_once_per_second(self) -> None:
+        """A burst of throttles halves the rate once."""
+        bucket = TokenBucket(rate=8)
+
+        for _ in range(5):
+            bucket.on_throttle()
+
+        assert bucket.rate == 4
+        assert bucket.stats.throttles == 5
+
+    def test_successes_recover_up_to_max_rate(self) -> None:
+        """Successful calls raise the rate additively, capped at max_rate."""
+        bucket = TokenBucket(rate=2, max_rate=3, increase=0.5)
+
+        bucket.on_success()
+        assert bucket.rate == 2.5
+        for _ in range(10):
+            bucket.on_success()
+        assert bucket.rate == 3
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter."""
+
+    def test_buckets_are_shared_per_account_service_region(self) -> None:
+        """Clients with the same key share one bucket; service rates apply."""
+        limiter = AdaptiveRateLimiter(default_rate=10, service_rates={"IAM": 2})
+
+        first = limiter.bucket("111111111111", "iam", "us-east-1")
+        assert limiter.bucket("111111111111", "iam", "us-east-1") is first
+        assert limiter.bucket("222222222222", "iam", "us-east-1") is not first
+        assert limiter.bucket("111111111111", "iam", "eu-west-1") is not first
+        assert first.rate == 2
+        assert limiter.bucket("111111111111", "ec2", "us-east-1").rate == 10
+
+    def test_instrumented_clients_learn_from_throttling(self) -> None:
+        """Throttling seen by one client slows every client with the same key."""
+        limiter = AdaptiveRateLimiter(default_rate=10)
+        first = limiter.instrument(make_client(), "111111111111", "iam")
+        second = limiter.instrument(make_client(), "111111111111", "iam")
+
+        emit_response(first, {"Error": {"Code": "Throttling"}})
+        emit_response(second, {"Error": {"Code": "NoSuchEntity"}})
+        emit_response(second, {"Roles": []})
+
+        stats = limiter.get_stats("111111111111")["111111111111/iam/us-east-1"]
+        assert stats["calls"] == 3
+        assert stats["throttles"] == 1
+        assert stats["rate"] == 5.1
+        assert limiter.get_stats("222222222222") == {}
+
+    def test_token_wait_releases_service_slot(self) -> None:
+        """A call waiting for a token does not hold its executor slot."""
+        limiter = AdaptiveRateLimiter(default_rate=1)
+        client = limiter.instrument(make_client(), "111111111111", "iam")
+        executor = ScannerExecutor(service_limits={"iam": 1}, max_in_flight_calls=1)
+        client.meta.events.emit("before-send.iam.ListRoles", request=None)
+
+        def throttled_call() -> None:
+            with executor.service_slot("iam"):
+                client.meta.events.emit("before-send.iam.ListRoles", request=None)
+
+        thread = threading.Thread(target=throttled_call)
+        thread.start()
+        while not limiter.get_stats()["111111111111/iam/us-east-1"]["wait_seconds"]:
+            pass
+        semaphore = executor._get_semaphore("iam")
+        acquired = semaphore.acquire(timeout=0.5)
+        if acquired:
+            semaphore.release()
+        thread.join(timeout=5)
+        executor.shutdown()
+
+        assert acquired
+        assert not thread.is_alive()
+
+    def test_scanner_clients_are_instrumented(self) -> None:
+        """Scanner clients draw from the limiter under the scanner's account."""
+        session = boto3.Session(
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+            region_name="us-east-1",
+        )
+        scanner = LambdaScanner(session)
+        scanner.rate_limiter = AdaptiveRateLimiter()
+        scanner.account_id = "123456789012"
+
+        client = scanner.get_client("lambda", region="eu-west-1")
+
+        assert client.meta.config.retries["mode"] == "standard"
+        bucket = scanner.rate_limiter.bucket("123456789012", "lambda", "eu-west-1")
+        assert bucket.stats.calls == 0
+        report = scanner.get_timing_report()
+        assert "123456789012/lambda/eu-west-1" in report["rate_limits"]
@@ -0,0 +1,97 @@
+"""Unit tests for the compact ScanResult."""
+
+import sys
+
+import pytest
+
+from cloud_optimizer.scanners.base import AccountContext, ScanResult
+from cloud_optimizer.scanners.fingerprint import result_from_dict, result_to_dict
+
+CONTEXT = AccountContext(
+    account_id="123456789012", account_name="Production", environment="prod"
+)
+
+
+class TestScanResult:
+    """Tests for ScanResult."""
+
+    def test_is_slotted_and_interned(self) -> None:
+        """Results carry no __dict__ and share rule ID and region strings."""
+        first = ScanResult(
+            rule_id="".join(["S3", "_001"]), passed=True, resource_id="a"
+        )
+        second = ScanResult(
+            rule_id="".join(["S3", "_001"]), passed=True, resource_id="b"
+        )
+
+        assert not hasattr(first, "__dict__")
+        assert first.rule_id is second.rule_id
+        assert first.region is second.region
+        with pytest.raises(AttributeError):
+            first.severity = "high"  # type: ignore[attr-defined]
+
+    def test_evidence_is_lazy(self) -> None:
+        """No evidence dict exists until evidence is written."""
+        result = ScanResult(rule_id="S3_001", passed=True, resource_id="a")
+
+        assert result._evidence is None
+        assert result.get_evidence("severity", "medium") == "medium"
+        assert result._evidence is None
+
+        with pytest.raises(TypeError):
+            result.evidence["severity"] = "low"  # type: ignore[index]
+        assert result._evidence is None
+
+        result.set_evidence("severity", "low")
+        assert result.get_evidence("severity") == "low"
+
+    def test_account_context_is_referenced(self) -> None:
+        """Account context is read through, not copied, until evidence is used."""
+        result = ScanResult(
+            rule_id="S3_001",
+            passed=False,
+            resource_id="a",
+            evidence={"severity": "high"},
+            context=CONTEXT,
+        )
+
+        assert result.get_evidence("account_id") == "123456789012"
+        assert "account_id" not in result._evidence
+        assert result.evidence == {
+            "severity": "high",
+            "account_id": "123456789012",
+            "account_name": "Production",
+            "environment": "prod",
+        }
+        assert result._evidence == {"severity": "high"}
+
+    def test_round_trip(self) -> None:
+        """Stored results leave out the context and get it back on load."""
+        result = ScanResult(
+            rule_id="S3_001",
+            passed=False,
+            resource_id="a",
+            evidence={"severity": "high"},
+            context=CONTEXT,
+        )
+
+        stored = result_to_dict(result)
+        renamed = AccountContext(
+            account_id="123456789012", account_name="Renamed", environment="prod"
+        )
+        rebuilt = result_from_dict(stored, CONTEXT)
+
+        assert stored["evidence"] == {"severity": "high"}
+        assert rebuilt == result
+        assert rebuilt._evidence == {"severity": "high"}
+        assert rebuilt.evidence["environment"] == "prod"
+        assert result_from_dict(stored, renamed).get_evidence("account_name") == (
+            "Renamed"
+        )
+        assert "ScanResult(rule_id='S3_001'" in repr(rebuilt)
+
+    def test_smaller_than_a_dict_backed_object(self) -> None:
+        """A slotted result is smaller than an instance __dict__ alone."""
+        result = ScanResult(rule_id="S3_001", passed=True, resource_id="a")
+
+        assert sys.getsizeof(result) < sys.getsizeof({"rule_id": 1, "passed": 2})
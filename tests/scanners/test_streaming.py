@@ -0,0 +1,214 @@
+"""Unit tests for streaming scan results."""
+
+import threading
+from contextlib import aclosing
+from typing import AsyncIterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cloud_optimizer.scanners.base import BaseScanner, ScannerRule, ScanResult
+from cloud_optimizer.scanners.executor import ScannerExecutor
+from cloud_optimizer.scanners.fanout import WorkUnit, region_units
+from cloud_optimizer.scanners.multi_account import (
+    AccountRegistry,
+    AuthMethod,
+    AWSAccount,
+    MultiAccountScanner,
+)
+from cloud_optimizer.scanners.streaming import achunked, next_chunk
+
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1"]
+
+
+async def numbers(count: int) -> AsyncIterator[int]:
+    """Yield ``count`` integers."""
+    for value in range(count):
+        yield value
+
+
+class CountingScanner(BaseScanner):
+    """Scanner that produces ``TOTAL`` findings one at a time."""
+
+    SERVICE = "Test"
+    TOTAL = 25
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.produced = 0
+        self.closed = False
+        self.threads: List[str] = []
+
+    def _register_rules(self) -> None:
+        self.register_rule(
+            ScannerRule(
+                rule_id="TEST_001",
+                title="Test",
+                description="Test rule",
+                severity="high",
+                service="Test",
+                resource_type="AWS::Test::Thing",
+                recommendation="None",
+            )
+        )
+
+    async def scan(self) -> List[ScanResult]:
+        return [result async for result in self.scan_iter()]
+
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        try:
+            for index in range(self.TOTAL):
+                self.threads.append(threading.current_thread().name)
+                self.produced += 1
+                yield self.create_result(
+                    "TEST_001",
+                    f"thing-{index}",
+                    "thing",
+                    metadata={"severity": "high"},
+                )
+        finally:
+            self.closed = True
+
+
+class RegionScanner(CountingScanner):
+    """Scanner that fans out one unit per region."""
+
+    async def scan_iter(self) -> AsyncIterator[ScanResult]:
+        async for result in self.fan_out_iter(
+            region_units(self.regions), self._scan_region
+        ):
+            yield result
+
+    async def _scan_region(self, unit: WorkUnit) -> List[ScanResult]:
+        return [
+            self.create_result("TEST_001", f"{unit.region}-{i}", "r", unit.region)
+            for i in range(2)
+        ]
+
+
+class TestChunkHelpers:
+    """Tests for chunking helpers."""
+
+    @pytest.mark.asyncio
+    async def test_achunked(self) -> None:
+        """Chunks are bounded and the tail chunk is kept."""
+        chunks = [chunk async for chunk in achunked(numbers(5), 2)]
+        assert chunks == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.asyncio
+    async def test_next_chunk_leaves_source_open(self) -> None:
+        """next_chunk can be called repeatedly on the same iterator."""
+        source = numbers(5)
+        assert await next_chunk(source, 3) == [0, 1, 2]
+        assert await next_chunk(source, 3) == [3, 4]
+        assert await next_chunk(source, 3) == []
+
+
+class TestScannerStreaming:
+    """Tests for BaseScanner streaming entry points."""
+
+    @pytest.mark.asyncio
+    async def test_default_scan_iter_wraps_scan(self, session) -> None:
+        """Scanners without a streaming override yield their scan() output."""
+
+        class ListScanner(CountingScanner):
+            async def scan(self) -> List[ScanResult]:
+                return [self.create_result("TEST_001", "a", "a")]
+
+            scan_iter = BaseScanner.scan_iter
+
+        scanner = ListScanner(session)
+        assert [r.resource_id async for r in scanner.scan_iter()] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_fan_out_iter_yields_every_unit(self, session) -> None:
+        """All unit results are yielded and every unit is timed."""
+        scanner = RegionScanner(session, regions=REGIONS)
+        results = [r async for r in scanner.scan_iter()]
+
+        assert sorted(r.resource_id for r in results) == sorted(
+            f"{region}-{i}" for region in REGIONS for i in range(2)
+        )
+        assert len(scanner.unit_timings) == len(REGIONS)
+
+    @pytest.mark.asyncio
+    async def test_stream_without_executor(self, session) -> None:
+        """stream() chunks scan_iter() output on the caller's loop."""
+        scanner = CountingScanner(session)
+        sizes = [len(chunk) async for chunk in scanner.stream(chunk_size=10)]
+        assert sizes == [10, 10, 5]
+
+
+class TestExecutorStream:
+    """Tests for ScannerExecutor.stream."""
+
+    @pytest.mark.asyncio
+    async def test_stream_runs_on_worker_thread(self, session) -> None:
+        """The generator is advanced on the executor's pool."""
+        executor = ScannerExecutor(max_workers=2)
+        scanner = CountingScanner(session, executor=executor)
+
+        chunks = [chunk async for chunk in scanner.stream(chunk_size=10)]
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert all(name.startswith("scanner") for name in scanner.threads)
+        assert scanner.closed
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_producer_stays_one_chunk_ahead(self, session) -> None:
+        """The producer is only advanced when the consumer asks for a chunk."""
+        executor = ScannerExecutor(max_workers=2)
+        scanner = CountingScanner(session, executor=executor)
+
+        seen = []
+        async with aclosing(scanner.stream(chunk_size=5)) as chunks:
+            async for _chunk in chunks:
+                seen.append(scanner.produced)
+                if len(seen) == 2:
+                    break
+
+        assert seen == [5, 10]
+        assert scanner.closed
+        executor.shutdown()
+
+
+class TestMultiAccountStreaming:
+    """Tests for streaming findings out of MultiAccountScanner."""
+
+    @pytest.mark.asyncio
+    async def test_result_sink_receives_chunks(self) -> None:
+        """Findings go to the sink in chunks and only counts are retained."""
+        account = AWSAccount(
+            account_id="123456789012",
+            name="Prod",
+            auth_method=AuthMethod.IAM_ROLE,
+            environment="prod",
+        )
+        registry = AccountRegistry()
+        registry.add_account(account)
+
+        received: List[List[ScanResult]] = []
+
+        async def sink(acct: AWSAccount, findings: List[ScanResult]) -> None:
+            assert acct is account
+            received.append(findings)
+
+        scanner = MultiAccountScanner(
+            registry=registry,
+            scanner_classes=[CountingScanner],
+            result_sink=sink,
+            chunk_size=10,
+        )
+
+        with patch.object(
+            scanner, "_get_session_for_account", return_value=MagicMock()
+        ):
+            result = await scanner._scan_account(account)
+
+        assert [len(chunk) for chunk in received] == [10, 10, 5]
+        assert received[0][0].evidence["account_id"] == "123456789012"
+        assert result.findings == []
+        assert result.finding_count == 25
+        assert result.findings_by_severity()["high"] == 25
+        assert result.scanners_run == ["CountingScanner"]
@@ -0,0 +1,184 @@
+"""Tests for materialized findings summary counters."""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from cloud_optimizer.models.finding import (
+    Finding,
+    FindingSeverity,
+    FindingStatus,
+    FindingType,
+)
+from cloud_optimizer.models.finding_summary import FindingSummaryCounter
+from cloud_optimizer.models.scan_job import ScanJob, ScanStatus, ScanType
+from cloud_optimizer.services.compliance import ComplianceService
+from cloud_optimizer.services.finding_summary import (
+    ALL_FINDINGS,
+    FindingSummaryReconciler,
+    SummaryDeltas,
+    counter_keys,
+)
+from cloud_optimizer.services.findings import FindingsService
+
+
+def test_counter_keys():
+    """A finding counts once overall and once per framework."""
+    account_id = uuid4()
+    keys = counter_keys(
+        account_id, FindingSeverity.HIGH, FindingStatus.OPEN, "S3", ["CIS", "SOC2"]
+    )
+    assert [key[4] for key in keys] == [ALL_FINDINGS, "CIS", "SOC2"]
+
+
+def test_status_move_nets_out():
+    """Moving a finding back to its original status leaves no changes."""
+    account_id = uuid4()
+    deltas = SummaryDeltas()
+    args = (account_id, FindingSeverity.LOW)
+    deltas.move(*args, FindingStatus.OPEN, FindingStatus.RESOLVED, "EC2", ["CIS"])
+    assert deltas
+    deltas.move(*args, FindingStatus.RESOLVED, FindingStatus.OPEN, "EC2", ["CIS"])
+    assert not deltas
+
+
+@pytest_asyncio.fixture
+async def scan_job(db_session, test_user, test_aws_account):
+    """Create a scan job to attach findings to."""
+    job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.RUNNING,
+    )
+    db_session.add(job)
+    await db_session.commit()
+    return job
+
+
+async def _create(service, scan_job, resource_id, severity, frameworks):
+    return await service.create_finding(
+        scan_job_id=scan_job.job_id,
+        aws_account_id=scan_job.aws_account_id,
+        rule_id="S3_001",
+        finding_type=FindingType.SECURITY,
+        severity=severity,
+        service="S3",
+        resource_type="AWS::S3::Bucket",
+        resource_id=resource_id,
+        region="us-east-1",
+        title="Public Bucket",
+        description="Bucket is public",
+        recommendation="Block public access",
+        compliance_frameworks=frameworks,
+    )
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_ingest_and_status_changes(db_session, scan_job):
+    """Creates, bulk ingests and status changes keep the summaries current."""
+    service = FindingsService(db_session)
+    first = await _create(
+        service, scan_job, "bucket-1", FindingSeverity.CRITICAL, ["CIS", "SOC2"]
+    )
+    # Deduplicated: refreshes evidence only
+    await _create(
+        service, scan_job, "bucket-1", FindingSeverity.CRITICAL, ["CIS", "SOC2"]
+    )
+    await service.bulk_upsert_findings(
+        [
+            {
+                "scan_job_id": scan_job.job_id,
+                "aws_account_id": scan_job.aws_account_id,
+                "rule_id": "S3_002",
+                "finding_type": FindingType.SECURITY,
+                "severity": FindingSeverity.HIGH,
+                "service": "S3",
+                "resource_type": "AWS::S3::Bucket",
+                "resource_id": f"bucket-{i}",
+                "region": "us-east-1",
+                "title": "Unencrypted Bucket",
+                "description": "Bucket is not encrypted",
+                "recommendation": "Enable encryption",
+                "compliance_frameworks": ["CIS"],
+            }
+            for i in range(3)
+        ]
+    )
+    await service.update_status(first.finding_id, FindingStatus.RESOLVED)
+
+    summary = await service.get_summary(scan_job.aws_account_id)
+    assert summary["total"] == 4
+    assert summary["by_severity"]["critical"] == 1
+    assert summary["by_severity"]["high"] == 3
+    assert summary["by_status"] == {
+        "open": 3,
+        "resolved": 1,
+        "suppressed": 0,
+        "false_positive": 0,
+    }
+
+    compliance_service = ComplianceService(db_session)
+    compliance = await compliance_service.get_account_compliance_summary(
+        scan_job.aws_account_id
+    )
+    assert compliance == {
+        "CIS": {"total": 4, "passed": 1, "failed": 3},
+        "SOC2": {"total": 1, "passed": 1, "failed": 0},
+    }
+
+    await compliance_service.seed_frameworks()
+    status = await compliance_service.get_framework_compliance_status(
+        "CIS", scan_job.aws_account_id
+    )
+    assert status["total_findings"] == 4
+    assert status["passed"] == 1
+    assert status["compliance_percentage"] == 25.0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_detects_and_repairs_drift(db_engine, db_session, scan_job):
+    """Changes that bypass the service are found and corrected."""
+    service = FindingsService(db_session)
+    finding = await _create(
+        service, scan_job, "bucket-1", FindingSeverity.MEDIUM, ["HIPAA"]
+    )
+    # Bypass the service: counters now say OPEN, the finding is SUPPRESSED
+    await db_session.execute(
+        update(Finding)
+        .where(Finding.finding_id == finding.finding_id)
+        .values(status=FindingStatus.SUPPRESSED)
+    )
+    await db_session.commit()
+
+    reconciler = FindingSummaryReconciler(
+        async_sessionmaker(bind=db_engine, class_=AsyncSession)
+    )
+    checked = await reconciler.reconcile(scan_job.aws_account_id, repair=False)
+    assert checked.drifted and not checked.repaired
+    assert len(checked.drift) == 4
+
+    repaired = await reconciler.reconcile(scan_job.aws_account_id)
+    assert repaired.repaired
+    assert not (await reconciler.reconcile(scan_job.aws_account_id)).drifted
+
+    db_session.expire_all()
+    summary = await service.get_summary(scan_job.aws_account_id)
+    assert summary["by_status"]["suppressed"] == 1
+    assert summary["by_status"]["open"] == 0
+    assert (
+        await db_session.get(
+            FindingSummaryCounter,
+            (
+                scan_job.aws_account_id,
+                FindingSeverity.MEDIUM,
+                FindingStatus.OPEN,
+                "S3",
+                ALL_FINDINGS,
+            ),
+        )
+        is None
+    )
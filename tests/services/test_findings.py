@@ -1,9 +1,10 @@
 """Tests for Findings service."""
+
 import pytest
 
 from cloud_optimizer.models.finding import FindingSeverity, FindingStatus, FindingType
 from cloud_optimizer.models.scan_job import ScanJob, ScanStatus, ScanType
-from cloud_optimizer.services.findings import FindingsService
+from cloud_optimizer.services.findings import DuplicateOpenFindingError, FindingsService
 
 
 @pytest.mark.asyncio
@@ -187,6 +188,35 @@ async def test_update_status(db_session, test_user, test_aws_account):
     assert updated.resolved_at is not None
 
 
+@pytest.mark.asyncio
+async def test_reopen_with_open_duplicate(db_session, test_user, test_aws_account):
+    """Test reopening is refused when a later scan already reopened the issue."""
+    scan_job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.RUNNING,
+    )
+    db_session.add(scan_job)
+    await db_session.commit()
+
+    service = FindingsService(db_session)
+    resolved = await service.create_finding(**_bulk_row(scan_job, "my-bucket"))
+    await service.update_status(resolved.finding_id, FindingStatus.RESOLVED)
+    # The next scan sees the issue again and opens a new finding
+    result = await service.bulk_upsert_findings([_bulk_row(scan_job, "my-bucket")])
+    assert result.created == 1
+
+    with pytest.raises(DuplicateOpenFindingError):
+        await service.update_status(resolved.finding_id, FindingStatus.OPEN)
+
+    await db_session.refresh(resolved)
+    assert resolved.status == FindingStatus.RESOLVED
+    summary = await service.get_summary(scan_job.aws_account_id)
+    assert summary["by_status"]["open"] == 1
+    assert summary["by_status"]["resolved"] == 1
+
+
 @pytest.mark.asyncio
 async def test_get_summary(db_session, test_user, test_aws_account):
     """Test getting findings summary."""
@@ -238,3 +268,157 @@ async def test_get_summary(db_session, test_user, test_aws_account):
     assert summary["by_severity"]["critical"] == 1
     assert summary["by_severity"]["high"] == 1
     assert summary["by_status"]["open"] == 2
+
+
+def _bulk_row(scan_job, resource_id, evidence=None):
+    return {
+        "scan_job_id": scan_job.job_id,
+        "aws_account_id": scan_job.aws_account_id,
+        "rule_id": "S3_001",
+        "finding_type": FindingType.SECURITY,
+        "severity": FindingSeverity.HIGH,
+        "service": "S3",
+        "resource_type": "AWS::S3::Bucket",
+        "resource_id": resource_id,
+        "region": "us-east-1",
+        "title": "Public Bucket",
+        "description": "Bucket is public",
+        "recommendation": "Block public access",
+        "evidence": evidence,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_findings(db_session, test_user, test_aws_account):
+    """Test bulk ingest creates new findings and refreshes existing ones."""
+    scan_job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.RUNNING,
+    )
+    db_session.add(scan_job)
+    await db_session.commit()
+
+    service = FindingsService(db_session)
+    existing = await service.create_finding(
+        scan_job_id=scan_job.job_id,
+        aws_account_id=scan_job.aws_account_id,
+        rule_id="S3_001",
+        finding_type=FindingType.SECURITY,
+        severity=FindingSeverity.HIGH,
+        service="S3",
+        resource_type="AWS::S3::Bucket",
+        resource_id="bucket-0",
+        region="us-east-1",
+        title="Public Bucket",
+        description="Bucket is public",
+        recommendation="Block public access",
+    )
+
+    rows = [_bulk_row(scan_job, f"bucket-{i}") for i in range(5)]
+    # Duplicate key inside the batch: last occurrence wins
+    rows.append(_bulk_row(scan_job, "bucket-0", evidence={"scan": 2}))
+
+    result = await service.bulk_upsert_findings(rows, chunk_size=2)
+
+    assert result.created == 4
+    assert result.updated == 1
+    assert result.total == 5
+
+    findings = await service.get_findings_by_account(scan_job.aws_account_id)
+    assert len(findings) == 5
+    await db_session.refresh(existing)
+    assert existing.evidence == {"scan": 2}
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_findings_empty(db_session):
+    """Test bulk ingest with no rows is a no-op."""
+    service = FindingsService(db_session)
+    result = await service.bulk_upsert_findings([])
+    assert result.total == 0
+
+
+def test_cursor_round_trip():
+    """Cursors encode a listing position and reject garbage."""
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+    from uuid import uuid4
+
+    from cloud_optimizer.services.findings import decode_cursor, encode_cursor
+
+    position = SimpleNamespace(
+        first_seen_at=datetime(2026, 10, 16, 9, 30, tzinfo=timezone.utc),
+        finding_id=uuid4(),
+    )
+    cursor = encode_cursor(position)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (position.first_seen_at, position.finding_id)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_findings_page(db_session, test_user, test_aws_account):
+    """Test keyset pages cover every finding once, newest first."""
+    scan_job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.RUNNING,
+    )
+    db_session.add(scan_job)
+    await db_session.commit()
+
+    service = FindingsService(db_session)
+    # One statement: every row shares first_seen_at, so finding_id decides
+    await service.bulk_upsert_findings(
+        [_bulk_row(scan_job, f"bucket-{i}") for i in range(7)]
+    )
+    listed = await service.get_findings_by_account(scan_job.aws_account_id)
+
+    paged = []
+    cursor = None
+    while True:
+        page = await service.get_findings_page(
+            scan_job.aws_account_id, limit=3, cursor=cursor
+        )
+        paged.extend(page.findings)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [f.finding_id for f in paged] == [f.finding_id for f in listed]
+    assert len(paged) == 7
+
+
+@pytest.mark.asyncio
+async def test_get_findings_bulk(db_session, test_user, test_aws_account):
+    """Test bulk lookup keeps request order and checks ownership."""
+    from uuid import uuid4
+
+    scan_job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.RUNNING,
+    )
+    db_session.add(scan_job)
+    await db_session.commit()
+
+    service = FindingsService(db_session)
+    await service.bulk_upsert_findings(
+        [_bulk_row(scan_job, f"bucket-{i}") for i in range(3)]
+    )
+    ids = [
+        f.finding_id
+        for f in await service.get_findings_by_account(scan_job.aws_account_id)
+    ]
+    requested = [ids[2], uuid4(), ids[0], ids[2], ids[1]]
+
+    findings = await service.get_findings_bulk(requested, user_id=test_user.user_id)
+    assert [f.finding_id for f in findings] == [ids[2], ids[0], ids[1]]
+    assert await service.get_findings_bulk(requested, user_id=uuid4()) == []
+    assert await service.get_findings_bulk([]) == []
@@ -0,0 +1,344 @@
+"""Tests for the background scan job queue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import UUID, uuid4
+
+import pytest
+
+from cloud_optimizer.models.scan_job import ScanJob, ScanStatus, ScanType
+from cloud_optimizer.services.scan_queue import (
+    DatabaseScanQueue,
+    LocalScanQueue,
+    ScanWorkerPool,
+)
+
+
+class FakeSession:
+    """Session stand-in for workers whose engine never touches the database."""
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        return None
+
+
+class RecordingEngine:
+    """Engine that records the jobs it runs."""
+
+    def __init__(self, ran: List[UUID], delay: float = 0.0, fail=()) -> None:
+        self.ran = ran
+        self.delay = delay
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+
+    async def run_scan_job(self, job_id: UUID) -> None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if job_id in self.fail:
+                raise RuntimeError("scan failed")
+            self.ran.append(job_id)
+        finally:
+            self.active -= 1
+
+
+async def wait_for_jobs(ran: List[UUID], count: int) -> None:
+    """Wait until ``count`` jobs have finished."""
+    for _ in range(200):
+        if len(ran) >= count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"only {len(ran)} of {count} jobs ran")
+
+
+@pytest.mark.asyncio
+async def test_local_queue_claim_times_out_when_empty() -> None:
+    """Claiming from an empty queue returns None after the timeout."""
+    queue = LocalScanQueue()
+    assert await queue.claim("w", timeout=0.01) is None
+
+    job_id = uuid4()
+    await queue.submit(job_id)
+    assert queue.pending == 1
+    assert await queue.claim("w", timeout=0.01) == job_id
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_submitted_jobs() -> None:
+    """Jobs submitted to the queue are run by the workers."""
+    queue = LocalScanQueue()
+    ran: List[UUID] = []
+    engine = RecordingEngine(ran)
+    pool = ScanWorkerPool(
+        queue,
+        FakeSession,
+        engine_factory=lambda _session: engine,
+        concurrency=2,
+        poll_interval=0.01,
+    )
+
+    await pool.start()
+    job_ids = [uuid4() for _ in range(5)]
+    for job_id in job_ids:
+        await queue.submit(job_id)
+    await wait_for_jobs(ran, len(job_ids))
+    await pool.stop()
+
+    assert sorted(ran) == sorted(job_ids)
+    assert not pool.running
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrency() -> None:
+    """No more than ``concurrency`` jobs run at once."""
+    queue = LocalScanQueue()
+    ran: List[UUID] = []
+    engine = RecordingEngine(ran, delay=0.02)
+    pool = ScanWorkerPool(
+        queue,
+        FakeSession,
+        engine_factory=lambda _session: engine,
+        concurrency=3,
+        poll_interval=0.01,
+    )
+
+    for _ in range(9):
+        await queue.submit(uuid4())
+    await pool.start()
+    await wait_for_jobs(ran, 9)
+    await pool.stop()
+
+    assert engine.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_stop_worker() -> None:
+    """A job that raises is logged and the worker moves on."""
+    queue = LocalScanQueue()
+    ran: List[UUID] = []
+    bad, good = uuid4(), uuid4()
+    engine = RecordingEngine(ran, fail=[bad])
+    pool = ScanWorkerPool(
+        queue,
+        FakeSession,
+        engine_factory=lambda _session: engine,
+        concurrency=1,
+        poll_interval=0.01,
+    )
+
+    await pool.start()
+    await queue.submit(bad)
+    await queue.submit(good)
+    await wait_for_jobs(ran, 1)
+    await pool.stop()
+
+    assert ran == [good]
+
+
+@pytest.mark.asyncio
+async def test_stopping_pool_returns_running_job_to_queue() -> None:
+    """A scan cancelled by ``stop`` is released instead of left running."""
+    queue = LocalScanQueue()
+    ran: List[UUID] = []
+    engine = RecordingEngine(ran, delay=10)
+    pool = ScanWorkerPool(
+        queue,
+        FakeSession,
+        engine_factory=lambda _session: engine,
+        concurrency=1,
+        poll_interval=0.01,
+    )
+
+    job_id = uuid4()
+    await queue.submit(job_id)
+    await pool.start()
+    for _ in range(200):
+        if engine.active:
+            break
+        await asyncio.sleep(0.01)
+    await pool.stop()
+
+    assert ran == []
+    assert queue.pending == 1
+    assert await queue.claim("w", timeout=0.01) == job_id
+
+
+class HeartbeatQueue(LocalScanQueue):
+    """Local queue that records heartbeats."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.beats: List[UUID] = []
+
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> bool:
+        self.beats.append(job_id)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_heartbeats_without_progress() -> None:
+    """A running job gets heartbeats even if the scan reports nothing."""
+    queue = HeartbeatQueue()
+    ran: List[UUID] = []
+    pool = ScanWorkerPool(
+        queue,
+        FakeSession,
+        engine_factory=lambda _session: RecordingEngine(ran, delay=0.1),
+        heartbeat_interval=0.01,
+    )
+
+    job_id = uuid4()
+    await pool.run_job(job_id, "worker-a")
+    beats = len(queue.beats)
+    await asyncio.sleep(0.05)
+
+    assert ran == [job_id]
+    assert beats >= 3
+    # The heartbeat stops with the job
+    assert len(queue.beats) == beats
+
+
+def test_worker_pool_requires_a_worker() -> None:
+    """Zero concurrency is rejected; callers skip creating the pool instead."""
+    with pytest.raises(ValueError):
+        ScanWorkerPool(LocalScanQueue(), FakeSession, concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_database_queue_claims_oldest_pending_job(
+    db_session, test_user, test_aws_account
+) -> None:
+    """The database queue claims pending jobs once and marks them running."""
+    jobs = [
+        ScanJob(
+            user_id=test_user.user_id,
+            aws_account_id=test_aws_account.account_id,
+            scan_type=ScanType.SECURITY,
+            status=ScanStatus.PENDING,
+        )
+        for _ in range(2)
+    ]
+    for job in jobs:
+        db_session.add(job)
+        await db_session.commit()
+
+    bind = db_session.bind
+
+    def session_factory():
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        return AsyncSession(bind, expire_on_commit=False)
+
+    queue = DatabaseScanQueue(session_factory)
+    first = await queue.claim("worker-a", timeout=0.01)
+    second = await queue.claim("worker-b", timeout=0.01)
+    third = await queue.claim("worker-c", timeout=0.01)
+
+    assert [first, second] == [jobs[0].job_id, jobs[1].job_id]
+    assert third is None
+
+    await db_session.refresh(jobs[0])
+    assert jobs[0].status == ScanStatus.RUNNING
+    assert jobs[0].worker_id == "worker-a"
+    assert jobs[0].attempts == 1
+
+
+def make_session_factory(db_session):
+    """Build a factory for fresh sessions on the test database."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    bind = db_session.bind
+    return lambda: AsyncSession(bind, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_database_queue_recovers_by_heartbeat(
+    db_session, test_user, test_aws_account
+) -> None:
+    """Long-running jobs with a recent heartbeat are not requeued."""
+    now = datetime.now(timezone.utc)
+    started = now - timedelta(hours=2)
+    alive, dead = [
+        ScanJob(
+            user_id=test_user.user_id,
+            aws_account_id=test_aws_account.account_id,
+            scan_type=ScanType.SECURITY,
+            status=ScanStatus.RUNNING,
+            started_at=started,
+            heartbeat_at=heartbeat,
+            worker_id="worker-a",
+            attempts=1,
+        )
+        for heartbeat in (now, started)
+    ]
+    db_session.add_all([alive, dead])
+    await db_session.commit()
+
+    queue = DatabaseScanQueue(make_session_factory(db_session))
+    assert await queue.recover_stale_jobs() == 1
+
+    await db_session.refresh(alive)
+    await db_session.refresh(dead)
+    assert alive.status == ScanStatus.RUNNING
+    assert dead.status == ScanStatus.PENDING
+    assert dead.worker_id is None
+
+
+@pytest.mark.asyncio
+async def test_database_queue_release_resets_claim(
+    db_session, test_user, test_aws_account
+) -> None:
+    """Releasing a claimed job makes it pending without using an attempt."""
+    job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.PENDING,
+    )
+    db_session.add(job)
+    await db_session.commit()
+
+    queue = DatabaseScanQueue(make_session_factory(db_session))
+    assert await queue.claim("worker-a", timeout=0.01) == job.job_id
+    # Only the claiming worker can release it
+    await queue.release(job.job_id, "worker-b")
+    await db_session.refresh(job)
+    assert job.status == ScanStatus.RUNNING
+
+    await queue.release(job.job_id, "worker-a")
+    await db_session.refresh(job)
+    assert job.status == ScanStatus.PENDING
+    assert job.worker_id is None
+    assert job.attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_database_queue_heartbeat_requires_claim(
+    db_session, test_user, test_aws_account
+) -> None:
+    """Only the worker holding a running job can record its heartbeat."""
+    job = ScanJob(
+        user_id=test_user.user_id,
+        aws_account_id=test_aws_account.account_id,
+        scan_type=ScanType.SECURITY,
+        status=ScanStatus.PENDING,
+    )
+    db_session.add(job)
+    await db_session.commit()
+
+    queue = DatabaseScanQueue(make_session_factory(db_session))
+    assert await queue.claim("worker-a", timeout=0.01) == job.job_id
+    await db_session.refresh(job)
+    claimed_at = job.heartbeat_at
+
+    assert not await queue.heartbeat(job.job_id, "worker-b")
+    assert await queue.heartbeat(job.job_id, "worker-a")
+    await db_session.refresh(job)
+    assert job.heartbeat_at > claimed_at
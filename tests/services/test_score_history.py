@@ -0,0 +1,175 @@
+"""Unit tests for persisted security score history."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from cloud_optimizer.scanners.base import ScanResult
+from cloud_optimizer.scanners.multi_account import (
+    AccountScanResult,
+    AuthMethod,
+    AWSAccount,
+)
+from cloud_optimizer.services.score_history import (
+    ORG_SCOPE,
+    InMemoryScoreHistoryStore,
+    RollupPeriod,
+    ScoreHistory,
+    ScoreSnapshot,
+    bucket_start,
+)
+from cloud_optimizer.services.security_dashboard import SecurityDashboard
+
+# A Wednesday
+NOW = datetime(2026, 10, 14, 15, 30, tzinfo=timezone.utc)
+
+
+def snapshot(
+    score: float, hours_ago: float = 0, scope: str = ORG_SCOPE
+) -> ScoreSnapshot:
+    """Build a snapshot recorded some hours before NOW."""
+    return ScoreSnapshot(
+        scope=scope, recorded_at=NOW - timedelta(hours=hours_ago), score=score
+    )
+
+
+def scan(account_id: str, critical: int) -> List[AccountScanResult]:
+    """Build scan results with some critical findings for one account."""
+    account = AWSAccount(
+        account_id=account_id, name=account_id, auth_method=AuthMethod.IAM_ROLE
+    )
+    findings = [
+        ScanResult(
+            rule_id="S3_001",
+            passed=False,
+            resource_id=f"bucket-{i}",
+            evidence={"severity": "critical"},
+        )
+        for i in range(critical)
+    ]
+    return [AccountScanResult(account=account, findings=findings)]
+
+
+class TestScoreHistory:
+    """Tests for ScoreHistory."""
+
+    def test_bucket_start(self) -> None:
+        """Days start at midnight, weeks on Monday."""
+        assert bucket_start(NOW, RollupPeriod.DAY) == datetime(
+            2026, 10, 14, tzinfo=timezone.utc
+        )
+        assert bucket_start(NOW, RollupPeriod.WEEK) == datetime(
+            2026, 10, 12, tzinfo=timezone.utc
+        )
+
+    def test_rollups_are_maintained_on_add(self) -> None:
+        """Each snapshot updates its daily and weekly buckets."""
+        history = ScoreHistory()
+        history.add([snapshot(80, hours_ago=50), snapshot(60, hours_ago=2)])
+        history.add([snapshot(70, hours_ago=1)])
+
+        days = history.rollups(ORG_SCOPE, RollupPeriod.DAY)
+        assert [r.samples for r in days] == [1, 2]
+        assert days[-1].average == 65.0
+        assert days[-1].last_score == 70
+        assert (days[-1].score_min, days[-1].score_max) == (60, 70)
+
+        (week,) = history.rollups(ORG_SCOPE, RollupPeriod.WEEK)
+        assert week.samples == 3
+        assert week.average == 70.0
+
+    def test_range_reads_and_retention(self) -> None:
+        """Snapshots are read by time range and pruned past retention."""
+        history = ScoreHistory(history_days=3)
+        history.add([snapshot(50, hours_ago=24 * 5)], now=NOW)
+        history.add([snapshot(90, hours_ago=30), snapshot(95, hours_ago=1)], now=NOW)
+
+        assert [s.score for s in history.snapshots(ORG_SCOPE)] == [90, 95]
+        assert [
+            s.score for s in history.snapshots(ORG_SCOPE, NOW - timedelta(hours=2))
+        ] == [95]
+        # Rollups outlive snapshots
+        assert len(history.rollups(ORG_SCOPE, RollupPeriod.DAY)) == 3
+
+
+class TestDashboardHistory:
+    """Tests for SecurityDashboard score history."""
+
+    def test_trend_reads_recorded_snapshots(self) -> None:
+        """Scores are computed at record time; trends return stored points."""
+        dashboard = SecurityDashboard()
+        dashboard.record_scan_results(scan("111111111111", critical=2))
+        dashboard.record_scan_results(scan("111111111111", critical=0))
+
+        trend = dashboard.get_score_trend(days=30)
+        assert [p["critical_count"] for p in trend] == [2, 0]
+        assert trend[-1]["score"] == 100.0
+
+        account_trend = dashboard.get_score_trend(
+            days=30, period=RollupPeriod.DAY, account_id="111111111111"
+        )
+        assert account_trend[0]["samples"] == 2
+        assert account_trend[0]["critical_count"] == 0
+        assert dashboard.export_summary_to_dict([])["trends"]["30_day"] == trend
+
+    @pytest.mark.asyncio
+    async def test_history_survives_restart(self) -> None:
+        """A new dashboard reloads persisted snapshots and rollups."""
+        store = InMemoryScoreHistoryStore()
+        first = SecurityDashboard(history_store=store)
+        await first.persist_scan_results(scan("111111111111", critical=1))
+        await first.persist_scan_results(scan("111111111111", critical=3))
+
+        restarted = SecurityDashboard(history_store=store)
+        await restarted.load_history()
+
+        assert restarted.get_score_trend(days=1) == first.get_score_trend(days=1)
+        (week,) = restarted.get_score_trend(days=7, period=RollupPeriod.WEEK)
+        assert week["samples"] == 2
+        assert week["critical_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_retried_save_is_not_counted_twice(self) -> None:
+        """Saving a snapshot again leaves snapshots and rollups unchanged."""
+        store = InMemoryScoreHistoryStore()
+        batch = [snapshot(80, hours_ago=2), snapshot(60, hours_ago=1)]
+        await store.save(batch)
+        await store.save(batch + [snapshot(40)])
+
+        loaded = await store.load_snapshots(NOW - timedelta(days=1))
+        assert [s.score for s in loaded] == [80, 60, 40]
+        rollups = await store.load_rollups(NOW - timedelta(days=7))
+        day = next(r for r in rollups if r.period == RollupPeriod.DAY)
+        assert day.samples == 3
+        assert day.score_sum == 180
+
+    @pytest.mark.asyncio
+    async def test_cutoff_bucket_is_kept_whole(self) -> None:
+        """Stores and history keep the buckets containing a retention cutoff."""
+        batch = [snapshot(80, hours_ago=53.5), snapshot(60, hours_ago=1)]
+        cutoff = NOW - timedelta(days=1)
+        store = InMemoryScoreHistoryStore()
+        await store.save(batch)
+        history = ScoreHistory(rollup_retention_days=1)
+        history.add(batch, now=NOW)
+
+        loaded = await store.load_rollups(cutoff)
+        await store.prune(snapshots_before=cutoff, rollups_before=cutoff)
+        pruned = await store.load_rollups(NOW - timedelta(days=30))
+
+        for rollups in (loaded, pruned):
+            by_period = {
+                period: [
+                    (r.bucket_start, r.samples) for r in rollups if r.period == period
+                ]
+                for period in RollupPeriod
+            }
+            for period, points in by_period.items():
+                assert points == [
+                    (r.bucket_start, r.samples)
+                    for r in history.rollups(ORG_SCOPE, period)
+                ]
+        week = history.rollups(ORG_SCOPE, RollupPeriod.WEEK)
+        assert [r.samples for r in week] == [2]
+        assert len(history.rollups(ORG_SCOPE, RollupPeriod.DAY)) == 1
@@ -5,8 +5,13 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from cloud_optimizer.models.finding import Finding
+from cloud_optimizer.models.scan_job import ScanJob, ScanStatus
+from cloud_optimizer.services.findings import FindingsService
+from cloud_optimizer.services.scan_queue import DatabaseScanQueue
 from cloud_optimizer.services.security_scanner import SecurityScanEngine
 
 
@@ -78,3 +83,162 @@ async def test_security_scan_engine_persists_findings(
     row = findings[0]
     assert row.rule_id == "S3_001"
     assert row.service == "s3"
+
+
+class ReclaimingAWSConnectionService(StubAWSConnectionService):
+    """Hands the job to another worker as the scan starts, as a requeue would."""
+
+    def __init__(self, bind, job_id) -> None:
+        self.bind = bind
+        self.job_id = job_id
+
+    async def get_session(self, _account_id):
+        async with AsyncSession(self.bind) as other:
+            await other.execute(
+                update(ScanJob)
+                .where(ScanJob.job_id == self.job_id)
+                .values(worker_id="worker-b", attempts=ScanJob.attempts + 1)
+            )
+            await other.commit()
+        return object()
+
+
+@pytest.mark.asyncio
+async def test_reclaimed_job_is_not_completed(
+    db_session, test_user, test_aws_account
+) -> None:
+    """A run that lost its claim leaves the job to the worker now holding it."""
+    bind = db_session.bind
+    job = await SecurityScanEngine(db_session).enqueue_security_scan(
+        user_id=test_user.user_id,
+        account_id=test_aws_account.account_id,
+        scan_types=["s3"],
+    )
+    queue = DatabaseScanQueue(lambda: AsyncSession(bind, expire_on_commit=False))
+    assert await queue.claim("worker-a", timeout=0.01) == job.job_id
+
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        engine = SecurityScanEngine(
+            session,
+            scanner_registry={"s3": DummyScanner},
+            aws_connection_service_factory=lambda _: ReclaimingAWSConnectionService(
+                bind, job.job_id
+            ),
+        )
+        await engine.run_scan_job(job.job_id)
+
+    await db_session.refresh(job)
+    assert job.status == ScanStatus.RUNNING
+    assert job.worker_id == "worker-b"
+    assert job.completed_at is None
+
+
+class ReclaimThenFailFindingsService:
+    """Loses the job to another worker while persisting, then fails."""
+
+    def __init__(self, bind, job_id) -> None:
+        self.bind = bind
+        self.job_id = job_id
+
+    async def bulk_upsert_findings(self, _rows, commit=True):
+        async with AsyncSession(self.bind) as other:
+            await other.execute(
+                update(ScanJob)
+                .where(ScanJob.job_id == self.job_id)
+                .values(
+                    worker_id="worker-b",
+                    attempts=ScanJob.attempts + 1,
+                    total_findings=7,
+                )
+            )
+            await other.commit()
+        raise RuntimeError("database went away")
+
+
+@pytest.mark.asyncio
+async def test_reclaimed_job_is_not_failed_by_old_run(
+    db_session, test_user, test_aws_account
+) -> None:
+    """A run that loses its claim mid-scan leaves the new run's job alone."""
+    bind = db_session.bind
+    job = await SecurityScanEngine(db_session).enqueue_security_scan(
+        user_id=test_user.user_id,
+        account_id=test_aws_account.account_id,
+        scan_types=["s3"],
+    )
+    queue = DatabaseScanQueue(lambda: AsyncSession(bind, expire_on_commit=False))
+    assert await queue.claim("worker-a", timeout=0.01) == job.job_id
+
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        engine = SecurityScanEngine(
+            session,
+            scanner_registry={"s3": DummyScanner},
+            aws_connection_service_factory=lambda _: StubAWSConnectionService(),
+            findings_service_factory=lambda _: ReclaimThenFailFindingsService(
+                bind, job.job_id
+            ),
+        )
+        with pytest.raises(RuntimeError):
+            await engine.run_scan_job(job.job_id)
+
+    await db_session.refresh(job)
+    assert job.status == ScanStatus.RUNNING
+    assert job.worker_id == "worker-b"
+    assert job.total_findings == 7
+    assert job.error_message is None
+    assert job.completed_at is None
+
+
+class ReclaimingFindingsService(FindingsService):
+    """Loses the job to another worker while a chunk is being persisted."""
+
+    def __init__(self, db, bind, job_id) -> None:
+        super().__init__(db)
+        self.bind = bind
+        self.job_id = job_id
+
+    async def bulk_upsert_findings(self, rows, commit=True):
+        async with AsyncSession(self.bind) as other:
+            await other.execute(
+                update(ScanJob)
+                .where(ScanJob.job_id == self.job_id)
+                .values(worker_id="worker-b", attempts=ScanJob.attempts + 1)
+            )
+            await other.commit()
+        return await super().bulk_upsert_findings(rows, commit=commit)
+
+
+@pytest.mark.asyncio
+async def test_reclaimed_job_chunk_is_rolled_back(
+    db_session, test_user, test_aws_account
+) -> None:
+    """Findings of a chunk whose claim check fails are not committed."""
+    bind = db_session.bind
+    job = await SecurityScanEngine(db_session).enqueue_security_scan(
+        user_id=test_user.user_id,
+        account_id=test_aws_account.account_id,
+        scan_types=["s3"],
+    )
+    queue = DatabaseScanQueue(lambda: AsyncSession(bind, expire_on_commit=False))
+    assert await queue.claim("worker-a", timeout=0.01) == job.job_id
+
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        engine = SecurityScanEngine(
+            session,
+            scanner_registry={"s3": DummyScanner},
+            aws_connection_service_factory=lambda _: StubAWSConnectionService(),
+            findings_service_factory=lambda db: ReclaimingFindingsService(
+                db, bind, job.job_id
+            ),
+        )
+        await engine.run_scan_job(job.job_id)
+
+    findings = (
+        await db_session.execute(
+            Finding.__table__.select().where(Finding.scan_job_id == job.job_id)
+        )
+    ).fetchall()
+    await db_session.refresh(job)
+    assert findings == []
+    assert job.worker_id == "worker-b"
+    assert job.total_findings == 0
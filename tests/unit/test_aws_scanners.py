@@ -46,6 +46,21 @@ class TestBaseAWSScanner:
         scanner = TestScanner(region="us-west-2")
         assert scanner.region == "us-west-2"
 
+    def test_get_client_uses_scanner_region(self):
+        """Test clients are created and cached for the scanner's region."""
+
+        class TestScanner(BaseAWSScanner):
+            async def scan(self, account_id: str):
+                return []
+
+            def get_scanner_name(self) -> str:
+                return "TestScanner"
+
+        scanner = TestScanner(region="eu-west-1")
+        client = scanner.get_client("ec2")
+        assert client.meta.region_name == "eu-west-1"
+        assert scanner.get_client("ec2") is client
+
     def test_scanner_name_abstract(self):
         """Test get_scanner_name must be implemented."""
 